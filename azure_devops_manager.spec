@@ -10,7 +10,9 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Kullanılmayan büyük paketler onefile arşivine girmez (her açılışta çıkarılmaları gerekmez)
+    excludes=['tkinter', 'matplotlib', 'IPython', 'scipy', 'pytest', 'PyQt5.QtWebEngineWidgets',
+              'PyQt5.QtWebEngineCore', 'PyQt5.QtQml', 'PyQt5.QtQuick', 'PyQt5.QtMultimedia'],
     noarchive=False,
     optimize=0,
 )
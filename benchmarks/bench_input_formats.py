@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Girdi formatı kıyaslaması
+Aynı kullanıcı listesini .xlsx, .csv, .jsonl ve (pyarrow varsa) .parquet olarak yazar ve
+ExcelProcessor.iter_rows ile tamamını okuma süresini karşılaştırır. Sütunlu formatların
+aynı satırları ürettiğini ve Excel süresinin belirli bir oranının altında kaldığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_input_formats.py [--rows 50000] [--max-ratio 0.25]
+
+Çıkış kodu: 0 = tüm formatlar aynı satırları oran içinde okudu, 1 = aksi halde
+"""
+
+import os
+import sys
+import io
+import time
+import argparse
+import tempfile
+import contextlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from core.excel_processor import ExcelProcessor
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        'User Email': [f"user{i}@company.com" for i in range(rows)],
+        'Action': ['add' if i % 5 else 'remove' for i in range(rows)],
+        'Team Name': [f"Team {i % 40}" for i in range(rows)],
+        'License Type': ['stakeholder' if i % 3 else 'express' for i in range(rows)],
+        'Project': [f"Project {i % 4}" for i in range(rows)],
+    })
+
+
+def write_inputs(df: pd.DataFrame, directory: str) -> dict:
+    """Formatları yazar; yazılamayan (ör. pyarrow yok) formatlar atlanır"""
+    paths = {
+        'xlsx': os.path.join(directory, 'users.xlsx'),
+        'csv': os.path.join(directory, 'users.csv'),
+        'jsonl': os.path.join(directory, 'users.jsonl'),
+        'parquet': os.path.join(directory, 'users.parquet'),
+    }
+    df.to_excel(paths['xlsx'], index=False)
+    df.to_csv(paths['csv'], index=False)
+    df.to_json(paths['jsonl'], orient='records', lines=True, force_ascii=False)
+    try:
+        df.to_parquet(paths['parquet'], index=False)
+    except ImportError:
+        print("⏭️ pyarrow yüklü değil, parquet atlanıyor")
+        del paths['parquet']
+    return paths
+
+
+def read_all(processor: ExcelProcessor, path: str):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = list(processor.iter_rows(path))
+    return rows, time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="CSV/JSONL/Parquet ve Excel okuma süresi kıyaslaması")
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--max-ratio', type=float, default=0.25,
+                        help="Sütunlu format süresinin Excel süresine izin verilen en yüksek oranı")
+    args = parser.parse_args(argv)
+
+    processor = ExcelProcessor()
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_inputs(build_frame(args.rows), directory)
+        excel_rows, excel_seconds = read_all(processor, paths.pop('xlsx'))
+        print(f"{args.rows} satır")
+        print(f"  xlsx    : {excel_seconds * 1000:9.1f} ms")
+
+        # Satır numarası formatlar arasında farklı başlar (başlık satırı); içerik karşılaştırılır
+        expected = [row._replace(row=0) for row in excel_rows]
+        for input_format, path in paths.items():
+            rows, seconds = read_all(processor, path)
+            ratio = seconds / excel_seconds
+            print(f"  {input_format:<8}: {seconds * 1000:9.1f} ms ({ratio:.2f}x Excel)")
+            if [row._replace(row=0) for row in rows] != expected:
+                failures.append(f"{input_format} Excel ile aynı satırları üretmedi")
+            if ratio > args.max_ratio:
+                failures.append(f"{input_format} Excel süresinin {ratio:.2f} katı (izin verilen {args.max_ratio})")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Sütunlu formatlar oran içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Log hedefi kıyaslaması
+Birden fazla thread'den LogSink'e yoğun log yazar, arayüz zamanlayıcısını taklit eden bir
+thread ile 100 ms'de bir kuyruğu boşaltır. Saniyedeki mesaj sayısını, kuyruğun
+max_pending ile sınırlı kaldığını ve tüm mesajların log dosyasına yazıldığını kontrol eder.
+
+Kullanım:
+    python benchmarks/bench_log_sink.py [--threads 4] [--messages 50000] [--min-rate 20000]
+
+Çıkış kodu: 0 = hız ve sınırlar beklenen içinde, 1 = aksi halde
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.log_sink import LogSink
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LogSink yazma hızı kıyaslaması")
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--messages', type=int, default=50000, help="Thread başına mesaj sayısı")
+    parser.add_argument('--max-pending', type=int, default=20000)
+    parser.add_argument('--min-rate', type=float, default=20000,
+                        help="Dosyaya yazma dahil en düşük kabul edilen mesaj/sn")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log_file = os.path.join(directory, 'bench.log')
+        # Döndürme bu testte olmasın diye boyut sınırı yüksek tutulur
+        sink = LogSink(log_file, max_bytes=1024 * 1024 * 1024, max_pending=args.max_pending)
+
+        done = threading.Event()
+        drained = [0]
+        largest_batch = [0]
+
+        def ui_timer():
+            while not done.is_set():
+                time.sleep(0.1)
+                lines = sink.drain()
+                drained[0] += len(lines)
+                largest_batch[0] = max(largest_batch[0], len(lines))
+
+        def producer(index):
+            for i in range(args.messages):
+                sink.write(f"✅ thread {index} - satır {i}: user{i}@company.com takıma eklendi")
+
+        drainer = threading.Thread(target=ui_timer)
+        drainer.start()
+        workers = [threading.Thread(target=producer, args=(i,)) for i in range(args.threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        drainer.join()
+        drained[0] += len(sink.drain())
+        sink.close()
+
+        with open(log_file, encoding='utf-8') as f:
+            file_lines = sum(1 for _ in f)
+
+    total = args.threads * args.messages
+    rate = total / elapsed if elapsed else float('inf')
+    print(f"{args.threads} thread x {args.messages} mesaj = {total}")
+    print(f"  süre           : {elapsed:.2f} sn ({rate:,.0f} mesaj/sn)")
+    print(f"  en büyük flush : {largest_batch[0]} satır (sınır {args.max_pending} + atlama notu)")
+    print(f"  dosyadaki satır: {file_lines}")
+
+    failures = []
+    if rate < args.min_rate:
+        failures.append(f"Yazma hızı {rate:,.0f} mesaj/sn (en az {args.min_rate:,.0f})")
+    if largest_batch[0] > args.max_pending + 1:
+        failures.append("Bekleyen kuyruk max_pending sınırını aştı")
+    if file_lines != total:
+        failures.append(f"Log dosyasında {file_lines} satır var, {total} bekleniyordu")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Log hedefi hız ve sınırlar içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
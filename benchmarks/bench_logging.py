@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yapılandırılmış loglama kıyaslaması
+Core modüllerinin eski print + f-string satırlarının (stdout /dev/null'a yönlendirilmiş) çağrı
+başına maliyetini, kapalı seviyedeki log.debug çağrısının maliyetiyle karşılaştırır. Ayrıca
+alt sistem başına seviyelerin uygulandığını ve açık kayıtların log dosyasına tek satırlık
+ayrıştırılabilir JSON olarak (ek alanlarıyla) yazıldığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_logging.py [--calls 200000] [--max-disabled-us 0.5]
+
+Çıkış kodu: 0 = kapalı log maliyeti sınır içinde ve JSON çıktısı doğru, 1 = aksi halde
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import log as azdo_log
+from core.log import get_logger
+
+
+def per_call_us(function, calls: int) -> float:
+    start = time.perf_counter()
+    function(calls)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def print_lines(calls: int):
+    email, team = "user@company.com", {'id': 'team-1', 'name': "Team 1"}
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(calls):
+            print(f"🔍 Satır {i}: {email} -> {team['name']} ({team['id']})")
+
+
+def disabled_debug(calls: int):
+    logger = get_logger('client')
+    email, team = "user@company.com", {'id': 'team-1', 'name': "Team 1"}
+    for i in range(calls):
+        logger.debug("🔍 Satır %s: %s -> %s (%s)", i, email, team['name'], team['id'])
+
+
+def check_json_output(path: str) -> list:
+    """Alt sistem seviyelerini ve JSON satırlarını doğrula; hata mesajlarını döndür"""
+    errors = []
+    azdo_log.configure(level='WARNING', levels={'client': 'DEBUG'}, log_file=path, console=False)
+    get_logger('client').debug("Data: %s", {'email': "user@company.com"})
+    get_logger('client').warning("⚠️ 429 - %s sn bekleniyor", 2, extra={'endpoint': 'team_members', 'retry_after': 2})
+    get_logger('excel').info("Bu satır yazılmamalı")
+    get_logger('excel').warning("⚠️ Doğrulama hatası: %s", "Satır 3: Geçersiz email")
+    azdo_log.configure(log_file='', console=False)  # Dosyayı kapat
+
+    with open(path, encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    expected = [('client', 'debug'), ('client', 'warning'), ('excel', 'warning')]
+    got = [(entry.get('subsystem'), entry.get('level')) for entry in entries]
+    if got != expected:
+        errors.append(f"Kayıtlar beklenenden farklı: {got}")
+    elif entries[1].get('endpoint') != 'team_members' or entries[1].get('retry_after') != 2:
+        errors.append(f"Ek alanlar JSON'a yazılmadı: {entries[1]}")
+    elif entries[0]['msg'] != "Data: {'email': 'user@company.com'}":
+        errors.append(f"Mesaj biçimlendirilmedi: {entries[0]['msg']}")
+    for entry in entries:
+        missing = {'ts', 'level', 'subsystem', 'msg', 'thread'} - set(entry)
+        if missing:
+            errors.append(f"Eksik alanlar: {sorted(missing)}")
+    return errors
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Yapılandırılmış loglama kıyaslaması")
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--max-disabled-us', type=float, default=0.5,
+                        help="Kapalı seviyedeki log çağrısı başına en fazla maliyet (µs)")
+    args = parser.parse_args(argv)
+
+    azdo_log.configure(level='WARNING', log_file='', console=False)
+    print_us = per_call_us(print_lines, args.calls)
+    disabled_us = per_call_us(disabled_debug, args.calls)
+    print(f"print + f-string (/dev/null): {print_us:.3f} µs/çağrı")
+    print(f"Kapalı log.debug:             {disabled_us:.3f} µs/çağrı ({print_us / disabled_us:.0f}x daha ucuz)")
+
+    failures = []
+    if disabled_us > args.max_disabled_us:
+        failures.append(f"Kapalı log çağrısı {disabled_us:.3f} µs (sınır {args.max_disabled_us} µs)")
+    with tempfile.TemporaryDirectory() as directory:
+        failures.extend(check_json_output(os.path.join(directory, 'azdo.jsonl')))
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Kapalı log maliyeti sınır içinde, JSON çıktısı doğru")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Büyük girdi bellek regresyon testi
+100.000 satırlık CSV girdisini ağ çağrısı yapmayan sahte bir client ile tüm pipeline'dan
+(okuma, bölümleme, parça işleme, rapor) geçirir ve ayrı bir süreçte en yüksek RSS
+artışını ölçer. Ayrıca intern edilen alanların satırlar arasında paylaşıldığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_memory_rss.py [--rows 100000] [--max-rss-mb 60]
+
+Aynı sınır tests/test_memory_rss.py ile pytest altında da doğrulanır.
+
+Çıkış kodu: 0 = RSS artışı sınır içinde, 1 = aksi halde (Windows'ta RSS ölçümü atlanır)
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import os, sys, json, resource, itertools, contextlib
+sys.path.insert(0, {root!r})
+
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.excel_processor import ExcelProcessor
+from core.job_queue import JobQueue, ClientPool
+from core.method_learner import MethodLearner
+from core.run_estimator import RunEstimator
+
+
+class Response:
+    def __init__(self, status_code, data):
+        self.status_code, self._data, self.text, self.headers = status_code, data, '', {{}}
+
+    def json(self):
+        return self._data
+
+
+def make_client(organization_url, project_name, pat_token):
+    client = AzureDevOpsRESTClient(organization_url, project_name, pat_token, requests_per_second=0,
+                                   method_learner=MethodLearner({state!r}))
+
+    def send(method, url, **kwargs):
+        if '/projects?' in url:
+            return Response(200, {{'value': [{{'name': 'Project'}}]}})
+        if '/teams?' in url:
+            return Response(200, {{'value': [{{'id': f't{{i}}', 'name': f'Team {{i}}'}} for i in range(40)]}})
+        if 'userentitlements' in url and method == 'GET':
+            return Response(200, {{'members': []}})
+        if method == 'GET':
+            return Response(200, {{'value': []}})
+        return Response(201, {{}})
+
+    client._send = send
+    return client
+
+
+def rss_mb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+processor = ExcelProcessor()
+# 1. ve 121. satırın takım ve lisansı aynı (bkz. write_input): aynı nesne olmalı
+rows = processor.iter_rows({path!r})
+with contextlib.redirect_stdout(None):
+    first, other = next(itertools.islice(rows, 0, None)), next(itertools.islice(rows, 119, None))
+shared = first.team == other.team and first.team is other.team and first.license_type is other.license_type
+rows.close()
+
+queue = JobQueue(ClientPool(make_client, requests_per_second=0), estimator=RunEstimator({history!r}),
+                 metrics_dir='')
+baseline = rss_mb()
+job = queue.submit({path!r}, 'https://dev.azure.com/bench', 'Project', 'pat')
+# Loglar bellekte biriktirilmeden atılır
+with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+    queue.run_job(queue.next_job(), processor)
+    report = job.runner.generate_excel_report({directory!r})
+print(json.dumps({{'baseline': baseline, 'peak': rss_mb(), 'rows': job.rows_done,
+                  'report': bool(report), 'shared': shared}}))
+"""
+
+
+def write_input(path: str, rows: int):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['User Email', 'Action', 'Team Name', 'License Type'])
+        for i in range(rows):
+            writer.writerow([f"user{i}@company.com", 'add' if i % 5 else 'remove',
+                             f"Team {i % 40}", 'stakeholder' if i % 3 else 'express'])
+
+
+def measure(rows: int) -> dict:
+    """Pipeline'ı ayrı bir süreçte çalıştırır; {'baseline', 'peak', 'rows', 'report', 'shared'} döndürür"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'users.csv')
+        write_input(path, rows)
+        code = PROBE.format(root=ROOT, path=path, directory=directory,
+                            state=os.path.join(directory, 'method_order.json'),
+                            history=os.path.join(directory, 'run_history.json'))
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=ROOT)
+        if result.returncode != 0:
+            raise RuntimeError(f"Ölçüm süreci başarısız: {result.stderr}")
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def check(measured: dict, rows: int, max_rss_mb: float) -> list:
+    """Ölçümü sınırlarla karşılaştırır; hata mesajlarını döndürür"""
+    failures = []
+    growth = measured['peak'] - measured['baseline']
+    if growth > max_rss_mb:
+        failures.append(f"RSS artışı {growth:.1f} MB (sınır {max_rss_mb} MB)")
+    if measured['rows'] != rows:
+        failures.append(f"{measured['rows']} satır işlendi, beklenen {rows}")
+    if not measured['report']:
+        failures.append("Rapor oluşturulamadı")
+    if not measured['shared']:
+        failures.append("Tekrarlayan alanlar satırlar arasında paylaşılmıyor")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Büyük girdi için en yüksek RSS regresyon testi")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--max-rss-mb', type=float, default=60.0,
+                        help="Pipeline çalışırken izin verilen en yüksek RSS artışı (MB)")
+    args = parser.parse_args(argv)
+
+    if sys.platform.startswith('win'):
+        print("⏭️ RSS ölçümü bu platformda desteklenmiyor")
+        return 0
+
+    try:
+        measured = measure(args.rows)
+    except RuntimeError as e:
+        print(e)
+        return 1
+
+    growth = measured['peak'] - measured['baseline']
+    print(f"{args.rows} satır")
+    print(f"  RSS başlangıç {measured['baseline']:.1f} MB, en yüksek {measured['peak']:.1f} MB "
+          f"(artış {growth:.1f} MB), işlenen satır {measured['rows']}")
+
+    failures = check(measured, args.rows, args.max_rss_mb)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Bellek sınır içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Client ölçümleri kıyaslaması
+Ağ çağrısı yerine anında yanıt dönen bir _send ile AzureDevOpsRESTClient._request'i birden
+fazla thread'den çağırır; ölçüm açıkken (ClientMetrics) ve kapalıyken (metrics_enabled=False)
+istek başına maliyeti, kapalı ölçümün boş çağrılarının maliyetini, gösterge panelinin her
+yenilemede aldığı snapshot'ın süresini ve JSON / Prometheus çıktılarının doğruluğunu ölçer.
+
+Kullanım:
+    python benchmarks/bench_metrics.py [--threads 4] [--requests 20000] [--max-overhead-us 30]
+                                       [--max-disabled-us 1] [--max-snapshot-ms 20]
+
+Çıkış kodu: 0 = maliyetler sınır içinde ve sayaçlar/çıktılar doğru, 1 = aksi halde
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+import threading
+import contextlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core import metrics
+from core.metrics import snapshot
+
+ENDPOINTS = [f"endpoint_{i}" for i in range(20)]
+
+
+class Request:
+    body = b'{"accessLevel": {"accountLicenseType": "express"}}'
+
+
+class Response:
+    status_code = 200
+    headers = {}
+    request = Request()
+    _content = b'{"count": 0, "value": []}'
+
+
+def make_client(metrics_enabled=True):
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        client = AzureDevOpsRESTClient('https://dev.azure.com/bench', 'Project', 'token', requests_per_second=0,
+                                       metrics_enabled=metrics_enabled)
+    response = Response()
+    client._send = lambda method, url, **kwargs: response
+    return client
+
+
+def run(client, threads, requests):
+    def worker(index):
+        for i in range(requests):
+            client._request('GET', 'https://dev.azure.com/bench/_apis/x', ENDPOINTS[(index + i) % len(ENDPOINTS)])
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def disabled_cost_us(iterations=200000):
+    """Kapalı ölçümün istek başına yaptığı boş çağrıların maliyeti (boş döngü düşülür)"""
+    disabled, response = metrics.DISABLED, Response()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pass
+    empty = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(iterations):
+        disabled.record_wait(0.0)
+        disabled.request_started()
+        disabled.request_finished('endpoint', 0.001, response)
+    return max(0.0, time.perf_counter() - start - empty) / iterations * 1e6
+
+
+def check_exports(client, total) -> list:
+    """JSON özeti ve Prometheus metin dosyası tutarlı mı"""
+    failures = []
+    raw = client.metrics.raw()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = metrics.write_json_summary(os.path.join(temp_dir, 'summary.json'), metrics.summary(raw, rows=total))
+        with open(path, encoding='utf-8') as f:
+            run_summary = json.load(f)
+        if run_summary['calls'] != total or run_summary['bytes_received'] != total * len(Response._content):
+            failures.append(f"JSON özeti uyuşmuyor: {run_summary['calls']} çağrı, {run_summary['bytes_received']} bayt")
+        histogram_total = sum(sum(values['latency_seconds']['buckets'].values())
+                              for values in run_summary['endpoints'].values())
+        if histogram_total != total:
+            failures.append(f"Histogram toplamı {histogram_total} (beklenen {total})")
+
+        path = metrics.write_prometheus_textfile(os.path.join(temp_dir, 'azdo.prom'), [('bench', 'Project', raw)])
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        requests = sum(int(line.rsplit(' ', 1)[1]) for line in lines if line.startswith('azdo_requests_total{'))
+        if requests != total or '# TYPE azdo_request_duration_seconds histogram' not in lines:
+            failures.append(f"Prometheus çıktısı uyuşmuyor: {requests} istek")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Client ölçümleri kıyaslaması")
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=20000, help="Thread başına istek")
+    parser.add_argument('--max-overhead-us', type=float, default=30.0,
+                        help="İstek başına izin verilen en yüksek ölçüm maliyeti (mikrosaniye)")
+    parser.add_argument('--max-disabled-us', type=float, default=1.0,
+                        help="Ölçüm kapalıyken istek başına izin verilen en yüksek maliyet (mikrosaniye)")
+    parser.add_argument('--max-snapshot-ms', type=float, default=20.0)
+    args = parser.parse_args(argv)
+    total = args.threads * args.requests
+
+    baseline = run(make_client(metrics_enabled=False), args.threads, args.requests)
+    disabled_us = disabled_cost_us()
+
+    client = make_client()
+    measured = run(client, args.threads, args.requests)
+    overhead_us = max(0.0, measured - baseline) / total * 1e6
+
+    start = time.perf_counter()
+    for _ in range(10):
+        stats = snapshot([client.metrics])
+    snapshot_ms = (time.perf_counter() - start) / 10 * 1000
+
+    print(f"{args.threads} thread x {args.requests} istek = {total}")
+    print(f"  ölçüm kapalı: {baseline * 1000:8.1f} ms (boş çağrılar istek başına {disabled_us:.3f} µs)")
+    print(f"  ölçüm açık  : {measured * 1000:8.1f} ms (istek başına +{overhead_us:.2f} µs)")
+    print(f"  snapshot    : {snapshot_ms:8.2f} ms ({len(stats['endpoints'])} endpoint, "
+          f"endpoint başına en fazla {client.metrics.window} örnek)")
+
+    failures = []
+    if stats['requests'] != total or stats['in_flight'] != 0:
+        failures.append(f"Sayaçlar uyuşmuyor: {stats['requests']} istek, {stats['in_flight']} eşzamanlı")
+    failures.extend(check_exports(client, total))
+    if disabled_us > args.max_disabled_us:
+        failures.append(f"Kapalı ölçüm maliyeti {disabled_us:.3f} µs (sınır {args.max_disabled_us} µs)")
+    if overhead_us > args.max_overhead_us:
+        failures.append(f"İstek başına ölçüm maliyeti {overhead_us:.2f} µs (sınır {args.max_overhead_us} µs)")
+    if snapshot_ms > args.max_snapshot_ms:
+        failures.append(f"Snapshot {snapshot_ms:.2f} ms (sınır {args.max_snapshot_ms} ms)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Ölçüm maliyetleri sınır içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
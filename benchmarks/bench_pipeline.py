@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uçtan uca pipeline kıyaslaması
+Yerel Azure DevOps taklidini (fake_azure_devops.py) ayağa kaldırır ve her girdi boyutu için
+tüm pipeline'ı (ExcelProcessor akışı, bölümleme, BatchRunner satır işleme, rapor) gerçek HTTP
+yolu üzerinden ayrı bir süreçte çalıştırır. Boyut başına duvar saati süresi, satır/sn, satır
+başına API çağrısı (client ölçümü ve sunucu sayacı) ve en yüksek RSS ölçülür.
+
+Girdi satırlarının beşte biri çıkarma, kalanı eklemedir; kullanıcılar organizasyonda zaten
+bulunur (davet sonrası client'ın bekleme süreleri ölçüme girmez).
+
+Kullanım:
+    python benchmarks/bench_pipeline.py [--sizes 100,1000,10000,100000] [--latency-ms 0]
+                                        [--page-size 0] [--throttle-every 0] [--failure-rate 0]
+                                        [--max-calls-per-row 3] [--timeout 900] [--json sonuc.json]
+
+Çıkış kodu: 0 = tüm satırlar süre sınırı içinde işlendi ve satır başına çağrı sınır içinde, 1 = aksi halde
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, ORGANIZATION, PROJECT, redirect
+
+
+def emails(rows: int):
+    return [f"user{i}@company.com" for i in range(rows)]
+
+
+def write_input(path: str, rows: int, teams: int):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['User Email', 'Action', 'Team Name', 'License Type'])
+        for i, email in enumerate(emails(rows)):
+            writer.writerow([email, 'add' if i % 5 else 'remove', f"Team {i % teams}",
+                             'stakeholder' if i % 3 else 'express'])
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+def worker(args) -> int:
+    """Alt süreç: pipeline'ı bir kez çalıştırır ve ölçümleri JSON satırı olarak yazar"""
+    from core import log as azdo_log
+    from core.azure_rest_client import AzureDevOpsRESTClient
+    from core.excel_processor import ExcelProcessor
+    from core.job_queue import JobQueue, ClientPool
+    from core.method_learner import MethodLearner
+    from core.run_estimator import RunEstimator
+
+    azdo_log.configure(log_file='', console=False)
+    learner = MethodLearner(os.path.join(args.work_dir, 'method_order.json'))
+
+    def make_client(organization_url, project_name, pat_token):
+        client = AzureDevOpsRESTClient(organization_url, project_name, pat_token,
+                                       requests_per_second=args.requests_per_second, method_learner=learner)
+        return redirect(client, args.server)
+
+    queue = JobQueue(ClientPool(make_client), estimator=RunEstimator(os.path.join(args.work_dir, 'run_history.json')),
+                     metrics_dir=args.work_dir)
+    processor = ExcelProcessor()
+    baseline = peak_rss_mb()
+    job = queue.submit(args.input, f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat')
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        queue.run_job(queue.next_job(), processor)
+        report = job.runner.generate_excel_report(args.work_dir)
+    elapsed = time.perf_counter() - start
+
+    run_summary = {}
+    if job.metrics_path:
+        with open(job.metrics_path, encoding='utf-8') as f:
+            run_summary = json.load(f)
+    print(json.dumps({'seconds': elapsed, 'rows': job.rows_done, 'success': job.success,
+                      'calls': run_summary.get('calls'), 'errors': run_summary.get('errors'),
+                      'throttled': run_summary.get('throttled'), 'report': bool(report),
+                      'baseline_mb': baseline, 'peak_mb': peak_rss_mb()}))
+    return 0
+
+
+def run_size(server, rows: int, args) -> dict:
+    """Tek bir boyutu taze bir organizasyonla alt süreçte çalıştır"""
+    server.organization = FakeOrganization(args.teams, emails(rows))
+    server.reset_counters()
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'users.csv')
+        write_input(path, rows, args.teams)
+        command = [sys.executable, os.path.abspath(__file__), '--worker', '--server', server.url,
+                   '--input', path, '--work-dir', work_dir,
+                   '--requests-per-second', str(args.requests_per_second)]
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, cwd=ROOT, timeout=args.timeout)
+        except subprocess.TimeoutExpired:
+            return {'rows_expected': rows, 'error': f"{args.timeout:g} sn içinde bitmedi "
+                                                    f"(sunucu {server.total_requests} istek aldı)"}
+    if result.returncode != 0 or not result.stdout.strip():
+        return {'rows_expected': rows, 'error': result.stderr.strip()[-500:]}
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    measured.update(rows_expected=rows, server_requests=server.total_requests,
+                    server_statuses={str(code): count for code, count in server.statuses.items()})
+    return measured
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Uçtan uca pipeline kıyaslaması (yerel Azure DevOps taklidi)")
+    parser.add_argument('--sizes', default='100,1000,10000,100000', help="Virgülle ayrılmış satır sayıları")
+    parser.add_argument('--teams', type=int, default=40)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Sunucu yanıt gecikmesi")
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=0, help="continuationToken sayfa boyu (0 = tek sayfa)")
+    parser.add_argument('--throttle-every', type=int, default=0, help="Her N. isteğe 429 (0 = kapalı)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="503 dönen isteklerin oranı")
+    parser.add_argument('--requests-per-second', type=float, default=0.0, help="Client hız sınırı (0 = sınırsız)")
+    parser.add_argument('--max-calls-per-row', type=float, default=3.0)
+    parser.add_argument('--timeout', type=float, default=900.0, help="Boyut başına en uzun süre (sn)")
+    parser.add_argument('--json', help="Sonuçların yazılacağı JSON dosyası")
+    # Alt süreç argümanları
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--server', help=argparse.SUPPRESS)
+    parser.add_argument('--input', help=argparse.SUPPRESS)
+    parser.add_argument('--work-dir', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return worker(args)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    server = FakeAzureDevOps(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                             page_size=args.page_size, throttle_every=args.throttle_every,
+                             failure_rate=args.failure_rate)
+    results, failures = [], []
+    with server:
+        print(f"🧪 Yerel sunucu: {server.url} (gecikme {args.latency_ms:g} ms, sayfa {args.page_size}, "
+              f"429 her {args.throttle_every or '-'}, hata oranı {args.failure_rate:g})")
+        print(f"{'Satır':>8} {'Süre (sn)':>10} {'Satır/sn':>10} {'Çağrı/satır':>12} {'Sunucu':>8} {'RSS (MB)':>9}")
+        for rows in sizes:
+            measured = run_size(server, rows, args)
+            results.append(measured)
+            if 'error' in measured:
+                print(f"{rows:>8} {'-':>10}", flush=True)
+                failures.append(f"{rows} satır: {measured['error']}")
+                continue
+            calls = measured['calls'] if measured['calls'] is not None else measured['server_requests']
+            measured['calls_per_row'] = calls / rows if rows else 0.0
+            rate = measured['rows'] / measured['seconds'] if measured['seconds'] else 0.0
+            rss = f"{measured['peak_mb']:.1f}" if measured['peak_mb'] is not None else '-'
+            print(f"{rows:>8} {measured['seconds']:>10.2f} {rate:>10.0f} {measured['calls_per_row']:>12.2f} "
+                  f"{measured['server_requests']:>8} {rss:>9}", flush=True)
+
+            if measured['rows'] != rows:
+                failures.append(f"{rows} satır: {measured['rows']} satır işlendi")
+            if not measured['report']:
+                failures.append(f"{rows} satır: rapor oluşturulamadı")
+            if measured['calls_per_row'] > args.max_calls_per_row:
+                failures.append(f"{rows} satır: satır başına {measured['calls_per_row']:.2f} çağrı "
+                                f"(sınır {args.max_calls_per_row})")
+            if not args.throttle_every and not args.failure_rate and not measured['success']:
+                failures.append(f"{rows} satır: iş başarısız bitti")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 Sonuçlar: {args.json}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Tüm boyutlar sınır içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
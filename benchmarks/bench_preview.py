@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Girdi önizlemesi kıyaslaması
+Büyük bir girdi dosyası (varsayılan 200k satır CSV) üretir ve RowPreview ile ilk sayfanın
+açılma süresini, dosyanın sonuna kadar kaydırırken Python bellek tepe değerini
+(tracemalloc) ve bellekte tutulan satır sayısının sayfa önbelleğiyle sınırlı kaldığını ölçer.
+
+Kullanım:
+    python benchmarks/bench_preview.py [--rows 200000] [--format csv|xlsx] [--max-first-page 1.5] [--max-memory-mb 40]
+
+Çıkış kodu: 0 = süre ve bellek sınır içinde, 1 = aksi halde
+"""
+
+import os
+import csv
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.excel_processor import ExcelProcessor
+from core.row_preview import RowPreview, FILTER_ERRORS
+
+HEADER = ['User Email', 'Action', 'Team Name', 'Role', 'License Type']
+
+
+def sample_rows(count):
+    for i in range(count):
+        # Her 1000 satırdan biri geçersiz email
+        email = f"user{i}@company.com" if i % 1000 else f"invalid-user-{i}"
+        yield [email, 'Add', f"Team {i % 40}", 'Member', 'stakeholder']
+
+
+def write_input(path, input_format, rows):
+    if input_format == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            writer.writerows(sample_rows(rows))
+    else:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(HEADER)
+        for row in sample_rows(rows):
+            sheet.append(row)
+        workbook.save(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Girdi önizlemesi kıyaslaması")
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv')
+    parser.add_argument('--max-first-page', type=float, default=1.5,
+                        help="İlk sayfa için izin verilen en uzun süre (sn, pandas/openpyxl importu dahil)")
+    parser.add_argument('--max-memory-mb', type=float, default=40.0,
+                        help="Dosyanın sonuna kadar kaydırırken izin verilen en yüksek Python bellek artışı (MB)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"preview.{args.format}")
+        write_input(path, args.format, args.rows)
+
+        # Okuyucuların log çıktıları ölçümü kirletmesin
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            preview = RowPreview(ExcelProcessor(), path)
+            first_page = preview.fetch_more()
+            first_page_seconds = time.perf_counter() - start
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            while preview.fetch_more():
+                pass
+            scroll_seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            cached_rows = preview.cached_rows
+            loaded_rows = preview.loaded_rows
+            error_rows = preview.error_rows
+
+            start = time.perf_counter()
+            middle = preview.row(loaded_rows // 2)
+            jump_seconds = time.perf_counter() - start
+
+            preview.set_filter(FILTER_ERRORS)
+            preview.fetch_more()
+            filtered = preview.loaded_rows
+            preview.close()
+
+    peak_mb = peak / 1024 / 1024
+    cache_limit = preview.page_size * preview.max_cached_pages
+    expected_errors = sum(1 for i in range(args.rows) if i % 1000 == 0)
+    print(f"{args.rows} satır ({args.format})")
+    print(f"  ilk sayfa     : {first_page_seconds * 1000:8.1f} ms ({first_page} satır)")
+    print(f"  sona kaydırma : {scroll_seconds * 1000:8.1f} ms, en yüksek bellek {peak_mb:.2f} MB")
+    print(f"  bellekteki    : {cached_rows} satır (sınır {cache_limit})")
+    print(f"  ortaya atlama : {jump_seconds * 1000:8.1f} ms (satır {middle.row if middle else '-'})")
+    print(f"  hatalı süzgeç : {filtered} satır")
+
+    failures = []
+    if first_page_seconds > args.max_first_page:
+        failures.append(f"İlk sayfa {first_page_seconds:.2f} sn (sınır {args.max_first_page} sn)")
+    if peak_mb > args.max_memory_mb:
+        failures.append(f"Kaydırma sırasında bellek {peak_mb:.2f} MB (sınır {args.max_memory_mb} MB)")
+    if cached_rows > cache_limit:
+        failures.append(f"Bellekte {cached_rows} satır tutuluyor (sınır {cache_limit})")
+    if loaded_rows != args.rows or error_rows != expected_errors or filtered != expected_errors:
+        failures.append("Satır veya hata sayıları uyuşmuyor")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Önizleme süre ve bellek sınırları içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profil modu kıyaslaması
+Pipeline'ı (JobQueue -> bölümleme -> BatchRunner) soket açmayan sahte taşıyıcı
+(fake_azure_devops.RecordingTransport) ve sunucu gecikmesiyle profil modu kapalı ve açık
+olarak çalıştırır. Profil modunun süre maliyetini, kapalı aşama ölçümünün çağrı başına
+maliyetini ölçer; raporun yanına yazılan katlanmış yığın (.folded) dosyasının flamegraph
+biçiminde olduğunu ve tüm aşamaların (parse, bootstrap, invite, team_add, propagation_wait,
+report) ölçüldüğünü doğrular.
+
+Girdinin dörtte biri organizasyonda olmayan (davet edilen) kullanıcılardır; davet sonrası
+yayılma beklemeleri ve bekleyen davetlerin en uzun bekleme süresi 1/1000 ölçeğindedir.
+
+Kullanım:
+    python benchmarks/bench_profiler.py [--rows 400] [--latency-ms 2] [--max-overhead 0.15]
+                                        [--max-disabled-us 1] [--keep sonuc_dizini]
+
+Çıkış kodu: 0 = maliyetler sınır içinde ve profil çıktıları doğru, 1 = aksi halde
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core import log as azdo_log
+from core import profiler
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.excel_processor import ExcelProcessor
+from core.job_queue import JobQueue, ClientPool
+from core.method_learner import MethodLearner
+from core.run_estimator import RunEstimator
+
+TEAMS = 10
+PROPAGATION_SCALE = 0.001
+FOLDED_LINE = re.compile(r'^(\S[^\n]*) (\d+)$')
+
+
+def write_input(path: str, rows: int):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['User Email', 'Action', 'Team Name'])
+        for i in range(rows):
+            writer.writerow([f"user{i}@company.com", 'remove' if i % 5 == 0 else 'add', f"Team {i % TEAMS}"])
+
+
+def run_pipeline(path: str, rows: int, directory: str, latency: float, profiling: bool):
+    """Pipeline'ı bir kez çalıştır; (süre sn, iş) döndürür"""
+    os.makedirs(directory, exist_ok=True)
+    existing = [f"user{i}@company.com" for i in range(rows) if i % 4]
+    organization = FakeOrganization(TEAMS, existing)
+    for i in range(0, rows, 5):
+        organization.add_member(f"team-{i % TEAMS}", f"user{i}@company.com")
+    transport = RecordingTransport(FakeAzureDevOps(organization, latency=latency))
+    learner = MethodLearner(os.path.join(directory, 'method_order.json'))
+
+    def make_client(organization_url, project_name, pat_token):
+        client = AzureDevOpsRESTClient(organization_url, project_name, pat_token,
+                                       requests_per_second=0, method_learner=learner)
+        sleep = client._sleep
+        wait = client.wait_for_pending_invitations
+        client._sleep = lambda seconds: sleep(seconds * PROPAGATION_SCALE)
+        client.wait_for_pending_invitations = lambda max_wait_time=30: wait(max_wait_time * PROPAGATION_SCALE)
+        return transport.attach(client)
+
+    queue = JobQueue(ClientPool(make_client), estimator=RunEstimator(os.path.join(directory, 'run_history.json')),
+                     metrics_dir='', profiling=profiling)
+    job = queue.submit(path, f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat')
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        queue.run_job(queue.next_job(), ExcelProcessor())
+        elapsed = time.perf_counter() - start
+        job.report_path = job.runner.generate_excel_report(directory)
+    return elapsed, job
+
+
+def check_profile(job) -> list:
+    """Raporun yanına yazılan profil dosyalarını doğrula; hata mesajlarını döndür"""
+    errors = []
+    folded_path = job.runner.profile_path
+    if not job.report_path or not folded_path:
+        return [f"Profil yazılmadı (rapor: {job.report_path}, profil: {folded_path})"]
+    if os.path.dirname(folded_path) != os.path.dirname(job.report_path):
+        errors.append(f"Profil raporun yanında değil: {folded_path}")
+
+    with open(folded_path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    bad = [line for line in lines if not FOLDED_LINE.match(line)]
+    if not lines or bad:
+        errors.append(f"Katlanmış yığın biçimi hatalı ({len(lines)} satır, {len(bad)} hatalı): {bad[:1]}")
+    if not any(';[team_add];' in line for line in lines):
+        errors.append("Örneklerde [team_add] aşaması görünmüyor")
+
+    with open(os.path.splitext(folded_path)[0] + '.json', encoding='utf-8') as f:
+        stages = json.load(f)['stages']
+    for name in ('parse', 'bootstrap', 'invite', 'team_add', 'propagation_wait', 'report'):
+        if not stages.get(name, {}).get('count'):
+            errors.append(f"'{name}' aşaması ölçülmedi")
+    return errors
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Profil modu kıyaslaması")
+    parser.add_argument('--rows', type=int, default=400)
+    parser.add_argument('--latency-ms', type=float, default=2.0, help="Sahte sunucu yanıt gecikmesi")
+    parser.add_argument('--max-overhead', type=float, default=0.15,
+                        help="Profil modunun en fazla göreli süre maliyeti (0.15 = %%15)")
+    parser.add_argument('--max-disabled-us', type=float, default=1.0,
+                        help="Kapalı aşama ölçümünün çağrı başına en fazla maliyeti (µs)")
+    parser.add_argument('--keep', help="Rapor ve profil dosyalarının kopyalanacağı dizin")
+    args = parser.parse_args(argv)
+    azdo_log.configure(log_file='', console=False)
+
+    calls = 200000
+    start = time.perf_counter()
+    for _ in range(calls):
+        with profiler.DISABLED.stage('team_add'):
+            pass
+    disabled_us = (time.perf_counter() - start) / calls * 1e6
+
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'users.csv')
+        write_input(path, args.rows)
+        run_pipeline(path, args.rows, os.path.join(directory, 'warmup'), args.latency_ms / 1000, False)
+        off_seconds, _ = run_pipeline(path, args.rows, os.path.join(directory, 'off'), args.latency_ms / 1000, False)
+        on_seconds, job = run_pipeline(path, args.rows, os.path.join(directory, 'on'), args.latency_ms / 1000, True)
+        overhead = on_seconds / off_seconds - 1 if off_seconds else 0.0
+
+        print(f"Profil kapalı: {off_seconds:.2f} sn, açık: {on_seconds:.2f} sn (maliyet {overhead:+.1%}), "
+              f"{job.profile.sample_count} örnek, {len(job.profile.samples)} farklı yığın")
+        print(f"Kapalı aşama ölçümü: {disabled_us:.3f} µs/çağrı")
+        for name, values in job.profile.stages().items():
+            print(f"  {name:<17} {values['seconds']:>8.3f} sn {values['count']:>7} kez")
+
+        failures.extend(check_profile(job))
+        if job.rows_done != args.rows:
+            failures.append(f"{job.rows_done}/{args.rows} satır işlendi")
+        if overhead > args.max_overhead:
+            failures.append(f"Profil modu maliyeti {overhead:.1%} (sınır {args.max_overhead:.0%})")
+        if disabled_us > args.max_disabled_us:
+            failures.append(f"Kapalı aşama ölçümü {disabled_us:.3f} µs (sınır {args.max_disabled_us} µs)")
+
+        if args.keep and job.runner.profile_path:
+            os.makedirs(args.keep, exist_ok=True)
+            base = os.path.splitext(job.runner.profile_path)[0]
+            for source in (job.report_path, job.runner.profile_path, base + '.json'):
+                shutil.copy(source, args.keep)
+            print(f"💾 Rapor ve profil: {args.keep}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Profil modu maliyeti sınır içinde, profil çıktıları doğru")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İlerleme kısıcısı kıyaslaması
+Birden fazla thread'den (paralel bölümler gibi) satır başına ilerleme ve durum olayı üretir.
+Olay başına maliyeti, iletilen güncelleme sayısının saniyedeki sınırı aşmadığını ve flush
+sonrası son güncellemenin gerçek son durumu taşıdığını kontrol eder.
+
+Kullanım:
+    python benchmarks/bench_progress_throttle.py [--threads 4] [--events 50000] [--rate 10]
+
+Çıkış kodu: 0 = sınırlar içinde ve son durum doğru, 1 = aksi halde
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.progress_throttle import ProgressThrottle
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="İlerleme kısıcısı kıyaslaması")
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--events', type=int, default=50000, help="Thread başına satır sayısı")
+    parser.add_argument('--rate', type=float, default=10.0, help="Saniyedeki en fazla güncelleme")
+    parser.add_argument('--max-event-us', type=float, default=20.0,
+                        help="Olay başına izin verilen en yüksek ortalama maliyet (mikrosaniye)")
+    args = parser.parse_args(argv)
+
+    updates = []
+    throttle = ProgressThrottle(updates.append, args.rate)
+    total = args.threads * args.events
+    counter_lock = threading.Lock()
+    done = [0]
+
+    def partition(index):
+        for i in range(args.events):
+            with counter_lock:
+                done[0] += 1
+                current = done[0]
+            throttle.status(f"Bölüm {index}: satır {i + 1} işleniyor")
+            throttle.progress(current, total)
+
+    workers = [threading.Thread(target=partition, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    throttle.flush()
+    elapsed = time.perf_counter() - start
+
+    events = throttle.received
+    per_event_us = elapsed / events * 1e6
+    # İlk olay hemen iletilir, flush bir tane daha ekler
+    allowed = int(elapsed * args.rate) + 2
+    last = updates[-1]
+    print(f"{args.threads} thread x {args.events} satır = {events} olay")
+    print(f"  süre          : {elapsed:.2f} sn ({per_event_us:.2f} µs/olay)")
+    print(f"  iletilen      : {throttle.delivered} güncelleme (izin verilen {allowed})")
+    print(f"  son güncelleme: {last.summary()} (final={last.final})")
+
+    failures = []
+    if throttle.delivered > allowed:
+        failures.append(f"{throttle.delivered} güncelleme iletildi (en fazla {allowed})")
+    if not last.final or last.current != total or last.total != total:
+        failures.append("Son güncelleme gerçek son durumu taşımıyor")
+    if per_event_us > args.max_event_us:
+        failures.append(f"Olay başına {per_event_us:.2f} µs (sınır {args.max_event_us} µs)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ İlerleme güncellemeleri sınır içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapor yazıcısı kıyaslaması
+ReportWriter'a çok sayıda satır ekler; ekleme sırasında Python bellek kullanımının satır
+sayısından bağımsız kaldığını (tracemalloc), özetlerin sayaçlardan geldiğini ve Excel
+raporunun yazılma süresini ölçer.
+
+Kullanım:
+    python benchmarks/bench_report_writer.py [--rows 100000] [--max-memory-mb 5]
+
+Çıkış kodu: 0 = bellek sınır içinde ve özetler doğru, 1 = aksi halde
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.report_writer import ReportWriter
+
+STATUSES = ['BAŞARILI', 'BAŞARILI', 'BAŞARILI', 'BAŞARISIZ', 'HATA']
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Akış halinde rapor yazıcısı kıyaslaması")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--max-memory-mb', type=float, default=5.0,
+                        help="Satır ekleme sırasında izin verilen en yüksek Python bellek artışı (MB)")
+    args = parser.parse_args(argv)
+
+    report = ReportWriter()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(args.rows):
+        status = STATUSES[i % len(STATUSES)]
+        report.add(f"user{i}@company.com", f"Team {i % 40}", 'Member', 'add', status,
+                   '' if status == 'BAŞARILI' else 'API işlemi başarısız')
+    add_seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report.close()
+
+    start = time.perf_counter()
+    summary = dict(report.summary_rows())
+    summary_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        report.write_excel(os.path.join(directory, 'report.xlsx'))
+        excel_seconds = time.perf_counter() - start
+
+    peak_mb = peak / 1024 / 1024
+    print(f"{args.rows} satır")
+    print(f"  ekleme   : {add_seconds * 1000:8.1f} ms (tracemalloc açık), en yüksek bellek {peak_mb:.2f} MB")
+    print(f"  özet     : {summary_seconds * 1000:8.3f} ms")
+    print(f"  Excel    : {excel_seconds * 1000:8.1f} ms")
+
+    failures = []
+    expected_success = sum(1 for i in range(args.rows) if STATUSES[i % len(STATUSES)] == 'BAŞARILI')
+    if summary['Toplam İşlem Sayısı'] != args.rows or summary['Başarılı İşlemler'] != expected_success:
+        failures.append("Özet sayaçları eklenen satırlarla uyuşmuyor")
+    if peak_mb > args.max_memory_mb:
+        failures.append(f"Ekleme sırasında bellek {peak_mb:.2f} MB (sınır {args.max_memory_mb} MB)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Bellek sınır içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Satır kaydı bellek/erişim kıyaslaması
+100.000 satırı eski satır başına sözlük biçiminde ve UserRow olarak tutmanın bellek
+maliyetini (tracemalloc) ve gruplama + işleme geçişlerinin alan erişim süresini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_row_memory.py [--rows 100000] [--max-ratio 0.6]
+
+Çıkış kodu: 0 = UserRow belleği sözlüklerin max-ratio katının altında, 1 = aksi halde
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.user_row import UserRow
+
+
+def build_values(rows: int):
+    return [(f"user{i}@company.com", 'add' if i % 5 else 'remove', f"Team {i % 40}", 'Member',
+             'stakeholder', '', f"Project {i % 4}", i + 2, '') for i in range(rows)]
+
+
+def as_dicts(values):
+    return [{'User Email': email, 'Action': action, 'Team Name': team, 'Role': role,
+             'License Type': license_type, 'Organization': organization, 'Project': project,
+             'Row': row, 'Error': error}
+            for email, action, team, role, license_type, organization, project, row, error in values]
+
+
+def as_rows(values):
+    return list(map(UserRow._make, values))
+
+
+def measure(build, values):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = build(values)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return rows, size
+
+
+def dict_passes(rows):
+    """Eski akış: gruplama ve işleme geçişlerinde alanlar her seferinde strip/lower edilir"""
+    adds = 0
+    for user in rows:
+        if user.get('User Email', '').strip() and user.get('Team Name', '').strip() and \
+                user.get('Action', 'add').strip().lower() == 'add':
+            adds += 1
+    for user in rows:
+        key = (user.get('User Email', '').strip().lower(), user.get('Team Name', '').strip().lower(),
+               user.get('Role', 'Member').strip(), user.get('Action', 'add').strip().lower())
+    return adds
+
+
+def row_passes(rows):
+    adds = 0
+    for user in rows:
+        if user.email and user.team and user.action == 'add':
+            adds += 1
+    for user in rows:
+        key = (user.email, user.team.lower(), user.role, user.action)
+    return adds
+
+
+def timed(func, rows):
+    start = time.perf_counter()
+    result = func(rows)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="UserRow ve satır başına sözlük kıyaslaması")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--max-ratio', type=float, default=0.6,
+                        help="UserRow belleğinin sözlük belleğine izin verilen en yüksek oranı")
+    args = parser.parse_args(argv)
+
+    values = build_values(args.rows)
+    dicts, dict_bytes = measure(as_dicts, values)
+    rows, row_bytes = measure(as_rows, values)
+    dict_adds, dict_seconds = timed(dict_passes, dicts)
+    row_adds, row_seconds = timed(row_passes, rows)
+
+    ratio = row_bytes / dict_bytes
+    print(f"{args.rows} satır")
+    print(f"  dict    : {dict_bytes / 1024 / 1024:7.1f} MB, {dict_bytes / args.rows:6.0f} B/satır, "
+          f"geçişler {dict_seconds * 1000:7.1f} ms")
+    print(f"  UserRow : {row_bytes / 1024 / 1024:7.1f} MB, {row_bytes / args.rows:6.0f} B/satır, "
+          f"geçişler {row_seconds * 1000:7.1f} ms")
+    print(f"  bellek oranı {ratio:.2f}, erişim {dict_seconds / row_seconds:.1f}x hızlı")
+
+    failures = []
+    if dict_adds != row_adds:
+        failures.append("İki biçim farklı sayıda ekleme satırı üretti")
+    if ratio > args.max_ratio:
+        failures.append(f"UserRow belleği sözlüklerin {ratio:.2f} katı (izin verilen {args.max_ratio})")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Bütçe içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Açılış süresi bütçesi
+Temiz bir Python sürecinde uygulama açılışını ölçer:
+  1. Pencerenin ihtiyaç duyduğu core modüllerin import süresi; pandas, openpyxl ve HTTP
+     katmanının (requests) bu aşamada yüklenmediği doğrulanır.
+  2. PyQt5 yüklüyse ana pencerenin (offscreen) ilk gösterilmesine kadar geçen süre.
+
+Kullanım:
+    python benchmarks/bench_startup.py [--core-budget 0.3] [--window-budget 2.0]
+
+Çıkış kodu: 0 = bütçe içinde, 1 = bütçe aşıldı veya ağır modül erken yüklendi
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Açılışta yüklenmemesi gereken modüller
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'requests', 'urllib3']
+
+CORE_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from core.config_manager import ConfigManager
+from core.excel_processor import ExcelProcessor
+from core.job_queue import JobQueue, ClientPool
+ExcelProcessor()
+JobQueue(ClientPool())
+print(json.dumps({{'seconds': time.perf_counter() - start,
+                  'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+WINDOW_PROBE = """
+import sys, time, json, io, contextlib
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+with contextlib.redirect_stdout(io.StringIO()):
+    from PyQt5.QtWidgets import QApplication
+    from gui.main_window import MainWindow
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+print(json.dumps({{'seconds': time.perf_counter() - start,
+                  'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_probe(code: str, env=None) -> dict:
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=ROOT, env=env, timeout=120)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "probe başarısız")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def pyqt_available() -> bool:
+    result = subprocess.run([sys.executable, '-c', 'import PyQt5.QtWidgets'], capture_output=True)
+    return result.returncode == 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Uygulama açılış süresi bütçesi")
+    parser.add_argument('--core-budget', type=float, default=0.3, help="Core import bütçesi (sn)")
+    parser.add_argument('--window-budget', type=float, default=2.0, help="İlk pencereye kadar bütçe (sn)")
+    args = parser.parse_args(argv)
+
+    failures = []
+
+    core = run_probe(CORE_PROBE.format(root=ROOT, heavy=HEAVY_MODULES))
+    print(f"  core import  : {core['seconds'] * 1000:8.1f} ms, erken yüklenen: {core['loaded'] or '-'}")
+    if core['seconds'] > args.core_budget:
+        failures.append(f"Core import {core['seconds']:.3f} sn (bütçe {args.core_budget} sn)")
+    if core['loaded']:
+        failures.append(f"Açılışta ağır modül yüklendi: {', '.join(core['loaded'])}")
+
+    if pyqt_available():
+        env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+        window = run_probe(WINDOW_PROBE.format(root=ROOT, heavy=HEAVY_MODULES), env=env)
+        print(f"  ilk pencere  : {window['seconds'] * 1000:8.1f} ms, erken yüklenen: {window['loaded'] or '-'}")
+        if window['seconds'] > args.window_budget:
+            failures.append(f"İlk pencere {window['seconds']:.3f} sn (bütçe {args.window_budget} sn)")
+        if window['loaded']:
+            failures.append(f"Pencere açılırken ağır modül yüklendi: {', '.join(window['loaded'])}")
+    else:
+        print("⏭️ PyQt5 yüklü değil, ilk pencere ölçümü atlanıyor")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Açılış bütçe içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
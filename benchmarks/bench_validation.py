@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Excel doğrulama kıyaslaması
+100.000 satırlık bellek içi tabloyu ExcelProcessor.validate_data ve read_excel'in
+sütun bazlı doğrulama adımıyla kontrol eder. Tüm hatalı satırların bulunduğunu ve
+sürenin bütçe içinde kaldığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_validation.py [--rows 100000] [--budget 0.5]
+
+Çıkış kodu: 0 = bütçe içinde ve tüm hatalar bulundu, 1 = aksi halde
+"""
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from core.excel_processor import ExcelProcessor
+
+
+ROLES = ('Member', 'admin', 'READER', 'Contributor')  # Geçerli roller büyük/küçük harf duyarsız
+
+
+def invalid_role(i: int) -> bool:
+    return i % 300 == 50
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    """Her 100 satırdan birinde geçersiz email, her 250 satırdan birinde geçersiz işlem,
+    her 300 satırdan birinde geçersiz rol olan tablo"""
+    emails = [f"user{i}@company.com" if i % 100 else f"user{i}-company.com" for i in range(rows)]
+    actions = ['add' if i % 250 else 'invite' for i in range(rows)]
+    return pd.DataFrame({
+        'User Email': emails,
+        'Action': actions,
+        'Team Name': [f"Team {i % 40}" for i in range(rows)],
+        'Role': ['Owner' if invalid_role(i) else ROLES[i % len(ROLES)] for i in range(rows)],
+    })
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sütun bazlı Excel doğrulama kıyaslaması")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--budget', type=float, default=0.5, help="Doğrulama başına izin verilen süre (sn)")
+    args = parser.parse_args(argv)
+
+    df = build_frame(args.rows)
+    invalid_email = sum(1 for i in range(args.rows) if i % 100 == 0)
+    invalid_action = sum(1 for i in range(args.rows) if i % 250 == 0 and i % 100 != 0)
+    processor = ExcelProcessor()
+
+    errors, validate_seconds = timed(processor.validate_data, df)
+    # validate_data email hatalı satırda işlemi de ayrıca raporlar; rol yalnızca ekleme satırında denetlenir
+    expected_validate = invalid_email + sum(1 for i in range(args.rows) if i % 250 == 0) + \
+        sum(1 for i in range(args.rows) if invalid_role(i) and i % 250)
+
+    frame, read_seconds = timed(processor._user_frame, df)
+    row_errors = int((frame['error'] != '').sum())
+    # Satır başına tek hata: email, işlem, rol sırasıyla
+    expected_read = invalid_email + invalid_action + \
+        sum(1 for i in range(args.rows) if invalid_role(i) and i % 100 and i % 250)
+
+    print(f"{args.rows} satır")
+    print(f"  validate_data : {validate_seconds * 1000:8.1f} ms, {len(errors)} hata (beklenen {expected_validate})")
+    print(f"  read_excel    : {read_seconds * 1000:8.1f} ms, {row_errors} hatalı satır (beklenen {expected_read})")
+
+    failures = []
+    if len(errors) != expected_validate:
+        failures.append("validate_data tüm hataları bulamadı")
+    if row_errors != expected_read:
+        failures.append("read_excel doğrulaması tüm hatalı satırları bulamadı")
+    for name, seconds in (('validate_data', validate_seconds), ('read_excel', read_seconds)):
+        if seconds > args.budget:
+            failures.append(f"{name} {seconds:.3f} sn sürdü (bütçe {args.budget} sn)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Bütçe içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
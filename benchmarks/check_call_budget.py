@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API çağrı bütçesi regresyon testi
+Satır işleme pipeline'ını (ExcelProcessor akışı + BatchRunner) soket açmayan, her çağrıyı
+kaydeden sahte bir taşıyıcı (fake_azure_devops.RecordingTransport) üzerinden senaryo senaryo
+çalıştırır ve her senaryonun toplam HTTP çağrısını bütçesiyle karşılaştırır. Bir değişiklik
+herhangi bir senaryoyu pahalılaştırırsa çıkış kodu 1 olur (CI'da çalıştırılır).
+
+Senaryolar --rows satırlıktır; bütçe = sabit maliyet (bağlantı testi, ön yükleme) + girdide geçen
+takım başına maliyet + satır başına maliyet. Takım başına maliyetler sabittir: bir takımın üye listesi
+ya da descriptor'ı satır sayısından bağımsız olarak bir kez indirilir. Çağrılar _send düzeyinde
+sayılır; 429 sonrası yeniden gönderimler de bütçeye dahildir. Aynı kontrol tests/test_call_budget.py
+ile pytest altında da çalışır.
+
+Kullanım:
+    python benchmarks/check_call_budget.py [--rows 20] [--scenario existing_user] [--verbose]
+
+Çıkış kodu: 0 = tüm senaryolar bütçe içinde, 1 = aksi halde
+"""
+
+import os
+import sys
+import csv
+import argparse
+import tempfile
+import contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core import log as azdo_log
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.batch_runner import BatchRunner
+from core.excel_processor import ExcelProcessor
+from core.method_learner import MethodLearner
+
+TEAMS = 10
+
+# Senaryo -> (sabit çağrı, takım başına çağrı, satır başına çağrı) üst sınırı; sabit kısım bağlantı
+# testi, takım ve organizasyon üyesi ön yüklemesini (3 çağrı) içerir
+BUDGETS = {
+    'new_user': (4, 1, 2),       # Proje ID'si bir kez; takım üyeleri bir kez; satır başına davet + ekleme
+    'existing_user': (3, 1, 1),  # Takım üyeleri bir kez; satır başına ekleme
+    'repeated_team': (3, 1, 1),  # Tek takım: üye listesi bir kez indirilir
+    'unknown_team': (11, 0, 0),  # Proje + Graph grupları bir kez; desteklenmeyen 2 yöntem en fazla 3'er kez
+    'removal': (3, 1, 1),        # Takım başına descriptor; satır başına üyelik silme (üye listesi gerekmez)
+}
+
+
+def scenario_rows(name: str, rows: int):
+    """Senaryonun (organizasyonda önceden bulunanlar, takım üyelikleri, girdi satırları)"""
+    emails = [f"user{i}@company.com" for i in range(rows)]
+    if name == 'new_user':
+        return [], [], [(email, 'add', f"Team {i % TEAMS}") for i, email in enumerate(emails)]
+    if name == 'existing_user':
+        return emails, [], [(email, 'add', f"Team {i % TEAMS}") for i, email in enumerate(emails)]
+    if name == 'repeated_team':
+        return emails, [], [(email, 'add', "Team 0") for email in emails]
+    if name == 'unknown_team':
+        return emails, [], [(email, 'add', "Olmayan Takım") for email in emails]
+    if name == 'removal':
+        members = [(f"team-{i % TEAMS}", email) for i, email in enumerate(emails)]
+        return emails, members, [(email, 'remove', f"Team {i % TEAMS}") for i, email in enumerate(emails)]
+    raise ValueError(name)
+
+
+def scenario_teams(name: str, rows: int) -> int:
+    """Senaryo girdisinde geçen, projede bulunan takım sayısı"""
+    _, _, input_rows = scenario_rows(name, rows)
+    known = {f"Team {i}" for i in range(TEAMS)}
+    return len({team for _, _, team in input_rows if team in known})
+
+
+def budget(name: str, rows: int) -> int:
+    fixed, per_team, per_row = BUDGETS[name]
+    return fixed + per_team * scenario_teams(name, rows) + per_row * rows
+
+
+def run_scenario(name: str, rows: int, directory: str):
+    """Senaryoyu çalıştır; (endpoint -> çağrı sayısı, işlenen satır, başarılı satır) döndürür"""
+    existing, members, input_rows = scenario_rows(name, rows)
+    organization = FakeOrganization(TEAMS, existing)
+    for team_id, email in members:
+        organization.add_member(team_id, email)
+    transport = RecordingTransport(FakeAzureDevOps(organization))
+
+    path = os.path.join(directory, f"{name}.csv")
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['User Email', 'Action', 'Team Name'])
+        writer.writerows(input_rows)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        client = AzureDevOpsRESTClient(f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat',
+                                       requests_per_second=0,
+                                       method_learner=MethodLearner(os.path.join(directory, f"{name}.json")))
+        transport.attach(client)
+        client._sleep = lambda seconds: None  # Davet sonrası yayılma beklemeleri çağrı sayısını etkilemez
+        runner = BatchRunner(path, client, ExcelProcessor())
+        runner.run()
+    return transport.counts(), runner._rows_done, runner._success_count
+
+
+def check(name: str, counts, rows_done: int, rows: int) -> list:
+    """Senaryo sonucunu bütçesiyle karşılaştır; hata mesajlarını döndürür"""
+    failures = []
+    fixed, per_team, per_row = BUDGETS[name]
+    limit = budget(name, rows)
+    calls = sum(counts.values())
+    if calls > limit:
+        failures.append(f"{name}: {calls} çağrı (bütçe {fixed} + {per_team} x {scenario_teams(name, rows)} takım "
+                        f"+ {per_row} x {rows} satır = {limit})")
+    if rows_done != rows:
+        failures.append(f"{name}: {rows_done}/{rows} satır işlendi")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="API çağrı bütçesi regresyon testi")
+    parser.add_argument('--rows', type=int, default=20, help="Senaryo başına satır")
+    parser.add_argument('--scenario', choices=sorted(BUDGETS), action='append',
+                        help="Yalnızca bu senaryo(lar)ı çalıştır")
+    parser.add_argument('--verbose', action='store_true', help="Endpoint başına çağrıları her zaman göster")
+    args = parser.parse_args(argv)
+    azdo_log.configure(log_file='', console=False)  # Bilinen takım hataları çıktıyı kirletmesin
+
+    failures = []
+    print(f"{'Senaryo':<15} {'Çağrı':>6} {'Bütçe':>6} {'Satır başına':>13} {'Başarılı':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.scenario or list(BUDGETS):
+            counts, rows_done, succeeded = run_scenario(name, args.rows, directory)
+            calls = sum(counts.values())
+            errors = check(name, counts, rows_done, args.rows)
+            print(f"{name:<15} {calls:>6} {budget(name, args.rows):>6} {calls / args.rows:>13.2f} "
+                  f"{succeeded:>5}/{rows_done:<3} {'❌' if errors else '✅'}")
+            if errors or args.verbose:
+                for endpoint, count in counts.most_common():
+                    print(f"    {endpoint:<28} {count:>6}")
+            failures.extend(errors)
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Tüm senaryolar çağrı bütçesi içinde")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yerel Azure DevOps taklidi
+Client'ın kullandığı endpoint'leri (projeler, takımlar, takım üyeleri, userentitlements,
+Graph grupları, descriptor'lar ve üyelikler) bellekteki bir organizasyon üzerinden yanıtlayan
+küçük bir HTTP sunucusu. Gecikme, sayfalama, kısıtlama (429) ve hata enjeksiyonu ayarlanabilir;
+kıyaslama betikleri gerçek organizasyona dokunmadan tüm HTTP yolunu (oturum, hız sınırı,
+yeniden deneme) çalıştırmak için kullanır.
+
+Client URL'leri dev.azure.com / vsaex.dev.azure.com / vssps.dev.azure.com'a sabit olduğundan
+redirect(client, server.url) client'ın _send'ini yerel sunucuya yönlendirir. Soket açmadan
+aynı sunucu mantığını kullanmak ve çağrıları kaydetmek için RecordingTransport kullanılır;
+kayıt _send düzeyinde yapılır, 429 sonrası yeniden gönderimler de ayrı çağrı sayılır.
+
+Kullanım (tek başına):
+    python benchmarks/fake_azure_devops.py [--port 8080] [--teams 40] [--users 1000] [--latency-ms 20]
+                                          [--page-size 0] [--throttle-every 0] [--failure-rate 0]
+
+Çıkış kodu: 0 = Ctrl+C ile durduruldu
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+
+ORGANIZATION = 'bench'
+PROJECT = 'Project'
+PROJECT_ID = '00000000-0000-0000-0000-00000000b001'
+
+# Gerçek API'de takım/proje listeleri ve takım üyeleri varsayılan olarak 100'lük sayfalar döner ($top)
+DEFAULT_TOP = 100
+
+# Client'ın kullandığı sabit host'lar -> yerel sunucudaki önekler
+HOSTS = (
+    ('https://vsaex.dev.azure.com/', '/vsaex/'),
+    ('https://vssps.dev.azure.com/', '/vssps/'),
+    ('https://dev.azure.com/', '/'),
+)
+
+
+def redirect(client, server_url: str):
+    """Client'ın isteklerini yerel sunucuya yönlendir (gerçek _send ve oturum kullanılmaya devam eder)"""
+    send = client._send
+    prefixes = [(host, server_url.rstrip('/') + prefix) for host, prefix in HOSTS]
+
+    def local_send(method, url, **kwargs):
+        for host, prefix in prefixes:
+            if url.startswith(host):
+                url = prefix + url[len(host):]
+                break
+        return send(method, url, **kwargs)
+
+    client._send = local_send
+    return client
+
+
+class FakeResponse:
+    """RecordingTransport yanıtı (client'ın kullandığı requests.Response alanları)"""
+
+    class Request:
+        def __init__(self, body):
+            self.body = body
+
+    def __init__(self, status_code: int, payload, headers: dict, body: bytes = None):
+        self.status_code = status_code
+        self.headers = headers
+        self._payload = payload
+        self._content = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.request = self.Request(body)
+
+    @property
+    def text(self) -> str:
+        return self._content.decode('utf-8')
+
+    def json(self):
+        if self._payload is None:
+            raise ValueError("Boş yanıt gövdesi")
+        return self._payload
+
+
+class RecordingTransport:
+    """Client isteklerini soket açmadan FakeAzureDevOps'a ileten ve her çağrıyı kaydeden taşıyıcı"""
+
+    def __init__(self, server=None):
+        self.server = server or FakeAzureDevOps()
+        self.calls = []  # (metod, endpoint etiketi, durum kodu)
+        self._lock = threading.Lock()
+
+    def attach(self, client):
+        """Client'ın _send'ini sunucuya bağla; yeniden denemeler dahil her HTTP isteği kaydedilir"""
+        def send(method, url, **kwargs):
+            for host, prefix in HOSTS:
+                if url.startswith(host):
+                    url = prefix + url[len(host):]
+                    break
+            body = json.dumps(kwargs['json']).encode('utf-8') if kwargs.get('json') is not None else None
+            status, payload, headers = self.server.handle(method, url, body)
+            endpoint, _ = self.server.route(method, urlsplit(url).path)
+            with self._lock:
+                self.calls.append((method, endpoint, status))
+            return FakeResponse(status, payload, headers, body)
+
+        client._send = send
+        return client
+
+    def counts(self) -> Counter:
+        """endpoint etiketi -> çağrı sayısı"""
+        with self._lock:
+            return Counter(endpoint for _, endpoint, _ in self.calls)
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+
+
+class FakeOrganization:
+    """Sunucunun yanıtladığı bellekteki organizasyon (thread-safe)"""
+
+    def __init__(self, teams: int = 40, users=(), groups: int = 5):
+        """
+        Args:
+            teams: Projedeki takım sayısı ('Team 0' ... )
+            users: Organizasyonda önceden bulunan kullanıcıların e-postaları
+            groups: Takım olmayan özel Graph grubu sayısı ('Group 0' ... )
+        """
+        self.lock = threading.Lock()
+        self.teams = [{'id': f'team-{i}', 'name': f'Team {i}', 'description': '',
+                       'descriptor': f'vssgp.team{i}'} for i in range(teams)]
+        self.teams_by_id = {team['id']: team for team in self.teams}
+        self.groups = [{'displayName': team['name'], 'principalName': f"[{PROJECT}]\\{team['name']}",
+                        'descriptor': team['descriptor'], 'originId': team['id']} for team in self.teams]
+        self.groups += [{'displayName': f'Group {i}', 'principalName': f'[{ORGANIZATION}]\\Group {i}',
+                         'descriptor': f'vssgp.group{i}', 'originId': f'group-{i}'} for i in range(groups)]
+        self.users = {}      # e-posta -> kullanıcı
+        self.members = {}    # takım id -> {e-posta: kullanıcı}
+        self.memberships = set()  # (kullanıcı descriptor, grup descriptor)
+        for email in users:
+            self.add_user(email)
+
+    def add_user(self, email: str) -> dict:
+        email = email.lower()
+        user = self.users.get(email)
+        if user is None:
+            number = len(self.users)
+            user = self.users[email] = {'id': f'user-{number}', 'descriptor': f'aad.user{number}',
+                                        'mailAddress': email, 'displayName': email.split('@')[0]}
+        return user
+
+    def add_member(self, team_id: str, email: str) -> bool:
+        team = self.teams_by_id.get(team_id)
+        if team is None:
+            return False
+        user = self.add_user(email)
+        self.members.setdefault(team_id, {})[user['mailAddress']] = user
+        self.memberships.add((user['descriptor'], team['descriptor']))
+        return True
+
+    def remove_membership(self, subject: str, container: str) -> bool:
+        if (subject, container) not in self.memberships:
+            return False
+        self.memberships.discard((subject, container))
+        for team in self.teams:
+            if team['descriptor'] == container:
+                members = self.members.get(team['id'], {})
+                for email, user in list(members.items()):
+                    if user['descriptor'] == subject:
+                        del members[email]
+        return True
+
+
+class FakeAzureDevOps:
+    """Ayarlanabilir gecikme, sayfalama, kısıtlama ve hata enjeksiyonlu yerel Azure DevOps sunucusu"""
+
+    def __init__(self, organization: FakeOrganization = None, latency: float = 0.0, jitter: float = 0.0,
+                 page_size: int = 0, throttle_every: int = 0, retry_after: float = 0.05,
+                 failure_rate: float = 0.0, seed: int = 0, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            organization: Yanıtlanacak organizasyon (varsayılan: 40 takımlı boş organizasyon)
+            latency: Her yanıttan önce beklenen süre (sn)
+            jitter: Gecikmeye eklenen rastgele süre üst sınırı (sn)
+            page_size: continuationToken ile sayfalanan listelerde (userentitlements, Graph) sayfa boyu
+                       (0 = tek sayfa); takım/proje/üye listeleri gerçek API gibi $top/$skip ile sayfalanır
+            throttle_every: Her N. isteğe 429 ve Retry-After döner (0 = kapalı)
+            retry_after: 429 yanıtlarındaki Retry-After (sn)
+            failure_rate: İsteklerin bu oranına 503 döner
+            seed: Hata enjeksiyonu ve gecikme için rastgele tohum
+            port: Dinlenecek port (0 = boş bir port)
+        """
+        self.organization = organization or FakeOrganization()
+        self.latency = latency
+        self.jitter = jitter
+        self.page_size = page_size
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.failure_rate = failure_rate
+        self.host = host
+        self.port = port
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self.total_requests = 0
+        self.requests = Counter()  # (metod, endpoint) -> istek
+        self.statuses = Counter()  # durum kodu -> yanıt
+        self.bytes_sent = 0
+
+        self._server = None
+        self._thread = None
+
+    def _bind(self) -> ThreadingHTTPServer:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # requests oturumu bağlantıyı yeniden kullanır
+            disable_nagle_algorithm = True  # Başlık ve gövde ayrı yazılır; gecikmeli ACK beklenmez
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, payload, headers = server.handle(self.command, self.path, body)
+                data = json.dumps(payload).encode('utf-8') if payload is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+                with server._count_lock:
+                    server.bytes_sent += len(data)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        http_server = ThreadingHTTPServer((self.host, self.port), Handler)
+        http_server.daemon_threads = True
+        return http_server
+
+    @property
+    def url(self) -> str:
+        """Sunucu adresi (start() sonrası)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """HTTP sunucusunu arka plan thread'inde başlat"""
+        self._server = self._bind()
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-azure-devops', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_counters(self):
+        with self._count_lock:
+            self.total_requests = 0
+            self.requests.clear()
+            self.statuses.clear()
+            self.bytes_sent = 0
+
+    def _count(self, method: str, endpoint: str, status: int):
+        with self._count_lock:
+            self.requests[(method, endpoint)] += 1
+            self.statuses[status] += 1
+
+    # ==================== YÖNLENDİRME ====================
+
+    ROUTES = [
+        ('GET', r'/[^/]+/_apis/projects', 'projects'),
+        ('GET', r'/[^/]+/_apis/projects/[^/]+', 'project'),
+        ('GET', r'/[^/]+/_apis/projects/[^/]+/teams', 'teams'),
+        ('GET', r'/[^/]+/_apis/projects/[^/]+/teams/(?P<team>[^/]+)', 'team'),
+        ('GET', r'/[^/]+/_apis/projects/[^/]+/teams/(?P<team>[^/]+)/members', 'team_members'),
+        ('POST', r'/[^/]+/_apis/teams/(?P<team>[^/]+)/members', 'team_member_add'),
+        ('PUT', r'/[^/]+/_apis/teams/(?P<team>[^/]+)/members/(?P<user>[^/]+)', 'team_member_add_by_id'),
+        ('GET', r'/vsaex/[^/]+/_apis/userentitlements', 'userentitlements'),
+        ('POST', r'/vsaex/[^/]+/_apis/userentitlements', 'userentitlements_add'),
+        ('GET', r'(/vssps)?/[^/]+/_apis/graph/groups', 'graph_groups'),
+        ('GET', r'/vssps/[^/]+/_apis/graph/descriptors/(?P<id>[^/]+)', 'graph_descriptors'),
+        ('GET', r'/vssps/[^/]+/_apis/graph/memberships', 'graph_memberships'),
+        ('PUT', r'/vssps/[^/]+/_apis/graph/memberships/(?P<subject>[^/]+)/(?P<container>[^/]+)', 'graph_membership_add'),
+        ('DELETE', r'/vssps/[^/]+/_apis/graph/memberships/(?P<subject>[^/]+)/(?P<container>[^/]+)', 'graph_membership_remove'),
+        # Yanıtlayıcısı yok (404): client'ın henüz uygulanmamış Security API yöntemi desteklenmiyor sayar
+        ('GET', r'/vssps/[^/]+/_apis/securityroles/.+', 'security_roles'),
+    ]
+    _COMPILED = [(method, re.compile(pattern + '$'), endpoint) for method, pattern, endpoint in ROUTES]
+
+    def route(self, method: str, path: str):
+        """Yolun endpoint adı ve parametreleri (client'ın endpoint etiketleriyle aynı; bulunamazsa 'unknown')"""
+        for route_method, pattern, name in self._COMPILED:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return name, {key: unquote(value) for key, value in match.groupdict().items()}
+        return 'unknown', {}
+
+    def handle(self, method: str, path: str, body: bytes):
+        """İsteği yanıtla: (durum kodu, JSON gövdesi, ek başlıklar)"""
+        parts = urlsplit(path)
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        endpoint, params = self.route(method, parts.path)
+
+        with self._count_lock:
+            self.total_requests += 1
+            number = self.total_requests
+        with self._random_lock:
+            delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0.0)
+            failed = self.failure_rate and self._random.random() < self.failure_rate
+        if delay:
+            time.sleep(delay)
+
+        if self.throttle_every and number % self.throttle_every == 0:
+            self._count(method, endpoint, 429)
+            return 429, {'message': 'Too many requests'}, {'Retry-After': str(self.retry_after)}
+        if failed:
+            self._count(method, endpoint, 503)
+            return 503, {'message': 'Injected failure'}, {}
+
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            payload = None
+        handler = getattr(self, f'_{endpoint}', None)
+        if handler is None:
+            status, response, headers = 404, {'message': f'Unknown route: {method} {parts.path}'}, {}
+        else:
+            with self.organization.lock:
+                status, response, headers = handler(params, query, payload)
+        self._count(method, endpoint, status)
+        return status, response, headers
+
+    @staticmethod
+    def _top_skip(items, query):
+        """$top/$skip sayfalaması (gerçek API varsayılanı 100)"""
+        skip = int(query.get('$skip', 0))
+        top = int(query.get('$top', DEFAULT_TOP))
+        page = items[skip:skip + top]
+        return {'count': len(page), 'value': page}
+
+    def _continuation(self, items, query, key='value'):
+        """continuationToken sayfalaması; sonraki sayfa varsa başlıkta ve gövdede token döner"""
+        start = int(query.get('continuationToken') or 0)
+        end = start + self.page_size if self.page_size else len(items)
+        response, headers = {key: items[start:end]}, {}
+        if end < len(items):
+            response['continuationToken'] = str(end)
+            headers['X-MS-ContinuationToken'] = str(end)
+        return 200, response, headers
+
+    # ==================== ENDPOINT'LER ====================
+
+    def _projects(self, params, query, payload):
+        return 200, self._top_skip([{'id': PROJECT_ID, 'name': PROJECT}], query), {}
+
+    def _project(self, params, query, payload):
+        return 200, {'id': PROJECT_ID, 'name': PROJECT}, {}
+
+    def _teams(self, params, query, payload):
+        teams = [{'id': team['id'], 'name': team['name'], 'description': team['description']}
+                 for team in self.organization.teams]
+        return 200, self._top_skip(teams, query), {}
+
+    def _team(self, params, query, payload):
+        team = self.organization.teams_by_id.get(params['team'])
+        if team is None:
+            return 404, {'message': 'Team not found'}, {}
+        return 200, {'id': team['id'], 'name': team['name']}, {}
+
+    def _team_members(self, params, query, payload):
+        if params['team'] not in self.organization.teams_by_id:
+            return 404, {'message': 'Team not found'}, {}
+        members = [{'identity': {'id': user['id'], 'displayName': user['displayName'],
+                                 'uniqueName': user['mailAddress']}}
+                   for user in self.organization.members.get(params['team'], {}).values()]
+        return 200, self._top_skip(members, query), {}
+
+    def _team_member_add(self, params, query, payload):
+        email = (payload or {}).get('uniqueName')
+        if not email or not self.organization.add_member(params['team'], email):
+            return 400, {'message': 'Invalid member'}, {}
+        return 201, {'uniqueName': email}, {}
+
+    def _team_member_add_by_id(self, params, query, payload):
+        for user in self.organization.users.values():
+            if user['id'] == params['user'] and self.organization.add_member(params['team'], user['mailAddress']):
+                return 200, {'id': user['id']}, {}
+        return 404, {'message': 'User not found'}, {}
+
+    def _userentitlements(self, params, query, payload):
+        members = [{'user': dict(user), 'accessLevel': {'accountLicenseType': 'express'}}
+                   for user in self.organization.users.values()]
+        return self._continuation(members, query, key='members')
+
+    def _userentitlements_add(self, params, query, payload):
+        email = ((payload or {}).get('user') or {}).get('principalName')
+        if not email:
+            return 400, {'message': 'principalName is required'}, {}
+        user = self.organization.add_user(email)
+        return 200, {'isSuccess': True, 'userEntitlement': {'user': dict(user)}}, {}
+
+    def _graph_groups(self, params, query, payload):
+        return self._continuation(self.organization.groups, query)
+
+    def _graph_descriptors(self, params, query, payload):
+        team = self.organization.teams_by_id.get(params['id'])
+        if team is None:
+            return 404, {'message': 'Storage key not found'}, {}
+        return 200, {'value': team['descriptor']}, {}
+
+    def _graph_memberships(self, params, query, payload):
+        memberships = [{'memberDescriptor': subject, 'containerDescriptor': container}
+                       for subject, container in sorted(self.organization.memberships)]
+        return self._continuation(memberships, query)
+
+    def _graph_membership_add(self, params, query, payload):
+        self.organization.memberships.add((params['subject'], params['container']))
+        return 200, {'memberDescriptor': params['subject'], 'containerDescriptor': params['container']}, {}
+
+    def _graph_membership_remove(self, params, query, payload):
+        if self.organization.remove_membership(params['subject'], params['container']):
+            return 200, None, {}
+        return 404, {'message': 'Membership not found'}, {}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Yerel Azure DevOps taklidi")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--teams', type=int, default=40)
+    parser.add_argument('--users', type=int, default=1000, help="Organizasyonda önceden bulunan kullanıcı sayısı")
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=0)
+    parser.add_argument('--throttle-every', type=int, default=0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    organization = FakeOrganization(args.teams, [f"user{i}@company.com" for i in range(args.users)])
+    server = FakeAzureDevOps(organization, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                             page_size=args.page_size, throttle_every=args.throttle_every,
+                             failure_rate=args.failure_rate, port=args.port)
+    server.start()
+    print(f"🧪 {server.url} dinleniyor (organizasyon: {ORGANIZATION}, proje: {PROJECT}); durdurmak için Ctrl+C")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"📊 {server.total_requests} istek: {dict(server.statuses)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AZURE DEVOPS KULLANICI EKLEME ARACI - KOMUT SATIRI SÜRÜMÜ
+Ekransız sunucularda (cron vb.) toplu işlem çalıştırmak için. PyQt5 yüklemez.
+
+İlerleme stdout'a satır başına bir JSON nesnesi olarak yazılır:
+    {"event": "log", "message": "...", "time": "..."}
+    {"event": "status", "message": "...", "time": "..."}
+    {"event": "progress", "current": 3, "total": 10, "rows_per_second": 2.5, "eta_seconds": 2.8, "time": "..."}
+    {"event": "job", "id": 1, "file": "...", "state": "done", "position": 0, "rows": 10, "throughput": 2.5, ...}
+    {"event": "finished", "success": true, "error": null, "report": "...", "exit_code": 0, "time": "..."}
+
+İlerleme ve durum olayları birleştirilir: saniyede en fazla progress_updates_per_second (config,
+varsayılan 10) progress satırı yazılır, status yalnızca mesaj değiştiğinde yazılır; her işin son
+durumu her zaman yazılır.
+
+--dry-run ile API'ye istek atılmaz; her dosya için tahmin yazılır:
+    {"event": "estimate", "file": "...", "rows": 10, "calls": {"team_member_add": 10, ...}, "seconds": 12.5, ...}
+
+--profile ile her iş için aşama süreleri ve örnekleme profili raporun yanına yazılır; job olayının
+"profile" alanı katlanmış yığın (.folded) dosyasını gösterir.
+
+Çıkış kodları:
+    0   Tüm işlemler başarılı
+    1   Kısmi başarı (bazı satırlar başarısız)
+    2   İşlem başarısız
+    3   Yapılandırma / girdi hatası
+    130 Kullanıcı tarafından durduruldu
+"""
+
+import sys
+import os
+import json
+import argparse
+import datetime
+import threading
+
+# Path ayarları
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.config_manager import ConfigManager
+from core.log import configure_from_config
+
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_FAILED = 2
+EXIT_CONFIG = 3
+EXIT_INTERRUPTED = 130
+
+
+class JsonLineEmitter:
+    """Olayları satır başına bir JSON nesnesi olarak yazar"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()  # Paralel bölümler aynı akışa yazar
+        self._last_status = None
+
+    def emit(self, event: str, **fields):
+        record = {'event': event}
+        record.update(fields)
+        record['time'] = datetime.datetime.now().isoformat(timespec='seconds')
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def log(self, message: str):
+        self.emit('log', message=message)
+
+    def status(self, message: str):
+        self.emit('status', message=message)
+
+    def progress(self, update):
+        """ProgressThrottle güncellemesi: değişen durum mesajı ve ilerleme satırı"""
+        if update.status is not None and update.status != self._last_status:
+            self._last_status = update.status
+            self.status(update.status)
+        eta = round(update.eta_seconds, 1) if update.eta_seconds is not None else None
+        self.emit('progress', current=update.current, total=update.total,
+                  rows_per_second=round(update.rows_per_second, 2), eta_seconds=eta)
+
+
+def parse_args(argv=None):
+    """Komut satırı argümanlarını ayrıştır"""
+    parser = argparse.ArgumentParser(
+        description="Azure DevOps kullanıcı ekleme aracı - komut satırı (GUI'siz) toplu işlem"
+    )
+    parser.add_argument('input', nargs='+',
+                        help="Kullanıcı listesini içeren Excel, CSV, JSONL veya Parquet dosyası "
+                             "(birden fazla dosya sırayla işlenir)")
+    parser.add_argument('--config', help="config.json yolu (varsayılan: uygulama dizinindeki config.json)")
+    parser.add_argument('--report-dir', help="Excel raporunun yazılacağı dizin (varsayılan: masaüstü)")
+    parser.add_argument('--no-report', action='store_true', help="Excel raporu oluşturma")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="İşlem yapmadan endpoint başına API çağrısı ve süre tahmini yazdır")
+    parser.add_argument('--profile', action='store_true',
+                        help="Profil modu: aşama süreleri ve duvar saati örnekleme profili raporun yanına "
+                             "(flamegraph.pl / speedscope için .folded) yazılır")
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], type=str.upper,
+                        help="Core modüllerinin log seviyesi (varsayılan: config.json 'log_level' veya WARNING)")
+    return parser.parse_args(argv)
+
+
+def dry_run(args, config, job_queue, excel_processor, emitter) -> int:
+    """Her dosya için çalışma tahminini yazdır (API'ye istek atılmaz)"""
+    errors = []
+    for path in args.input:
+        estimate, error_message = job_queue.estimate(path, config['organization_url'], config['project_name'],
+                                                     config['pat_token'], excel_processor)
+        if error_message:
+            errors.append(f"{path}: {error_message}")
+            continue
+        emitter.emit('estimate', file=path, summary=estimate.summary(), **estimate.to_dict())
+
+    exit_code = EXIT_CONFIG if errors else EXIT_OK
+    emitter.emit('finished', success=not errors, error="; ".join(errors) or None,
+                 report=None, exit_code=exit_code)
+    return exit_code
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    args = parse_args(argv)
+
+    # JSON akışı stdout'a yazılır; core modüllerin logları dosyaya ve (uyarılar) stderr'e gider
+    emitter = JsonLineEmitter(sys.stdout)
+
+    config = ConfigManager(args.config).get_config()
+    if args.log_level:
+        config = dict(config, log_level=args.log_level)
+    configure_from_config(config)
+    missing = [key for key in ('organization_url', 'project_name', 'pat_token') if not config.get(key)]
+    if missing:
+        emitter.emit('finished', success=False, error=f"Eksik ayarlar: {', '.join(missing)}",
+                     report=None, exit_code=EXIT_CONFIG)
+        return EXIT_CONFIG
+
+    missing_files = [path for path in args.input if not os.path.exists(path)]
+    if missing_files:
+        emitter.emit('finished', success=False, error=f"Dosya bulunamadı: {', '.join(missing_files)}",
+                     report=None, exit_code=EXIT_CONFIG)
+        return EXIT_CONFIG
+
+    from core.excel_processor import ExcelProcessor
+    from core.job_queue import JobQueue, ClientPool
+    from core.progress_throttle import ProgressThrottle
+
+    # Tüm dosyalar aynı org/proje için tek bir (ısınmış) client paylaşır
+    job_queue = JobQueue(
+        ClientPool(requests_per_second=config.get('requests_per_second', 10.0),
+                   metrics_enabled=config.get('metrics_enabled', True)),
+        max_parallel_partitions=config.get('max_parallel_partitions', 4),
+        metrics_dir=config.get('metrics_dir') or None,
+        prometheus_textfile=config.get('prometheus_textfile') or None,
+        profiling=args.profile or config.get('profiling_enabled', False),
+        profile_sample_interval=config.get('profile_sample_interval_ms', 10) / 1000,
+        prepare_reports=not args.no_report
+    )
+    excel_processor = ExcelProcessor()
+
+    if args.dry_run:
+        return dry_run(args, config, job_queue, excel_processor, emitter)
+
+    for path in args.input:
+        job_queue.submit(path, config['organization_url'], config['project_name'], config['pat_token'])
+
+    finished_jobs = []
+    current_job = None
+
+    def emit_job(job):
+        emitter.emit('job', id=job.id, file=job.file_path, state=job.state,
+                     position=job_queue.position(job), rows=job.rows_done,
+                     total=job.rows_total, throughput=round(job.throughput, 2),
+                     success=job.success, error=job.error_message,
+                     metrics=job.metrics_path, profile=job.profile_path)
+
+    try:
+        for job in job_queue.pending():
+            emit_job(job)
+
+        while True:
+            current_job = job_queue.next_job()
+            if current_job is None:
+                break
+            current_job.state = current_job.RUNNING
+            emit_job(current_job)
+            throttle = ProgressThrottle(emitter.progress, config.get('progress_updates_per_second', 10.0))
+            job_queue.run_job(current_job, excel_processor,
+                              on_log=emitter.log, on_status=throttle.status, on_progress=throttle.progress)
+            throttle.flush()
+            if not args.no_report and current_job.runner:
+                current_job.report_path = current_job.runner.generate_excel_report(args.report_dir)
+            if current_job.profile and current_job.runner:
+                # Rapor yoksa (--no-report, boş rapor) profil rapor dizinine yazılır
+                current_job.profile_path = current_job.runner.profile_path or \
+                    current_job.runner.write_profile(args.report_dir)
+            finished_jobs.append(current_job)
+            emit_job(current_job)
+    except KeyboardInterrupt:
+        job_queue.cancel_pending()
+        if current_job:
+            job_queue.stop_job(current_job)
+        emitter.emit('finished', success=False, error="Kullanıcı tarafından durduruldu",
+                     report=None, exit_code=EXIT_INTERRUPTED)
+        return EXIT_INTERRUPTED
+
+    failed = [job for job in finished_jobs if not job.success]
+    partial = [job for job in finished_jobs if job.success and job.error_message]
+    if failed:
+        exit_code = EXIT_FAILED
+    elif partial:
+        exit_code = EXIT_PARTIAL
+    else:
+        exit_code = EXIT_OK
+
+    errors = [f"{job.file_path}: {job.error_message}" for job in failed + partial]
+    reports = [job.report_path for job in finished_jobs if job.report_path]
+    emitter.emit('finished', success=not failed, error="; ".join(errors) or None,
+                 report=reports[0] if reports else None, reports=reports, exit_code=exit_code)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
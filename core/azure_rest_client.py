@@ -10,14 +10,31 @@ import requests
 import json
 import base64
 import time
-from typing import List, Dict, Tuple, Optional
+import logging
+import threading
+from typing import Callable, List, Dict, Tuple, Optional
+from collections import OrderedDict
 from urllib.parse import quote
 
+from core.rate_limiter import RateLimiter
+from core.cancellation import CancellationToken, CancelledError
+from core.http_transport import abort_session, cancellable_session
+from core.method_learner import MethodLearner, MethodUnsupported, UNSUPPORTED_STATUSES
+from core.metrics import ClientMetrics, DISABLED
+from core import profiler
+from core.log import get_logger
+
+log = get_logger('client')
+
+PAGE_SIZE = 100  # $top/$skip ile sayfalanan listelerde (takımlar, takım üyeleri) API'nin varsayılan sayfa boyu
+
 
 class AzureDevOpsRESTClient:
     """Azure DevOps REST API Client"""
     
-    def __init__(self, organization_url: str, project_name: str, pat_token: str = None):
+    def __init__(self, organization_url: str, project_name: str, pat_token: str = None,
+                 requests_per_second: float = 10.0, method_learner: MethodLearner = None,
+                 metrics_enabled: bool = True):
         """
         Azure DevOps REST API Client başlatma
         
@@ -25,6 +42,9 @@ class AzureDevOpsRESTClient:
             organization_url: Azure DevOps organizasyon URL'i
             project_name: Proje adı
             pat_token: Personal Access Token (opsiyonel, eski sürümlerle uyumluluk için)
+            requests_per_second: Bu client'ın istek bütçesi (saniyede istek, 0 = sınırsız)
+            method_learner: Ekleme yöntemi sırasını öğrenen nesne (havuzdaki client'lar paylaşır)
+            metrics_enabled: Endpoint sayaçları, gecikme histogramları ve bayt ölçümleri (kapalıyken kayıt yapılmaz)
         """
         self.organization_url = organization_url.rstrip('/')
         self.project_name = project_name
@@ -33,6 +53,7 @@ class AzureDevOpsRESTClient:
         # API endpoints
         self.base_url = f"{self.organization_url}/_apis"
         self.vsaex_base_url = f"https://vsaex.dev.azure.com/{self.organization_url.split('/')[-1]}/_apis"
+        self.vssps_base_url = f"https://vssps.dev.azure.com/{self.organization_url.split('/')[-1]}/_apis"
         self.api_version = "7.1"
         
         # Authentication headers
@@ -41,14 +62,14 @@ class AzureDevOpsRESTClient:
         # Kimlik Doğrulama Yöntemi Seçimi
         if pat_token:
             # PAT token ile authentication (geriye dönük uyumluluk için)
-            print("⚠️ PAT token: Azure CLI kullanımı önerilir")
+            log.info("⚠️ PAT token: Azure CLI kullanımı önerilir")
             auth_string = f":{pat_token}"
             encoded_auth = base64.b64encode(auth_string.encode()).decode()
             self.headers['Authorization'] = f'Basic {encoded_auth}'
-            print("✅ PAT token doğrulama başarılı")
+            log.info("✅ PAT token doğrulama başarılı")
         else:
             # Azure CLI tabanlı kimlik doğrulama
-            print("✅ Azure CLI doğrulama hazır")
+            log.info("✅ Azure CLI doğrulama hazır")
             # Not: Az CLI kimlik bilgileri otomatik kullanılacak
         
         # PERFORMANS CACHE SİSTEMİ
@@ -56,40 +77,199 @@ class AzureDevOpsRESTClient:
         self._teams_cache_time = None
         self._org_users_cache = None
         self._org_users_cache_time = None
+        self._org_user_index = {}  # küçük harf e-posta -> org üyesi (cache ile birlikte kurulur)
         self._project_id_cache = None
         self._cache_ttl = 300  # 5 dakika cache süresi
+        self._team_members_cache = {}  # team_id -> {email: üye}
+        self._team_descriptor_cache = {}  # team_id -> Graph descriptor
+        self._graph_groups_cache = None
+        self._group_table = {}  # küçük harf grup adı -> sınıflandırma (çalışma başına bir kez)
         
         # Toplu işlem için batch kontrolürü
         self._pending_invitations = []  # List olarak değiştirildi - pop(0) ve append() için
         self._batch_size = 10  # Aynı anda işlenecek kullanıcı sayısı
+        
+        # HTTP bağlantı havuzu ve client'a özel hız sınırı bütçesi
+        self.session = cancellable_session()
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self._max_retries = 3  # 429 (Too Many Requests) sonrası yeniden deneme sayısı
+        self._call_stats = {}  # endpoint -> [çağrı sayısı, toplam süre (sn)]
+        self._stats_lock = threading.Lock()
+        self.metrics = ClientMetrics() if metrics_enabled else DISABLED  # bkz. core/metrics.py
+        self.profile = profiler.DISABLED  # Profil modunda çalışma başında runner tarafından bağlanır
+        
+        # İptal token'ı: çalışma başında runner tarafından bağlanır
+        self.cancel_token = CancellationToken()
+        
+        # Ekleme zincirlerinde çalışan yöntemi öne alan öğrenici
+        self.method_learner = method_learner or MethodLearner()
+    
+    def set_cancel_token(self, token: CancellationToken):
+        """Çalışmaya ait iptal token'ını bağlar; iptalde sürmekte olan istekler kesilir, bağlantılar kapatılır"""
+        if self.cancel_token.is_cancelled:
+            # Önceki çalışma iptal edilip bağlantılar kapatıldıysa taze bağlantı havuzu kullan
+            self.session = cancellable_session()
+        self.cancel_token = token
+        token.register(self._abort_connections)
     
+    def set_profile(self, profile: profiler.RunProfile):
+        """Çalışmanın profilini bağlar (davet sonrası yayılma beklemeleri ayrı aşama olarak ölçülür)"""
+        self.profile = profile
+    
+    def _abort_connections(self):
+        """İptal anında sürmekte olan istekleri kes ve havuzdaki bağlantıları kapat"""
+        try:
+            abort_session(self.session)
+        except Exception:
+            pass
+    
+    def _sleep(self, seconds: float):
+        """İptal edilebilir bekleme (iptalde CancelledError fırlatır)"""
+        self.cancel_token.sleep(seconds)
+    
+    def _wait_for_propagation(self, seconds: float):
+        """Davet edilen kullanıcının organizasyona yansımasını bekle (profilde propagation_wait)"""
+        with self.profile.stage('propagation_wait'):
+            self._sleep(seconds)
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        HTTP isteğini gönderir
+        
+        İptal istek sürerken gelirse bağlantının soketi kapatılır (bkz. core/http_transport.py) ve
+        istek zaman aşımını beklemeden hata alır. İsteğin sunucuya ulaşıp ulaşmadığı bilinmediğinden
+        CancelledError(in_flight=True) fırlatılır; satır raporda BİLİNMİYOR olarak görünür.
+        """
+        try:
+            return self.session.request(method, url, **kwargs)
+        except Exception:
+            if self.cancel_token.is_cancelled:
+                raise CancelledError("İstek sürerken işlem iptal edildi", in_flight=True)
+            raise
+    
+    def _record_call(self, endpoint: str, seconds: float):
+        """Endpoint başına çağrı sayısı ve süresini biriktirir (çalışma süresi tahmini için)"""
+        with self._stats_lock:
+            stats = self._call_stats.setdefault(endpoint, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+    
+    def get_call_stats(self) -> Dict[str, Tuple[int, float]]:
+        """Client oluşturulduğundan beri endpoint başına (çağrı sayısı, toplam süre sn)"""
+        with self._stats_lock:
+            return {endpoint: (count, seconds) for endpoint, (count, seconds) in self._call_stats.items()}
+    
+    def _request(self, method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Tüm HTTP çağrılarının geçtiği ortak nokta: bağlantı havuzu, hız sınırı ve 429 yeniden deneme
+        
+        Args:
+            method: HTTP metodu (GET, POST, PUT, DELETE)
+            url: İstek URL'i
+            endpoint: Endpoint etiketi (ör. 'teams', 'userentitlements')
+            
+        Returns:
+            requests.Response: Son yanıt
+        """
+        kwargs.setdefault('headers', self.headers)
+        kwargs.setdefault('timeout', 30)
+        
+        metrics = self.metrics
+        for attempt in range(self._max_retries + 1):
+            self.cancel_token.raise_if_cancelled()
+            if attempt:
+                metrics.record_retry(endpoint)
+            waited = time.monotonic()
+            self.rate_limiter.acquire(sleep=self._sleep)
+            started = time.monotonic()
+            metrics.record_wait(started - waited)
+            metrics.request_started()
+            try:
+                response = self._send(method, url, **kwargs)
+            except BaseException:
+                metrics.request_finished(endpoint, time.monotonic() - started)
+                raise
+            elapsed = time.monotonic() - started
+            metrics.request_finished(endpoint, elapsed, response)
+            self._record_call(endpoint, elapsed)
+            if response.status_code != 429 or attempt == self._max_retries:
+                return response
+            
+            # Sunucu kısıtlaması: Retry-After kadar tüm client isteklerini durdur
+            try:
+                retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+            except ValueError:
+                retry_after = 2 ** attempt
+            log.warning("⏳ 429 (%s): %.0f sn bekleniyor...", endpoint, retry_after,
+                        extra={'endpoint': endpoint, 'retry_after': retry_after})
+            self.rate_limiter.penalize(retry_after)
+        
+        return response
+    
+    
+    def _get_pages(self, url: str, endpoint: str) -> Tuple[Optional[List[Dict]], int]:
+        """
+        $top/$skip ile sayfalanan listenin tüm sayfalarını indirir (takımlar, takım üyeleri)
+        
+        Returns:
+            Tuple[Optional[List[Dict]], int]: (tüm 'value' öğeleri, son durum kodu); 200 değilse öğeler None
+        """
+        items = []
+        while True:
+            response = self._request('GET', f"{url}&$top={PAGE_SIZE}&$skip={len(items)}", endpoint)
+            if response.status_code != 200:
+                return None, response.status_code
+            page = response.json().get('value', [])
+            items.extend(page)
+            if len(page) < PAGE_SIZE:
+                return items, 200
+    
+    def _get_continuation_pages(self, url: str, endpoint: str, key: str = 'value') -> Tuple[Optional[List[Dict]], int]:
+        """
+        continuationToken ile sayfalanan listenin tüm sayfalarını indirir (userentitlements, Graph)
+        
+        Returns:
+            Tuple[Optional[List[Dict]], int]: (tüm öğeler, son durum kodu); 200 değilse öğeler None
+        """
+        items = []
+        token = None
+        while True:
+            page_url = f"{url}&continuationToken={quote(token)}" if token else url
+            response = self._request('GET', page_url, endpoint)
+            if response.status_code != 200:
+                return None, response.status_code
+            data = response.json()
+            items.extend(data.get(key, []))
+            token = data.get('continuationToken') or response.headers.get('X-MS-ContinuationToken')
+            if not token:
+                return items, 200
     
     def test_connection(self) -> bool:
         """Azure DevOps bağlantısını test eder"""
         try:
-            print("🔄 API bağlantı testi...")
+            log.debug("🔄 API bağlantı testi...")
             
             # Projects endpoint'ini test et
             url = f"{self.base_url}/projects?api-version={self.api_version}"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._request('GET', url, 'projects')
             
             if response.status_code == 200:
                 projects = response.json().get('value', [])
                 project_names = [p['name'] for p in projects]
                 
                 if self.project_name in project_names:
-                    print(f"✅ Bağlantı başarılı")
+                    log.info("✅ Bağlantı başarılı")
                     return True
                 else:
-                    print(f"❌ Proje bulunamadı: {self.project_name}")
-                    print(f"📋 Mevcut projeler: {project_names}")
+                    log.warning("❌ Proje bulunamadı: %s", self.project_name)
+                    log.debug("📋 Mevcut projeler: %s", project_names)
                     return False
             else:
-                print(f"❌ API hatası: {response.status_code}")
+                log.error("❌ API hatası: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            print(f"❌ Bağlantı hatası: {str(e)}")
+            log.error("❌ Bağlantı hatası: %s", e)
             return False
     
     def _is_cache_valid(self, cache_time) -> bool:
@@ -101,45 +281,106 @@ class AzureDevOpsRESTClient:
     def _get_teams_from_cache(self) -> Optional[List[Dict]]:
         """Cache'den takımları al"""
         if self._is_cache_valid(self._teams_cache_time) and self._teams_cache is not None:
-            print("⚡ Takımlar cache'den alındı")
+            log.debug("⚡ Takımlar cache'den alındı")
+            self.metrics.cache_lookup('teams', True)
             return self._teams_cache
+        self.metrics.cache_lookup('teams', False)
         return None
     
     def _cache_teams(self, teams: List[Dict]):
         """Takımları cache'le"""
         self._teams_cache = teams
         self._teams_cache_time = time.time()
-        print(f"💾 {len(teams)} takım kaydedildi")
+        log.info("💾 %s takım kaydedildi", len(teams))
     
     def _detect_group_type(self, group_name: str) -> str:
         """
         Verilen grup isminin takım mı yoksa güvenlik grubu mu olduğunu tespit eder.
+        Sonuç sınıflandırma tablosundan okunur; tabloda olmayan ad bir kez sınıflandırılıp eklenir.
         
         Args:
             group_name: Tespit edilecek grup adı
             
         Returns:
-            str: 'team', 'security' veya 'unknown'
+            str: 'team', 'security', 'custom' veya 'unknown'
         """
-        try:
-            # Önce takımları kontrol et
-            teams = self.get_teams()
-            for team in teams:
-                if team.get('name', '').lower() == group_name.lower():
-                    return 'team'
-            
-            # Sonra güvenlik gruplarını kontrol et
-            security_groups = self._get_security_groups()
-            for group in security_groups:
-                if group.get('principalName', '').lower() == group_name.lower():
-                    return 'security'
+        key = group_name.strip().lower()
+        entry = self._group_table.get(key)
+        if entry is None:
+            entry = self.classify_groups([group_name]).get(key, {'type': 'unknown'})
+        return entry['type']
+    
+    def classify_groups(self, group_names: List[str], refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Girdideki farklı grup adlarını tek seferde sınıflandırır (çalışma başına bir kez)
+        
+        Takım listesi, proje güvenlik grupları ve Graph grupları en fazla birer kez indirilir;
+        her ad takım, güvenlik grubu veya özel gruba kimliği/descriptor'ı ile eşlenir.
+        
+        Args:
+            group_names: Sınıflandırılacak grup adları (tekrarlar birleştirilir)
+            refresh: True ise önceki tablo atılır (yeni çalışma başlangıcı)
             
-            # Bulunamadıysa bilinmeyen
-            return 'unknown'
+        Returns:
+            Dict[str, Dict]: küçük harf grup adı -> {'type', 'name', 'id', 'descriptor'}
+        """
+        if refresh:
+            self._group_table = {}
+            self._graph_groups_cache = None  # Graph grupları çalışma başına en fazla bir kez indirilir
+            # Havuzdaki client işler arasında yaşar: üyelikler işler arasında değişmiş olabilir
+            self._team_members_cache = {}
+        
+        pending = OrderedDict()
+        for name in group_names:
+            name = (name or '').strip()
+            if name and name.lower() not in self._group_table:
+                pending.setdefault(name.lower(), name)
+        if not pending:
+            return self._group_table
+        
+        try:
+            # 1. Takımlar (tek liste, tam eşleşme öncelikli)
+            for key, name in list(pending.items()):
+                team = self._find_team(name)
+                if team:
+                    self._group_table[key] = {'type': 'team', 'name': team['name'],
+                                              'id': team['id'], 'descriptor': None}
+                    del pending[key]
+            
+            # 2. Proje güvenlik grupları (yalnızca takım olmayan ad kaldıysa)
+            if pending:
+                security_groups = {}
+                for group in self._get_security_groups():
+                    security_groups.setdefault((group.get('principalName') or '').lower(), group)
+                for key, name in list(pending.items()):
+                    group = security_groups.get(key)
+                    if group:
+                        self._group_table[key] = {'type': 'security', 'name': group.get('principalName'),
+                                                  'id': group.get('originId'),
+                                                  'descriptor': group.get('descriptor')}
+                        del pending[key]
+            
+            # 3. Organizasyondaki diğer Graph grupları (özel gruplar)
+            for key, name in list(pending.items()):
+                group = self._find_graph_group(name)
+                if group:
+                    self._group_table[key] = {'type': 'custom', 'name': group.get('displayName') or name,
+                                              'id': group.get('originId'),
+                                              'descriptor': group.get('descriptor')}
+                    del pending[key]
             
         except Exception as e:
-            print(f"⛔ Grup tespiti hatası: {str(e)}")
-            return 'unknown'
+            log.error("⛔ Grup sınıflandırma hatası: %s", e)
+        
+        # Bulunamayanlar da tabloya yazılır ki her satırda tekrar aranmasın
+        for key, name in pending.items():
+            self._group_table[key] = {'type': 'unknown', 'name': name, 'id': None, 'descriptor': None}
+        
+        counts = {}
+        for entry in self._group_table.values():
+            counts[entry['type']] = counts.get(entry['type'], 0) + 1
+        log.info("🗂️ Grup sınıflandırması: %s", counts)
+        return self._group_table
     
     def _get_security_groups(self) -> List[Dict]:
         """
@@ -154,28 +395,21 @@ class AzureDevOpsRESTClient:
             if not project_id:
                 return []
             
-            # Güvenlik gruplarını getir
-            url = f"{self.organization_url}/_apis/graph/groups?api-version=7.1-preview.1"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            # Güvenlik grupları cache'lenmiş Graph gruplarından süzülür (ayrı indirme yok)
+            groups = self._get_graph_groups()
+            project_groups = []
             
-            if response.status_code == 200:
-                groups = response.json().get('value', [])
-                project_groups = []
-                
-                # Sadece proje ile ilgili grupları filtrele
-                for group in groups:
-                    if group.get('description', '').find(project_id) >= 0 or \
-                       group.get('principalName', '').find(self.project_name) >= 0:
-                        project_groups.append(group)
-                        
-                print(f"✅ {len(project_groups)} güvenlik grubu")
-                return project_groups
-            else:
-                print(f"⛔ Güvenlik grupları hatası: {response.status_code}")
-                return []
+            # Sadece proje ile ilgili grupları filtrele
+            for group in groups:
+                if (group.get('description') or '').find(project_id) >= 0 or \
+                   (group.get('principalName') or '').find(self.project_name) >= 0:
+                    project_groups.append(group)
+                    
+            log.info("✅ %s güvenlik grubu", len(project_groups))
+            return project_groups
                 
         except Exception as e:
-            print(f"⛔ Güvenlik grupları hatası: {str(e)}")
+            log.error("⛔ Güvenlik grupları hatası: %s", e)
             return []
     
     def get_teams(self) -> List[Dict]:
@@ -186,13 +420,12 @@ class AzureDevOpsRESTClient:
             if cached_teams is not None:
                 return cached_teams
             
-            print("📋 Takımlar yükleniyor...")
+            log.debug("📋 Takımlar yükleniyor...")
             
             url = f"{self.base_url}/projects/{quote(self.project_name)}/teams?api-version={self.api_version}"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            teams_data, status_code = self._get_pages(url, 'teams')
             
-            if response.status_code == 200:
-                teams_data = response.json().get('value', [])
+            if status_code == 200:
                 teams = []
                 
                 for team in teams_data:
@@ -203,28 +436,27 @@ class AzureDevOpsRESTClient:
                         'url': team.get('url', '')
                     })
                 
-                print(f"✅ {len(teams)} takım")
+                log.info("✅ %s takım", len(teams))
                 
                 # Cache'le
                 self._cache_teams(teams)
                 
                 return teams
             else:
-                print(f"❌ Takım listesi hatası: {response.status_code}")
+                log.error("❌ Takım listesi hatası: %s", status_code)
                 return []
                 
         except Exception as e:
-            print(f"❌ Takım listesi hatası: {str(e)}")
+            log.error("❌ Takım listesi hatası: %s", e)
             return []
     
     def get_team_members(self, team_id: str) -> List[Dict]:
-        """Takım üyelerini listeler"""
+        """Takım üyelerini listeler (tüm sayfalar)"""
         try:
             url = f"{self.base_url}/projects/{quote(self.project_name)}/teams/{team_id}/members?api-version={self.api_version}"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            members_data, status_code = self._get_pages(url, 'team_members')
             
-            if response.status_code == 200:
-                members_data = response.json().get('value', [])
+            if status_code == 200:
                 members = []
                 
                 for member in members_data:
@@ -239,25 +471,42 @@ class AzureDevOpsRESTClient:
                 
                 return members
             else:
-                print(f"❌ Takım üyeleri hatası: {response.status_code}")
+                log.error("❌ Takım üyeleri hatası: %s", status_code)
                 return []
                 
         except Exception as e:
-            print(f"❌ Takım üyeleri hatası: {str(e)}")
+            log.error("❌ Takım üyeleri hatası: %s", e)
             return []
     
     def _get_org_users_from_cache(self) -> Optional[List[Dict]]:
         """Cache'den organizasyon üyelerini al"""
         if self._is_cache_valid(self._org_users_cache_time) and self._org_users_cache is not None:
-            print("⚡ Organizasyon üyeleri cache'den alındı")
+            log.debug("⚡ Organizasyon üyeleri cache'den alındı")
+            self.metrics.cache_lookup('org_users', True)
             return self._org_users_cache
+        self.metrics.cache_lookup('org_users', False)
         return None
     
     def _cache_org_users(self, users: List[Dict]):
-        """Organizasyon üyelerini cache'le"""
+        """Organizasyon üyelerini cache'le (e-posta indeksi de bir kez kurulur)"""
         self._org_users_cache = users
         self._org_users_cache_time = time.time()
-        print(f"💾 {len(users)} üye kaydedildi")
+        self._org_user_index = {user['email']: user for user in users if user.get('email')}
+        log.info("💾 %s üye kaydedildi", len(users))
+    
+    def _remember_org_user(self, user_info: Dict):
+        """Davet edilen kullanıcıyı org üyesi cache'ine ekle (satırlar tekrar davet etmesin)"""
+        email = (user_info.get('mailAddress') or user_info.get('principalName') or '').lower()
+        if not email or self._org_users_cache is None or email in self._org_user_index:
+            return
+        user = {
+            'email': email,
+            'descriptor': user_info.get('descriptor'),
+            'displayName': user_info.get('displayName', ''),
+            'id': user_info.get('id')
+        }
+        self._org_users_cache.append(user)
+        self._org_user_index[email] = user
     
     def _load_all_org_users(self) -> List[Dict]:
         """🚀 OPTIMIZE EDİLMİŞ: Tüm organizasyon üyelerini yükle (cache ile)"""
@@ -267,14 +516,13 @@ class AzureDevOpsRESTClient:
             if cached_users is not None:
                 return cached_users
             
-            print("👥 Org üyeleri yükleniyor...")
+            log.debug("👥 Org üyeleri yükleniyor...")
             
-            # User Entitlements API ile kullanıcıları listele
+            # User Entitlements API ile kullanıcıları listele (tüm sayfalar)
             url = f"{self.vsaex_base_url}/userentitlements?api-version=7.1-preview.3"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            users_data, status_code = self._get_continuation_pages(url, 'userentitlements', key='members')
             
-            if response.status_code == 200:
-                users_data = response.json().get('members', [])
+            if status_code == 200:
                 users = []
                 
                 for user in users_data:
@@ -286,82 +534,76 @@ class AzureDevOpsRESTClient:
                         'id': user_info.get('id')
                     })
                 
-                print(f"✅ {len(users)} üye yüklendi")
+                log.info("✅ %s üye yüklendi", len(users))
                 
                 # Cache'le
                 self._cache_org_users(users)
                 
                 return users
             else:
-                print(f"❌ Üyeler hatası: {response.status_code}")
+                log.error("❌ Üyeler hatası: %s", status_code)
                 return []
                 
         except Exception as e:
-            print(f"❌ Üye yükleme hatası: {str(e)}")
+            log.error("❌ Üye yükleme hatası: %s", e)
             return []
     
     def check_user_exists_in_org(self, user_email: str) -> Optional[str]:
         """🚀 OPTIMIZE EDİLMİŞ: Kullanıcının organizasyonda olup olmadığını kontrol eder (cache ile)"""
         try:
-            # Tüm organizasyon üyelerini yükle (cache'den veya API'den)
-            org_users = self._load_all_org_users()
-            
-            # Cache'den ara
-            for user in org_users:
-                if user['email'] == user_email.lower():
-                    print(f"✅ Kullanıcı bulundu: {user_email}")
-                    return user['descriptor']
+            # E-posta indeksinden ara (org üyeleri cache'den veya API'den)
+            user = self._get_org_user_index().get(user_email.strip().lower())
+            if user:
+                log.debug("✅ Kullanıcı bulundu: %s", user_email)
+                return user['descriptor']
             
-            print(f"❌ Kullanıcı bulunamadı: {user_email}")
+            log.debug("❌ Kullanıcı bulunamadı: %s", user_email)
             return None
                 
         except Exception as e:
-            print(f"❌ Kontrol hatası: {str(e)}")
+            log.error("❌ Kontrol hatası: %s", e)
             return None
     
     def check_multiple_users_exist(self, user_emails: List[str]) -> Dict[str, Optional[str]]:
         """🚀 YENİ: Birden fazla kullanıcının organizasyonda olup olmadığını toplu kontrol et"""
         try:
-            print(f"👥 {len(user_emails)} kullanıcı kontrolü...")
+            log.debug("👥 %s kullanıcı kontrolü...", len(user_emails))
             
-            # Tüm organizasyon üyelerini yükle (cache'den veya API'den)
-            org_users = self._load_all_org_users()
-            
-            # Email'leri normalize et
-            email_to_descriptor = {user['email']: user['descriptor'] for user in org_users}
+            # E-posta indeksi (org üyeleri cache'den veya API'den)
+            index = self._get_org_user_index()
             
             # Sonuçları hazırla
             results = {}
             for email in user_emails:
-                normalized_email = email.lower().strip()
-                results[email] = email_to_descriptor.get(normalized_email)
+                user = index.get(email.lower().strip())
+                results[email] = user['descriptor'] if user else None
             
             existing_count = sum(1 for desc in results.values() if desc is not None)
-            print(f"✅ Kontrol: {existing_count}/{len(user_emails)} kullanıcı mevcut")
+            log.info("✅ Kontrol: %s/%s kullanıcı mevcut", existing_count, len(user_emails))
             
             return results
                 
         except Exception as e:
-            print(f"❌ Kontrol hatası: {str(e)}")
+            log.error("❌ Kontrol hatası: %s", e)
             return {email: None for email in user_emails}
     
     def invite_user_to_organization(self, user_email: str, license_type: str = "stakeholder", team_name: str = None, role: str = "Member") -> bool:
         """Kullanıcıyı organizasyona davet eder ve isteğe bağlı olarak doğrudan takıma ekler - Microsoft resmi dokümantasyonuna göre"""
         try:
-            print(f"📧 Davet: {user_email}")
+            log.debug("📧 Davet: %s", user_email)
             if team_name:
-                print(f"👥 Hedef takım: {team_name} ({role})")
+                log.debug("👥 Hedef takım: %s (%s)", team_name, role)
             
             # Önce kullanıcının zaten organizasyonda olup olmadığını kontrol et
             existing_user = self.check_user_exists_in_org(user_email)
             if existing_user:
-                print(f"ℹ️ Kullanıcı zaten organizasyonda: {user_email}")
+                log.debug("ℹ️ Kullanıcı zaten organizasyonda: %s", user_email)
                 return True
             
             # Proje ID'sini al (Microsoft dokümantasyonuna göre projectRef için id gerekli)
             project_id = self._get_project_id()
             if not project_id:
-                print(f"❌ Proje ID bulunamadı: {self.project_name}")
+                log.warning("❌ Proje ID bulunamadı: %s", self.project_name)
                 return False
             
             # Microsoft resmi dokümantasyonuna göre User Entitlements API
@@ -383,7 +625,7 @@ class AzureDevOpsRESTClient:
             
             # Eğer takım belirtilmişse, projectEntitlements ekle
             if team_name:
-                print(f"🎯 ProjectEntitlements ile doğrudan takıma ekleme: {team_name}")
+                log.debug("🎯 ProjectEntitlements ile doğrudan takıma ekleme: %s", team_name)
                 
                 # Rol tipini Microsoft formatına çevir
                 group_type = self._convert_role_to_group_type(role, team_name)
@@ -399,25 +641,27 @@ class AzureDevOpsRESTClient:
                     }
                 ]
                 
-                print(f"📋 Grup tipi: {group_type}")
-                print(f"📋 Proje ID: {project_id}")
+                log.debug("📋 Grup tipi: %s", group_type)
+                log.debug("📋 Proje ID: %s", project_id)
             
-            print(f" API: {url}")
-            print(f" Data: {json.dumps(payload)}")
+            log.debug("API: %s", url)
+            log.debug("Data: %s", payload)
             
-            response = requests.post(url, headers=self.headers, json=payload, timeout=60)
+            response = self._request('POST', url, 'userentitlements_add', json=payload, timeout=60)
             
-            print(f"📊 Status: {response.status_code}") 
+            log.debug("📊 Status: %s", response.status_code)
             
             if response.status_code in [200, 201]:
                 response_data = response.json()
                 if response_data.get('isSuccess', False):
-                    print(f"✅ Davet başarılı: {user_email}")
-                    time.sleep(2)
+                    log.info("✅ Davet başarılı: %s", user_email)
+                    self._remember_org_user((response_data.get('userEntitlement') or {}).get('user') or
+                                            {'principalName': user_email})
+                    self._wait_for_propagation(2)
                     return True
                 else:
                     errors = response_data.get('operationResult', {}).get('errors', [])
-                    print(f"❌ Davet hatası: {errors}")
+                    log.error("❌ Davet hatası: %s", errors)
                     return False
             elif response.status_code == 400:
                 try:
@@ -425,48 +669,51 @@ class AzureDevOpsRESTClient:
                     error_msg = str(error_data).lower()
                     
                     if 'already exists' in error_msg or 'already a member' in error_msg:
-                        print(f"ℹ️ Zaten üye: {user_email}")
+                        log.debug("ℹ️ Zaten üye: %s", user_email)
                         return True
                     else:
-                        print(f"❌ Davet hatası: {response.text[:100]}...")
+                        log.warning("❌ Davet hatası: %s...", response.text[:100])
                         return False
                 except:
-                    print(f"❌ Kullanıcı davet hatası (400): {response.text}")
+                    log.error("❌ Kullanıcı davet hatası (400): %s", response.text)
                     return False
             elif response.status_code == 405:
-                print(f"⚠️ 405: Alternatif yöntem...")
+                log.warning("⚠️ 405: Alternatif yöntem...")
                 # Direkt olarak başarısız dön - kullanıcı daha sonra Excel listesinde belirtilen takıma eklenecek
-                print(f"⚠️ Kullanıcı davet işlemi desteklenmeyen yöntem hatası - doğrudan eklemek için kullanıcı zaten organizasyonda olmalı")
+                log.warning("⚠️ Kullanıcı davet işlemi desteklenmeyen yöntem hatası - doğrudan eklemek için kullanıcı zaten organizasyonda olmalı")
                 return False
             else:
-                print(f"❌ Kullanıcı davet hatası: {response.status_code} - {response.text}")
+                log.error("❌ Kullanıcı davet hatası: %s - %s", response.status_code, response.text)
                 # 405 dışındaki hatalar için de alternatif yöntem dene
                 if response.status_code in [403, 404]:
-                    print(f"⚠️ {response.status_code} hatası - alternatif yöntem deneniyor...")
+                    log.warning("⚠️ %s hatası - alternatif yöntem deneniyor...", response.status_code)
                     # Direkt olarak başarısız dön - kullanıcı daha sonra Excel listesinde belirtilen takıma eklenecek
-                    print(f"⚠️ Kullanıcı davet işlemi desteklenmeyen yöntem hatası - doğrudan eklemek için kullanıcı zaten organizasyonda olmalı")
+                    log.warning("⚠️ Kullanıcı davet işlemi desteklenmeyen yöntem hatası - doğrudan eklemek için kullanıcı zaten organizasyonda olmalı")
                     return False
                 return False
                 
         except Exception as e:
-            print(f"❌ Organizasyon davet hatası: {str(e)}")
+            log.error("❌ Organizasyon davet hatası: %s", e)
             return False
     
     def _get_project_id(self) -> Optional[str]:
-        """Proje ID'sini al"""
+        """Proje ID'sini al (client ömrü boyunca cache'lenir; proje ID'si değişmez)"""
+        if self._project_id_cache:
+            return self._project_id_cache
         try:
             url = f"{self.base_url}/projects/{self.project_name}?api-version=7.1"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._request('GET', url, 'project')
             
             if response.status_code == 200:
                 project_data = response.json()
-                return project_data.get('id')
+                self._project_id_cache = project_data.get('id')
+                return self._project_id_cache
             else:
-                print(f"❌ Proje bilgisi alınamadı: {response.status_code}")
+                log.warning("❌ Proje bilgisi alınamadı: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"❌ Proje ID alma hatası: {str(e)}")
+            log.error("❌ Proje ID alma hatası: %s", e)
             return None
     
     def _get_team_descriptor(self, team_id: str) -> Optional[str]:
@@ -474,24 +721,24 @@ class AzureDevOpsRESTClient:
         try:
             # Teams API ile takım bilgilerini al
             url = f"{self.base_url}/projects/{self.project_name}/teams/{team_id}?api-version=7.1"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._request('GET', url, 'team')
             
             if response.status_code == 200:
                 team_data = response.json()
                 # Takım descriptor'ı genellikle 'id' alanında bulunur
                 descriptor = team_data.get('id')
                 if descriptor:
-                    print(f"✅ Takım descriptor bulundu: {descriptor}")
+                    log.debug("✅ Takım descriptor bulundu: %s", descriptor)
                     return descriptor
                 else:
-                    print(f"❌ Takım descriptor bulunamadı")
+                    log.warning("❌ Takım descriptor bulunamadı")
                     return None
             else:
-                print(f"❌ Takım bilgisi alınamadı: {response.status_code}")
+                log.warning("❌ Takım bilgisi alınamadı: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"❌ Takım descriptor alma hatası: {str(e)}")
+            log.error("❌ Takım descriptor alma hatası: %s", e)
             return None
     
     def _convert_role_to_group_type(self, role: str, team_name: str = None) -> str:
@@ -520,22 +767,22 @@ class AzureDevOpsRESTClient:
         # Eğer rol mapping'de varsa onu kullan
         if role_lower in role_mapping:
             group_type = role_mapping[role_lower]
-            print(f"🔄 Rol dönüşümü: {role} -> {group_type}")
+            log.debug("🔄 Rol dönüşümü: %s -> %s", role, group_type)
             return group_type
         
         # Eğer özel bir takım adı belirtilmişse ve rol bulunamazsa
         if team_name:
-            print(f"⚠️ Bilinmeyen rol '{role}', takım '{team_name}' için varsayılan 'projectContributor' kullanılıyor")
+            log.warning("⚠️ Bilinmeyen rol '%s', takım '%s' için varsayılan 'projectContributor' kullanılıyor", role, team_name)
             return 'projectContributor'
         
         # Varsayılan olarak Contributor
-        print(f"⚠️ Bilinmeyen rol '{role}', varsayılan 'projectContributor' kullanılıyor")
+        log.warning("⚠️ Bilinmeyen rol '%s', varsayılan 'projectContributor' kullanılıyor", role)
         return 'projectContributor'
     
     def invite_multiple_users_batch(self, user_emails: List[str], license_type: str = "stakeholder") -> Dict[str, bool]:
         """🚀 YENİ: Birden fazla kullanıcıyı toplu davet et"""
         try:
-            print(f"📧 {len(user_emails)} kullanıcı toplu davet ediliyor...")
+            log.info("📧 %s kullanıcı toplu davet ediliyor...", len(user_emails))
             
             results = {}
             
@@ -546,10 +793,10 @@ class AzureDevOpsRESTClient:
             users_to_invite = [email for email, descriptor in existing_users.items() if descriptor is None]
             
             if not users_to_invite:
-                print("✅ Tüm kullanıcılar zaten organizasyonda mevcut")
+                log.debug("✅ Tüm kullanıcılar zaten organizasyonda mevcut")
                 return {email: True for email in user_emails}
             
-            print(f"📧 {len(users_to_invite)} yeni kullanıcı davet edilecek...")
+            log.info("📧 %s yeni kullanıcı davet edilecek...", len(users_to_invite))
             
             # Toplu davet işlemi
             for email in users_to_invite:
@@ -559,7 +806,7 @@ class AzureDevOpsRESTClient:
                     if success:
                         self._pending_invitations.append(email)
                 except Exception as e:
-                    print(f"❌ Davet hatası {email}: {str(e)}")
+                    log.error("❌ Davet hatası %s: %s", email, e)
                     results[email] = False
             
             # Zaten mevcut olan kullanıcılar için başarılı işaretle
@@ -568,12 +815,12 @@ class AzureDevOpsRESTClient:
                     results[email] = True
             
             success_count = sum(1 for success in results.values() if success)
-            print(f"✅ Toplu davet tamamlandı: {success_count}/{len(user_emails)} başarılı")
+            log.info("✅ Toplu davet tamamlandı: %s/%s başarılı", success_count, len(user_emails))
             
             return results
                 
         except Exception as e:
-            print(f"❌ Toplu davet hatası: {str(e)}")
+            log.error("❌ Toplu davet hatası: %s", e)
             return {email: False for email in user_emails}
     
     
@@ -589,95 +836,134 @@ class AzureDevOpsRESTClient:
             bool: İşlem başarılı ise True, değilse False
         """
         try:
-            print(f"\n==== GRUP EKLEME ====")
-            print(f"Ekleniyor: {user_email} -> {group_name} ({role})")
-            print(f"==============================")
+            log.debug("==== GRUP EKLEME ====")
+            log.debug("Ekleniyor: %s -> %s (%s)", user_email, group_name, role)
+            log.debug("==============================")
 
             # 1. Kullanıcı organizasyonda mı?
             user_descriptor = self.check_user_exists_in_org(user_email)
             if not user_descriptor:
-                print(f"❌ Kullanıcı organizasyonda yok, ProjectEntitlements ile doğrudan takıma ekleyerek davet ediliyor...")
+                log.info("❌ Kullanıcı organizasyonda yok, ProjectEntitlements ile doğrudan takıma ekleyerek davet ediliyor...")
                 
                 # 🚀 YENİ: ProjectEntitlements ile doğrudan takıma ekleme
                 invite_ok = self.invite_user_to_organization(user_email, "stakeholder", group_name, role)
                 
                 if not invite_ok:
-                    print(f"❌ ProjectEntitlements ile davet başarısız: {user_email}")
-                    print(f"🔄 Klasik davet yöntemi deneniyor...")
+                    log.warning("❌ ProjectEntitlements ile davet başarısız: %s", user_email)
+                    log.debug("🔄 Klasik davet yöntemi deneniyor...")
                     
                     # Fallback: Klasik davet yöntemi
                     fallback_invite = self.invite_user_to_organization(user_email, "stakeholder")
                     if not fallback_invite:
-                        print(f"❌ Tüm davet yöntemleri başarısız: {user_email}")
-                        print(f"⚠️ Manuel davet gerekebilir - Azure DevOps portalından davet edin")
+                        log.warning("❌ Tüm davet yöntemleri başarısız: %s", user_email)
+                        log.warning("⚠️ Manuel davet gerekebilir - Azure DevOps portalından davet edin")
                         return False
                     
                     # Fallback başarılıysa, ayrıca takıma ekleme işlemi yapılacak
-                    print(f"✅ Klasik davet başarılı, şimdi takıma ekleniyor: {user_email}")
+                    log.debug("✅ Klasik davet başarılı, şimdi takıma ekleniyor: %s", user_email)
                 else:
-                    print(f"✅ ProjectEntitlements ile doğrudan takıma ekleme başarılı: {user_email}")
-                    print(f"🎉 Hem organizasyona davet hem takıma ekleme tek seferde tamamlandı!")
+                    log.debug("✅ ProjectEntitlements ile doğrudan takıma ekleme başarılı: %s", user_email)
+                    log.debug("🎉 Hem organizasyona davet hem takıma ekleme tek seferde tamamlandı!")
                     # ProjectEntitlements başarılıysa, işlem tamamdır - hem davet hem takıma ekleme yapıldı
                     return True
                 
                 # Davetten sonra tekrar kontrol et
-                print(f"🔄 Davet sonrası tekrar kontrol ediliyor...")
-                time.sleep(3)
+                log.debug("🔄 Davet sonrası tekrar kontrol ediliyor...")
+                self._wait_for_propagation(3)
                 user_descriptor = self.check_user_exists_in_org(user_email)
                 if not user_descriptor:
-                    print(f"❌ Bulunamadı: {user_email}")
-                    print(f"⚠️ Manuel davet gerekebilir - Azure DevOps portalından davet edin")
+                    log.warning("❌ Bulunamadı: %s", user_email)
+                    log.warning("⚠️ Manuel davet gerekebilir - Azure DevOps portalından davet edin")
                     return False
-                print(f"✅ Organizasyona eklendi: {user_email}")
+                log.debug("✅ Organizasyona eklendi: %s", user_email)
             else:
-                print(f"✅ Zaten üye: {user_email}")
+                log.debug("✅ Zaten üye: %s", user_email)
 
             # 2. Grup türünü otomatik tespit et - hataya karşı korumalı
             try:
                 group_type = self._detect_group_type(group_name)
-                print(f"🔍 Grup türü: {group_type}")
+                log.debug("🔍 Grup türü: %s", group_type)
             except AttributeError:
-                print(f"⚠️ _detect_group_type metodu bulunamadı, 'unknown' varsayılıyor")
+                log.warning("⚠️ _detect_group_type metodu bulunamadı, 'unknown' varsayılıyor")
                 group_type = 'unknown'
 
             # 3. Grup türüne göre uygun ekleme fonksiyonunu çağır
             if group_type == 'team':
-                print(f"👥 Takıma ekleniyor: {user_email} -> {group_name}")
+                log.debug("👥 Takıma ekleniyor: %s -> %s", user_email, group_name)
                 added = self._add_user_to_work_team(user_email, group_name, role)
                 if not added:
-                    print(f"❌ Standart takım ekleme başarısız: {user_email}")
-                    print(f"🔄 Özel grup yöntemleri deneniyor...")
+                    log.warning("❌ Standart takım ekleme başarısız: %s", user_email)
+                    log.debug("🔄 Özel grup yöntemleri deneniyor...")
                     # Özel grup yöntemlerini dene
-                    return self.add_user_to_custom_group(user_email, group_name)
-                print(f"✅ Kullanıcı başarıyla takıma eklendi: {user_email}")
+                    return self.add_user_to_custom_group(user_email, group_name, group_type)
+                log.debug("✅ Kullanıcı başarıyla takıma eklendi: %s", user_email)
                 return True
 
             elif group_type == 'security':
-                print(f"👮 Güvenlik grubuna ekleniyor: {user_email}")
+                log.debug("👮 Güvenlik grubuna ekleniyor: %s", user_email)
                 added = self._add_user_to_security_group(user_email, group_name)
                 if not added:
-                    print(f"❌ Standart güvenlik grubu ekleme başarısız: {user_email}")
-                    print(f"🔄 Özel grup yöntemleri deneniyor...")
+                    log.warning("❌ Standart güvenlik grubu ekleme başarısız: %s", user_email)
+                    log.debug("🔄 Özel grup yöntemleri deneniyor...")
                     # Özel grup yöntemlerini dene
-                    return self.add_user_to_custom_group(user_email, group_name)
-                print(f"✅ Kullanıcı başarıyla güvenlik grubuna eklendi: {user_email}")
+                    return self.add_user_to_custom_group(user_email, group_name, group_type)
+                log.debug("✅ Kullanıcı başarıyla güvenlik grubuna eklendi: %s", user_email)
                 return True
 
-            else:  # unknown - özel grup olabilir
-                print(f"❓ Bilinmeyen grup türü: {group_name}")
-                print(f"🎯 Özel grup yöntemleri deneniyor...")
+            else:  # custom / unknown - özel grup olabilir
+                log.debug("❓ Bilinmeyen grup türü: %s", group_name)
+                log.debug("🎯 Özel grup yöntemleri deneniyor...")
                 # Doğrudan özel grup yöntemlerini dene
-                success = self.add_user_to_custom_group(user_email, group_name)
+                success = self.add_user_to_custom_group(user_email, group_name, group_type)
                 if success:
                     return True
                     
-                print(f"❌ Tüm yöntemler başarısız: {group_name}")
-                print(f"⚠️ Grup bulunamadı/erişim yok")
-                print(f"⚠️ Manuel ekleme gerekebilir")
+                log.warning("❌ Tüm yöntemler başarısız: %s", group_name)
+                log.warning("⚠️ Grup bulunamadı/erişim yok")
+                log.warning("⚠️ Manuel ekleme gerekebilir")
                 return False
                 
         except Exception as e:
-            print(f"❌ Hata: {str(e)}")
+            log.error("❌ Hata: %s", e)
+            return False
+    
+    def _add_user_to_security_group(self, user_email: str, group_name: str) -> bool:
+        """Kullanıcıyı proje güvenlik grubuna Graph üyeliği olarak ekler
+        
+        Grubun descriptor'ı çalışma başında kurulan sınıflandırma tablosundan okunur (ayrı indirme yok).
+        
+        Args:
+            user_email: Kullanıcının e-posta adresi
+            group_name: Güvenlik grubu adı (ör. "[Proje]\\Contributors")
+            
+        Returns:
+            bool: İşlem başarılı ise True, değilse False
+        """
+        try:
+            classified = self._group_table.get(group_name.strip().lower()) or {}
+            group_descriptor = classified.get('descriptor')
+            if not group_descriptor:
+                group = self._find_graph_group(group_name)
+                group_descriptor = group.get('descriptor') if group else None
+            if not group_descriptor:
+                log.warning("❌ Güvenlik grubu bulunamadı: %s", group_name)
+                return False
+            
+            user_descriptor = self.check_user_exists_in_org(user_email)
+            if not user_descriptor:
+                log.warning("❌ Kullanıcı bulunamadı: %s", user_email)
+                return False
+            
+            url = f"{self.vssps_base_url}/graph/memberships/{user_descriptor}/{group_descriptor}?api-version=7.1-preview.1"
+            response = self._request('PUT', url, 'graph_membership_add')
+            if response.status_code in [200, 201]:
+                log.debug("✅ Güvenlik grubuna eklendi: %s -> %s", user_email, group_name)
+                return True
+            log.error("❌ Güvenlik grubu ekleme hatası: %s", response.status_code)
+            return False
+            
+        except Exception as e:
+            log.error("❌ Güvenlik grubu ekleme hatası: %s", e)
             return False
     
     def wait_for_pending_invitations(self, max_wait_time: int = 30) -> int:
@@ -695,135 +981,135 @@ class AzureDevOpsRESTClient:
         processed_count = 0
         start_time = time.time()
         
-        print(f"⏳ {len(self._pending_invitations)} bekleyen davet işleniyor...")
+        log.info("⏳ %s bekleyen davet işleniyor...", len(self._pending_invitations))
         
         while self._pending_invitations and (time.time() - start_time) < max_wait_time:
             user_email = self._pending_invitations.pop(0)  # Sadece email string'i al
             
-            print(f"🔄 İşleniyor: {user_email}")
+            log.debug("🔄 İşleniyor: %s", user_email)
+            
+            # Davet yanıtıyla organizasyona yansımış kullanıcı için beklenmez
+            if self.check_user_exists_in_org(user_email):
+                log.debug("✅ Kullanıcı organizasyona katıldı: %s", user_email)
+                processed_count += 1
+                continue
             
             # Kullanıcının organizasyona katılmasını bekle
-            time.sleep(2)
+            self._wait_for_propagation(2)
             
             # Kullanıcı organizasyonda mı kontrol et
             if self.check_user_exists_in_org(user_email):
-                print(f"✅ Kullanıcı organizasyona katıldı: {user_email}")
+                log.debug("✅ Kullanıcı organizasyona katıldı: %s", user_email)
                 processed_count += 1
             else:
-                print(f"⏳ Kullanıcı henüz organizasyona katılmamış: {user_email}")
+                log.debug("⏳ Kullanıcı henüz organizasyona katılmamış: %s", user_email)
                 # Tekrar listeye ekle (bir sonraki döngüde denenecek)
                 self._pending_invitations.append(user_email)
                 
         return processed_count
 
-    def add_user_to_custom_group(self, user_email: str, group_name: str) -> bool:
+    def add_user_to_custom_group(self, user_email: str, group_name: str, group_type: str = 'unknown') -> bool:
         """Özel gruplara kullanıcı ekleme - farklı API yaklaşımları
         
         Args:
             user_email: Kullanıcı e-posta adresi
             group_name: Özel grup adı
+            group_type: Tespit edilen grup türü (öğrenilen yöntem sırası bu türe göre tutulur)
             
         Returns:
             bool: İşlem başarılı ise True
         """
-        print(f"🎯 Özel gruba ekleme: {user_email} -> {group_name}")
+        log.debug("🎯 Özel gruba ekleme: %s -> %s", user_email, group_name)
         
-        # Yöntem 1: Graph API ile grup üyeliği
-        if self._add_to_custom_group_via_graph(user_email, group_name):
-            return True
-            
-        # Yöntem 2: Security Groups API
-        if self._add_to_custom_group_via_security_api(user_email, group_name):
-            return True
-            
-        # Yöntem 3: Teams API ile özel takım
-        if self._add_to_custom_group_via_teams_api(user_email, group_name):
-            return True
-            
-        # Yöntem 4: Group Memberships API
-        if self._add_to_custom_group_via_memberships_api(user_email, group_name):
+        methods = {
+            'graph': ("Yöntem 1: Graph API ile grup üyeliği",
+                      lambda: self._add_to_custom_group_via_graph(user_email, group_name)),
+            'security_api': ("Yöntem 2: Security Groups API",
+                             lambda: self._add_to_custom_group_via_security_api(user_email, group_name)),
+            'teams_api': ("Yöntem 3: Teams API ile özel takım",
+                          lambda: self._add_to_custom_group_via_teams_api(user_email, group_name)),
+            'memberships_api': ("Yöntem 4: Group Memberships API",
+                                lambda: self._add_to_custom_group_via_memberships_api(user_email, group_name)),
+        }
+        if self._try_learned_methods(f"custom:{group_type}", methods):
             return True
             
-        print(f"❌ Tüm özel grup ekleme yöntemleri başarısız: {group_name}")
+        log.warning("❌ Tüm özel grup ekleme yöntemleri başarısız: %s", group_name)
         return False
     
     def _add_to_custom_group_via_graph(self, user_email: str, group_name: str) -> bool:
         """Graph API ile özel gruba ekleme"""
         try:
-            print(f"🔍 Graph API ile grup aranıyor: {group_name}")
+            log.debug("🔍 Graph API ile grup aranıyor: %s", group_name)
             
-            # Önce grubu bul
-            org_name = self.organization_url.split('/')[-1]  # URL'den organizasyon adını çıkar
-            groups_url = f"https://vssps.dev.azure.com/{org_name}/_apis/graph/groups?api-version=6.0-preview.1"
-            
-            response = requests.get(groups_url, headers=self.headers)
-            if response.status_code == 200:
-                groups_data = response.json()
-                target_group = None
-                
-                for group in groups_data.get('value', []):
-                    if group.get('displayName', '').lower() == group_name.lower():
-                        target_group = group
-                        break
-                        
+            # Önce grubu bul: sınıflandırma tablosundaki descriptor, yoksa cache'lenmiş Graph grupları
+            classified = self._group_table.get(group_name.strip().lower())
+            if classified and classified['type'] == 'unknown':
+                log.warning("❌ Grup bulunamadı: %s", group_name)
+                return False
+            group_descriptor = classified.get('descriptor') if classified else None
+            if not group_descriptor:
+                target_group = self._find_graph_group(group_name)
                 if not target_group:
-                    print(f"❌ Grup bulunamadı: {group_name}")
+                    log.warning("❌ Grup bulunamadı: %s", group_name)
                     return False
-                    
                 group_descriptor = target_group.get('descriptor')
-                print(f"✅ Grup bulundu: {group_name} ({group_descriptor})")
-                
-                # Kullanıcı descriptor'ını al
-                user_descriptor = self.check_user_exists_in_org(user_email)
-                if not user_descriptor:
-                    print(f"❌ Kullanıcı bulunamadı: {user_email}")
-                    return False
-                    
-                # Gruba ekle
-                membership_url = f"https://vssps.dev.azure.com/{org_name}/_apis/graph/memberships/{user_descriptor}/{group_descriptor}?api-version=6.0-preview.1"
+            log.debug("✅ Grup bulundu: %s (%s)", group_name, group_descriptor)
+            
+            # Kullanıcı descriptor'ını al
+            user_descriptor = self.check_user_exists_in_org(user_email)
+            if not user_descriptor:
+                log.warning("❌ Kullanıcı bulunamadı: %s", user_email)
+                return False
                 
-                add_response = requests.put(membership_url, headers=self.headers)
-                if add_response.status_code in [200, 201]:
-                    print(f"✅ Graph API ile gruba eklendi: {user_email} -> {group_name}")
-                    return True
-                else:
-                    print(f"❌ Graph API ekleme hatası: {add_response.status_code}")
-                    return False
-                    
+            # Gruba ekle
+            org_name = self.organization_url.split('/')[-1]  # URL'den organizasyon adını çıkar
+            membership_url = f"https://vssps.dev.azure.com/{org_name}/_apis/graph/memberships/{user_descriptor}/{group_descriptor}?api-version=6.0-preview.1"
+            
+            add_response = self._request('PUT', membership_url, 'graph_membership_add')
+            if add_response.status_code in [200, 201]:
+                log.debug("✅ Graph API ile gruba eklendi: %s -> %s", user_email, group_name)
+                return True
             else:
-                print(f"❌ Graph API grup listesi hatası: {response.status_code}")
+                self._check_supported(add_response, "Graph API üyelik")
+                log.error("❌ Graph API ekleme hatası: %s", add_response.status_code)
                 return False
                 
+        except MethodUnsupported:
+            raise
         except Exception as e:
-            print(f"❌ Graph API hatası: {str(e)}")
+            log.error("❌ Graph API hatası: %s", e)
             return False
     
     def _add_to_custom_group_via_security_api(self, user_email: str, group_name: str) -> bool:
         """Security Groups API ile ekleme"""
         try:
-            print(f"🛡️ Security API ile grup aranıyor: {group_name}")
+            log.debug("🛡️ Security API ile grup aranıyor: %s", group_name)
             
             # Security groups endpoint
             org_name = self.organization_url.split('/')[-1]  # URL'den organizasyon adını çıkar
-            security_url = f"https://vssps.dev.azure.com/{org_name}/_apis/securityroles/scopes/distributedtask.environmentreferencerole/roleassignments/resources/{self.project}?api-version=6.0-preview.1"
+            security_url = f"https://vssps.dev.azure.com/{org_name}/_apis/securityroles/scopes/distributedtask.environmentreferencerole/roleassignments/resources/{self.project_name}?api-version=6.0-preview.1"
             
-            response = requests.get(security_url, headers=self.headers)
+            response = self._request('GET', security_url, 'security_roles')
             if response.status_code == 200:
-                print(f"✅ Security API erişimi başarılı")
-                # Security group ekleme logic buraya gelecek
-                return False  # Şimdilik false, geliştirilebilir
+                log.debug("✅ Security API erişimi başarılı")
+                # Security group ekleme logic buraya gelecek; o zamana kadar yöntem desteklenmiyor sayılır
+                raise MethodUnsupported("Security API ile ekleme henüz uygulanmadı")
             else:
-                print(f"❌ Security API erişim hatası: {response.status_code}")
+                self._check_supported(response, "Security API")
+                log.error("❌ Security API erişim hatası: %s", response.status_code)
                 return False
                 
+        except MethodUnsupported:
+            raise
         except Exception as e:
-            print(f"❌ Security API hatası: {str(e)}")
+            log.error("❌ Security API hatası: %s", e)
             return False
     
     def _add_to_custom_group_via_teams_api(self, user_email: str, group_name: str) -> bool:
         """Teams API ile özel takım ekleme"""
         try:
-            print(f"👥 Teams API ile takım aranıyor: {group_name}")
+            log.debug("👥 Teams API ile takım aranıyor: %s", group_name)
             
             # Takımları listele
             teams = self.get_teams()
@@ -835,42 +1121,77 @@ class AzureDevOpsRESTClient:
                     break
                     
             if not target_team:
-                print(f"❌ Takım bulunamadı: {group_name}")
+                log.warning("❌ Takım bulunamadı: %s", group_name)
                 return False
                 
             team_id = target_team.get('id')
-            print(f"✅ Takım bulundu: {group_name} ({team_id})")
+            log.debug("✅ Takım bulundu: %s (%s)", group_name, team_id)
             
             # Takıma ekle
             return self._add_user_to_work_team(user_email, group_name, 'Member')
             
         except Exception as e:
-            print(f"❌ Teams API hatası: {str(e)}")
+            log.error("❌ Teams API hatası: %s", e)
             return False
     
     def _add_to_custom_group_via_memberships_api(self, user_email: str, group_name: str) -> bool:
         """Group Memberships API ile ekleme"""
         try:
-            print(f"🔗 Memberships API ile grup aranıyor: {group_name}")
+            log.debug("🔗 Memberships API ile grup aranıyor: %s", group_name)
             
             # Group memberships endpoint
             org_name = self.organization_url.split('/')[-1]  # URL'den organizasyon adını çıkar
             memberships_url = f"https://vssps.dev.azure.com/{org_name}/_apis/graph/memberships?api-version=6.0-preview.1"
             
-            response = requests.get(memberships_url, headers=self.headers)
+            response = self._request('GET', memberships_url, 'graph_memberships')
             if response.status_code == 200:
-                print(f"✅ Memberships API erişimi başarılı")
-                # Memberships logic buraya gelecek
-                return False  # Şimdilik false, geliştirilebilir
+                log.debug("✅ Memberships API erişimi başarılı")
+                # Memberships logic buraya gelecek; o zamana kadar yöntem desteklenmiyor sayılır
+                raise MethodUnsupported("Memberships API ile ekleme henüz uygulanmadı")
             else:
-                print(f"❌ Memberships API erişim hatası: {response.status_code}")
+                self._check_supported(response, "Memberships API")
+                log.error("❌ Memberships API erişim hatası: %s", response.status_code)
                 return False
                 
+        except MethodUnsupported:
+            raise
         except Exception as e:
-            print(f"❌ Memberships API hatası: {str(e)}")
+            log.error("❌ Memberships API hatası: %s", e)
             return False
 
 
+    def _try_learned_methods(self, group_type: str, methods: Dict[str, Tuple[str, Callable[[], bool]]]) -> bool:
+        """Yöntem zincirini öğrenilen sırayla dener (sürekli başarısız olanlar atlanır)
+        
+        Args:
+            group_type: Zincir/grup türü anahtarı (ör. 'team', 'custom:security')
+            methods: Varsayılan sırada yöntem adı -> (açıklama, parametresiz çağrı)
+            
+        Returns:
+            bool: Yöntemlerden biri başarılı olduysa True
+        """
+        for name in self.method_learner.order(self.organization_url, group_type, list(methods)):
+            label, method = methods[name]
+            log.debug("🔍 %s", label)
+            try:
+                result = bool(method())
+            except MethodUnsupported as e:
+                log.debug("⏭️ Yöntem desteklenmiyor: %s (%s)", label, e)
+                self.method_learner.record(self.organization_url, group_type, name, False)
+                continue
+            if result:
+                self.method_learner.record(self.organization_url, group_type, name, True)
+                log.debug("✅ Başarılı yöntem: %s", label)
+                return True
+            # Satıra özgü veya geçici başarısızlık (geçersiz e-posta, 429/5xx): yöntem atlanmaz
+        return False
+    
+    @staticmethod
+    def _check_supported(response: requests.Response, label: str):
+        """Yanıt yöntemin bu organizasyonda desteklenmediğini gösteriyorsa MethodUnsupported fırlat"""
+        if response.status_code in UNSUPPORTED_STATUSES:
+            raise MethodUnsupported(f"{label}: {response.status_code}")
+
     def add_user_to_team(self, user_email: str, team_name: str, role: str = 'Member') -> bool:
         """Kullanıcıyı takıma ekler (geriye uyumluluk için)"""
         return self.add_user_to_any_group(user_email, team_name, role)
@@ -892,101 +1213,114 @@ class AzureDevOpsRESTClient:
             bool: İşlem başarılı ise True, değilse False
         """
         try:
-            print(f"\n🔑 Takıma ekleme: {user_email} -> {team_name}")
-            
-            # KRİTİK: Cache temizleme - eski/yanlış takım bilgilerini önlemek için
-            print(f"🗑️ Cache temizleniyor - taze takım bilgileri alınacak")
-            self._teams_cache = None
-            self._teams_cache_time = None
-            
-            # Takım ID'sini bul - GELİŞMİŞ EŞLEŞTİRME MANTIĞI
-            teams = self.get_teams()
-            team_id = None
-            matched_team = None
+            log.debug("🔑 Takıma ekleme: %s -> %s", user_email, team_name)
+            
+            # Çalışma başında oluşturulan sınıflandırma tablosu takımı zaten çözdüyse
+            # takım listesi tekrar indirilmez
+            classified = self._group_table.get(team_name.strip().lower())
+            if classified and classified['type'] == 'team':
+                team_id = classified['id']
+                matched_team = {'id': team_id, 'name': classified['name']}
+                log.debug("✅ Sınıflandırma tablosundan: '%s' -> ID: %s", matched_team['name'], team_id)
+            else:
+                # KRİTİK: Cache temizleme - eski/yanlış takım bilgilerini önlemek için
+                log.debug("🗑️ Cache temizleniyor - taze takım bilgileri alınacak")
+                self._teams_cache = None
+                self._teams_cache_time = None
             
-            print(f"🔍 Takım arama: '{team_name}'")
-            print(f"📋 Mevcut takımlar: {[team['name'] for team in teams]}")
+                # Takım ID'sini bul - GELİŞMİŞ EŞLEŞTİRME MANTIĞI
+                teams = self.get_teams()
+                team_id = None
+                matched_team = None
             
-            # 1. TAM EŞLEŞME (en güvenilir)
-            for team in teams:
-                if team['name'] == team_name:  # Tam eşleşme (case-sensitive)
-                    team_id = team['id']
-                    matched_team = team
-                    print(f"✅ TAM EŞLEŞME bulundu: '{team['name']}' -> ID: {team_id}")
-                    break
+                log.debug("🔍 Takım arama: '%s'", team_name)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("📋 Mevcut takımlar: %s", [team['name'] for team in teams])
             
-            # 2. CASE-INSENSITIVE EŞLEŞME (fallback)
-            if not team_id:
+                # 1. TAM EŞLEŞME (en güvenilir)
                 for team in teams:
-                    if team['name'].lower() == team_name.lower():
+                    if team['name'] == team_name:  # Tam eşleşme (case-sensitive)
                         team_id = team['id']
                         matched_team = team
-                        print(f"⚠️ CASE-INSENSITIVE eşleşme: '{team['name']}' -> ID: {team_id}")
+                        log.debug("✅ TAM EŞLEŞME bulundu: '%s' -> ID: %s", team['name'], team_id)
                         break
             
-            # 3. KİSMİ EŞLEŞME (en riskli - sadece tek sonuç varsa)
-            if not team_id:
-                partial_matches = []
-                for team in teams:
-                    if team_name.lower() in team['name'].lower() or team['name'].lower() in team_name.lower():
-                        partial_matches.append(team)
+                # 2. CASE-INSENSITIVE EŞLEŞME (fallback)
+                if not team_id:
+                    for team in teams:
+                        if team['name'].lower() == team_name.lower():
+                            team_id = team['id']
+                            matched_team = team
+                            log.warning("⚠️ CASE-INSENSITIVE eşleşme: '%s' -> ID: %s", team['name'], team_id)
+                            break
+            
+                # 3. KİSMİ EŞLEŞME (en riskli - sadece tek sonuç varsa)
+                if not team_id:
+                    partial_matches = []
+                    for team in teams:
+                        if team_name.lower() in team['name'].lower() or team['name'].lower() in team_name.lower():
+                            partial_matches.append(team)
                 
-                if len(partial_matches) == 1:
-                    team_id = partial_matches[0]['id']
-                    matched_team = partial_matches[0]
-                    print(f"⚠️ KİSMİ eşleşme (tek sonuç): '{matched_team['name']}' -> ID: {team_id}")
-                elif len(partial_matches) > 1:
-                    print(f"❌ ÇOKLU KİSMİ EŞLEŞME - Belirsizlik!")
-                    print(f"🔍 Aranan: '{team_name}'")
-                    print(f"🔍 Bulunanlar: {[t['name'] for t in partial_matches]}")
-                    print(f"⚠️ GÜVENLİK İÇİN İŞLEM DURDURULUYOR!")
-                    return False
+                    if len(partial_matches) == 1:
+                        team_id = partial_matches[0]['id']
+                        matched_team = partial_matches[0]
+                        log.warning("⚠️ KİSMİ eşleşme (tek sonuç): '%s' -> ID: %s", matched_team['name'], team_id)
+                    elif len(partial_matches) > 1:
+                        log.warning("❌ ÇOKLU KİSMİ EŞLEŞME - Belirsizlik!")
+                        log.debug("🔍 Aranan: '%s'", team_name)
+                        log.debug("🔍 Bulunanlar: %s", [t['name'] for t in partial_matches])
+                        log.warning("⚠️ GÜVENLİK İÇİN İŞLEM DURDURULUYOR!")
+                        return False
             
-            if not team_id:
-                print(f"❌ Takım bulunamadı: '{team_name}'")
-                print(f"📋 Mevcut takımlar: {[team['name'] for team in teams]}")
-                return False
+                if not team_id:
+                    log.warning("❌ Takım bulunamadı: '%s'", team_name)
+                    log.debug("📋 Mevcut takımlar: %s", [team['name'] for team in teams])
+                    return False
             
             # SON KONTROL - Doğru takımı seçtiğimizi doğrula
-            print(f"🎯 SEÇİLEN TAKIM:")
-            print(f"  • Aranan: '{team_name}'")
-            print(f"  • Bulunan: '{matched_team['name']}'")
-            print(f"  • ID: {team_id}")
+            log.debug("🎯 SEÇİLEN TAKIM:")
+            log.debug("  • Aranan: '%s'", team_name)
+            log.debug("  • Bulunan: '%s'", matched_team['name'])
+            log.debug("  • ID: %s", team_id)
             
             # Kullanıcıdan onay al (kritik işlemler için)
             if matched_team['name'] != team_name:
-                print(f"⚠️ UYARI: Tam eşleşme değil!")
-                print(f"  • İstenen: '{team_name}'")
-                print(f"  • Bulanan: '{matched_team['name']}'")
+                log.warning("⚠️ UYARI: Tam eşleşme değil!")
+                log.debug("  • İstenen: '%s'", team_name)
+                log.debug("  • Bulanan: '%s'", matched_team['name'])
         
-            # METOD 1: Teams API ile e-posta kullanarak doğrudan ekleme
-            print(f"🔍 METOD 1: Teams API ile e-posta kullanarak doğrudan ekleme")
-            result = self._add_user_by_email_direct(user_email, team_id, team_name)
-            if result:
-                print(f"✅ Kullanıcı başarıyla takıma eklendi (Metod 1)")
+            # Kullanıcı zaten üye mi? (takım üyeleri çalışma boyunca cache'lenir). Yöntem zincirinden
+            # önce bakılır: çağrı yapmadan dönen sonuç öğrenicide yöntemin başarısı sayılmamalı
+            if user_email.lower() in self._get_team_member_map(team_id):
+                log.debug("✅ Zaten üye: %s -> %s", user_email, team_name)
                 return True
-                
-            # METOD 2: Kullanıcıyı organizasyonda arayıp ID ile ekleme
-            print(f"🔍 METOD 2: Kullanıcıyı organizasyonda arayıp ID ile ekleme")
-            user_id = self._find_user_in_organization(user_email)
-            if user_id:
-                result = self._add_user_by_id_direct(user_id, team_id, team_name)
-                if result:
-                    print(f"✅ Kullanıcı başarıyla takıma eklendi (Metod 2)")
-                    return True
             
-            # METOD 3: Basit davet sistemi
-            print(f"🔍 METOD 3: Alternatif endpoint ile ekleme deniyor")
-            result = self._simple_invite_and_add(user_email, team_id, team_name)
-            if result:
-                print(f"✅ Kullanıcı başarıyla takıma eklendi (Metod 3)")
+            def add_by_id():
+                user_id = self._find_user_in_organization(user_email)
+                return bool(user_id) and self._add_user_by_id_direct(user_id, team_id, team_name)
+            
+            # Yöntemler bu organizasyonda daha önce çalışan önce gelecek şekilde denenir
+            methods = {
+                'email_direct': ("METOD 1: Teams API ile e-posta kullanarak doğrudan ekleme",
+                                 lambda: self._add_user_by_email_direct(user_email, team_id, team_name)),
+                'id_direct': ("METOD 2: Kullanıcıyı organizasyonda arayıp ID ile ekleme", add_by_id),
+                'simple_invite': ("METOD 3: Alternatif endpoint ile ekleme",
+                                  lambda: self._simple_invite_and_add(user_email, team_id, team_name)),
+            }
+            if self._try_learned_methods('team', methods):
+                log.debug("✅ Kullanıcı başarıyla takıma eklendi")
+                # Üye cache'i atılmaz, yeni üye eklenir (sonraki satırlar üye listesini tekrar indirmez)
+                members = self._team_members_cache.get(team_id)
+                if members is not None:
+                    members.setdefault(user_email.lower(), {'id': None, 'displayName': '', 'uniqueName': user_email,
+                                                            'email': user_email, 'isActive': True})
                 return True
                 
-            print(f"❌ Tüm ekleme yöntemleri başarısız oldu: {user_email} -> {team_name}")
+            log.warning("❌ Tüm ekleme yöntemleri başarısız oldu: %s -> %s", user_email, team_name)
             return False
                 
         except Exception as e:
-            print(f"❌ Takıma ekleme hatası: {str(e)}")
+            log.error("❌ Takıma ekleme hatası: %s", e)
             return False
 
 
@@ -1002,17 +1336,8 @@ class AzureDevOpsRESTClient:
             bool: İşlem başarılı ise True, değilse False
         """
         try:
-            print(f"🧠 Teams API ile doğrudan ekleme: {user_email} -> {team_name}")
+            log.debug("🧠 Teams API ile doğrudan ekleme: %s -> %s", user_email, team_name)
             
-            # Üyeleri kontrol et
-            team_members = self.get_team_members(team_id)
-            
-            # Kullanıcı zaten üye mi?
-            for member in team_members:
-                if member.get('uniqueName', '').lower() == user_email.lower():
-                    print(f"✅ Zaten üye: {user_email} -> {team_name}")
-                    return True
-                    
             # Teams API endpoint
             url = f"{self.base_url}/teams/{team_id}/members?api-version={self.api_version}"
             
@@ -1021,21 +1346,22 @@ class AzureDevOpsRESTClient:
                 'uniqueName': user_email
             }
             
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=data
-            )
+            response = self._request('POST', url, 'team_member_add', json=data)
             
             if response.status_code in [200, 201]:
-                print(f"✅ Teams API ile eklendi: {user_email}")
+                log.debug("✅ Teams API ile eklendi: %s", user_email)
                 return True
             else:
-                print(f"ℹ️ Teams API yanıt kodu: {response.status_code}")
+                # 404 bu endpoint'te çoğunlukla satıra özgüdür (bilinmeyen kullanıcı/takım): yöntemi atlatmaz
+                if response.status_code != 404:
+                    self._check_supported(response, "Teams API e-posta ile ekleme")
+                log.debug("ℹ️ Teams API yanıt kodu: %s", response.status_code)
                 return False
                 
+        except MethodUnsupported:
+            raise
         except Exception as e:
-            print(f"ℹ️ Teams API hata: {str(e)}")
+            log.debug("ℹ️ Teams API hata: %s", e)
             return False
             
     def _find_user_in_organization(self, user_email: str) -> Optional[str]:
@@ -1048,24 +1374,20 @@ class AzureDevOpsRESTClient:
             Optional[str]: Kullanıcı ID'si veya None
         """
         try:
-            print(f"🔍 Kullanıcı aranıyor: {user_email}")
-            
-            # Tüm organizasyon üyelerini al
-            org_members = self._load_all_org_users()
-            
-            # Kullanıcıyı bul
-            for member in org_members:
-                email = member.get('uniqueName', '').lower()
-                if email == user_email.lower():
-                    user_id = member.get('id')
-                    print(f"✅ Kullanıcı bulundu: {user_email}, ID: {user_id}")
-                    return user_id
+            log.debug("🔍 Kullanıcı aranıyor: %s", user_email)
+            
+            # E-posta indeksinden bul (org üyeleri cache'den veya API'den)
+            member = self._get_org_user_index().get(user_email.strip().lower())
+            if member and member.get('id'):
+                user_id = member.get('id')
+                log.debug("✅ Kullanıcı bulundu: %s, ID: %s", user_email, user_id)
+                return user_id
                     
-            print(f"ℹ️ Kullanıcı organizasyonda bulunamadı: {user_email}")
+            log.debug("ℹ️ Kullanıcı organizasyonda bulunamadı: %s", user_email)
             return None
             
         except Exception as e:
-            print(f"ℹ️ Kullanıcı arama hatası: {str(e)}")
+            log.debug("ℹ️ Kullanıcı arama hatası: %s", e)
             return None
             
     def _add_user_by_id_direct(self, user_id: str, team_id: str, team_name: str) -> bool:
@@ -1080,26 +1402,26 @@ class AzureDevOpsRESTClient:
             bool: İşlem başarılı ise True, değilse False
         """
         try:
-            print(f"🔑 ID ile ekleme: Kullanıcı ID {user_id} -> Takım {team_name}")
+            log.debug("🔑 ID ile ekleme: Kullanıcı ID %s -> Takım %s", user_id, team_name)
             
             # Teams API endpoint
             url = f"{self.base_url}/teams/{team_id}/members/{user_id}?api-version={self.api_version}"
             
             # PUT isteği yap
-            response = requests.put(
-                url,
-                headers=self.headers
-            )
+            response = self._request('PUT', url, 'team_member_add_by_id')
             
             if response.status_code in [200, 201]:
-                print(f"✅ ID ile başarıyla eklendi")
+                log.debug("✅ ID ile başarıyla eklendi")
                 return True
             else:
-                print(f"ℹ️ ID ile ekleme yanıt kodu: {response.status_code}")
+                self._check_supported(response, "Teams API ID ile ekleme")
+                log.debug("ℹ️ ID ile ekleme yanıt kodu: %s", response.status_code)
                 return False
                 
+        except MethodUnsupported:
+            raise
         except Exception as e:
-            print(f"ℹ️ ID ile ekleme hatası: {str(e)}")
+            log.debug("ℹ️ ID ile ekleme hatası: %s", e)
             return False
             
     def _simple_invite_and_add(self, user_email: str, team_id: str, team_name: str) -> bool:
@@ -1114,7 +1436,7 @@ class AzureDevOpsRESTClient:
             bool: İşlem başarılı ise True, değilse False
         """
         try:
-            print(f"📧 Basit davet ile ekleme: {user_email} -> {team_name}")
+            log.debug("📧 Basit davet ile ekleme: %s -> %s", user_email, team_name)
             
             # Alternatif endpoint
             url = f"{self.base_url}/teams/{team_id}/members?api-version={self.api_version}"
@@ -1126,21 +1448,141 @@ class AzureDevOpsRESTClient:
             }
             
             # Önce POST ile dene
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=data
-            )
+            response = self._request('POST', url, 'team_member_add', json=data)
             
             if response.status_code in [200, 201]:
-                print(f"✅ Alternatif yöntem ile eklendi: {user_email}")
+                log.debug("✅ Alternatif yöntem ile eklendi: %s", user_email)
                 return True
             
-            print(f"ℹ️ Alternatif ekleme yanıt kodu: {response.status_code}")
+            self._check_supported(response, "Alternatif endpoint")
+            log.debug("ℹ️ Alternatif ekleme yanıt kodu: %s", response.status_code)
             return False
                 
+        except MethodUnsupported:
+            raise
         except Exception as e:
-            print(f"ℹ️ Alternatif ekleme hatası: {str(e)}")
+            log.debug("ℹ️ Alternatif ekleme hatası: %s", e)
             return False
 
-
+    # ==================== ÇIKARMA (REMOVAL) ====================
+    
+    def _get_org_user_index(self) -> Dict[str, Dict]:
+        """Organizasyon üyelerinin e-posta -> kullanıcı indeksi (cache ile birlikte kurulur; arama O(1))"""
+        if self._load_all_org_users() is not self._org_users_cache:
+            return {}  # Yükleme başarısız
+        return self._org_user_index
+    
+    def _find_team(self, team_name: str) -> Optional[Dict]:
+        """Takımı tam veya büyük/küçük harf duyarsız eşleşmeyle bulur (kısmi eşleşme yok)"""
+        teams = self.get_teams()
+        for team in teams:
+            if team.get('name') == team_name:
+                return team
+        for team in teams:
+            if (team.get('name') or '').lower() == team_name.lower():
+                return team
+        return None
+    
+    def _get_team_member_map(self, team_id: str) -> Dict[str, Dict]:
+        """Takım üyelerini e-posta -> üye sözlüğü olarak döndürür (çalışma boyunca cache'lenir, çalışma başında atılır)"""
+        members = self._team_members_cache.get(team_id)
+        self.metrics.cache_lookup('team_members', members is not None)
+        if members is None:
+            members = {
+                (member.get('uniqueName') or '').lower(): member
+                for member in self.get_team_members(team_id)
+                if member.get('uniqueName')
+            }
+            self._team_members_cache[team_id] = members
+        return members
+    
+    def _get_team_graph_descriptor(self, team_id: str) -> Optional[str]:
+        """Takımın Graph (vssgp) descriptor'ını storage key üzerinden çözer (cache'lenir)"""
+        hit = team_id in self._team_descriptor_cache
+        self.metrics.cache_lookup('team_descriptors', hit)
+        if hit:
+            return self._team_descriptor_cache[team_id]
+        try:
+            url = f"{self.vssps_base_url}/graph/descriptors/{team_id}?api-version=7.1-preview.1"
+            response = self._request('GET', url, 'graph_descriptors')
+            
+            if response.status_code == 200:
+                descriptor = response.json().get('value')
+                self._team_descriptor_cache[team_id] = descriptor
+                return descriptor
+            else:
+                log.warning("❌ Takım descriptor alınamadı: %s", response.status_code)
+                return None
+                
+        except Exception as e:
+            log.error("❌ Takım descriptor hatası: %s", e)
+            return None
+    
+    def _get_graph_groups(self) -> List[Dict]:
+        """Organizasyondaki Graph gruplarını listeler (cache ile)"""
+        self.metrics.cache_lookup('graph_groups', self._graph_groups_cache is not None)
+        if self._graph_groups_cache is not None:
+            return self._graph_groups_cache
+        try:
+            url = f"{self.vssps_base_url}/graph/groups?api-version=7.1-preview.1"
+            groups, status_code = self._get_continuation_pages(url, 'graph_groups')
+            
+            if status_code == 200:
+                self._graph_groups_cache = groups
+                return self._graph_groups_cache
+            else:
+                log.warning("❌ Graph grupları alınamadı: %s", status_code)
+                return []
+                
+        except Exception as e:
+            log.error("❌ Graph grupları hatası: %s", e)
+            return []
+    
+    def _find_graph_group(self, group_name: str) -> Optional[Dict]:
+        """Graph grubunu görünen ad veya principalName ile bulur"""
+        name = group_name.lower()
+        for group in self._get_graph_groups():
+            if (group.get('displayName') or '').lower() == name or \
+               (group.get('principalName') or '').lower() == name:
+                return group
+        return None
+    
+    def _remove_membership(self, subject_descriptor: str, container_descriptor: str) -> Tuple[bool, str]:
+        """
+        Graph üyeliğini siler
+        
+        Returns:
+            Tuple[bool, str]: (başarı, mesaj) - üyelik zaten yoksa da başarılı sayılır
+        """
+        try:
+            url = f"{self.vssps_base_url}/graph/memberships/{subject_descriptor}/{container_descriptor}?api-version=7.1-preview.1"
+            response = self._request('DELETE', url, 'graph_membership_remove')
+            
+            if response.status_code in [200, 204]:
+                return True, "Üyelik silindi"
+            elif response.status_code == 404:
+                return True, "Zaten üye değil"
+            else:
+                return False, f"Üyelik silme hatası: {response.status_code}"
+                
+        except Exception as e:
+            return False, f"Üyelik silme hatası: {str(e)}"
+    
+    def remove_users_batch(self, removals: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[bool, str]]:
+        """🚀 Kullanıcıları takım/gruplardan toplu ve paralel olarak çıkarır
+        
+        Args:
+            removals: (kullanıcı e-postası, takım/grup adı) listesi
+            
+        Returns:
+            Dict[Tuple[str, str], Tuple[bool, str]]: (e-posta küçük harf, grup adı küçük harf) -> (başarı, mesaj)
+        """
+        from core.removal_engine import RemovalEngine
+        return RemovalEngine(self).remove_batch(removals)
+    
+    def remove_user_from_team(self, user_email: str, team_name: str) -> bool:
+        """Kullanıcıyı takımdan veya güvenlik grubundan çıkarır"""
+        results = self.remove_users_batch([(user_email, team_name)])
+        ok, message = results.get((user_email.strip().lower(), team_name.strip().lower()), (False, ''))
+        log.debug("%s Çıkarma: %s -> %s: %s", '✅' if ok else '❌', user_email, team_name, message)
+        return ok
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Toplu İşlem Yürütücüsü
+Excel'den okunan kullanıcı listesini Azure DevOps üzerinde işleyen, arayüzden bağımsız pipeline.
+GUI (ProcessThread) ve komut satırı (cli.py) aynı yürütücüyü kullanır; bu modül PyQt5 import etmez.
+"""
+
+import os
+import datetime
+import itertools
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core import profiler
+from core.cancellation import CancellationToken, CancelledError
+from core.log import get_logger
+from core.report_writer import ReportWriter
+from core.user_row import UserRow
+
+log = get_logger('runner')
+
+
+CANCELLED_MESSAGE = "İşlem kullanıcı tarafından durduruldu"
+
+
+class BatchRunner:
+    """Arayüzden bağımsız kullanıcı ekleme/çıkarma pipeline'ı"""
+
+    chunk_size = 500  # Satırlar bu büyüklükte parçalar halinde okunup işlenir
+
+    def __init__(self, file_path: str, azure_rest_client, excel_processor,
+                 on_log: Callable[[str], None] = None,
+                 on_status: Callable[[str], None] = None,
+                 on_progress: Callable[[int, int], None] = None,
+                 users: Iterable[UserRow] = None,
+                 cancel_token: CancellationToken = None,
+                 total_hint: int = None,
+                 profile: profiler.RunProfile = None):
+        """
+        Toplu işlem yürütücüsü başlatma
+
+        Args:
+            file_path: İşlenecek Excel dosyası
+            azure_rest_client: AzureDevOpsRESTClient örneği
+            excel_processor: ExcelProcessor örneği
+            on_log: Log mesajı callback'i
+            on_status: Durum mesajı callback'i
+            on_progress: İlerleme callback'i (current, total)
+            users: Satırlar (liste veya akış; verilmezse dosya akış halinde okunur)
+            cancel_token: İptal token'ı (verilmezse yeni oluşturulur; stop() ile tetiklenir)
+            total_hint: İlerleme için yaklaşık toplam satır sayısı (akışta bilinmiyorsa)
+            profile: Aşama sürelerinin yazılacağı çalışma profili (verilmezse ölçüm yapılmaz)
+        """
+        self.file_path = file_path
+        self.azure_rest_client = azure_rest_client
+        self.excel_processor = excel_processor
+        self.on_log = on_log
+        self.on_status = on_status
+        self.on_progress = on_progress
+        self.users = users
+        self.cancel_token = cancel_token or CancellationToken()
+        self.total_hint = total_hint
+        self.profile = profile if profile is not None else profiler.DISABLED
+        self.is_running = False
+        self._current_chunk = []  # İşlenmekte olan parça
+        self._row_index = 0  # Parça içinde işlenmekte olan satır (iptalde buradan itibaren rapora İPTAL yazılır)
+        self._uncertain_rows = []  # Toplu isteği sürmekte olan satırlar (iptalde sonuçları bilinmez)
+        self._removal_results = {}  # İşlenen bölümün tamamlanmış toplu çıkarma sonuçları
+        self._segment_end = 0  # İşlenen bölümün parça içindeki bitiş indeksi
+        self._active_row = None  # Ekleme isteği sürmekte olan satır
+        self._unread = None  # Satır akışının henüz parçaya alınmamış kısmı (iptalde rapora İPTAL yazılır)
+        self._rows_done = 0
+        self._success_count = 0
+        self._error_count = 0
+        self._errors = []
+        self.call_stats = {}  # Bu çalışmada endpoint başına (çağrı sayısı, toplam süre sn)
+
+        # Rapor satırları diske akıtılır; özetler sayaçlardan üretilir
+        self.report = ReportWriter()
+
+    def log(self, message: str):
+        """Log mesajını callback'e ilet"""
+        if self.on_log:
+            self.on_log(message)
+
+    def status(self, message: str):
+        """Durum mesajını callback'e ilet"""
+        if self.on_status:
+            self.on_status(message)
+
+    def progress(self, current: int, total: int):
+        """İlerleme bilgisini callback'e ilet"""
+        if self.on_progress:
+            self.on_progress(current, total)
+
+    def stop(self):
+        """Çalışan işlemi durdur: bekleyen sleep ve HTTP çağrıları hemen uyandırılır"""
+        self.is_running = False
+        self.cancel_token.cancel()
+
+    def _add_report_entry(self, user_email: str, team_name: str, role: str, action: str,
+                          status: str, error_message: str = ''):
+        """Rapora bir satır ekle"""
+        self.report.add(user_email, team_name, role, action, status, error_message)
+
+    def _record_error(self, message: str):
+        """Hatayı say; özet için yalnızca ilk birkaç mesaj tutulur (bellek satır sayısından bağımsız)"""
+        self._error_count += 1
+        if len(self._errors) < 3:
+            self._errors.append(message)
+
+    def run(self) -> Tuple[bool, Optional[str]]:
+        """
+        Pipeline'ı çalıştırır
+
+        Returns:
+            Tuple[bool, Optional[str]]: (başarı durumu, hata özeti)
+        """
+        users = None
+        stats_before = self._client_call_stats()
+        try:
+            self.is_running = True
+            self.log("🚀 Azure DevOps işlemi başlatılıyor...")
+
+            # İptal token'ını client'a bağla (sleep, hız sınırı ve HTTP beklemeleri iptalde uyanır)
+            if hasattr(self.azure_rest_client, 'set_cancel_token'):
+                self.azure_rest_client.set_cancel_token(self.cancel_token)
+            if hasattr(self.azure_rest_client, 'set_profile'):
+                self.azure_rest_client.set_profile(self.profile)
+
+            # Bağlantıyı test et
+            self.log("🔍 Azure DevOps bağlantısı test ediliyor...")
+            try:
+                with self.profile.stage('bootstrap'):
+                    success = self.azure_rest_client.test_connection()
+                if not success:
+                    self.log("❌ Azure CLI bağlantı hatası")
+                    self.status("❌ Bağlantı hatası")
+                    return False, "Azure CLI bağlantı hatası"
+            except Exception as e:
+                self.log(f"❌ Bağlantı test hatası: {str(e)}")
+                return False, f"Bağlantı test hatası: {str(e)}"
+
+            self.log("✅ Azure DevOps bağlantısı başarılı")
+
+            users = self.users
+            if users is None:
+                users, error_message = self.iter_users()
+                if error_message:
+                    return False, error_message
+
+            return self._process_users(users)
+
+        except CancelledError as e:
+            return self._finish_cancelled(e)
+        except Exception as e:
+            self.log(f"❌ Genel işlem hatası: {str(e)}")
+            self.status("❌ İşlem hatası")
+            return False, str(e)
+        finally:
+            self.is_running = False
+            self.report.close()
+            self.call_stats = self._diff_call_stats(stats_before, self._client_call_stats())
+
+    def _client_call_stats(self) -> Dict[str, Tuple[int, float]]:
+        if hasattr(self.azure_rest_client, 'get_call_stats'):
+            return self.azure_rest_client.get_call_stats()
+        return {}
+
+    @staticmethod
+    def _diff_call_stats(before: Dict[str, Tuple[int, float]],
+                         after: Dict[str, Tuple[int, float]]) -> Dict[str, Tuple[int, float]]:
+        """Paylaşılan client'ın sayaçlarından yalnızca bu çalışmaya ait kısmı"""
+        diff = {}
+        for endpoint, (count, seconds) in after.items():
+            prev_count, prev_seconds = before.get(endpoint, (0, 0.0))
+            if count > prev_count:
+                diff[endpoint] = (count - prev_count, seconds - prev_seconds)
+        return diff
+
+    def _finish_cancelled(self, error: CancelledError = None) -> Tuple[bool, Optional[str]]:
+        """
+        İptal sonrası raporu tutarlı bırakır: tamamlanmamış ve henüz okunmamış her satır İPTAL
+        olarak yazılır. İptal anında isteği sürmekte olan satırların (toplu çıkarma, bağlantısı
+        kopan istek) sonucu bilinmediğinden BİLİNMİYOR yazılır. İşlenen bölümün toplu çıkarması
+        iptalden önce bittiyse o satırlar silme sonucuyla yazılır.
+        """
+        message = CANCELLED_MESSAGE
+        uncertain = set(self._uncertain_rows)
+        if error is not None and error.in_flight and self._active_row is not None:
+            uncertain.add(self._active_row)
+
+        cancelled = unknown = removed = 0
+        for index in range(self._row_index, len(self._current_chunk)):
+            user = self._current_chunk[index]
+            removal = self._completed_removal(index, user)
+            if index in uncertain:
+                self._add_report_entry(user.email, user.team, user.role, user.action, 'BİLİNMİYOR',
+                                       "İptal anında istek sürüyordu; sonuç bilinmiyor")
+                unknown += 1
+            elif removal is not None:
+                # Bölümün toplu çıkarması iptalden önce bitti: silme sonucu yazılır
+                result, failure_message = removal
+                self._add_report_entry(user.email, user.team, user.role, user.action,
+                                       'BAŞARILI' if result else 'BAŞARISIZ', '' if result else failure_message)
+                removed += 1
+            else:
+                self._add_report_entry(user.email, user.team, user.role, user.action, 'İPTAL', message)
+                cancelled += 1
+
+        # Okunmamış satırlar da rapora yazılır (akıştan okundukça; bellekte tutulmaz)
+        unread = self._unread if self._unread is not None else self.users
+        try:
+            for user in unread or ():
+                self._add_report_entry(user.email, user.team, user.role, user.action, 'İPTAL', message)
+                cancelled += 1
+        except Exception as e:
+            self.log(f"⚠️ Okunmamış satırlar rapora eklenemedi: {str(e)}")
+
+        unknown_note = f", {unknown} satırın sonucu bilinmiyor" if unknown else ""
+        removed_note = f", {removed} çıkarma sonucu yazıldı" if removed else ""
+        self.log(f"⏹️ {message} ({cancelled} satır işlenmedi{unknown_note}{removed_note})")
+        self.status("⏹️ İşlem durduruldu")
+        return False, message
+
+    def _completed_removal(self, index: int, user: UserRow) -> Optional[Tuple[bool, str]]:
+        """Satır, işlenen bölümün tamamlanmış toplu çıkarmasındaysa (sonuç, hata mesajı)"""
+        if index >= self._segment_end or user.action != 'remove' or user.error:
+            return None
+        return self._removal_results.get((user.email, (user.team or '').lower()))
+
+    def read_users(self) -> Tuple[Optional[List[UserRow]], Optional[str]]:
+        """
+        Girdi dosyasını okur
+
+        Returns:
+            Tuple[Optional[List[UserRow]], Optional[str]]: (kullanıcı satırları, hata mesajı)
+        """
+        self.status("📂 Excel dosyası okunuyor...")
+        try:
+            excel_data = self.excel_processor.read_excel(self.file_path)
+            if not excel_data or 'users' not in excel_data:
+                self.log("❌ Excel dosyası okunamadı veya boş")
+                return None, "Excel dosyası okunamadı"
+
+            users = excel_data['users']
+            if not users:
+                self.log("❌ Excel dosyasında kullanıcı bulunamadı")
+                return None, "Excel dosyasında kullanıcı bulunamadı"
+
+            return users, None
+
+        except Exception as e:
+            self.log(f"❌ Excel okuma hatası: {str(e)}")
+            return None, f"Excel okuma hatası: {str(e)}"
+
+    def iter_users(self) -> Tuple[Optional[Iterator[UserRow]], Optional[str]]:
+        """
+        Girdi dosyasını akış halinde açar; başlık ve ilk satır burada okunur ki
+        dosya hataları işlem başlamadan raporlansın
+
+        Returns:
+            Tuple[Optional[Iterator[UserRow]], Optional[str]]: (satır akışı, hata mesajı)
+        """
+        self.status("📂 Excel dosyası okunuyor...")
+        try:
+            with self.profile.stage('parse'):
+                rows = self.excel_processor.iter_rows(self.file_path)
+                first = next(rows, None)
+                if first is None:
+                    self.log("❌ Excel dosyasında kullanıcı bulunamadı")
+                    return None, "Excel dosyasında kullanıcı bulunamadı"
+                if self.total_hint is None:
+                    self.total_hint = self.excel_processor.count_rows(self.file_path)
+            return itertools.chain([first], self.profile.iterate('parse', rows)), None
+
+        except Exception as e:
+            self.log(f"❌ Excel okuma hatası: {str(e)}")
+            return None, f"Excel okuma hatası: {str(e)}"
+
+    def _chunks(self, users: Iterable[UserRow]) -> Iterator[List[UserRow]]:
+        """Satır akışını chunk_size büyüklüğünde parçalara böler"""
+        iterator = iter(users)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _process_users(self, users: Iterable[UserRow]) -> Tuple[bool, Optional[str]]:
+        """Kullanıcı satırlarını (liste veya akış) parça parça Azure DevOps üzerinde işler"""
+        if isinstance(users, list):
+            self.total_hint = len(users)
+            self.log(f"📊 {len(users)} kullanıcı bulundu, işlem başlatılıyor...")
+        else:
+            hint = f" (~{self.total_hint} satır)" if self.total_hint else ""
+            self.log(f"📊 Satırlar okundukça işleniyor{hint}...")
+
+        # 🚀 PERFORMANS OPTİMİZASYONU: Toplu işlem stratejisi
+        self.log("⚡ Performans optimizasyonu aktif: Cache ve batch işlem kullanılıyor")
+
+        self._current_chunk = []
+        self._row_index = 0
+        self._uncertain_rows = []
+        self._active_row = None
+        self._unread = iter(users)
+        self._rows_done = 0
+        self._success_count = 0
+        self._error_count = 0
+        self._errors = []
+
+        # Önce tüm takımları ve organizasyon üyelerini cache'le (tek seferde)
+        self.status("🔄 Takımlar ve organizasyon üyeleri yükleniyor...")
+        with self.profile.stage('bootstrap'):
+            teams = self.azure_rest_client.get_teams()  # Cache'lenir
+            org_users = self.azure_rest_client._load_all_org_users()  # Cache'lenir
+            self.log(f"💾 {len(teams)} takım ve {len(org_users)} organizasyon üyesi cache'lendi")
+
+            # Grup sınıflandırma tablosu bu çalışma için sıfırlanır; parçalar yeni adları ekler
+            self.azure_rest_client.classify_groups([], refresh=True)
+
+        for chunk in self._chunks(self._unread):
+            self._current_chunk = chunk
+            self._row_index = 0
+            self._process_chunk(chunk)
+
+        self._current_chunk = []
+        self._row_index = 0
+        self._unread = None
+        success_count, error_count, errors = self._success_count, self._error_count, self._errors
+
+        # Bekleyen davetleri işle (non-blocking)
+        if hasattr(self.azure_rest_client, '_pending_invitations') and self.azure_rest_client._pending_invitations:
+            self.status("⏳ Bekleyen davetler işleniyor...")
+            with self.profile.stage('propagation_wait'):
+                processed = self.azure_rest_client.wait_for_pending_invitations(max_wait_time=30)
+            if processed > 0:
+                self.log(f"✅ {processed} bekleyen davet başarıyla işlendi")
+
+        # Sonuçları raporla
+        self.progress(self._rows_done, self._rows_done)
+        self.log(f"📊 {self._rows_done} satır işlendi")
+
+        if success_count > 0:
+            self.log(f"\n🎉 İşlem tamamlandı!")
+            self.log(f"✅ Başarılı işlem sayısı: {success_count}")
+            if error_count > 0:
+                self.log(f"❌ Hatalı işlem sayısı: {error_count}")
+
+        if error_count == 0:
+            self.status("🎉 Tüm işlemler başarılı!")
+            return True, None
+
+        error_summary = f"{error_count} hata oluştu"
+        if errors:
+            error_summary += f": {'; '.join(errors[:3])}"
+            if error_count > len(errors):
+                error_summary += f" ve {error_count - len(errors)} hata daha..."
+
+        self.status(f"⚠️ {success_count} başarılı, {error_count} hatalı")
+        return success_count > 0, error_summary
+
+    @staticmethod
+    def _segments(users: List[UserRow]) -> Iterator[Tuple[int, int]]:
+        """
+        Parçayı, aynı (email, takım) için ekleme/çıkarma yönünün değiştiği satırlardan böler
+
+        Çıkarmalar bölüm başında toplu yapıldığından, aynı üyelik için "ekle sonra çıkar" (veya
+        tersi) aynı bölümde olursa sıra bozulur; yön değişen satır yeni bölüm başlatır.
+
+        Yields:
+            Tuple[int, int]: Bölümün parça içindeki [başlangıç, bitiş) indeksleri
+        """
+        start = 0
+        directions = {}  # (email, takım küçük harf) -> bu bölümdeki işlem
+        for index, user in enumerate(users):
+            if user.error or not user.email or not user.team or user.action not in ('add', 'remove'):
+                continue
+            key = (user.email, user.team.lower())
+            previous = directions.get(key)
+            if previous is not None and previous != user.action:
+                yield start, index
+                start = index
+                directions = {}
+            directions[key] = user.action
+        yield start, len(users)
+
+    def _process_chunk(self, users: List[UserRow]):
+        """Tek bir parçayı satır sırasını bozmayan bölümler halinde işler"""
+        for start, end in self._segments(users):
+            self._process_segment(users, start, end)
+        self._row_index = len(users)
+
+    def _process_segment(self, users: List[UserRow], start: int, end: int):
+        """Parçanın [start, end) bölümünü işler: toplu davet ve çıkarma, ardından satır döngüsü"""
+        self._row_index = start
+        self._segment_end = end
+        self._removal_results = {}
+        # Kullanıcıları işlem türüne göre grupla (alanlar ayrıştırmada normalize edildi);
+        # satırlar kopyalanmaz, parça içindeki indeksleri tutulur
+        add_rows = []
+        remove_rows = []
+
+        for index in range(start, end):
+            user = users[index]
+            if not user.email or not user.team or user.error:
+                continue
+
+            if user.action == 'add':
+                add_rows.append(index)
+            elif user.action == 'remove':
+                remove_rows.append(index)
+
+        self.log(f"📊 İşlem planı: {len(add_rows)} ekleme, {len(remove_rows)} çıkarma")
+
+        # Parçadaki yeni grup adları sınıflandırma tablosuna eklenir (bilinen adlar tekrar aranmaz)
+        if add_rows:
+            group_names = {users[index].team for index in add_rows}
+            with self.profile.stage('bootstrap'):
+                self.azure_rest_client.classify_groups(sorted(group_names))
+
+        # Toplu davet işlemi (sadece ekleme için)
+        if add_rows:
+            self.status("📧 Toplu davet işlemi başlatılıyor...")
+            add_emails = [users[index].email for index in add_rows]
+            with self.profile.stage('invite'):
+                batch_invite_results = self.azure_rest_client.invite_multiple_users_batch(add_emails)
+            self.log(f"📧 Toplu davet tamamlandı: {sum(batch_invite_results.values())}/{len(add_emails)} başarılı")
+
+        # Toplu çıkarma işlemi: takım başına gruplanır, üyelik silmeleri paralel gönderilir
+        removal_results = {}
+        if remove_rows:
+            self.status("🧹 Toplu çıkarma işlemi başlatılıyor...")
+            self._uncertain_rows = remove_rows  # Silmeler paralel gider; iptalde hangisinin bittiği bilinmez
+            with self.profile.stage('removal'):
+                removal_results = self.azure_rest_client.remove_users_batch([
+                    (users[index].email, users[index].team) for index in remove_rows
+                ])
+            self._uncertain_rows = []
+            self._removal_results = removal_results  # İptalde bu bölümün çıkarma satırları buradan raporlanır
+            removed_count = sum(1 for ok, _ in removal_results.values() if ok)
+            self.log(f"🧹 Toplu çıkarma tamamlandı: {removed_count}/{len(removal_results)} başarılı")
+
+        # Kullanıcıları işle (optimize edilmiş)
+        for i in range(start, end):
+            user = users[i]
+            self._row_index = i
+            self.cancel_token.raise_if_cancelled()
+            self._rows_done += 1
+            row_number = user.row
+
+            try:
+                user_email, team_name, role, action = user.email, user.team, user.role, user.action
+
+                total_users = max(self.total_hint or 0, self._rows_done)
+                self.progress(self._rows_done, total_users)
+                self.status(f"⚡ İşleniyor: {user_email} ({self._rows_done}/{total_users})")
+
+                if user.error:
+                    # Akışta doğrulanamayan satır: işlem durmaz, satır hatası olarak raporlanır
+                    self._add_report_entry(user_email, team_name, role, action, 'HATA', user.error)
+                    self.log(f"❌ {user.error}")
+                    self._record_error(user.error)
+                    continue
+
+                if not user_email or not team_name:
+                    self.log(f"❌ Eksik bilgi: {user}")
+                    self._record_error(f"Eksik bilgi: {user_email or 'Email yok'} - {team_name or 'Takım yok'}")
+                    continue
+
+                try:
+                    # İşlem türüne göre kullanıcı ekle/çıkar (çıkarmalar yukarıda toplu yapıldı)
+                    failure_message = 'API işlemi başarısız'
+                    if action == 'add':
+                        self._active_row = i
+                        with self.profile.stage('team_add'):
+                            result = self.azure_rest_client.add_user_to_team(user_email, team_name, role)
+                        self._active_row = None
+                    elif action == 'remove':
+                        result, failure_message = removal_results.get(
+                            (user_email, team_name.lower()),
+                            (False, 'Çıkarma sonucu bulunamadı')
+                        )
+                    else:
+                        self.log(f"❌ Geçersiz işlem: {action} - {user_email}")
+                        self._record_error(f"Geçersiz işlem: {action} - {user_email}")
+                        continue
+
+                    # Rapor verilerini topla
+                    self._add_report_entry(user_email, team_name, role, action,
+                                           'BAŞARILI' if result else 'BAŞARISIZ',
+                                           '' if result else failure_message)
+
+                    if result:
+                        self.log(f"✅ Başarılı: {user_email} -> {team_name} ({action})")
+                        self._success_count += 1
+                    else:
+                        self.log(f"❌ Başarısız: {user_email} -> {team_name} ({action})")
+                        self._record_error(f"İşlem başarısız: {user_email} -> {team_name}")
+
+                except Exception as e:
+                    # Hata durumu için rapor verisi
+                    self._add_report_entry(user_email, team_name, role, action, 'HATA', str(e))
+
+                    self.log(f"❌ Hata: {user_email} -> {str(e)}")
+                    self._record_error(f"Hata: {user_email} -> {str(e)}")
+
+            except Exception as e:
+                error_msg = f"Satır {row_number} işlem hatası: {str(e)}"
+                self.log(f"❌ {error_msg}")
+                self._record_error(error_msg)
+
+    def generate_excel_report(self, output_dir: str = None) -> Optional[str]:
+        """İşlem sonuçlarının Excel raporunu oluşturur
+
+        Args:
+            output_dir: Raporun yazılacağı dizin (varsayılan: masaüstü)
+
+        Returns:
+            Optional[str]: Oluşturulan rapor dosyasının yolu
+        """
+        try:
+            if not len(self.report):
+                return None
+
+            # Masaüstü yolunu al
+            if not output_dir:
+                output_dir = os.path.join(os.path.expanduser("~"), "Desktop")
+            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            report_filename = f"azure_devops_islem_raporu_{timestamp}.xlsx"
+            report_path = os.path.join(output_dir, report_filename)
+
+            # Satırlar rapor dosyasından akıtılır, özetler sayaçlardan üretilir
+            with self.profile.stage('report'):
+                return self.report.write_excel(report_path)
+
+        except Exception as e:
+            log.error("Excel raporu oluşturma hatası: %s", e)
+            return None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İptal Token'ı
+Çalışan bir işlemi bekleme (sleep), hız sınırı ve HTTP çağrıları dahil her noktada
+sınırlı sürede durdurmak için client, runner ve executor'lar arasında paylaşılır.
+"""
+
+import threading
+from typing import Callable
+
+from core.log import get_logger
+
+log = get_logger('runner')
+
+
+class CancelledError(BaseException):
+    """İşlem iptal edildi
+
+    BaseException'dan türetilir; client'taki geniş `except Exception` blokları iptali
+    "başarısız işlem" olarak yutmaz, iptal runner'a kadar ulaşır.
+    """
+
+    def __init__(self, message: str = "İşlem iptal edildi", in_flight: bool = False):
+        super().__init__(message)
+        self.in_flight = in_flight  # İptal anında yanıtı alınamamış bir istek vardı (sonucu bilinmiyor)
+
+
+class CancellationToken:
+    """Thread-safe iptal bayrağı ve uyandırma callback'leri"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """İptal et: bekleyenleri uyandır ve kayıtlı callback'leri bir kez çağır"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                log.warning("⚠️ İptal callback hatası: %s", e)
+
+    def register(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        İptal anında çağrılacak callback ekle (zaten iptal edildiyse hemen çağrılır)
+
+        Returns:
+            Callable[[], None]: Kaydı kaldıran fonksiyon
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def unregister():
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+
+                return unregister
+
+        callback()
+        return lambda: None
+
+    def raise_if_cancelled(self):
+        """İptal edildiyse CancelledError fırlat"""
+        if self._event.is_set():
+            raise CancelledError("İşlem iptal edildi")
+
+    def sleep(self, seconds: float):
+        """İptal edilebilir bekleme: iptalde hemen uyanır ve CancelledError fırlatır"""
+        if self._event.wait(seconds):
+            raise CancelledError("İşlem iptal edildi")
+
+    def wait_for(self, event: threading.Event):
+        """Olay tetiklenene veya iptal edilene kadar bekle (iptalde CancelledError)"""
+        unregister = self.register(event.set)
+        try:
+            event.wait()
+        finally:
+            unregister()
+        self.raise_if_cancelled()
@@ -1,9 +1,13 @@
 import os
 import json
 
+from core.log import get_logger
+
+log = get_logger('config')
+
 class ConfigManager:
-    def __init__(self):
-        self.config_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
+    def __init__(self, config_file=None):
+        self.config_file = config_file or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.json')
         self.config = self.load_config()
     
     def load_config(self):
@@ -14,7 +18,7 @@ class ConfigManager:
                     return json.load(f)
             return {}
         except Exception as e:
-            print(f"Konfigürasyon yükleme hatası: {e}")
+            log.error("Konfigürasyon yükleme hatası: %s", e)
             return {}
     
     def save_config(self, config):
@@ -25,7 +29,7 @@ class ConfigManager:
             self.config = config
             return True
         except Exception as e:
-            print(f"Konfigürasyon kaydetme hatası: {e}")
+            log.error("Konfigürasyon kaydetme hatası: %s", e)
             return False
     
     def get_config(self):
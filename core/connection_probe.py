@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bağlantı Testi
+Projeler API'si, kullanıcı yetkileri (vsaex), Graph (vssps) ve takımlar endpoint'lerini
+paralel olarak yoklar. Her sonuç biter bitmez callback'e iletilir ve endpoint başına
+gecikmeyi taşır; en yavaş endpoint toplam süreyi belirler. Bu modül PyQt5 import etmez.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, NamedTuple, Optional
+from urllib.parse import quote
+
+
+class ProbeResult(NamedTuple):
+    """Tek bir endpoint yoklamasının sonucu"""
+    name: str                   # 'projects', 'entitlements', 'graph', 'teams'
+    label: str                  # Arayüzde gösterilen ad
+    ok: bool
+    status_code: Optional[int]  # HTTP durum kodu (istek atılamadıysa None)
+    latency: float              # Saniye
+    detail: str                 # Kullanıcıya gösterilecek açıklama
+
+
+# name -> arayüz etiketi (yoklama sırası)
+PROBE_LABELS = {
+    'projects': 'Projeler API',
+    'entitlements': 'Kullanıcı Yetkileri (vsaex)',
+    'graph': 'Graph (vssps)',
+    'teams': 'Takımlar',
+}
+
+
+class ConnectionProber:
+    """Bağlantı endpoint'lerini paralel yoklayan test"""
+
+    def __init__(self, client, timeout: float = 10):
+        """
+        Args:
+            client: AzureDevOpsRESTClient (istekler _request üzerinden gider)
+            timeout: Endpoint başına istek zaman aşımı (saniye)
+        """
+        self.client = client
+        self.timeout = timeout
+        self.teams = []  # Takımlar yoklaması başarılıysa takım listesi
+
+    def _get(self, url: str, endpoint: str):
+        return self.client._request('GET', url, f"probe_{endpoint}", timeout=self.timeout)
+
+    def _probe_projects(self):
+        client = self.client
+        response = self._get(f"{client.base_url}/projects/{quote(client.project_name)}?api-version={client.api_version}",
+                             'projects')
+        if response.status_code == 200:
+            return response, f"Proje bulundu: {response.json().get('name', client.project_name)}"
+        if response.status_code == 404:
+            return response, f"Proje bulunamadı: {client.project_name}"
+        return response, None
+
+    def _probe_entitlements(self):
+        response = self._get(f"{self.client.vsaex_base_url}/userentitlements?top=1&api-version=7.1-preview.3",
+                             'entitlements')
+        if response.status_code == 200:
+            return response, "Kullanıcı yetkileri okunabiliyor"
+        return response, None
+
+    def _probe_graph(self):
+        response = self._get(f"{self.client.vssps_base_url}/graph/groups?api-version=7.1-preview.1", 'graph')
+        if response.status_code == 200:
+            return response, f"{len(response.json().get('value', []))} grup okundu"
+        return response, None
+
+    def _probe_teams(self):
+        client = self.client
+        response = self._get(f"{client.base_url}/projects/{quote(client.project_name)}/teams"
+                             f"?api-version={client.api_version}", 'teams')
+        if response.status_code == 200:
+            self.teams = [{'id': team.get('id'), 'name': team.get('name'),
+                           'description': team.get('description', ''), 'url': team.get('url', '')}
+                          for team in response.json().get('value', [])]
+            # İşlem başladığında takım listesi yeniden çekilmez
+            client._cache_teams(self.teams)
+            if not self.teams:
+                return response, "Projede takım bulunamadı"
+            names = ", ".join(team['name'] for team in self.teams[:5])
+            more = f" ve {len(self.teams) - 5} takım daha" if len(self.teams) > 5 else ""
+            return response, f"{len(self.teams)} takım: {names}{more}"
+        return response, None
+
+    def _run_probe(self, name: str) -> ProbeResult:
+        probe = getattr(self, f"_probe_{name}")
+        started = time.monotonic()
+        try:
+            response, detail = probe()
+        except Exception as e:
+            return ProbeResult(name, PROBE_LABELS[name], False, None, time.monotonic() - started, str(e))
+        latency = time.monotonic() - started
+        status_code = response.status_code
+        ok = status_code == 200 and not (name == 'teams' and not self.teams)
+        if detail is None:
+            if status_code in (401, 203):
+                detail = "Yetkisiz: PAT token geçersiz veya süresi dolmuş"
+            elif status_code == 403:
+                detail = "Erişim reddedildi: PAT token kapsamı yetersiz"
+            else:
+                detail = f"API hatası: {status_code}"
+        return ProbeResult(name, PROBE_LABELS[name], ok, status_code, latency, detail)
+
+    def run(self, on_result: Callable[[ProbeResult], None] = None) -> List[ProbeResult]:
+        """
+        Tüm endpoint'leri paralel yokla
+
+        Args:
+            on_result: Her sonuç geldiğinde (bitiş sırasıyla) çağrılır
+
+        Returns:
+            List[ProbeResult]: PROBE_LABELS sırasıyla sonuçlar
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(PROBE_LABELS), thread_name_prefix='probe') as executor:
+            futures = [executor.submit(self._run_probe, name) for name in PROBE_LABELS]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.name] = result
+                if on_result:
+                    on_result(result)
+        return [results[name] for name in PROBE_LABELS]
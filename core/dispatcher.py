@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çoklu Organizasyon/Proje Dağıtıcısı
+Tek bir girdi dosyasındaki satırları Organization/Project kolonlarına göre bölümlere ayırır,
+her bölümü havuzdaki kendi client'ı (ve kendi hız sınırı bütçesi) ile paralel işler ve
+raporu bölüm bazında birleştirir. Dosya akış halinde okunur; satırlar okundukça parçalar
+halinde bölümlere iletilir, böylece işlem dosyanın tamamı okunmadan başlar.
+"""
+
+import os
+import re
+import time
+import shutil
+import queue
+import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from core import profiler
+from core.batch_runner import BatchRunner, CANCELLED_MESSAGE
+from core.report_writer import REPORT_COLUMNS, ReportWriter, spool_directory, write_rows
+from core.cancellation import CancellationToken
+from core.log import get_logger
+from core.run_estimator import CallTally, RunEstimate, RunEstimator
+from core.user_row import UserRow
+
+log = get_logger('runner')
+
+
+def normalize_organization_url(value: str) -> str:
+    """'myorg' veya 'https://dev.azure.com/myorg/' biçimindeki değeri tam URL'e çevirir"""
+    value = (value or '').strip()
+    if not value:
+        return ''
+    if not value.startswith(('https://', 'http://')):
+        return f"https://dev.azure.com/{value.strip('/')}"
+    return value.rstrip('/')
+
+
+class Partition:
+    """Aynı organizasyon/projeye ait satırlar ve bu satırları işleyen runner"""
+
+    max_buffered_chunks = 2  # Çalışan bölüm için okuyucunun önden tampona alabileceği parça sayısı
+
+    def __init__(self, organization_url: str, project_name: str):
+        self.organization_url = organization_url
+        self.project_name = project_name
+        self.runner = None
+        self.success = None
+        self.error_message = None
+
+        # Akış: okuyucu parçaları kuyruğa koyar, bölüm runner'ı tüketir
+        self.buffer = []
+        self.rows_read = 0
+        self.rows_unprocessed = 0  # Runner bittikten sonra gelen, doğrudan rapora yazılan satırlar
+        self._lock = threading.Lock()  # feed ile finish arasında parça kaybolmasın
+        self._chunks = queue.Queue()
+        self._slots = threading.Semaphore(self.max_buffered_chunks)
+        self.started = threading.Event()
+        self.finished = threading.Event()
+
+    def feed(self, cancel_token):
+        """Tampondaki satırları parça olarak bölüme ilet (okuyucu tarafı)
+
+        Çalışmaya başlamış bölüm için en fazla max_buffered_chunks parça bekletilir; okuyucu
+        gerekirse bölümün yetişmesini bekler ve bellek dosya boyutundan bağımsız kalır. Henüz
+        başlamamış (worker bekleyen) bölümün tamponu sınırlanmaz, aksi halde okuyucu kilitlenirdi.
+        """
+        if not self.buffer:
+            return
+        chunk, self.buffer = self.buffer, []
+        acquired = False
+        if self.started.is_set():
+            while not acquired and not self.finished.is_set() and not cancel_token.is_cancelled:
+                acquired = self._slots.acquire(timeout=0.1)
+        with self._lock:
+            if not self.finished.is_set():
+                self._chunks.put((chunk, acquired))
+                return
+        # Runner erken bitti (ör. bağlantı hatası): satırlar tüketilmeyecek, doğrudan rapora yazılır
+        self._report_unprocessed([chunk], cancel_token)
+
+    def finish(self, cancel_token):
+        """Runner bitti: kuyrukta kalan, tüketilmemiş parçalar rapora yazılır (runner tarafı)"""
+        with self._lock:
+            self.finished.set()
+            chunks = []
+            while True:
+                try:
+                    chunk, _ = self._chunks.get_nowait()
+                except queue.Empty:
+                    break
+                if chunk:
+                    chunks.append(chunk)
+        self._report_unprocessed(chunks, cancel_token)
+
+    def _report_unprocessed(self, chunks, cancel_token):
+        """İşlenmeyecek satırları iptalde İPTAL, bölüm hatasında HATA olarak rapora yazar"""
+        if not chunks or self.runner is None:
+            return
+        if cancel_token.is_cancelled:
+            status, message = 'İPTAL', CANCELLED_MESSAGE
+        else:
+            status, message = 'HATA', f"Bölüm işlenemedi: {self.error_message or 'bilinmeyen hata'}"
+        report = self.runner.report
+        for chunk in chunks:
+            for user in chunk:
+                report.add(user.email, user.team, user.role, user.action, status, message)
+                self.rows_unprocessed += 1
+        report.close()
+
+    def close(self):
+        """Okuma bitti: runner kalan parçaları işleyip sonlanır"""
+        self._chunks.put((None, False))
+
+    def rows(self):
+        """Bölüme iletilen satırları okundukça üretir (runner tarafı)"""
+        self.started.set()
+        while True:
+            chunk, acquired = self._chunks.get()
+            if acquired:
+                self._slots.release()
+            if chunk is None:
+                return
+            yield from chunk
+
+    @property
+    def label(self) -> str:
+        org_name = self.organization_url.rstrip('/').split('/')[-1]
+        return f"{org_name}/{self.project_name}"
+
+
+class PartitionDispatcher:
+    """Girdi satırlarını organizasyon/proje bölümlerine dağıtıp paralel işler"""
+
+    def __init__(self, file_path: str, client_pool, excel_processor,
+                 organization_url: str, project_name: str, pat_token: str = None,
+                 on_log: Callable[[str], None] = None,
+                 on_status: Callable[[str], None] = None,
+                 on_progress: Callable[[int, int], None] = None,
+                 max_workers: int = 4, estimator: RunEstimator = None, run_estimate: RunEstimate = None,
+                 profile: profiler.RunProfile = None, prepare_report: bool = True,
+                 cancel_token: CancellationToken = None):
+        """
+        Args:
+            file_path: İşlenecek girdi dosyası
+            client_pool: Organizasyon/proje başına client tutan ClientPool
+            excel_processor: ExcelProcessor örneği
+            organization_url: Satırda Organization boşsa kullanılacak varsayılan organizasyon
+            project_name: Satırda Project boşsa kullanılacak varsayılan proje
+            pat_token: Personal Access Token
+            on_log / on_status / on_progress: İlerleme callback'leri
+            max_workers: Aynı anda işlenecek en fazla bölüm sayısı
+            estimator: Verilirse çalışma sonunda ölçülen endpoint gecikmeleri geçmişe eklenir
+            run_estimate: Çalışma öncesi alınmış tahmin (verilirse sonunda gerçekleşenle karşılaştırılır)
+            profile: Profil modunda aşama sürelerinin yazılacağı çalışma profili (raporun yanına yazılır)
+            prepare_report: False ise rapor çalışma sonunda önceden hazırlanmaz (rapor istenmediğinde)
+            cancel_token: İşin iptal token'ı (verilmezse yeni token; stop() ile tetiklenir)
+        """
+        self.file_path = file_path
+        self.client_pool = client_pool
+        self.excel_processor = excel_processor
+        self.organization_url = organization_url
+        self.project_name = project_name
+        self.pat_token = pat_token
+        self.on_log = on_log
+        self.on_status = on_status
+        self.on_progress = on_progress
+        self.max_workers = max_workers
+        self.estimator = estimator
+        self.run_estimate = run_estimate
+        self.profile = profile if profile is not None else profiler.DISABLED
+        self.profile_path = None  # Raporun yanına yazılan katlanmış yığın dosyası
+        self.prepare_report = prepare_report
+        self.finished_at = None  # İşlemenin bittiği an (rapor hazırlığından önce)
+
+        self.partitions = []
+        self._partitions_by_key = {}
+        self._rows_read = 0
+        self._total_hint = None
+        self._progress = {}
+        self._progress_lock = threading.Lock()
+        self.cancel_token = cancel_token or CancellationToken()  # Tüm bölümler aynı token'ı paylaşır
+        self.unread_report = None  # İptalde okunmadan bırakılan satırların toplu kaydı (tek bölüm yoksa)
+        self._prepared_report = None  # Çalışma sonunda önceden yazılan rapor dosyası
+
+    def log(self, message: str):
+        if self.on_log:
+            self.on_log(message)
+
+    def _partition_key(self, user: UserRow) -> Tuple[Tuple[str, str], str, str]:
+        """Satırın bölüm anahtarı, organizasyon URL'i ve proje adı (boşsa varsayılanlar)"""
+        org_url = normalize_organization_url(user.organization) or \
+            normalize_organization_url(self.organization_url)
+        project_name = user.project or self.project_name
+        return (org_url.lower(), project_name.lower()), org_url, project_name
+
+    def _route(self, user: UserRow, executor: ThreadPoolExecutor) -> Partition:
+        """Satırı bölümüne yönlendirir; yeni bölüm görüldüğünde runner'ı hemen başlatılır"""
+        key, org_url, project_name = self._partition_key(user)
+        partition = self._partitions_by_key.get(key)
+        if partition is None:
+            partition = Partition(org_url, project_name)
+            self._partitions_by_key[key] = partition
+            self.partitions.append(partition)
+            with self._progress_lock:
+                self._progress[id(partition)] = 0
+            if len(self.partitions) > 1:
+                self.log(f"🗂️ Yeni organizasyon/proje bölümü: {partition.label} "
+                         f"(toplam {len(self.partitions)}, en fazla {self.max_workers} paralel)")
+            executor.submit(self._run_partition, partition)
+        return partition
+
+    def _partition_callbacks(self, partition: Partition):
+        """Bölüm runner'ı için (birden fazla bölüm varsa etiketli) callback'ler"""
+        def prefix():
+            return f"[{partition.label}] " if len(self.partitions) > 1 else ""
+
+        def on_log(message):
+            self.log(f"{prefix()}{message}")
+
+        def on_status(message):
+            if self.on_status:
+                self.on_status(f"{prefix()}{message}")
+
+        def on_progress(current, total):
+            with self._progress_lock:
+                self._progress[id(partition)] = current
+                done = sum(self._progress.values())
+            if self.on_progress:
+                self.on_progress(done, max(self._total_hint or 0, self._rows_read, done))
+
+        return on_log, on_status, on_progress
+
+    def _run_partition(self, partition: Partition) -> Partition:
+        """Tek bir bölümü kendi client'ı ile, satırlar okundukça işler"""
+        try:
+            # İptal edilmiş olsa da runner kurulur: satırlar rapora İPTAL olarak yazılır
+            on_log, on_status, on_progress = self._partition_callbacks(partition)
+            try:
+                client = self.client_pool.get_client(partition.organization_url, partition.project_name, self.pat_token)
+                partition.runner = BatchRunner(self.file_path, client, self.excel_processor,
+                                               on_log=on_log, on_status=on_status, on_progress=on_progress,
+                                               users=partition.rows(), cancel_token=self.cancel_token,
+                                               profile=self.profile)
+                partition.success, partition.error_message = partition.runner.run()
+            except Exception as e:
+                on_log(f"❌ Bölüm hatası: {str(e)}")
+                partition.success, partition.error_message = False, str(e)
+                if partition.runner is None:
+                    # Yalnızca rapor için: bölümün satırları rapora HATA olarak yazılır
+                    partition.runner = BatchRunner(self.file_path, None, self.excel_processor,
+                                                   cancel_token=self.cancel_token)
+            return partition
+        finally:
+            partition.finish(self.cancel_token)
+            if partition.rows_unprocessed:
+                self.log(f"⚠️ [{partition.label}] {partition.rows_unprocessed} satır işlenmeden rapora yazıldı")
+
+    def _estimate_tallies(self, tallies: List[Tuple[str, str, CallTally]]) -> RunEstimate:
+        """Bölüm özetlerini (havuzdaki client'ların cache durumu ile) API'ye istek atmadan tahmin eder"""
+        estimator = self.estimator or RunEstimator()
+        return estimator.estimate(
+            [(tally, self.client_pool.get_client(org_url, project_name, self.pat_token))
+             for org_url, project_name, tally in tallies],
+            requests_per_second=getattr(self.client_pool, 'requests_per_second', 10.0),
+            max_parallel=self.max_workers
+        )
+
+    def estimate(self) -> Tuple[Optional[RunEstimate], Optional[str]]:
+        """
+        Dosyayı okuyup çalışmanın API çağrı sayısını ve süresini tahmin eder (dry-run)
+
+        Returns:
+            Tuple[Optional[RunEstimate], Optional[str]]: (tahmin, hata mesajı)
+        """
+        reader = BatchRunner(self.file_path, None, self.excel_processor,
+                             on_log=self.on_log, on_status=self.on_status)
+        rows, error_message = reader.iter_users()
+        if error_message:
+            return None, error_message
+
+        # Satırlar akış halinde okunur ve bölüm özetlerine işlenir; dosyanın tamamı bellekte tutulmaz
+        tallies = OrderedDict()
+        for user in rows:
+            key, org_url, project_name = self._partition_key(user)
+            entry = tallies.get(key)
+            if entry is None:
+                entry = tallies[key] = (org_url, project_name, CallTally())
+            entry[2].add(user)
+        return self._estimate_tallies(list(tallies.values())), None
+
+    def _report_estimate(self, elapsed: float):
+        """Gerçekleşen çağrıları tahminle karşılaştır ve ölçümleri geçmişe ekle"""
+        actual = {}
+        for partition in self.partitions:
+            if not partition.runner:
+                continue
+            for endpoint, (count, seconds) in partition.runner.call_stats.items():
+                prev_count, prev_seconds = actual.get(endpoint, (0, 0.0))
+                actual[endpoint] = (prev_count + count, prev_seconds + seconds)
+
+        if self.run_estimate is not None and not self.cancel_token.is_cancelled:
+            actual_calls = {endpoint: count for endpoint, (count, _) in actual.items()}
+            for line in self.estimator.compare(self.run_estimate, actual_calls, elapsed):
+                self.log(line)
+        self.estimator.record(actual)
+
+    def run(self) -> Tuple[bool, Optional[str]]:
+        """
+        Dosyayı akış halinde bir kez okur; satırları okundukça bölümlerine iletir ve
+        bölümleri paralel işler
+
+        Returns:
+            Tuple[bool, Optional[str]]: (başarı durumu, hata özeti)
+        """
+        reader = BatchRunner(self.file_path, None, self.excel_processor,
+                             on_log=self.on_log, on_status=self.on_status, profile=self.profile)
+        rows, error_message = reader.iter_users()
+        if error_message:
+            return False, error_message
+        self._total_hint = reader.total_hint
+
+        if self.run_estimate is not None:
+            self.log(f"⏱️ Tahmin: {self.run_estimate.summary()}")
+        started = time.time()
+
+        read_error = None
+        unread_from = None
+        chunk_size = BatchRunner.chunk_size
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix='partition') as executor:
+            try:
+                # İptalde okuma durur: tampondaki satırlar bölümlerce İPTAL yazılır, kalanlar toplu kaydedilir
+                for user in rows:
+                    if self.cancel_token.is_cancelled:
+                        unread_from = user.row
+                        break
+                    partition = self._route(user, executor)
+                    partition.buffer.append(user)
+                    partition.rows_read += 1
+                    self._rows_read += 1
+                    if len(partition.buffer) >= chunk_size:
+                        partition.feed(self.cancel_token)
+                for partition in self.partitions:
+                    partition.feed(self.cancel_token)
+            except Exception as e:
+                read_error = f"Excel okuma hatası (satır {self._rows_read + 2} civarı): {str(e)}"
+                self.log(f"❌ {read_error}")
+            except BaseException:
+                # Ctrl+C vb.: bölümleri iptal et ki executor kapanışı sınırlı sürede bitsin
+                self.stop()
+                raise
+            finally:
+                for partition in self.partitions:
+                    partition.close()
+
+        if unread_from is not None:
+            self._report_unread(unread_from)
+
+        if len(self.partitions) > 1:
+            self.log(f"🗂️ {len(self.partitions)} organizasyon/proje bölümü işlendi: "
+                     f"{', '.join(f'{p.label} ({p.rows_read})' for p in self.partitions)}")
+
+        self.finished_at = time.time()
+        if self.estimator:
+            self._report_estimate(self.finished_at - started)
+
+        # Rapor çalışma biter bitmez hazırlanır; generate_excel_report yalnızca taşır
+        if self.prepare_report:
+            self._prepare_report()
+
+        if read_error:
+            return False, read_error
+
+        failed = [p for p in self.partitions if not p.success]
+        errors = [p for p in self.partitions if p.error_message]
+        if not errors:
+            return True, None
+
+        if len(self.partitions) > 1:
+            summary = "; ".join(f"[{p.label}] {p.error_message}" for p in errors)
+        else:
+            summary = errors[0].error_message
+        return len(failed) < len(self.partitions), summary
+
+    def _report_unread(self, from_row: int):
+        """İptalde okunmadan bırakılan satırları tek kayıtla rapora ekler
+
+        Satır sayısı dosya okunmadan bilinmiyorsa (CSV) yalnızca okunan ilk satır sayılır. Tek bölüm
+        varsa kayıt onun raporuna, yoksa birleşik rapordaki ayrı bir bölüme yazılır.
+        """
+        if self._total_hint:
+            count = max(self._total_hint - self._rows_read, 1)
+            size = f"~{count} satır"
+        else:
+            count, size = 1, "toplam satır sayısı bilinmiyor"
+        message = f"{CANCELLED_MESSAGE}: satır {from_row} ve sonrası okunmadı ({size})"
+        self.log(f"⏹️ Okuma durduruldu: satır {from_row} ve sonrası okunmadı ({size})")
+        if len(self.partitions) == 1 and self.partitions[0].runner:
+            report = self.partitions[0].runner.report
+        else:
+            report = self.unread_report = ReportWriter()
+        report.add_bulk('İPTAL', message, count)
+        report.close()
+
+    def stop(self):
+        """Tüm bölümleri durdur (paylaşılan iptal token'ı tetiklenir)"""
+        self.cancel_token.cancel()
+
+    @staticmethod
+    def _sheet_name(label: str, used: set) -> str:
+        """Excel sayfa adı kurallarına uygun, benzersiz ad (en fazla 31 karakter)"""
+        base = re.sub(r'[\[\]:*?/\\]', '-', label)[:31]
+        name, counter = base, 2
+        while name in used:
+            suffix = f" ({counter})"
+            name = base[:31 - len(suffix)] + suffix
+            counter += 1
+        used.add(name)
+        return name
+
+    def _report_partitions(self) -> List[Partition]:
+        return [p for p in self.partitions if p.runner and len(p.runner.report)]
+
+    def _has_report(self) -> bool:
+        return bool(self._report_partitions()) or self.unread_report is not None
+
+    def _write_report(self, report_path: str) -> Optional[str]:
+        """Tek bölümde runner raporunu, birden fazla bölümde bölüm sayfalı birleşik raporu yazar
+
+        Satırlar bölümlerin rapor dosyalarından akıtılır; özetler sayaçlardan üretilir.
+        """
+        partitions = self._report_partitions()
+        unread = self.unread_report
+        if not partitions and unread is None:
+            return None
+        if unread is None and len(partitions) == 1 and len(self.partitions) == 1:
+            return partitions[0].runner.report.write_excel(report_path)
+        if unread is not None and not self.partitions:
+            return unread.write_excel(report_path)
+
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+
+        # Tüm satırlar
+        details = workbook.create_sheet('İşlem Detayları')
+        details.append(['Organizasyon', 'Proje'] + REPORT_COLUMNS)
+        for partition in partitions:
+            prefix = [partition.organization_url, partition.project_name]
+            write_rows(details, (prefix + row for row in partition.runner.report.rows()))
+        if unread is not None:
+            write_rows(details, (['', ''] + row for row in unread.rows()))
+
+        # Bölüm bazında özet (sayaçlardan)
+        summary = workbook.create_sheet('Bölüm Özeti')
+        summary.append(['Organizasyon', 'Proje', 'Toplam İşlem Sayısı', 'Başarılı İşlemler',
+                        'Başarısız İşlemler', 'Hatalı İşlemler', 'İptal Edilen İşlemler',
+                        'Sonucu Bilinmeyen İşlemler', 'Başarı Oranı (%)', 'Bölüm Hatası'])
+        for partition in self.partitions:
+            report = partition.runner.report if partition.runner else None
+            counts = report.status_counts if report else {}
+            summary.append([
+                partition.organization_url,
+                partition.project_name,
+                len(report) if report else 0,
+                counts.get('BAŞARILI', 0),
+                counts.get('BAŞARISIZ', 0),
+                counts.get('HATA', 0),
+                counts.get('İPTAL', 0),
+                counts.get('BİLİNMİYOR', 0),
+                report.success_rate() if report else 0,
+                partition.error_message or ''
+            ])
+        if unread is not None:
+            summary.append(['', '', len(unread), 0, 0, 0, unread.status_counts.get('İPTAL', 0), 0, 0,
+                            'Okunmamış satırlar'])
+
+        # Her bölüm için ayrı sayfa
+        used_names = {'İşlem Detayları', 'Bölüm Özeti'}
+        for partition in partitions:
+            sheet = workbook.create_sheet(self._sheet_name(partition.label, used_names))
+            sheet.append(REPORT_COLUMNS)
+            write_rows(sheet, partition.runner.report.rows())
+
+        workbook.save(report_path)
+        return report_path
+
+    def _prepare_report(self):
+        """Raporu çalışma sonunda geçici dizine yazar"""
+        try:
+            with self.profile.stage('report'):
+                self._prepared_report = self._write_report(os.path.join(spool_directory(self), 'report.xlsx'))
+        except Exception as e:
+            log.error("Excel raporu hazırlama hatası: %s", e)
+            self._prepared_report = None
+
+    def generate_excel_report(self, output_dir: str = None) -> Optional[str]:
+        """Bölüm bazında sayfaları olan birleşik Excel raporu oluşturur
+
+        Args:
+            output_dir: Raporun yazılacağı dizin (varsayılan: masaüstü)
+
+        Returns:
+            Optional[str]: Oluşturulan rapor dosyasının yolu
+        """
+        try:
+            if not self._has_report():
+                return None
+
+            if not output_dir:
+                output_dir = os.path.join(os.path.expanduser("~"), "Desktop")
+            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+            report_path = os.path.join(output_dir, f"azure_devops_islem_raporu_{timestamp}.xlsx")
+
+            # Çalışma sonunda hazırlanan rapor varsa yalnızca taşınır
+            with self.profile.stage('report'):
+                prepared, self._prepared_report = self._prepared_report, None
+                if prepared and os.path.exists(prepared):
+                    shutil.move(prepared, report_path)
+                else:
+                    report_path = self._write_report(report_path)
+            if report_path:
+                self.write_profile(report_path=report_path)
+            return report_path
+
+        except Exception as e:
+            log.error("Excel raporu oluşturma hatası: %s", e)
+            return None
+
+    def write_profile(self, output_dir: str = None, report_path: str = None) -> Optional[str]:
+        """Profil modunda katlanmış yığınları ve aşama sürelerini raporun yanına yazar
+
+        Args:
+            output_dir: Rapor yoksa profilin yazılacağı dizin (varsayılan: masaüstü)
+            report_path: Yanına yazılacak rapor dosyası
+
+        Returns:
+            Optional[str]: Katlanmış yığın (.folded) dosyasının yolu
+        """
+        if not self.profile.enabled:
+            return None
+        try:
+            if report_path:
+                base_path = os.path.splitext(report_path)[0]
+            else:
+                output_dir = output_dir or os.path.join(os.path.expanduser("~"), "Desktop")
+                timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+                base_path = os.path.join(output_dir, f"azure_devops_profil_{timestamp}")
+            self.profile_path = self.profile.write(base_path)
+            return self.profile_path
+        except Exception as e:
+            log.error("Profil yazma hatası: %s", e)
+            return None
@@ -1,90 +1,395 @@
 import os
-import pandas as pd
+import sys
+
+from core.log import get_logger
+from core.user_row import UserRow
+
+# pandas açılış süresini uzattığı için modül düzeyinde değil, ilk kullanımda import edilir
+
+log = get_logger('excel')
+
+# Az sayıda farklı değer alan, satırlar arasında paylaşılan (intern edilen) UserRow alanları
+SHARED_FIELDS = ('action', 'team', 'role', 'license_type', 'organization', 'project')
 
 class ExcelProcessor:
     def __init__(self):
         # Basitleştirilmiş şablon - sadece gerekli kolonlar
         self.required_columns = ['User Email', 'Action']
         # İsteğe bağlı kolonlar
-        self.optional_columns = ['Team Name', 'License Type']
+        # Organization / Project doluysa satır o organizasyon/proje bölümünde işlenir,
+        # boşsa config.json'daki varsayılanlar kullanılır
+        self.optional_columns = ['Team Name', 'Role', 'License Type', 'Organization', 'Project']
         # Azure DevOps REST API desteklenen license türleri
         self.valid_license_types = ['stakeholder', 'express', 'advanced', 'earlyAdopter']
         # Stakeholder = Ücretsiz temel erişim
         # Express = Basic license (Visual Studio Community)
         # Advanced = Visual Studio Professional/Enterprise
         # EarlyAdopter = Test Features
+        self.valid_actions = ['add', 'remove']
+        self.valid_roles = ['Member', 'Admin', 'Contributor', 'Reader']
+        # Büyük/küçük harf duyarsız eşleme için kanonik adlar
+        self._license_names = {name.lower(): name for name in self.valid_license_types}
+        self._role_names = {name.lower(): name for name in self.valid_roles}
+        # Desteklenen girdi formatları (uzantı -> format); CSV/JSONL/Parquet sütunlu okuyucularla
+        # parça parça okunur, Excel openpyxl ile satır satır
+        self.input_formats = {
+            '.xlsx': 'xlsx', '.xlsm': 'xlsx', '.xls': 'xls',
+            '.csv': 'csv', '.tsv': 'tsv',
+            '.jsonl': 'jsonl', '.ndjson': 'jsonl',
+            '.parquet': 'parquet', '.pq': 'parquet'
+        }
+        self.columnar_formats = ['csv', 'tsv', 'jsonl', 'parquet']
+        self.frame_chunk_size = 10000  # Sütunlu formatlarda bir seferde okunan satır sayısı
     
     def read_excel(self, file_path):
-        """Excel dosyasını oku ve doğrula - PyQt5 GUI uyumlu format"""
+        """Girdi dosyasını (Excel, CSV, JSONL veya Parquet) oku ve doğrula - PyQt5 GUI uyumlu format
+        
+        Tüm satırları belleğe alır ve sütun bazında doğrular; geçersiz satır varsa tümü
+        satır numaralarıyla tek hata mesajında bildirilir. Büyük dosyalar için iter_rows kullanın.
+        """
+        import pandas as pd
+
         try:
-            print(f"📂 Excel dosyası okunuyor: {file_path}")
-            
-            # Excel dosyasını oku
-            df = pd.read_excel(file_path)
-            print(f"📊 {len(df)} satır okundu")
-            
-            # Sütun isimlerini temizle
-            df.columns = df.columns.str.strip()
-            print(f"📋 Sütunlar: {list(df.columns)}")
-            
-            # Gerekli sütunları kontrol et
-            missing_columns = []
-            for col in self.required_columns:
-                if col not in df.columns:
-                    missing_columns.append(col)
+            log.debug("📂 Excel dosyası okunuyor: %s", file_path)
             
+            input_format = self.detect_format(file_path)
+            if input_format in self.columnar_formats:
+                df = pd.concat(self._iter_frames(file_path, input_format), ignore_index=True)
+            else:
+                df = pd.read_excel(file_path, dtype=object)
+            df.columns = [str(name).strip() for name in df.columns]
+            log.debug("📋 Sütunlar: %s", list(df.columns))
+            missing_columns = [col for col in self.required_columns if col not in df.columns]
             if missing_columns:
                 raise Exception(f"Eksik sütunlar: {', '.join(missing_columns)}. Mevcut sütunlar: {list(df.columns)}")
             
-            # Veriyi temizle - sadece gerekli kolonlar
-            df = df.dropna(subset=['User Email', 'Action'])
-            print(f"🧹 Temizleme sonrası: {len(df)} satır")
-            
-            # Email formatını kontrol et
-            for index, row in df.iterrows():
-                email = str(row['User Email']).strip()
-                if '@' not in email:
-                    raise Exception(f"Geçersiz email formatı (satır {index + 2}): {email}")
-                
-                action = str(row['Action']).strip().lower()
-                if action not in ['add', 'remove']:
-                    raise Exception(f"Geçersiz işlem (satır {index + 2}): {action}. 'Add' veya 'Remove' olmalı")
-            
-            # PyQt5 GUI için uygun formata çevir
-            users = []
-            for index, row in df.iterrows():
-                user_data = {
-                    'User Email': str(row['User Email']).strip(),
-                    'Action': str(row['Action']).strip(),
-                    'Team Name': str(row.get('Team Name', '')).strip() if 'Team Name' in df.columns else '',
-                    'License Type': str(row.get('License Type', 'stakeholder')).strip() if 'License Type' in df.columns else 'stakeholder'
-                }
-                users.append(user_data)
-                team_info = f" -> {user_data['Team Name']}" if user_data['Team Name'] else ""
-                print(f"✅ Kullanıcı {index+1}: {user_data['User Email']}{team_info} ({user_data['Action']}) [License: {user_data['License Type']}]")
+            frame = self._user_frame(df, self._first_row(input_format))
+            del df  # Ham tablo artık gerekmiyor
+            errors = frame['error'][frame['error'] != ''].tolist()
+            if errors:
+                raise Exception(self._summarize_errors(errors))
             
+            users = self._frame_rows(frame)
+            del frame
             result = {
                 'users': users,
                 'total_count': len(users)
             }
             
-            print(f"✅ Excel okuma başarılı: {len(users)} kullanıcı bulundu")
+            log.info("✅ Excel okuma başarılı: %s kullanıcı bulundu", len(users))
             return result
             
         except Exception as e:
             error_msg = f"Excel dosyası okuma hatası: {str(e)}"
-            print(f"❌ {error_msg}")
+            log.warning("❌ %s", error_msg)
             raise Exception(error_msg)
     
+    @staticmethod
+    def _text_column(df, column):
+        """Sütunu baştaki/sondaki boşluklar atılmış metin olarak döndürür (eksik sütun/boş hücre = '')"""
+        import pandas as pd
+        if column not in df.columns:
+            return pd.Series('', index=df.index, dtype=object)
+        values = df[column]
+        return values.astype(str).str.strip().where(values.notna(), '')
+    
+    @staticmethod
+    def _canonical_column(values, names, default):
+        """Değerleri kanonik adlarına çevirir (büyük/küçük harf duyarsız); tanınmayanlar olduğu gibi, boşlar default"""
+        canonical = values.str.lower().map(names)
+        values = canonical.where(canonical.notna(), values)
+        return values.where(values != '', default)
+    
+    def _user_frame(self, df, first_row=2):
+        """Ham DataFrame'i UserRow alanlarına sahip, normalize edilmiş ve doğrulanmış tabloya çevirir
+        
+        User Email veya Action boş olan satırlar atlanır; 'error' sütunu geçersiz satırlarda doludur.
+        first_row, df'nin ilk satırının dosyadaki numarasıdır.
+        """
+        import pandas as pd
+
+        email = self._text_column(df, 'User Email')
+        action = self._text_column(df, 'Action')
+        frame = pd.DataFrame({
+            'email': email,
+            'action': action,
+            'team': self._text_column(df, 'Team Name'),
+            'role': self._canonical_column(self._text_column(df, 'Role'), self._role_names, 'Member'),
+            'license_type': self._canonical_column(self._text_column(df, 'License Type'),
+                                                   self._license_names, 'stakeholder'),
+            'organization': self._text_column(df, 'Organization'),
+            'project': self._text_column(df, 'Project'),
+            'row': range(first_row, first_row + len(df))
+        })
+        frame = frame[(email != '') & (action != '')]
+        # Hata mesajları kullanıcının yazdığı değeri gösterir; normalize etme doğrulamadan sonra
+        frame['error'] = self._row_errors(frame['email'], frame['action'], frame['role'], frame['row'])
+        frame['email'] = frame['email'].str.lower()
+        frame['action'] = frame['action'].str.lower()
+        return frame
+    
+    @staticmethod
+    def _frame_rows(frame):
+        """_user_frame tablosunu UserRow listesine çevirir
+
+        Tekrarlayan değerler (takım, rol, lisans, organizasyon, proje, işlem) intern edilir;
+        satırlar her hücre için ayrı kopya yerine aynı string nesnesini paylaşır.
+        """
+        columns = []
+        for field in UserRow._fields:
+            values = frame[field].tolist()
+            if field in SHARED_FIELDS:
+                values = list(map(sys.intern, values))
+            columns.append(values)
+        return list(map(UserRow._make, zip(*columns)))
+    
+    def _invalid_roles(self, action, role):
+        """Ekleme satırlarında tanınmayan rol maskesi (büyük/küçük harf duyarsız; boş rol 'Member' sayılır)"""
+        return (action.str.lower() == 'add') & (role != '') & ~role.str.lower().isin(list(self._role_names))
+    
+    def _row_error_message(self, row_number, email, action, role):
+        """Tek satırın doğrulama hatası (geçerliyse ''); _row_errors ile aynı kontroller ve mesajlar"""
+        if '@' not in email:
+            return f"Geçersiz email formatı (satır {row_number}): {email}"
+        if action.lower() not in self.valid_actions:
+            return f"Geçersiz işlem (satır {row_number}): {action}. 'Add' veya 'Remove' olmalı"
+        if action.lower() == 'add' and role and role.lower() not in self._role_names:
+            return f"Geçersiz rol (satır {row_number}): {role}. {', '.join(self.valid_roles)} olmalı"
+        return ''
+    
+    def _row_errors(self, email, action, role, row_numbers):
+        """Email, işlem ve rol sütunlarını tek geçişte doğrular; geçerli satırlar için '' döner
+        
+        Mesajlar iter_rows'un satır hatalarıyla aynı biçimdedir.
+        """
+        import pandas as pd
+
+        errors = pd.Series('', index=email.index, dtype=object)
+        invalid_email = ~email.str.contains('@', regex=False)
+        invalid_action = ~invalid_email & ~action.str.lower().isin(self.valid_actions)
+        invalid_role = ~invalid_email & ~invalid_action & self._invalid_roles(action, role)
+        errors[invalid_email] = [f"Geçersiz email formatı (satır {row}): {value}"
+                                 for row, value in zip(row_numbers[invalid_email], email[invalid_email])]
+        errors[invalid_action] = [f"Geçersiz işlem (satır {row}): {value}. 'Add' veya 'Remove' olmalı"
+                                  for row, value in zip(row_numbers[invalid_action], action[invalid_action])]
+        errors[invalid_role] = [f"Geçersiz rol (satır {row}): {value}. {', '.join(self.valid_roles)} olmalı"
+                                for row, value in zip(row_numbers[invalid_role], role[invalid_role])]
+        return errors
+    
+    @staticmethod
+    def _summarize_errors(errors, limit=20):
+        """Hata listesini sayısıyla birlikte tek mesajda toplar (ilk limit kadarı gösterilir)"""
+        message = f"{len(errors)} geçersiz satır: " + "; ".join(errors[:limit])
+        if len(errors) > limit:
+            message += f" ve {len(errors) - limit} hata daha..."
+        return message
+    
+    def iter_rows(self, file_path):
+        """Excel dosyasını satır satır okuyup doğrulanmış kullanıcı satırlarını tek tek üretir
+        
+        openpyxl read-only modu ile okunur; dosyanın tamamı belleğe alınmaz ve ilk satırlar
+        dosyanın geri kalanı okunmadan işlenmeye başlanabilir. User Email veya Action boş
+        olan satırlar atlanır. Geçersiz satırlar akışı durdurmaz: 'error' alanı dolu olarak
+        üretilir ve çalışma sırasında satır hatası olarak raporlanır.
+        
+        CSV, JSONL ve Parquet dosyaları sütunlu okuyucularla frame_chunk_size satırlık
+        parçalar halinde okunur ve read_excel ile aynı sütun bazlı doğrulamadan geçer.
+        
+        Args:
+            file_path: Girdi dosyası (.xlsx/.xlsm; .xls için pandas; .csv/.tsv, .jsonl/.ndjson, .parquet)
+            
+        Yields:
+            UserRow: Normalize edilmiş satır ('row' dosyadaki satır numarası, 'error' doğrulama hatası)
+        """
+        input_format = self.detect_format(file_path)
+        if input_format in self.columnar_formats:
+            yield from self._iter_columnar_rows(file_path, input_format)
+            return
+        
+        if input_format == 'xls':
+            # openpyxl eski .xls biçimini okuyamaz
+            rows = self._iter_xls_values(file_path)
+        else:
+            rows = self._iter_xlsx_values(file_path)
+        
+        header = next(rows, None)
+        if header is None:
+            raise Exception("Excel dosyası boş")
+        
+        columns = [str(name).strip() if name is not None else '' for name in header]
+        log.debug("📋 Sütunlar: %s", [name for name in columns if name])
+        missing_columns = [col for col in self.required_columns if col not in columns]
+        if missing_columns:
+            raise Exception(f"Eksik sütunlar: {', '.join(missing_columns)}. Mevcut sütunlar: {[name for name in columns if name]}")
+        
+        index = {}
+        for position, name in enumerate(columns):
+            if name and name not in index:
+                index[name] = position
+        
+        count = 0
+        for row_number, values in enumerate(rows, start=2):
+            user = self._row_to_user(values, index, row_number)
+            if user is not None:
+                count += 1
+                yield user
+        log.debug("📊 %s satır okundu", count)
+    
+    def count_rows(self, file_path):
+        """İlerleme için yaklaşık veri satırı sayısı (dosya okunmadan; bilinmiyorsa None)"""
+        try:
+            input_format = self.detect_format(file_path)
+            if input_format == 'parquet':
+                return self._parquet_module().ParquetFile(file_path).metadata.num_rows
+            if input_format != 'xlsx':
+                return None
+            from openpyxl import load_workbook
+            workbook = load_workbook(file_path, read_only=True)
+            try:
+                max_row = workbook.worksheets[0].max_row
+            finally:
+                workbook.close()
+            return max(max_row - 1, 0) if max_row else None
+        except Exception:
+            return None
+    
+    def detect_format(self, file_path):
+        """Girdi formatını uzantıdan, tanınmayan uzantılarda dosyanın ilk baytlarından belirler"""
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension in self.input_formats:
+            return self.input_formats[extension]
+        
+        with open(file_path, 'rb') as f:
+            head = f.read(512)
+        if head.startswith(b'PAR1'):
+            return 'parquet'
+        if head.startswith(b'PK'):
+            return 'xlsx'
+        if head.startswith(b'\xd0\xcf\x11\xe0'):
+            return 'xls'
+        if head.lstrip().startswith(b'{'):
+            return 'jsonl'
+        return 'csv'
+    
+    @staticmethod
+    def _first_row(input_format):
+        """Verinin ilk satırının dosyadaki numarası (başlık satırı olan formatlarda 2)"""
+        return 1 if input_format in ('jsonl', 'parquet') else 2
+    
+    @staticmethod
+    def _parquet_module():
+        try:
+            import pyarrow.parquet as parquet
+        except ImportError:
+            raise Exception("Parquet dosyaları için pyarrow gerekli: pip install pyarrow")
+        return parquet
+    
+    def _iter_frames(self, file_path, input_format):
+        """Sütunlu formatları frame_chunk_size satırlık DataFrame parçaları olarak okur"""
+        import pandas as pd
+
+        if input_format in ('csv', 'tsv'):
+            # Tüm hücreler metin olarak okunur; 'NA' gibi değerler boş sayılmaz
+            with pd.read_csv(file_path, sep='\t' if input_format == 'tsv' else ',', dtype=str,
+                             keep_default_na=False, chunksize=self.frame_chunk_size) as reader:
+                yield from reader
+        elif input_format == 'jsonl':
+            with pd.read_json(file_path, lines=True, dtype=False, chunksize=self.frame_chunk_size) as reader:
+                yield from reader
+        elif input_format == 'parquet':
+            parquet_file = self._parquet_module().ParquetFile(file_path)
+            for batch in parquet_file.iter_batches(batch_size=self.frame_chunk_size):
+                yield batch.to_pandas()
+        else:
+            raise Exception(f"Desteklenmeyen girdi formatı: {input_format}")
+    
+    def _iter_columnar_rows(self, file_path, input_format):
+        """CSV/JSONL/Parquet parçalarını sütun bazında doğrulayıp iter_rows satırları olarak üretir"""
+        first_row = self._first_row(input_format)
+        count = 0
+        checked = False
+        for df in self._iter_frames(file_path, input_format):
+            df.columns = [str(name).strip() for name in df.columns]
+            if not checked:
+                log.debug("📋 Sütunlar: %s", list(df.columns))
+                missing_columns = [col for col in self.required_columns if col not in df.columns]
+                if missing_columns:
+                    raise Exception(f"Eksik sütunlar: {', '.join(missing_columns)}. Mevcut sütunlar: {list(df.columns)}")
+                checked = True
+            
+            frame = self._user_frame(df, first_row)
+            first_row += len(df)
+            count += len(frame)
+            rows = self._frame_rows(frame)
+            del df, frame  # Parça satırlara çevrildi; tablo sonraki parça okunmadan bırakılır
+            yield from rows
+        
+        if not checked:
+            raise Exception("Girdi dosyası boş")
+        log.debug("📊 %s satır okundu", count)
+    
+    def _iter_xlsx_values(self, file_path):
+        """İlk sayfanın satırlarını değer tuple'ları olarak okur (read-only, sabit bellek)"""
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for values in workbook.worksheets[0].iter_rows(values_only=True):
+                yield values
+        finally:
+            workbook.close()
+    
+    def _iter_xls_values(self, file_path):
+        """.xls dosyası için pandas ile okuma (biçim akış halinde okunamaz)"""
+        import pandas as pd
+        df = pd.read_excel(file_path, header=None, dtype=object)
+        for values in df.itertuples(index=False, name=None):
+            yield tuple(None if pd.isna(value) else value for value in values)
+    
+    def _row_to_user(self, values, index, row_number):
+        """Ham satır değerlerini UserRow'a çevirir (boş satırlar için None)"""
+        def cell(column):
+            position = index.get(column)
+            if position is None or position >= len(values):
+                return None
+            value = values[position]
+            if value is None:
+                return None
+            value = str(value).strip()
+            return value or None
+        
+        email = cell('User Email')
+        action = cell('Action')
+        if email is None or action is None:
+            return None
+        
+        role = cell('Role')
+        license_type = cell('License Type')
+        error = self._row_error_message(row_number, email, action, role)
+        # Tekrarlayan değerler intern edilir (bkz. _frame_rows)
+        return UserRow(
+            email=email.lower(),
+            action=sys.intern(action.lower()),
+            team=sys.intern(cell('Team Name') or ''),
+            role=sys.intern(self._role_names.get(role.lower(), role)) if role else 'Member',
+            license_type=sys.intern(self._license_names.get(license_type.lower(), license_type))
+            if license_type else 'stakeholder',
+            organization=sys.intern(cell('Organization') or ''),
+            project=sys.intern(cell('Project') or ''),
+            row=row_number,
+            error=error
+        )
+    
     def create_sample_template(self, output_path=None):
         """Örnek şablon oluştur"""
+        import pandas as pd
+
         try:
             if not output_path:
                 # Kullanıcının masaüstüne kaydet
                 desktop_path = os.path.join(os.path.expanduser('~'), 'Desktop')
                 output_path = os.path.join(desktop_path, 'azure_devops_template.xlsx')
             
-            print(f"Şablon oluşturuluyor: {output_path}")
+            log.debug("Şablon oluşturuluyor: %s", output_path)
             
             # Basitleştirilmiş örnek veri - Azure DevOps REST API uyumlu
             data = {
@@ -118,10 +423,10 @@ class ExcelProcessor:
                 ]
             }
             
-            print("DataFrame oluşturuluyor...")
+            log.debug("DataFrame oluşturuluyor...")
             df = pd.DataFrame(data)
             
-            print("Excel dosyası yazılıyor...")
+            log.debug("Excel dosyası yazılıyor...")
             # Dizin yoksa oluştur
             output_dir = os.path.dirname(output_path)
             if not os.path.exists(output_dir):
@@ -149,22 +454,26 @@ class ExcelProcessor:
                 
                 # Kaydet ve kapat
                 writer.close()
-                print(f"Excel dosyası başarıyla oluşturuldu: {output_path}")
+                log.debug("Excel dosyası başarıyla oluşturuldu: %s", output_path)
             except Exception as excel_error:
-                print(f"Excel yazma hatası: {excel_error}")
+                log.warning("Excel yazma hatası: %s", excel_error)
                 # Alternatif yöntem dene
                 df.to_excel(output_path, index=False)
-                print(f"Excel dosyası alternatif yöntemle oluşturuldu: {output_path}")
+                log.debug("Excel dosyası alternatif yöntemle oluşturuldu: %s", output_path)
             
             return output_path
         except Exception as e:
-            import traceback
-            print(f"Şablon oluşturma hatası: {e}")
-            print(traceback.format_exc())
+            log.exception("Şablon oluşturma hatası: %s", e)
             return None
     
     def validate_data(self, df):
-        """Veri doğrulama"""
+        """Veri doğrulama
+        
+        Kontroller satır satır değil sütun bazında yapılır; tüm hatalar Excel satır
+        numarasıyla ve satır sırasına göre tek listede döner.
+        """
+        import pandas as pd
+
         errors = []
         
         # Tüm gerekli sütunların var olduğunu kontrol et
@@ -173,52 +482,48 @@ class ExcelProcessor:
                 errors.append(f"Eksik sütun: {col}")
                 return errors
         
-        print(f"Excel doğrulama: {len(df)} satır kontrol ediliyor")
+        log.debug("Excel doğrulama: %s satır kontrol ediliyor", len(df))
         
-        for index, row in df.iterrows():
-            row_num = index + 2  # Excel'de başlık satırı olduğu için +2
-            
-            # Team Name kontrolü
-            team_name = str(row.get('Team Name', '')).strip()
-            if pd.isna(row.get('Team Name')) or team_name == '':
-                errors.append(f"Satır {row_num}: Team Name boş olamaz")
-            else:
-                print(f"Satır {row_num}: Team Name = '{team_name}'")
-            
-            # User Email kontrolü
-            email = str(row.get('User Email', '')).strip()
-            if pd.isna(row.get('User Email')) or email == '':
-                errors.append(f"Satır {row_num}: User Email boş olamaz")
-            elif '@' not in email:
-                errors.append(f"Satır {row_num}: Geçersiz email formatı: {email}")
-            else:
-                print(f"Satır {row_num}: User Email = '{email}'")
-            
-            # Action kontrolü
-            action = str(row.get('Action', '')).strip().lower()
-            if pd.isna(row.get('Action')) or action == '':
-                errors.append(f"Satır {row_num}: Action boş olamaz")
-            elif action not in ['add', 'remove']:
-                errors.append(f"Satır {row_num}: Geçersiz Action değeri: {action}. 'add' veya 'remove' olmalı")
-            else:
-                print(f"Satır {row_num}: Action = '{action}'")
-            
-            # Role kontrolü (sadece Action=add için gerekli)
-            if action == 'add':
-                role = str(row.get('Role', 'Member')).strip()
-                if pd.isna(row.get('Role')) or role == '':
-                    print(f"Satır {row_num}: Role belirtilmemiş, varsayılan 'Member' kullanılacak")
-                else:
-                    print(f"Satır {row_num}: Role = '{role}'")
-                    valid_roles = ['Member', 'Admin', 'Contributor', 'Reader']
-                    if role not in valid_roles:
-                        errors.append(f"Satır {row_num}: Geçersiz Role: {role} ({', '.join(valid_roles)} olmalı)")
+        row_numbers = pd.Series(range(2, len(df) + 2), index=df.index)  # Excel'de başlık satırı olduğu için +2
+        team_name = self._text_column(df, 'Team Name')
+        email = self._text_column(df, 'User Email')
+        action = self._text_column(df, 'Action').str.lower()
+        role = self._text_column(df, 'Role')
+        
+        # (satır, kontrol sırası, mesaj) - aynı satırın hataları kontrol sırasıyla listelenir
+        found = []
+        
+        def collect(order, mask, values, message):
+            # Yalnızca hatalı satırlar için mesaj üretilir
+            found.extend((row, order, message.format(value=value))
+                         for row, value in zip(row_numbers[mask], values[mask]))
+        
+        # Team Name kontrolü
+        collect(0, team_name == '', team_name, "Team Name boş olamaz")
+        
+        # User Email kontrolü
+        collect(1, email == '', email, "User Email boş olamaz")
+        collect(2, (email != '') & ~email.str.contains('@', regex=False), email, "Geçersiz email formatı: {value}")
+        
+        # Action kontrolü
+        collect(3, action == '', action, "Action boş olamaz")
+        collect(4, (action != '') & ~action.isin(self.valid_actions), action,
+                "Geçersiz Action değeri: {value}. 'add' veya 'remove' olmalı")
+        
+        # Role kontrolü (sadece Action=add için, büyük/küçük harf duyarsız; boşsa varsayılan 'Member' kullanılır)
+        collect(5, self._invalid_roles(action, role), role,
+                "Geçersiz Role: {value} (" + ", ".join(self.valid_roles) + " olmalı)")
+        
+        found.sort(key=lambda item: (item[0], item[1]))
+        errors = [f"Satır {row}: {message}" for row, _, message in found]
         
         if errors:
-            print(f"Excel doğrulama: {len(errors)} hata bulundu")
-            for error in errors:
-                print(f"  - {error}")
+            log.warning("Excel doğrulama: %s hata bulundu", len(errors))
+            for error in errors[:20]:
+                log.debug("  - %s", error)
+            if len(errors) > 20:
+                log.debug("  ... ve %s hata daha", len(errors) - 20)
         else:
-            print("Excel doğrulama: Tüm veriler geçerli")
+            log.debug("Excel doğrulama: Tüm veriler geçerli")
             
-        return errors
\ No newline at end of file
+        return errors
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İptal Edilebilir HTTP Transport'u
+requests oturumuna bağlanan adapter, açtığı bağlantıların soketlerini izler; iptalde bu soketler
+kapatılır ve yanıt bekleyen istek (zaman aşımını beklemeden) bağlantı hatasıyla hemen uyanır.
+İstek, çağıran thread'de çalışmaya devam eder; istek başına ek thread açılmaz.
+"""
+
+import socket
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class CancellableHTTPAdapter(HTTPAdapter):
+    """Bağlantı soketlerini izleyen, abort() ile sürmekte olan istekleri kesen adapter
+
+    abort() sonrası adapter kalıcı olarak iptal edilmiş sayılır (yeni bağlantılar da hemen kesilir);
+    sonraki çalışma için yeni oturum açılır.
+    """
+
+    def __init__(self, **kwargs):
+        self._sockets = weakref.WeakSet()
+        self._sockets_lock = threading.Lock()
+        self._aborted = False
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # Havuzların bağlantı sınıfları, connect sonrası soketi bu adapter'a kaydeden alt sınıflarla değiştirilir
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': self._tracked(pool_cls.ConnectionCls)})
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def _tracked(self, connection_cls):
+        adapter = self
+
+        class TrackedConnection(connection_cls):
+            def connect(self):
+                super().connect()
+                adapter._register(self.sock)
+
+        TrackedConnection.__name__ = connection_cls.__name__
+        return TrackedConnection
+
+    def _register(self, sock):
+        if sock is None:
+            return
+        with self._sockets_lock:
+            if not self._aborted:
+                self._sockets.add(sock)
+                return
+        self._shutdown(sock)  # abort() sırasında bağlanmakta olan istek de kesilir
+
+    def abort(self):
+        """Açık tüm soketleri kapat: okuma/yazmada bekleyen istekler hemen hata alır"""
+        with self._sockets_lock:
+            self._aborted = True
+            sockets = list(self._sockets)
+            self._sockets.clear()
+        for sock in sockets:
+            self._shutdown(sock)
+
+    @staticmethod
+    def _shutdown(sock):
+        try:
+            # TLS katmanı atlanır: diğer thread'in sürmekte olan okuması bozulmadan EOF alır
+            socket.socket.shutdown(sock, socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def cancellable_session() -> requests.Session:
+    """http/https isteklerini CancellableHTTPAdapter üzerinden gönderen oturum"""
+    session = requests.Session()
+    adapter = CancellableHTTPAdapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def abort_session(session: requests.Session):
+    """Oturumun sürmekte olan isteklerini kes ve bağlantı havuzunu kapat"""
+    for adapter in session.adapters.values():
+        if isinstance(adapter, CancellableHTTPAdapter):
+            adapter.abort()
+    session.close()
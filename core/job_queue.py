@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çoklu İş Kuyruğu
+Birden fazla girdi dosyasını sıraya alır, aynı organizasyon/proje için tek bir "ısınmış"
+AzureDevOpsRESTClient'ı (ve cache'lerini) paylaştırır ve işleri organizasyon/proje
+anahtarları arasında sırayla (round-robin) adil biçimde dağıtır.
+"""
+
+import os
+import time
+import itertools
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.cancellation import CancellationToken
+
+
+def client_key(organization_url: str, project_name: str) -> Tuple[str, str]:
+    """Client havuzu anahtarı (organizasyon URL'i ve proje adı normalize edilir)"""
+    return (organization_url.rstrip('/').lower(), project_name.strip().lower())
+
+
+class ClientPool:
+    """Organizasyon/proje başına tek bir AzureDevOpsRESTClient tutan havuz"""
+
+    def __init__(self, client_factory: Callable = None, requests_per_second: float = 10.0,
+                 metrics_enabled: bool = True):
+        """
+        Args:
+            client_factory: (organization_url, project_name, pat_token) alan client üretici
+                            (varsayılan: AzureDevOpsRESTClient)
+            requests_per_second: Her client'ın kendi hız sınırı bütçesi
+            metrics_enabled: Varsayılan client'larda ölçüm kaydı (bkz. core/metrics.py)
+        """
+        self._client_factory = client_factory
+        self.requests_per_second = requests_per_second
+        self.metrics_enabled = metrics_enabled
+        self._method_learner = None  # Varsayılan client'lar öğrenilen yöntem sırasını paylaşır
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, organization_url: str, project_name: str, pat_token: str = None):
+        """Anahtar için mevcut client'ı döndür, yoksa oluştur"""
+        key = client_key(organization_url, project_name)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.pat_token != pat_token:
+                if self._client_factory is None:
+                    from core.azure_rest_client import AzureDevOpsRESTClient
+                    from core.method_learner import MethodLearner
+                    if self._method_learner is None:
+                        self._method_learner = MethodLearner()
+                    client = AzureDevOpsRESTClient(organization_url, project_name, pat_token,
+                                                   requests_per_second=self.requests_per_second,
+                                                   method_learner=self._method_learner,
+                                                   metrics_enabled=self.metrics_enabled)
+                else:
+                    client = self._client_factory(organization_url, project_name, pat_token)
+                self._clients[key] = client
+            return client
+
+    def begin_run(self):
+        """Yeni iş başlangıcı: client'ların paylaştığı yöntem öğrenicilerinin çalışma içi sayaçlarını sıfırla"""
+        with self._lock:
+            learners = [self._method_learner] + [getattr(client, 'method_learner', None)
+                                                 for client in self._clients.values()]
+        for learner in {id(learner): learner for learner in learners if learner is not None}.values():
+            learner.begin_run()
+
+    def clients(self) -> list:
+        """Havuzdaki client'lar"""
+        with self._lock:
+            return list(self._clients.values())
+
+    def __len__(self):
+        return len(self._clients)
+
+
+class Job:
+    """Kuyruktaki tek bir girdi dosyası işi"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    _ids = itertools.count(1)
+
+    def __init__(self, file_path: str, organization_url: str, project_name: str, pat_token: str = None,
+                 run_estimate=None):
+        self.id = next(Job._ids)
+        self.file_path = file_path
+        self.organization_url = organization_url
+        self.project_name = project_name
+        self.pat_token = pat_token
+        self.key = client_key(organization_url, project_name)
+        self.run_estimate = run_estimate  # Kuyruğa eklenmeden önce alınan tahmin (varsa)
+        self.cancel_token = CancellationToken()  # İşin bölümleri paylaşır; runner kurulmadan da iptal edilebilir
+
+        self.state = Job.QUEUED
+        self.success = None
+        self.error_message = None
+        self.runner = None
+        self.report_path = None
+        self.metrics_path = None  # Çalışmanın ölçüm özeti (JSON)
+        self.profile = None  # Profil modunda çalışmanın profili (RunProfile)
+        self.profile_path = None  # Raporun yanına yazılan katlanmış yığın dosyası
+        self.rows_done = 0
+        self.rows_total = 0
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.file_path)
+
+    @property
+    def elapsed(self) -> float:
+        """İşin çalışma süresi (saniye)"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """İşlenen satır/saniye"""
+        elapsed = self.elapsed
+        return self.rows_done / elapsed if elapsed > 0 else 0.0
+
+    def update_progress(self, current: int, total: int):
+        """BatchRunner ilerleme callback'i"""
+        self.rows_done = current
+        self.rows_total = total
+
+
+class JobQueue:
+    """Organizasyon/proje anahtarları arasında round-robin dağıtım yapan iş kuyruğu"""
+
+    def __init__(self, client_pool: ClientPool = None, max_parallel_partitions: int = 4, estimator=None,
+                 metrics_dir: str = None, prometheus_textfile: str = None,
+                 profiling: bool = False, profile_sample_interval: float = None, prepare_reports: bool = True):
+        """
+        Args:
+            client_pool: Paylaşılan client havuzu
+            max_parallel_partitions: Aynı anda işlenecek en fazla organizasyon/proje bölümü
+            estimator: Çalışma süresi tahmincisi (varsayılan: RunEstimator)
+            metrics_dir: Her işin sonunda ölçüm özetinin (JSON) yazılacağı dizin ('' = yazma;
+                         varsayılan: uygulama dizinindeki metrics/)
+            prometheus_textfile: Her işin sonunda güncellenecek Prometheus metin dosyası (opsiyonel)
+            profiling: Profil modu: her iş için aşama süreleri ve duvar saati örnekleme profili
+                       (bkz. core/profiler.py; rapor oluşturulurken raporun yanına yazılır)
+            profile_sample_interval: Örnekleme aralığı (sn; varsayılan 0.01)
+            prepare_reports: False ise çalışma sonunda Excel raporu önceden hazırlanmaz (ör. --no-report)
+        """
+        self.client_pool = client_pool if client_pool is not None else ClientPool()
+        self.max_parallel_partitions = max_parallel_partitions
+        if metrics_dir is None:
+            metrics_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'metrics')
+        self.metrics_dir = metrics_dir
+        self.prometheus_textfile = prometheus_textfile
+        self.profiling = profiling
+        self.profile_sample_interval = profile_sample_interval
+        self.prepare_reports = prepare_reports
+        if estimator is None:
+            from core.run_estimator import RunEstimator
+            estimator = RunEstimator()
+        self.estimator = estimator
+        self._queues = OrderedDict()  # key -> deque[Job]
+        self._jobs = []
+        self._lock = threading.Lock()
+
+    def submit(self, file_path: str, organization_url: str, project_name: str, pat_token: str = None,
+               run_estimate=None) -> Job:
+        """Kuyruğa yeni bir iş ekle (tahmin verilirse iş sonunda gerçekleşenle karşılaştırılır)"""
+        job = Job(file_path, organization_url, project_name, pat_token, run_estimate)
+        with self._lock:
+            self._queues.setdefault(job.key, deque()).append(job)
+            self._jobs.append(job)
+        return job
+
+    def _fair_order(self) -> List[Job]:
+        """Bekleyen işlerin çalışma sırası (anahtarlar arasında round-robin)"""
+        queues = [list(q) for q in self._queues.values() if q]
+        order = []
+        for round_jobs in itertools.zip_longest(*queues):
+            order.extend(job for job in round_jobs if job is not None)
+        return order
+
+    def next_job(self) -> Optional[Job]:
+        """Sıradaki işi kuyruktan al; anahtar bir sonraki tur için sona taşınır"""
+        with self._lock:
+            for key in list(self._queues.keys()):
+                queue = self._queues[key]
+                if queue:
+                    job = queue.popleft()
+                    self._queues.move_to_end(key)
+                    return job
+            return None
+
+    def position(self, job: Job) -> int:
+        """İşin kuyruktaki sırası (1 = sıradaki iş, 0 = kuyrukta değil)"""
+        with self._lock:
+            order = self._fair_order()
+        return order.index(job) + 1 if job in order else 0
+
+    def pending(self) -> List[Job]:
+        """Bekleyen işler (çalışma sırasına göre)"""
+        with self._lock:
+            return self._fair_order()
+
+    def jobs(self) -> List[Job]:
+        """Kuyruğa eklenmiş tüm işler (eklenme sırasına göre)"""
+        with self._lock:
+            return list(self._jobs)
+
+    def cancel_pending(self) -> int:
+        """Bekleyen tüm işleri iptal et"""
+        with self._lock:
+            cancelled = 0
+            for queue in self._queues.values():
+                while queue:
+                    job = queue.popleft()
+                    job.state = Job.CANCELLED
+                    job.cancel_token.cancel()
+                    cancelled += 1
+            return cancelled
+
+    def _dispatcher(self, file_path: str, organization_url: str, project_name: str, pat_token: str,
+                    excel_processor, on_log=None, on_status=None, on_progress=None, run_estimate=None,
+                    profile=None, cancel_token=None):
+        from core.dispatcher import PartitionDispatcher
+        return PartitionDispatcher(file_path, self.client_pool, excel_processor,
+                                   organization_url, project_name, pat_token,
+                                   on_log=on_log, on_status=on_status, on_progress=on_progress,
+                                   max_workers=self.max_parallel_partitions, estimator=self.estimator,
+                                   run_estimate=run_estimate, profile=profile,
+                                   prepare_report=self.prepare_reports, cancel_token=cancel_token)
+
+    def estimate(self, file_path: str, organization_url: str, project_name: str, pat_token: str,
+                 excel_processor):
+        """
+        Dosya kuyruğa eklenmeden önce çalışma tahmini (API'ye istek atılmaz)
+
+        Returns:
+            Tuple[Optional[RunEstimate], Optional[str]]: (tahmin, hata mesajı)
+        """
+        return self._dispatcher(file_path, organization_url, project_name, pat_token, excel_processor).estimate()
+
+    def run_job(self, job: Job, excel_processor,
+                on_log: Callable[[str], None] = None,
+                on_status: Callable[[str], None] = None,
+                on_progress: Callable[[int, int], None] = None) -> Job:
+        """İşi havuzdaki paylaşılan client'larla çalıştır (satırlar org/proje bölümlerine dağıtılır)"""
+        def progress(current, total):
+            job.update_progress(current, total)
+            if on_progress:
+                on_progress(current, total)
+
+        if self.profiling:
+            from core.profiler import RunProfile, DEFAULT_SAMPLE_INTERVAL
+            job.profile = RunProfile(self.profile_sample_interval if self.profile_sample_interval is not None
+                                     else DEFAULT_SAMPLE_INTERVAL)
+        job.runner = self._dispatcher(job.file_path, job.organization_url, job.project_name, job.pat_token,
+                                      excel_processor, on_log=on_log, on_status=on_status, on_progress=progress,
+                                      run_estimate=job.run_estimate, profile=job.profile,
+                                      cancel_token=job.cancel_token)
+        # Runner kurulmadan durdurulan iş iptal edilmiş token'la çalışır: satırlar rapora İPTAL yazılır
+        if job.state != Job.CANCELLED:
+            job.state = Job.RUNNING
+        self.client_pool.begin_run()  # Önceki işte atlanan yöntemler bu işte yeniden denenir
+        job.started_at = time.time()
+        metrics_before = self._metrics_raw()
+        if job.profile:
+            job.profile.start()
+        try:
+            job.success, job.error_message = job.runner.run()
+        except Exception as e:
+            job.success, job.error_message = False, str(e)
+        finally:
+            if job.profile:
+                job.profile.stop()
+        # Süre ve satır/sn işlemenin bittiği andan hesaplanır; rapor yazımı dahil değildir
+        job.finished_at = getattr(job.runner, 'finished_at', None) or time.time()
+        if job.profile and on_log:
+            on_log(f"🔬 Aşama süreleri: {job.profile.summary()} "
+                   f"({job.profile.sample_count} örnek; profil rapor oluşturulurken yazılır)")
+
+        # Durdurulan iş iptal olarak kalır
+        if job.state != Job.CANCELLED:
+            job.state = Job.DONE if job.success else Job.FAILED
+        self._export_metrics(job, metrics_before, on_log)
+        return job
+
+    def _metrics_raw(self) -> Dict:
+        """Ölçümü açık client'ların ham ölçümleri (client -> ham değerler)"""
+        return {client: client.metrics.raw() for client in self.client_pool.clients()
+                if getattr(client, 'metrics', None) is not None and client.metrics.enabled}
+
+    def _export_metrics(self, job: Job, metrics_before: Dict, on_log: Callable[[str], None] = None):
+        """İşin ölçüm özetini JSON'a, havuzun birikmiş sayaçlarını Prometheus dosyasına yaz"""
+        from core import metrics
+
+        metrics_after = self._metrics_raw()
+        if not metrics_after or not (self.metrics_dir or self.prometheus_textfile):
+            return
+        try:
+            if self.metrics_dir:
+                empty = metrics.DISABLED.raw()
+                run_raw = metrics.merge_raw([metrics.diff_raw(raw, metrics_before.get(client, empty))
+                                             for client, raw in metrics_after.items()])
+                run_summary = {
+                    'job': job.id,
+                    'file': job.file_path,
+                    'organization_url': job.organization_url,
+                    'project': job.project_name,
+                    'state': job.state,
+                    'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(job.started_at)),
+                    'duration_seconds': round(job.elapsed, 2),
+                    'rows_per_second': round(job.throughput, 2),
+                }
+                run_summary.update(metrics.summary(run_raw, rows=job.rows_done))
+                file_name = f"metrics_{time.strftime('%Y%m%d_%H%M%S', time.localtime(job.started_at))}_job{job.id}.json"
+                job.metrics_path = metrics.write_json_summary(os.path.join(self.metrics_dir, file_name), run_summary)
+                if on_log:
+                    on_log(f"📊 Ölçüm özeti: {job.metrics_path} ({run_summary['calls']} çağrı, "
+                           f"satır başına {run_summary['calls_per_row']})")
+            if self.prometheus_textfile:
+                metrics.write_prometheus_textfile(self.prometheus_textfile, [
+                    (client.organization_url.rstrip('/').split('/')[-1], client.project_name, raw)
+                    for client, raw in metrics_after.items()
+                ])
+        except Exception as e:
+            if on_log:
+                on_log(f"⚠️ Ölçümler yazılamadı: {e}")
+
+    def stop_job(self, job: Job):
+        """Çalışan işi durdur (runner henüz kurulmadıysa iş iptal edilmiş olarak başlar)"""
+        job.state = Job.CANCELLED
+        job.cancel_token.cancel()
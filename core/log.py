@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Yapılandırılmış Loglama
+Core modüllerinin (REST client, Excel okuyucu, çıkarma motoru, runner ...) teşhis mesajları için
+seviyeli log katmanı. Her alt sistem kendi 'azdo.<alt sistem>' logger'ını kullanır ve seviyesi
+ayrı ayarlanabilir. Mesajlar %-biçiminde argümanlarla yazılır; seviye kapalıysa biçimlendirme
+yapılmaz, çağrı yalnızca bir seviye karşılaştırmasına mal olur.
+
+Açık seviyelerdeki kayıtlar satır başına bir JSON nesnesi olarak dönen log dosyasına
+(varsayılan logs/azdo.jsonl) yazılır; uyarı ve hatalar ayrıca stderr'e düz metin basılır.
+Bu modül PyQt5 import etmez.
+"""
+
+import os
+import sys
+import json
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+from typing import Dict
+
+ROOT = 'azdo'
+
+# Alt sistem -> açıklama (config.json 'log_levels' anahtarları)
+SUBSYSTEMS = {
+    'client': "REST client (HTTP çağrıları, cache, ekleme/davet akışları)",
+    'excel': "Girdi dosyası okuma ve doğrulama",
+    'removal': "Toplu çıkarma motoru",
+    'runner': "Satır işleme, bölümler, iptal ve rapor yazımı",
+    'learner': "Ekleme yöntemi öğrenici",
+    'estimator': "Çalışma tahmini ve gecikme geçmişi",
+    'config': "Yapılandırma dosyası",
+    'sink': "Arayüz log kuyruğu ve tam log dosyası",
+}
+
+DEFAULT_LEVEL = 'WARNING'
+
+# LogRecord'un kendi alanları; bunların dışındaki 'extra' alanları JSON'a eklenir
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_configure_lock = threading.Lock()
+_handlers = []
+
+
+def default_log_file() -> str:
+    """Uygulama dizinindeki logs/azdo.jsonl"""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs', 'azdo.jsonl')
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """Alt sistemin logger'ı (ör. get_logger('client') -> 'azdo.client')"""
+    return logging.getLogger(f"{ROOT}.{subsystem}")
+
+
+class JsonFormatter(logging.Formatter):
+    """Kaydı tek satırlık JSON nesnesine çevirir (log toplayıcılar için)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f".{int(record.msecs):03d}",
+            'level': record.levelname.lower(),
+            'subsystem': record.name[len(ROOT) + 1:] if record.name.startswith(ROOT + '.') else record.name,
+            'msg': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+_LEVELS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'WARNING': logging.WARNING,
+           'ERROR': logging.ERROR, 'CRITICAL': logging.CRITICAL}
+
+
+def _level(value, default: int) -> int:
+    if isinstance(value, int):
+        return value
+    return _LEVELS.get(str(value).strip().upper(), default)
+
+
+def configure(level: str = DEFAULT_LEVEL, levels: Dict[str, str] = None, log_file: str = None,
+              console: bool = True, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3):
+    """
+    Log seviyelerini ve hedeflerini ayarla (tekrar çağrılırsa önceki hedefler kaldırılır)
+
+    Args:
+        level: Tüm alt sistemlerin varsayılan seviyesi (DEBUG, INFO, WARNING, ERROR)
+        levels: Alt sistem -> seviye (ör. {'client': 'DEBUG'})
+        log_file: JSON satırlarının yazılacağı dosya (varsayılan: logs/azdo.jsonl; '' = dosyaya yazma)
+        console: Uyarı ve hataları stderr'e de yaz
+        max_bytes: Log dosyası bu boyuta ulaşınca döndürülür
+        backup_count: Saklanacak eski log dosyası sayısı
+    """
+    root = logging.getLogger(ROOT)
+    with _configure_lock:
+        for handler in _handlers:
+            root.removeHandler(handler)
+            handler.close()
+        _handlers.clear()
+
+        root.setLevel(_level(level, logging.WARNING))
+        root.propagate = False
+        for subsystem in SUBSYSTEMS:
+            get_logger(subsystem).setLevel(logging.NOTSET)
+        for subsystem, subsystem_level in (levels or {}).items():
+            get_logger(subsystem).setLevel(_level(subsystem_level, logging.NOTSET))
+
+        log_file = default_log_file() if log_file is None else log_file
+        if log_file:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+                handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                              encoding='utf-8')
+                handler.setFormatter(JsonFormatter())
+                _handlers.append(handler)
+            except Exception as e:
+                print(f"⚠️ Yapılandırılmış log dosyası açılamadı: {e}", file=sys.stderr)
+        if console:
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setLevel(logging.WARNING)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            _handlers.append(handler)
+        if not _handlers:
+            _handlers.append(logging.NullHandler())  # logging.lastResort stderr'e yazmasın
+        for handler in _handlers:
+            root.addHandler(handler)
+
+
+def configure_from_config(config: Dict):
+    """config.json'daki log_level, log_levels ve structured_log_file anahtarlarıyla ayarla"""
+    configure(level=config.get('log_level', DEFAULT_LEVEL), levels=config.get('log_levels') or {},
+              log_file=config.get('structured_log_file'))
+
+
+# configure() çağrılmadan da sessiz ve ucuz: varsayılan seviye WARNING, hedef yalnızca stderr
+_root = logging.getLogger(ROOT)
+_root.setLevel(logging.WARNING)
+_root.propagate = False
+if not _root.handlers:
+    _stderr = logging.StreamHandler(sys.stderr)
+    _stderr.setFormatter(logging.Formatter('%(message)s'))
+    _root.addHandler(_stderr)
+    _handlers.append(_stderr)
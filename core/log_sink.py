@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tamponlu Log Hedefi
+İşlem thread'lerinden gelen log mesajlarını thread-safe bir kuyrukta biriktirir; arayüz
+bunları kendi zamanlayıcısıyla toplu olarak çeker. Her mesaj ayrıca dönen (rotating) log
+dosyasına yazılır, böylece ekranda yalnızca son satırlar tutulsa da tam log kaybolmaz.
+Bu modül PyQt5 import etmez.
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import List
+
+from core.log import get_logger
+
+log = get_logger('sink')
+
+
+def default_log_file() -> str:
+    """Uygulama dizinindeki logs/azure_devops_manager.log"""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs', 'azure_devops_manager.log')
+
+
+class LogSink:
+    """Mesajları kuyrukta biriktiren ve dönen log dosyasına yazan log hedefi"""
+
+    def __init__(self, log_file: str = None, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3,
+                 max_pending: int = 20000):
+        """
+        Args:
+            log_file: Tam logun yazılacağı dosya (varsayılan: logs/azure_devops_manager.log; '' = dosyaya yazma)
+            max_bytes: Log dosyası bu boyuta ulaşınca döndürülür
+            backup_count: Saklanacak eski log dosyası sayısı
+            max_pending: Arayüz çekmeden biriken en fazla mesaj (aşılırsa en eskiler ekrandan düşer)
+        """
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self.max_pending = max_pending
+        self._dropped = 0
+        self._logger = None
+        self.log_file = default_log_file() if log_file is None else log_file
+        if self.log_file:
+            self._logger = self._create_logger(self.log_file, max_bytes, backup_count)
+
+    def _create_logger(self, log_file: str, max_bytes: int, backup_count: int):
+        try:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        except Exception as e:
+            log.warning("⚠️ Log dosyası açılamadı, yalnızca ekrana yazılacak: %s", e)
+            return None
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger = logging.getLogger(f"azure_devops_manager.log_sink.{id(self)}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        return logger
+
+    def write(self, message: str):
+        """Mesajı zaman damgasıyla kuyruğa ve log dosyasına ekle (herhangi bir thread'den çağrılabilir)"""
+        line = f"[{time.strftime('%H:%M:%S')}] {message}"
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self._dropped += 1
+            self._pending.append(line)
+        if self._logger:
+            self._logger.info(f"{time.strftime('%Y-%m-%d')} {line}")
+
+    def drain(self) -> List[str]:
+        """Biriken satırları al ve kuyruğu boşalt (arayüz thread'i)"""
+        with self._lock:
+            if not self._pending:
+                return []
+            lines = list(self._pending)
+            self._pending.clear()
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            where = f"tam log: {self.log_file}" if self._logger else "log dosyası kapalı"
+            lines.insert(0, f"... {dropped} satır ekrana yazılmadan atlandı ({where})")
+        return lines
+
+    def close(self):
+        """Log dosyasını kapat"""
+        if self._logger:
+            for handler in list(self._logger.handlers):
+                handler.close()
+                self._logger.removeHandler(handler)
+            self._logger = None
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ekleme Yöntemi Öğrenici
+Takım/özel grup ekleme zincirlerinde hangi yöntemin organizasyon ve grup türü bazında
+gerçekten çalıştığını izler. Çalışan yöntem bir sonraki denemede ilk sıraya alınır,
+bu organizasyonda desteklenmeyen yöntemler çalışmanın geri kalanında atlanır. Öğrenilen
+sıra uygulama dizinindeki method_order.json dosyasında saklanır.
+
+Yalnızca yöntemin kendisinin çalışmadığını gösteren sonuçlar (404/405/501 yanıtı, henüz
+tamamlanmamış yöntem) başarısızlık sayılır; satıra özgü hatalar (geçersiz e-posta, kullanıcı
+bulunamadı) ve geçici hatalar (429/5xx) yöntemi atlatmaz.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, List
+
+from core.log import get_logger
+
+log = get_logger('learner')
+
+# Yöntemin (endpoint'in) bu organizasyonda desteklenmediğini gösteren yanıt kodları
+UNSUPPORTED_STATUSES = (404, 405, 501)
+
+
+class MethodUnsupported(Exception):
+    """Yöntem bu organizasyon/grup türünde çalışmıyor; öğrenicide başarısızlık olarak sayılır"""
+
+
+class MethodLearner:
+    """Organizasyon/grup türü başına ekleme yöntemi sırasını öğrenir ve saklar"""
+
+    def __init__(self, state_file: str = None, failure_threshold: int = 3):
+        """
+        Args:
+            state_file: Öğrenilen sıranın saklanacağı dosya (varsayılan: config.json yanındaki method_order.json)
+            failure_threshold: Bu çalışmada hiç başarılı olmadan bu kadar başarısız olan yöntem atlanır
+        """
+        self.state_file = state_file or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'method_order.json')
+        self.failure_threshold = failure_threshold
+        self._lock = threading.Lock()
+        self._order = self._load()  # org -> {grup türü -> [yöntem adları]}
+        self._run_failures = {}  # (org, grup türü, yöntem) -> bu çalışmada desteklenmediği görülen deneme sayısı
+        self._run_successes = set()  # (org, grup türü, yöntem) bu çalışmada en az bir kez başarılı
+
+    def begin_run(self):
+        """Yeni çalışma: çalışma içi sayaçlar sıfırlanır, atlanan yöntemler tekrar denenir (öğrenilen sıra korunur)"""
+        with self._lock:
+            self._run_failures.clear()
+            self._run_successes.clear()
+
+    def _load(self) -> Dict[str, Dict[str, List[str]]]:
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            log.warning("⚠️ Yöntem sırası yüklenemedi: %s", e)
+        return {}
+
+    def _save(self):
+        try:
+            with open(self.state_file, 'w') as f:
+                json.dump(self._order, f, indent=2)
+        except Exception as e:
+            log.warning("⚠️ Yöntem sırası kaydedilemedi: %s", e)
+
+    @staticmethod
+    def _org_key(organization_url: str) -> str:
+        return organization_url.rstrip('/').lower()
+
+    def _is_skipped(self, org: str, group_type: str, method: str) -> bool:
+        key = (org, group_type, method)
+        return key not in self._run_successes and self._run_failures.get(key, 0) >= self.failure_threshold
+
+    def order(self, organization_url: str, group_type: str, methods: List[str],
+              skip_failing: bool = True) -> List[str]:
+        """
+        Denenecek yöntemlerin sırası: önce öğrenilen sıra, sonra varsayılan sıradaki diğerleri.
+        Sürekli başarısız olan yöntemler çıkarılır; hepsi elenirse en iyi aday yine denenir.
+
+        Args:
+            organization_url: Organizasyon URL'i
+            group_type: Zincir/grup türü anahtarı (ör. 'team', 'custom:security')
+            methods: Varsayılan sıradaki yöntem adları
+            skip_failing: False ise bu çalışmada atlanan yöntemler de döner (ör. sonraki çalışmanın tahmini)
+        """
+        org = self._org_key(organization_url)
+        with self._lock:
+            learned = [m for m in self._order.get(org, {}).get(group_type, []) if m in methods]
+            ordered = learned + [m for m in methods if m not in learned]
+            if not skip_failing:
+                return ordered
+            active = [m for m in ordered if not self._is_skipped(org, group_type, m)]
+        return active or ordered[:1]
+
+    def record(self, organization_url: str, group_type: str, method: str, success: bool):
+        """
+        Yöntem denemesinin sonucunu kaydet; başarılı yöntem öne alınır ve sıra saklanır
+
+        success=False yalnızca yöntem desteklenmediğinde (MethodUnsupported) kaydedilmelidir;
+        satıra özgü veya geçici başarısızlıklar kaydedilmez.
+        """
+        org = self._org_key(organization_url)
+        key = (org, group_type, method)
+        with self._lock:
+            if not success:
+                self._run_failures[key] = self._run_failures.get(key, 0) + 1
+                if self._run_failures[key] == self.failure_threshold and key not in self._run_successes:
+                    log.info("⏭️ '%s' yöntemi %s kez başarısız oldu, bu çalışmada atlanacak (%s)",
+                             method, self.failure_threshold, group_type)
+                return
+
+            self._run_successes.add(key)
+            learned = self._order.setdefault(org, {}).setdefault(group_type, [])
+            if learned[:1] == [method]:
+                return
+            if method in learned:
+                learned.remove(method)
+            learned.insert(0, method)
+            self._save()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İstemci Ölçümleri
+AzureDevOpsRESTClient'ın çalışma sırasında biriktirdiği ölçümler: endpoint ve HTTP durum
+kodu başına çağrı sayıları, endpoint başına gecikme histogramları, gönderilen/alınan bayt,
+eşzamanlı istek sayısı, yeniden deneme ve 429 sayıları, hız sınırı beklemesi ve cache
+isabet oranları. İşçi thread'leri yalnızca sayaç artırır; yüzdelikler ve özetler okuma
+sırasında (işçileri bekletmeden) hesaplanır.
+
+Ölçümler kapatıldığında client DISABLED nesnesini kullanır: tüm kayıt metotları boştur.
+
+Çalışma sonunda ölçümler JSON özeti (write_json_summary) ve node exporter textfile
+collector için Prometheus metin dosyası (write_prometheus_textfile) olarak yazılabilir.
+"""
+
+import os
+import json
+import math
+import threading
+from collections import Counter, deque
+from typing import Dict, List, Optional
+
+# Gecikme histogramı kova üst sınırları (saniye); son kova +Inf
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Yanıt alınamayan (bağlantı hatası, zaman aşımı, iptal) istekler için durum etiketi
+NO_RESPONSE = 'error'
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Sıralı değerlerde en yakın sıra yöntemiyle yüzdelik (boş listede 0)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def histogram_quantile(buckets: List[int], fraction: float) -> Optional[float]:
+    """Histogram kovalarından yüzdelik tahmini (değerin düştüğü kovanın üst sınırı; +Inf ise None)"""
+    total = sum(buckets)
+    if not total:
+        return None
+    rank = max(1, math.ceil(fraction * total))
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, buckets):
+        seen += count
+        if seen >= rank:
+            return bound
+    return None
+
+
+def _body_size(response) -> int:
+    request = getattr(response, 'request', None)
+    body = getattr(request, 'body', None)
+    return len(body) if body else 0
+
+
+def _content_size(response) -> int:
+    content = getattr(response, '_content', None)  # requests yanıtı zaten okuduysa
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+
+class ClientMetrics:
+    """Bir client'ın thread-safe ölçümleri"""
+
+    enabled = True
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: Endpoint başına tutulan son gecikme örneği sayısı (canlı p50/p95 bu pencereden)
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.calls = Counter()          # (endpoint, durum kodu veya 'error') -> çağrı
+        self.retries = Counter()        # endpoint -> 429 sonrası yeniden deneme
+        self.bytes_sent = Counter()     # endpoint -> istek gövdesi baytı
+        self.bytes_received = Counter() # endpoint -> yanıt gövdesi baytı
+        self.cache_hits = Counter()     # cache adı -> isabet
+        self.cache_misses = Counter()   # cache adı -> ıska
+        self.wait_seconds = 0.0         # Hız sınırı (token bucket / Retry-After) beklemesi toplamı
+        self._histograms = {}           # endpoint -> kova sayıları (LATENCY_BUCKETS + +Inf)
+        self._latency_sum = Counter()   # endpoint -> toplam gecikme (sn)
+        self._latencies = {}            # endpoint -> deque[sn] (son window örnek)
+
+    def request_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, endpoint: str, seconds: float, response=None):
+        """İstek bitti (response None ise yanıt alınamadı)"""
+        sent = _body_size(response) if response is not None else 0
+        received = _content_size(response) if response is not None else 0
+        status = str(response.status_code) if response is not None else NO_RESPONSE
+        bucket = len(LATENCY_BUCKETS)
+        for position, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                bucket = position
+                break
+        with self._lock:
+            self.in_flight -= 1
+            self.calls[(endpoint, status)] += 1
+            if sent:
+                self.bytes_sent[endpoint] += sent
+            if received:
+                self.bytes_received[endpoint] += received
+            if response is None:
+                return
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = self._histograms[endpoint] = [0] * (len(LATENCY_BUCKETS) + 1)
+                self._latencies[endpoint] = deque(maxlen=self.window)
+            histogram[bucket] += 1
+            self._latency_sum[endpoint] += seconds
+            self._latencies[endpoint].append(seconds)
+
+    def record_retry(self, endpoint: str):
+        with self._lock:
+            self.retries[endpoint] += 1
+
+    def record_wait(self, seconds: float):
+        if seconds > 0:
+            with self._lock:
+                self.wait_seconds += seconds
+
+    def cache_lookup(self, cache: str, hit: bool):
+        with self._lock:
+            if hit:
+                self.cache_hits[cache] += 1
+            else:
+                self.cache_misses[cache] += 1
+
+    def raw(self) -> Dict:
+        """Kilit altında ham değerlerin kopyası (hesaplama kilit dışında yapılır)"""
+        with self._lock:
+            return {
+                'in_flight': self.in_flight,
+                'calls': Counter(self.calls),
+                'retries': Counter(self.retries),
+                'bytes_sent': Counter(self.bytes_sent),
+                'bytes_received': Counter(self.bytes_received),
+                'cache_hits': Counter(self.cache_hits),
+                'cache_misses': Counter(self.cache_misses),
+                'wait_seconds': self.wait_seconds,
+                'histograms': {endpoint: list(buckets) for endpoint, buckets in self._histograms.items()},
+                'latency_sum': Counter(self._latency_sum),
+                'latencies': {endpoint: list(samples) for endpoint, samples in self._latencies.items()},
+            }
+
+    def snapshot(self) -> Dict:
+        return snapshot([self])
+
+
+class DisabledMetrics(ClientMetrics):
+    """Ölçümler kapalıyken kullanılan, hiçbir şey kaydetmeyen nesne"""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__(window=0)
+
+    def request_started(self):
+        pass
+
+    def request_finished(self, endpoint, seconds, response=None):
+        pass
+
+    def record_retry(self, endpoint):
+        pass
+
+    def record_wait(self, seconds):
+        pass
+
+    def cache_lookup(self, cache, hit):
+        pass
+
+
+DISABLED = DisabledMetrics()
+
+_COUNTER_FIELDS = ('calls', 'retries', 'bytes_sent', 'bytes_received', 'cache_hits', 'cache_misses', 'latency_sum')
+
+
+def merge_raw(raws: List[Dict]) -> Dict:
+    """Birden fazla client'ın ham ölçümlerini toplar"""
+    merged = {name: Counter() for name in _COUNTER_FIELDS}
+    merged.update(in_flight=0, wait_seconds=0.0, histograms={}, latencies={})
+    for raw in raws:
+        for name in _COUNTER_FIELDS:
+            merged[name].update(raw[name])
+        merged['in_flight'] += raw['in_flight']
+        merged['wait_seconds'] += raw['wait_seconds']
+        for endpoint, buckets in raw['histograms'].items():
+            total = merged['histograms'].setdefault(endpoint, [0] * len(buckets))
+            for position, count in enumerate(buckets):
+                total[position] += count
+        for endpoint, samples in raw['latencies'].items():
+            merged['latencies'].setdefault(endpoint, []).extend(samples)
+    return merged
+
+
+def diff_raw(after: Dict, before: Dict) -> Dict:
+    """İki ham ölçüm arasındaki fark (bir çalışmanın kendi ölçümleri); canlı örnekler 'after'dan alınır"""
+    result = {name: after[name] - before[name] for name in _COUNTER_FIELDS}
+    result.update(in_flight=after['in_flight'], wait_seconds=after['wait_seconds'] - before['wait_seconds'],
+                  latencies=after['latencies'], histograms={})
+    for endpoint, buckets in after['histograms'].items():
+        previous = before['histograms'].get(endpoint, [0] * len(buckets))
+        delta = [count - old for count, old in zip(buckets, previous)]
+        if any(delta):
+            result['histograms'][endpoint] = delta
+    return result
+
+
+def _endpoint_counts(calls: Counter):
+    requests, throttled, failures, statuses = Counter(), Counter(), Counter(), {}
+    for (endpoint, status), count in calls.items():
+        statuses.setdefault(endpoint, Counter())[status] += count
+        if status == NO_RESPONSE:
+            failures[endpoint] += count
+            continue
+        requests[endpoint] += count
+        if status == '429':
+            throttled[endpoint] += count
+    return requests, throttled, failures, statuses
+
+
+def _cache_rates(raw: Dict) -> Dict:
+    caches = {}
+    for cache in sorted(set(raw['cache_hits']) | set(raw['cache_misses'])):
+        hits, misses = raw['cache_hits'][cache], raw['cache_misses'][cache]
+        caches[cache] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
+    return caches
+
+
+def snapshot(metrics_list: List[ClientMetrics]) -> Dict:
+    """
+    Bir veya daha fazla client'ın canlı ölçümlerini birleştirir (gösterge paneli)
+
+    Returns:
+        Dict: in_flight, requests, retries, throttled, failures, wait_seconds (toplamlar),
+              endpoints {endpoint: {'count', 'p50', 'p95', 'throttled', 'retries', 'failures'}} (gecikmeler sn),
+              caches {cache: {'hits', 'misses', 'hit_rate'}}
+    """
+    raw = merge_raw([metrics.raw() for metrics in metrics_list])
+    requests, throttled, failures, _ = _endpoint_counts(raw['calls'])
+
+    endpoints = {}
+    for endpoint in sorted(set(requests) | set(failures)):
+        samples = sorted(raw['latencies'].get(endpoint, []))
+        endpoints[endpoint] = {
+            'count': requests[endpoint],
+            'p50': percentile(samples, 0.50),
+            'p95': percentile(samples, 0.95),
+            'throttled': throttled[endpoint],
+            'retries': raw['retries'][endpoint],
+            'failures': failures[endpoint],
+        }
+
+    return {
+        'in_flight': raw['in_flight'],
+        'requests': sum(requests.values()),
+        'retries': sum(raw['retries'].values()),
+        'throttled': sum(throttled.values()),
+        'failures': sum(failures.values()),
+        'wait_seconds': raw['wait_seconds'],
+        'endpoints': endpoints,
+        'caches': _cache_rates(raw),
+    }
+
+
+def summary(raw: Dict, rows: int = 0) -> Dict:
+    """
+    Ham ölçümlerden JSON'a yazılabilir çalışma özeti
+
+    Args:
+        raw: merge_raw / diff_raw çıktısı
+        rows: Çalışmada işlenen satır sayısı (satır başına çağrı için)
+    """
+    requests, throttled, failures, statuses = _endpoint_counts(raw['calls'])
+    bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['+Inf']
+    endpoints = {}
+    for endpoint in sorted(statuses):
+        buckets = raw['histograms'].get(endpoint, [0] * len(bounds))
+        count = sum(buckets)
+        endpoints[endpoint] = {
+            'calls': requests[endpoint] + failures[endpoint],
+            'status': dict(sorted(statuses[endpoint].items())),
+            'retries': raw['retries'][endpoint],
+            'bytes_sent': raw['bytes_sent'][endpoint],
+            'bytes_received': raw['bytes_received'][endpoint],
+            'latency_seconds': {
+                'sum': round(raw['latency_sum'][endpoint], 4),
+                'mean': round(raw['latency_sum'][endpoint] / count, 4) if count else None,
+                'p50_le': histogram_quantile(buckets, 0.50),
+                'p95_le': histogram_quantile(buckets, 0.95),
+                'buckets': dict(zip(bounds, buckets)),
+            },
+        }
+
+    calls = sum(requests.values()) + sum(failures.values())
+    return {
+        'rows': rows,
+        'calls': calls,
+        'calls_per_row': round(calls / rows, 3) if rows else None,
+        'errors': sum(failures.values()),
+        'throttled': sum(throttled.values()),
+        'retries': sum(raw['retries'].values()),
+        'bytes_sent': sum(raw['bytes_sent'].values()),
+        'bytes_received': sum(raw['bytes_received'].values()),
+        'rate_limit_wait_seconds': round(raw['wait_seconds'], 3),
+        'endpoints': endpoints,
+        'caches': _cache_rates(raw),
+    }
+
+
+def _write_atomic(path: str, text: str):
+    """Önce geçici dosyaya yazar, sonra yerine taşır (okuyucu yarım dosya görmez)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def write_json_summary(path: str, run_summary: Dict) -> str:
+    """Çalışma özetini JSON dosyasına yazar"""
+    _write_atomic(path, json.dumps(run_summary, ensure_ascii=False, indent=2))
+    return path
+
+
+def _labels(**labels) -> str:
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def prometheus_text(clients: List[tuple]) -> str:
+    """
+    Prometheus metin formatı (node exporter textfile collector)
+
+    Args:
+        clients: (organization, project, ham ölçüm) listesi; değerler süreç başından beri birikmiş sayaçlardır
+    """
+    families = {
+        'azdo_requests_total': ('counter', "Endpoint ve HTTP durum kodu başına istek sayısı", []),
+        'azdo_request_duration_seconds': ('histogram', "Endpoint başına istek gecikmesi", []),
+        'azdo_retries_total': ('counter', "429 sonrası yeniden deneme sayısı", []),
+        'azdo_bytes_sent_total': ('counter', "Gönderilen istek gövdesi baytı", []),
+        'azdo_bytes_received_total': ('counter', "Alınan yanıt gövdesi baytı", []),
+        'azdo_rate_limit_wait_seconds_total': ('counter', "Hız sınırı beklemesinde geçen süre", []),
+        'azdo_cache_hits_total': ('counter', "Cache isabeti", []),
+        'azdo_cache_misses_total': ('counter', "Cache ıskası", []),
+    }
+
+    def add(family, value, suffix='', **labels):
+        families[family][2].append(f"{family}{suffix}{_labels(**labels)} {value}")
+
+    for organization, project, raw in clients:
+        scope = {'organization': organization, 'project': project}
+        for (endpoint, status), count in sorted(raw['calls'].items()):
+            add('azdo_requests_total', count, endpoint=endpoint, status=status, **scope)
+        for endpoint, buckets in sorted(raw['histograms'].items()):
+            cumulative = 0
+            for bound, count in zip(list(LATENCY_BUCKETS) + ['+Inf'], buckets):
+                cumulative += count
+                add('azdo_request_duration_seconds', cumulative, '_bucket', endpoint=endpoint, le=bound, **scope)
+            add('azdo_request_duration_seconds', round(raw['latency_sum'][endpoint], 6), '_sum', endpoint=endpoint, **scope)
+            add('azdo_request_duration_seconds', cumulative, '_count', endpoint=endpoint, **scope)
+        for name, family in (('retries', 'azdo_retries_total'), ('bytes_sent', 'azdo_bytes_sent_total'),
+                             ('bytes_received', 'azdo_bytes_received_total')):
+            for endpoint, value in sorted(raw[name].items()):
+                add(family, value, endpoint=endpoint, **scope)
+        add('azdo_rate_limit_wait_seconds_total', round(raw['wait_seconds'], 3), **scope)
+        for name, family in (('cache_hits', 'azdo_cache_hits_total'), ('cache_misses', 'azdo_cache_misses_total')):
+            for cache, value in sorted(raw[name].items()):
+                add(family, value, cache=cache, **scope)
+
+    lines = []
+    for family, (metric_type, help_text, samples) in families.items():
+        if not samples:
+            continue
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {metric_type}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(path: str, clients: List[tuple]) -> str:
+    """Prometheus metin dosyasını atomik olarak yazar (node exporter yarım dosya okumaz)"""
+    _write_atomic(path, prometheus_text(clients))
+    return path
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çalışma Profili
+Profil modu açıkken bir işin süresinin nereye gittiğini ölçer:
+
+- Aşama süreleri: girdi okuma (parse), ön yükleme (bootstrap: bağlantı testi, takım/üye
+  cache'i, grup sınıflandırma), davet (invite), takıma ekleme (team_add), çıkarma (removal),
+  yayılma beklemesi (propagation_wait: davet sonrası kullanıcının organizasyona düşmesini
+  bekleme) ve rapor (report). İç içe aşamalarda süre en içteki aşamaya yazılır (ör. takıma
+  ekleme sırasındaki davet beklemesi propagation_wait'e sayılır). Paralel bölümlerde aşama
+  süreleri thread'ler üzerinden toplanır; toplam duvar saati süresini aşabilir.
+- Duvar saati örneklemesi: ayrı bir thread belirli aralıklarla tüm thread'lerin yığınlarını
+  (bekleyen, uyuyan thread'ler dahil) örnekler. Yığınlar flamegraph.pl / speedscope'un okuduğu
+  katlanmış (collapsed) biçimde yazılır: "thread;[aşama];dosya.py:fonksiyon;... örnek_sayısı".
+
+Profil kapalıyken DISABLED nesnesi kullanılır: stage() paylaşılan boş bir context manager
+döndürür, iterate() girdiyi olduğu gibi döndürür. Bu modül PyQt5 import etmez.
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+# Raporlarda gösterilen aşama sırası
+STAGES = ('parse', 'bootstrap', 'invite', 'team_add', 'removal', 'propagation_wait', 'report')
+
+DEFAULT_SAMPLE_INTERVAL = 0.01  # 100 Hz
+
+
+class _Stage:
+    """Bir aşamanın süresini ölçen context manager (iç içe aşamaların süresi dış aşamadan düşülür)"""
+
+    __slots__ = ('profile', 'name')
+
+    def __init__(self, profile: 'RunProfile', name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.profile._stack().append([self.name, time.perf_counter(), 0.0])
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        stack = self.profile._stack()
+        name, started, child_seconds = stack.pop()
+        elapsed = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += elapsed
+        self.profile._add(name, elapsed - child_seconds)
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class RunProfile:
+    """Bir çalışmanın aşama süreleri ve duvar saati örnekleme profili"""
+
+    enabled = True
+
+    def __init__(self, sample_interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """
+        Args:
+            sample_interval: Yığın örnekleme aralığı (saniye; 0 = örnekleme yapma, yalnızca aşama süreleri)
+        """
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+        self._seconds = Counter()  # aşama -> süre (sn)
+        self._counts = Counter()   # aşama -> giriş sayısı
+        self._stacks = {}          # thread ident -> açık aşamalar [[ad, başlangıç, alt aşama süresi], ...]
+        self.samples = Counter()   # katlanmış yığın -> örnek sayısı
+        self.sample_count = 0
+        self.started_at = None
+        self.finished_at = None
+        self._labels = {}          # code nesnesi -> çerçeve etiketi
+        self._sampler = None
+        self._stop = threading.Event()
+
+    # --- Aşama süreleri ---
+
+    def _stack(self) -> list:
+        ident = threading.get_ident()
+        stack = self._stacks.get(ident)
+        if stack is None:
+            stack = self._stacks[ident] = []
+        return stack
+
+    def _add(self, name: str, seconds: float):
+        with self._lock:
+            self._seconds[name] += seconds
+            self._counts[name] += 1
+
+    def stage(self, name: str) -> _Stage:
+        """Aşamanın süresini ölçen context manager: `with profile.stage('invite'): ...`"""
+        return _Stage(self, name)
+
+    def iterate(self, name: str, iterable: Iterable) -> Iterable:
+        """Her öğenin üretilme süresini aşamaya yazan yineleyici (ör. akış halinde dosya okuma)"""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def stages(self) -> Dict[str, Dict]:
+        """Aşama -> {'seconds', 'count'} (bilinen aşamalar STAGES sırasıyla, ölçülmeyenler 0)"""
+        with self._lock:
+            seconds, counts = Counter(self._seconds), Counter(self._counts)
+        names = list(STAGES) + sorted(name for name in seconds if name not in STAGES)
+        return {name: {'seconds': round(seconds[name], 4), 'count': counts[name]} for name in names}
+
+    def summary(self) -> str:
+        """Tek satırlık aşama özeti (en uzun aşama önce)"""
+        parts = [f"{name} {values['seconds']:.2f} sn"
+                 for name, values in sorted(self.stages().items(), key=lambda item: -item[1]['seconds'])
+                 if values['count']]
+        return ", ".join(parts) or "ölçülen aşama yok"
+
+    # --- Duvar saati örneklemesi ---
+
+    def start(self):
+        """Çalışmayı başlat (örnekleme açıksa örnekleyici thread'i başlatılır)"""
+        self.started_at = time.time()
+        if self.sample_interval > 0 and self._sampler is None:
+            self._sampler = threading.Thread(target=self._sample_loop, name='profiler', daemon=True)
+            self._sampler.start()
+
+    def stop(self):
+        """Örneklemeyi durdur (aşama süreleri ölçülmeye devam eder; ör. rapor yazımı)"""
+        self.finished_at = time.time()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1.0)
+            self._sampler = None
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+        return label
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.sample_interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                frames = []
+                while frame is not None:
+                    frames.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                frames.append(self._current_stage(ident))
+                frames.append(names.get(ident, 'thread'))
+                self.samples[';'.join(reversed([f for f in frames if f]))] += 1
+            self.sample_count += 1
+
+    def _current_stage(self, ident: int) -> Optional[str]:
+        """Thread'in en içteki açık aşaması (yığında [aşama] çerçevesi olarak gösterilir)"""
+        try:
+            return f"[{self._stacks[ident][-1][0]}]"
+        except (KeyError, IndexError):
+            return None
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope katlanmış yığın metni"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def to_dict(self) -> Dict:
+        return {
+            'wall_seconds': round(self.wall_seconds, 3),
+            'sample_interval': self.sample_interval,
+            'samples': self.sample_count,
+            'stages': self.stages(),
+        }
+
+    def write(self, base_path: str) -> Optional[str]:
+        """
+        Profili '<base_path>_profile.folded' (katlanmış yığınlar) ve '<base_path>_profile.json'
+        (aşama süreleri) olarak yazar
+
+        Returns:
+            Optional[str]: Katlanmış yığın dosyasının yolu
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(base_path)), exist_ok=True)
+        folded_path = f"{base_path}_profile.folded"
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+        with open(f"{base_path}_profile.json", 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return folded_path
+
+
+class DisabledProfile(RunProfile):
+    """Profil modu kapalıyken kullanılan, hiçbir şey ölçmeyen nesne"""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__(sample_interval=0)
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def iterate(self, name, iterable):
+        return iterable
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def write(self, base_path):
+        return None
+
+
+DISABLED = DisabledProfile()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+İlerleme Kısıcı
+BatchRunner'lar her satırda ilerleme ve durum bildirir. Bu sınıf bu olayları birleştirir ve
+saniyede en fazla belirli sayıda güncelleme iletir; araya düşen olaylar atılmaz, bir sonraki
+güncellemede en son durum olarak gönderilir. İş bitince flush ile son durum her zaman iletilir.
+Güncellemeler işlenen satır/sn ve tahmini kalan süreyi de taşır.
+"""
+
+import time
+import threading
+from typing import Callable, NamedTuple, Optional
+
+from core.run_estimator import format_duration
+
+
+class ProgressUpdate(NamedTuple):
+    """Arayüze / CLI'a iletilen birleştirilmiş ilerleme durumu"""
+    current: int
+    total: int
+    rows_per_second: float
+    eta_seconds: Optional[float]    # Kalan süre tahmini (hız henüz bilinmiyorsa None)
+    status: Optional[str]           # Son durum mesajı (henüz yoksa None)
+    final: bool = False             # İş sonundaki son güncelleme
+
+    @property
+    def percent(self) -> int:
+        return int(self.current / self.total * 100) if self.total > 0 else 0
+
+    def summary(self) -> str:
+        """'120/1000 satır, 8.5 satır/sn, kalan ~1 dk 43 sn' biçiminde özet"""
+        text = f"{self.current}/{self.total} satır"
+        if self.rows_per_second > 0:
+            text += f", {self.rows_per_second:.1f} satır/sn"
+        if self.eta_seconds is not None and not self.final:
+            text += f", kalan ~{format_duration(self.eta_seconds)}"
+        return text
+
+
+class ProgressThrottle:
+    """İlerleme ve durum olaylarını birleştirip saniyede en fazla max_updates_per_second kez ileten kısıcı"""
+
+    def __init__(self, on_update: Callable[[ProgressUpdate], None], max_updates_per_second: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            on_update: Birleştirilmiş güncellemeyi alan callback (herhangi bir thread'den çağrılır)
+            max_updates_per_second: Saniyedeki en fazla güncelleme (0 = kısıtlama yok)
+            clock: Zaman kaynağı (saniye)
+        """
+        self.on_update = on_update
+        self.interval = 1.0 / max_updates_per_second if max_updates_per_second > 0 else 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started_at = None
+        self._last_delivery = None
+        self._current = 0
+        self._total = 0
+        self._status = None
+        self._dirty = False
+        self.received = 0   # Gelen olay sayısı
+        self.delivered = 0  # İletilen güncelleme sayısı
+
+    def progress(self, current: int, total: int):
+        """BatchRunner ilerleme callback'i (current, total)"""
+        with self._lock:
+            self._current = current
+            self._total = total
+            self._record()
+
+    def status(self, message: str):
+        """BatchRunner durum callback'i"""
+        with self._lock:
+            self._status = message
+            self._record()
+
+    def flush(self):
+        """Bekleyen son durumu hemen ilet (iş sonunda çağrılır)"""
+        with self._lock:
+            if self._started_at is None:
+                return
+            self._deliver(self._clock(), final=True)
+
+    def _record(self):
+        now = self._clock()
+        self.received += 1
+        if self._started_at is None:
+            self._started_at = now
+        self._dirty = True
+        if self._last_delivery is None or now - self._last_delivery >= self.interval:
+            self._deliver(now)
+
+    def _deliver(self, now: float, final: bool = False):
+        # Kilit altında iletilir; paralel bölümlerden gelen güncellemeler sırasıyla ulaşır
+        update = self._snapshot(now, final)
+        self._last_delivery = now
+        self._dirty = False
+        self.delivered += 1
+        self.on_update(update)
+
+    def _snapshot(self, now: float, final: bool) -> ProgressUpdate:
+        elapsed = now - self._started_at
+        rate = self._current / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if rate > 0 and self._total >= self._current:
+            eta = (self._total - self._current) / rate
+        return ProgressUpdate(self._current, self._total, rate, eta, self._status, final)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Hız Sınırlayıcı
+Her AzureDevOpsRESTClient kendi token bucket'ına sahiptir; böylece paralel çalışan
+organizasyon/proje bölümleri birbirinin istek bütçesini tüketmez.
+"""
+
+import time
+import threading
+
+
+class RateLimiter:
+    """Thread-safe token bucket hız sınırlayıcı"""
+
+    def __init__(self, requests_per_second: float = 10.0, burst: int = None):
+        """
+        Args:
+            requests_per_second: Saniyede izin verilen ortalama istek sayısı (0 = sınırsız)
+            burst: Ani yüklenmede art arda izin verilen istek sayısı (varsayılan: saniyelik oran)
+        """
+        self.rate = requests_per_second
+        self.capacity = burst or max(1, int(requests_per_second))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, sleep=time.sleep):
+        """Bir istek hakkı alınana kadar bekle
+
+        Args:
+            sleep: Bekleme fonksiyonu (iptal edilebilir bekleme için client'ın _sleep'i verilir)
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Sunucu kısıtlaması (429 / Retry-After) sonrası tüm istekleri belirtilen süre durdur"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Toplu Takım/Grup Çıkarma Motoru
+Çıkarma satırlarını takım/grup bazında gruplar; her takım için Graph descriptor'ını bir kez
+çözer, üyelik silme isteklerini paralel gönderir. Üye olup olmadığı cache'lenmiş üye listesinden
+değil silme isteğinin yanıtından anlaşılır (404 = zaten üye değil).
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from core.log import get_logger
+
+log = get_logger('removal')
+
+
+class RemovalEngine:
+    """Takım ve güvenlik grubu üyeliklerini toplu olarak kaldırır"""
+
+    def __init__(self, client, max_workers: int = 8):
+        """
+        Args:
+            client: AzureDevOpsRESTClient örneği (cache'leri paylaşılır)
+            max_workers: Aynı anda gönderilecek en fazla silme isteği
+        """
+        self.client = client
+        self.max_workers = max_workers
+
+    def _group_by_target(self, removals: List[Tuple[str, str]]) -> "OrderedDict[str, Tuple[str, List[str]]]":
+        """Çıkarma isteklerini hedef takım/grup adına göre grupla (aynı satır tekrarları birleştirilir)"""
+        groups = OrderedDict()
+        seen = set()
+        for user_email, group_name in removals:
+            key = group_name.strip().lower()
+            if key not in groups:
+                groups[key] = (group_name.strip(), [])
+            if (user_email.strip().lower(), key) not in seen:
+                seen.add((user_email.strip().lower(), key))
+                groups[key][1].append(user_email.strip())
+        return groups
+
+    def remove_batch(self, removals: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[bool, str]]:
+        """
+        Kullanıcıları takım/gruplardan toplu olarak çıkarır
+
+        Args:
+            removals: (kullanıcı e-postası, takım/grup adı) listesi
+
+        Returns:
+            Dict[Tuple[str, str], Tuple[bool, str]]: (e-posta küçük harf, grup adı küçük harf) -> (başarı, mesaj)
+        """
+        results = {}
+        if not removals:
+            return results
+
+        groups = self._group_by_target(removals)
+        log.info("🧹 %s çıkarma isteği, %s takım/grup", len(removals), len(groups))
+
+        # Kullanıcı descriptor'ları tek seferde (org üyeleri cache'inden)
+        user_index = self.client._get_org_user_index()
+
+        cancel_token = self.client.cancel_token
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='removal') as executor:
+            # Executor iptalde kapatılmaz (sonraki submit RuntimeError verirdi): kuyruktaki silme
+            # istekleri _request'in iptal kontrolünde CancelledError ile gönderilmeden biter
+            for group_key, (group_name, emails) in groups.items():
+                cancel_token.raise_if_cancelled()
+                results.update(self._remove_from_group(executor, group_key, group_name, emails, user_index))
+        cancel_token.raise_if_cancelled()
+
+        removed = sum(1 for ok, _ in results.values() if ok)
+        log.info("✅ Çıkarma tamamlandı: %s/%s başarılı", removed, len(results))
+        return results
+
+    def _remove_from_group(self, executor, group_key: str, group_name: str, emails: List[str],
+                           user_index: Dict[str, Dict]) -> Dict[Tuple[str, str], Tuple[bool, str]]:
+        """Tek bir takım/gruptan kullanıcıları paralel çıkarır"""
+        results = {}
+
+        # Hedef: önce takım, sonra güvenlik/özel grup
+        team = self.client._find_team(group_name)
+        if team:
+            container_descriptor = self.client._get_team_graph_descriptor(team['id'])
+            # Ekleme akışının cache'lediği üye listesi (varsa) silinen üyelerle güncel tutulur
+            members = self.client._team_members_cache.get(team['id'])
+        else:
+            group = self.client._find_graph_group(group_name)
+            container_descriptor = group.get('descriptor') if group else None
+            members = None
+
+        if not container_descriptor:
+            message = f"Takım/grup bulunamadı: {group_name}"
+            log.warning("❌ %s", message)
+            return {(email.lower(), group_key): (False, message) for email in emails}
+
+        futures = {}
+        for email in emails:
+            email_key = email.lower()
+            user = user_index.get(email_key)
+            if not user or not user.get('descriptor'):
+                results[(email_key, group_key)] = (False, f"Kullanıcı organizasyonda bulunamadı: {email}")
+                continue
+
+            self.client.cancel_token.raise_if_cancelled()
+            futures[email_key] = executor.submit(
+                self.client._remove_membership, user['descriptor'], container_descriptor
+            )
+
+        for email_key, future in futures.items():
+            try:
+                ok, message = future.result()
+            except Exception as e:
+                ok, message = False, str(e)
+            results[(email_key, group_key)] = (ok, message)
+            if ok and members is not None:
+                members.pop(email_key, None)
+
+        removed = sum(1 for email_key in futures if results[(email_key, group_key)][0])
+        log.debug("👥 %s: %s/%s üyelik silindi", group_name, removed, len(futures))
+        return results
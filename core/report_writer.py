@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Akış Halinde Rapor Yazıcısı
+İşlem sonuçlarını satır satır geçici bir CSV dosyasına yazar; durum ve takım bazında
+sayaçları çalışma boyunca günceller. Rapor satırları bellekte tutulmaz, özet sayfaları
+sayaçlardan üretilir ve Excel raporu write-only openpyxl çalışma kitabı ile yazılır.
+"""
+
+import os
+import csv
+import time
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import Counter
+from typing import Iterator, List, Tuple
+
+# Rapor detay sayfasının kolonları
+REPORT_COLUMNS = ['Kullanıcı Email', 'Takım Adı', 'Rol', 'İşlem', 'Durum', 'Hata Mesajı', 'Zaman']
+# Özet sayfalarındaki durum sırası
+REPORT_STATUSES = ['BAŞARILI', 'BAŞARISIZ', 'HATA', 'İPTAL', 'BİLİNMİYOR']
+
+
+def spool_directory(owner) -> str:
+    """owner çöp toplandığında (veya uygulama kapanırken) silinen geçici dizin"""
+    directory = tempfile.mkdtemp(prefix='azdo_report_')
+    weakref.finalize(owner, shutil.rmtree, directory, True)
+    return directory
+
+
+def write_rows(sheet, rows):
+    """Satırları write-only sayfaya ekler"""
+    for row in rows:
+        sheet.append(row)
+
+
+class ReportWriter:
+    """Rapor satırlarını diske akıtır ve özet sayaçlarını tutar (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spool_dir = spool_directory(self)
+        self._spool_path = os.path.join(self.spool_dir, 'rows.csv')
+        self._file = None
+        self._writer = None
+        self.row_count = 0
+        self.status_counts = Counter()
+        self.team_counts = {}  # takım adı -> Counter(durum)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def _write_row(self, row: list):
+        """Satırı geçici dosyaya yaz (kilit altında çağrılır; kapatılmışsa dosya yeniden açılır)"""
+        if self._file is None:
+            self._file = open(self._spool_path, 'a', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+        self._writer.writerow(row)
+
+    def add(self, user_email: str, team_name: str, role: str, action: str,
+            status: str, error_message: str = ''):
+        """Rapora bir satır ekle: satır diske yazılır, sayaçlar güncellenir"""
+        row = [user_email, team_name, role, action.upper(), status, error_message,
+               time.strftime('%Y-%m-%d %H:%M:%S')]
+        with self._lock:
+            self._write_row(row)
+            self.row_count += 1
+            self.status_counts[status] += 1
+            team = self.team_counts.get(team_name)
+            if team is None:
+                team = self.team_counts[team_name] = Counter()
+            team[status] += 1
+
+    def add_bulk(self, status: str, message: str, rows: int):
+        """Tek tek okunmamış satırlar için toplu kayıt: tek detay satırı, sayaçlara rows kadar eklenir"""
+        row = ['', '', '', '', status, message, time.strftime('%Y-%m-%d %H:%M:%S')]
+        with self._lock:
+            self._write_row(row)
+            self.row_count += rows
+            self.status_counts[status] += rows
+
+    def close(self):
+        """Bekleyen satırları diske yaz (sonradan add çağrılırsa dosya yeniden açılır)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+    def rows(self) -> Iterator[List[str]]:
+        """Yazılmış rapor satırlarını diskten sırayla okur"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        if not os.path.exists(self._spool_path):
+            return
+        with open(self._spool_path, newline='', encoding='utf-8') as f:
+            yield from csv.reader(f)
+
+    def success_rate(self) -> float:
+        if not self.row_count:
+            return 0
+        return round(self.status_counts['BAŞARILI'] / self.row_count * 100, 2)
+
+    def summary_rows(self) -> List[Tuple[str, object]]:
+        """Özet istatistikler (sayaçlardan; satırlar taranmaz)"""
+        return [
+            ('Toplam İşlem Sayısı', self.row_count),
+            ('Başarılı İşlemler', self.status_counts['BAŞARILI']),
+            ('Başarısız İşlemler', self.status_counts['BAŞARISIZ']),
+            ('Hatalı İşlemler', self.status_counts['HATA']),
+            ('İptal Edilen İşlemler', self.status_counts['İPTAL']),
+            ('Sonucu Bilinmeyen İşlemler', self.status_counts['BİLİNMİYOR']),
+            ('Başarı Oranı (%)', self.success_rate())
+        ]
+
+    def team_summary_rows(self) -> List[list]:
+        """Takım bazında durum sayıları (başlık satırı dahil; yalnızca görülen durumlar)"""
+        statuses = [status for status in REPORT_STATUSES if self.status_counts[status]]
+        statuses += sorted(status for status in self.status_counts if status not in REPORT_STATUSES)
+        rows = [['Takım Adı'] + statuses]
+        for team_name in sorted(self.team_counts):
+            counts = self.team_counts[team_name]
+            rows.append([team_name] + [counts[status] for status in statuses])
+        return rows
+
+    def write_excel(self, report_path: str) -> str:
+        """Detay, özet ve takım özeti sayfalarıyla Excel raporunu yazar (satırlar diskten akıtılır)"""
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        details = workbook.create_sheet('İşlem Detayları')
+        details.append(REPORT_COLUMNS)
+        write_rows(details, self.rows())
+
+        summary = workbook.create_sheet('Özet İstatistikler')
+        summary.append(['Metrik', 'Değer'])
+        write_rows(summary, self.summary_rows())
+
+        if self.team_counts:
+            team_summary = workbook.create_sheet('Takım Bazında Özet')
+            write_rows(team_summary, self.team_summary_rows())
+
+        workbook.save(report_path)
+        return report_path
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Girdi Önizlemesi
+Girdi dosyasının satırlarını ExcelProcessor.iter_rows akışından sayfa sayfa, yalnızca
+istendikçe okur. Bellekte en fazla max_cached_pages sayfa tutulur (en son kullanılanlar);
+dosya boyutu bellek kullanımını etkilemez. Akış yalnızca ileri okunabildiği için bellekten
+atılmış önceki bir sayfaya dönüldüğünde dosya baştan okunur. Satırlar doğrulama durumuna
+ve metne göre süzülebilir. Bu modül PyQt5 import etmez.
+"""
+
+from collections import OrderedDict
+from typing import List, Optional
+
+from core.user_row import UserRow
+
+# Süzgeç modları
+FILTER_ALL = 'all'
+FILTER_ERRORS = 'errors'
+FILTER_VALID = 'valid'
+
+
+class RowPreview:
+    """Girdi dosyasının sayfalı, tembel okunan önizlemesi"""
+
+    def __init__(self, excel_processor, file_path: str, page_size: int = 500, max_cached_pages: int = 8):
+        """
+        Args:
+            excel_processor: Satırları üreten ExcelProcessor
+            file_path: Önizlenecek girdi dosyası
+            page_size: Bir seferde okunan (süzgeçten geçen) satır sayısı
+            max_cached_pages: Bellekte tutulan en fazla sayfa
+        """
+        self.excel_processor = excel_processor
+        self.file_path = file_path
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self._total_hint = False  # Henüz hesaplanmadı (ilk sayfayı geciktirmemesi için ilk kullanımda)
+        self.filter_mode = FILTER_ALL
+        self.filter_text = ''
+        self.restarts = 0  # Geri dönüşlerde dosyanın baştan okunma sayısı
+        self._reset()
+
+    def _reset(self):
+        self._close_stream()
+        self._pages = OrderedDict()  # sayfa no -> List[UserRow]
+        self._stream = None
+        self._stream_page = 0  # Akıştan okunacak sıradaki sayfa
+        self.loaded_rows = 0   # Süzgeçten geçen ve şu ana kadar bilinen satır sayısı
+        self.error_rows = 0    # Bunların kaçı hatalı (süzgeç 'all' iken)
+        self.exhausted = False
+
+    def _close_stream(self):
+        stream = getattr(self, '_stream', None)
+        if stream is not None:
+            stream.close()  # read-only çalışma kitabı kapatılır
+
+    def close(self):
+        """Açık okuyucuyu kapat ve sayfaları bırak"""
+        self._close_stream()
+        self._stream = None
+        self._pages.clear()
+
+    def set_filter(self, mode: str = FILTER_ALL, text: str = ''):
+        """Süzgeci değiştir (önizleme baştan okunur)"""
+        self.filter_mode = mode
+        self.filter_text = text.strip().lower()
+        self._reset()
+
+    def _matches(self, user: UserRow) -> bool:
+        if self.filter_mode == FILTER_ERRORS and not user.error:
+            return False
+        if self.filter_mode == FILTER_VALID and user.error:
+            return False
+        if self.filter_text:
+            text = self.filter_text
+            return text in user.email or text in user.team.lower() or text in user.error.lower()
+        return True
+
+    def _filtered_rows(self):
+        for user in self.excel_processor.iter_rows(self.file_path):
+            if self._matches(user):
+                yield user
+
+    def _read_page(self) -> List[UserRow]:
+        """Akıştan sıradaki sayfayı oku"""
+        if self._stream is None:
+            self._stream = self._filtered_rows()
+        page = []
+        for user in self._stream:
+            page.append(user)
+            if len(page) >= self.page_size:
+                break
+        else:
+            self.exhausted = True
+            self._stream = None
+
+        page_number = self._stream_page
+        self._stream_page += 1
+        if page_number * self.page_size >= self.loaded_rows:
+            # İlk kez okunan sayfa: bilinen satır sayısı büyür
+            self.loaded_rows += len(page)
+            self.error_rows += sum(1 for user in page if user.error)
+        return page
+
+    def _cache(self, page_number: int, page: List[UserRow]):
+        self._pages[page_number] = page
+        self._pages.move_to_end(page_number)
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+
+    def fetch_more(self) -> int:
+        """Henüz bilinmeyen bir sonraki sayfayı oku; eklenen satır sayısını döndürür"""
+        if self.exhausted:
+            return 0
+        before = self.loaded_rows
+        known_pages = -(-self.loaded_rows // self.page_size)
+        self._page(known_pages)
+        return self.loaded_rows - before
+
+    def _page(self, page_number: int) -> List[UserRow]:
+        page = self._pages.get(page_number)
+        if page is not None:
+            self._pages.move_to_end(page_number)
+            return page
+
+        if page_number >= self._stream_page and self._stream is None and self._stream_page:
+            # Akış bitti; dosyanın sonundan sonraki sayfa
+            return []
+        if page_number < self._stream_page:
+            # Bellekten atılmış geride kalmış sayfa: dosya baştan okunur
+            self._close_stream()
+            self._stream = None
+            self._stream_page = 0
+            self.restarts += 1
+
+        page = []
+        while self._stream_page <= page_number:
+            current = self._stream_page
+            page = self._read_page()
+            if current >= page_number - self.max_cached_pages + 1:
+                self._cache(current, page)
+            if not page:
+                break
+        return page
+
+    def row(self, index: int) -> Optional[UserRow]:
+        """Süzgeçten geçen satırlar arasında index. satır (okunmamışsa okunur)"""
+        page = self._page(index // self.page_size)
+        offset = index % self.page_size
+        return page[offset] if offset < len(page) else None
+
+    @property
+    def total_hint(self) -> Optional[int]:
+        """Süzgeçsiz yaklaşık satır sayısı (bilinmiyorsa None)"""
+        if self._total_hint is False:
+            self._total_hint = self.excel_processor.count_rows(self.file_path)
+        return self._total_hint
+
+    @property
+    def cached_rows(self) -> int:
+        """Bellekte tutulan satır sayısı"""
+        return sum(len(page) for page in self._pages.values())
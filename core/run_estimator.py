@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Çalışma Süresi Tahmincisi
+Okunan satırlardan ve client'ın cache durumundan, çalışmanın endpoint başına kaç API
+çağrısı yapacağını simüle eder (API'ye istek atmaz). Son çalışmalarda ölçülen endpoint
+gecikmeleriyle birleştirerek tahmini süreyi hesaplar; çalışma sonunda tahmin gerçekleşen
+çağrı sayılarıyla karşılaştırılır ve ölçümler geçmiş dosyasına eklenir.
+"""
+
+import os
+import json
+import time
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from core.log import get_logger
+from core.user_row import UserRow
+
+log = get_logger('estimator')
+
+# Davet edilen her kullanıcıdan sonra organizasyona yansıması için beklenen süre (sn)
+INVITE_PROPAGATION_WAIT = 2
+
+# Takım ekleme zincirinde yöntem -> başarılı denemede satır başına yapılan çağrılar
+# (zincirden önce bakılan takım üye listesi takım başına bir kez indirilir, ayrıca sayılır)
+TEAM_METHOD_CALLS = {
+    'email_direct': ('team_member_add',),
+    'id_direct': ('team_member_add_by_id',),
+    'simple_invite': ('team_member_add',),
+}
+# Özel grup zincirinin yöntemleri (varsayılan sıra); grup sınıflandırma tablosundan çözülür
+CUSTOM_METHODS = ('graph', 'security_api', 'teams_api', 'memberships_api')
+# Henüz uygulanmamış (MethodUnsupported) yöntemler: öğrenici atlayana kadar denemede bir çağrı yapar
+UNSUPPORTED_METHOD_CALLS = {
+    'security_api': 'security_roles',
+    'memberships_api': 'graph_memberships',
+}
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Paralel gönderilen endpoint'ler (RemovalEngine varsayılan worker sayısı)
+PARALLEL_ENDPOINTS = {'graph_membership_remove': 8}
+
+
+def format_duration(seconds: float) -> str:
+    """Saniyeyi '1 sa 5 dk', '3 dk 20 sn' veya '45 sn' biçiminde yazar"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours} sa {minutes} dk"
+    if minutes:
+        return f"{minutes} dk {secs} sn"
+    return f"{secs} sn"
+
+
+class RunEstimate:
+    """Bir çalışma (veya bölüm) için tahmin edilen çağrı sayıları ve süre"""
+
+    def __init__(self, calls: Dict[str, int], seconds: float, rows: int, idle_seconds: float = 0.0):
+        self.calls = {endpoint: count for endpoint, count in calls.items() if count}
+        self.seconds = seconds
+        self.rows = rows
+        self.idle_seconds = idle_seconds
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def summary(self) -> str:
+        """Tek satırlık özet"""
+        text = f"{self.rows} satır, ~{self.total_calls} API çağrısı, tahmini süre {format_duration(self.seconds)}"
+        if self.idle_seconds:
+            text += f" (davet bekleme dahil {format_duration(self.idle_seconds)})"
+        return text
+
+    def details(self) -> List[str]:
+        """Endpoint başına tahmini çağrı sayıları (çoktan aza)"""
+        return [f"{endpoint}: {count}" for endpoint, count in
+                sorted(self.calls.items(), key=lambda item: (-item[1], item[0]))]
+
+    def to_dict(self) -> Dict:
+        return {
+            'rows': self.rows,
+            'calls': self.calls,
+            'total_calls': self.total_calls,
+            'seconds': round(self.seconds, 1),
+            'idle_seconds': self.idle_seconds,
+        }
+
+
+class CallTally:
+    """
+    Maliyet modelinin bir bölümden ihtiyaç duyduğu özet; satırlar okundukça doldurulur,
+    satırların kendisi saklanmaz (yalnızca farklı grup adları ve e-postalar tutulur)
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.group_names = {}   # küçük harf grup adı -> girdideki ad
+        self.add_rows = Counter()  # küçük harf grup adı -> ekleme satırı sayısı
+        self.adds = {}          # küçük harf grup adı -> eklenecek farklı e-postalar
+        self.removals = OrderedDict()  # küçük harf grup adı -> çıkarılacak farklı e-postalar
+
+    def add(self, user: UserRow):
+        self.rows += 1
+        if not user.email or not user.team or user.error:
+            return
+        key = user.team.lower()
+        email = user.email.lower()
+        self.group_names.setdefault(key, user.team)
+        if user.action == 'add':
+            self.add_rows[key] += 1
+            self.adds.setdefault(key, set()).add(email)
+        elif user.action == 'remove':
+            self.removals.setdefault(key, set()).add(email)
+
+    @classmethod
+    def from_rows(cls, users: Iterable[UserRow]) -> 'CallTally':
+        tally = cls()
+        for user in users:
+            tally.add(user)
+        return tally
+
+
+class RunEstimator:
+    """Çağrı maliyet modeli ve ölçülen gecikme geçmişi"""
+
+    def __init__(self, history_file: str = None, default_latency: float = 0.3, max_runs: int = 20):
+        """
+        Args:
+            history_file: Ölçülen gecikmelerin saklandığı dosya (varsayılan: config.json yanındaki run_history.json)
+            default_latency: Geçmişte ölçümü olmayan endpoint için varsayılan gecikme (sn)
+            max_runs: Gecikme ortalamasına katılan son çalışma sayısı
+        """
+        self.history_file = history_file or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'run_history.json')
+        self.default_latency = default_latency
+        self.max_runs = max_runs
+        self._lock = threading.Lock()
+
+    # ---------------- Geçmiş ----------------
+
+    def _load_history(self) -> List[Dict]:
+        try:
+            if os.path.exists(self.history_file):
+                with open(self.history_file, 'r') as f:
+                    return json.load(f).get('runs', [])
+        except Exception as e:
+            log.warning("⚠️ Çalışma geçmişi yüklenemedi: %s", e)
+        return []
+
+    def latencies(self) -> Dict[str, float]:
+        """Son çalışmalarda ölçülen endpoint başına ortalama gecikme (sn)"""
+        totals = {}
+        for run in self._load_history():
+            for endpoint, (count, seconds) in run.get('endpoints', {}).items():
+                total = totals.setdefault(endpoint, [0, 0.0])
+                total[0] += count
+                total[1] += seconds
+        return {endpoint: seconds / count for endpoint, (count, seconds) in totals.items() if count}
+
+    def record(self, call_stats: Dict[str, Tuple[int, float]]):
+        """Gerçekleşen çağrı sayısı/süre ölçümlerini geçmişe ekle"""
+        if not call_stats:
+            return
+        with self._lock:
+            runs = self._load_history()
+            runs.append({
+                'finished_at': time.time(),
+                'endpoints': {endpoint: [count, round(seconds, 4)] for endpoint, (count, seconds) in call_stats.items()},
+            })
+            try:
+                with open(self.history_file, 'w') as f:
+                    json.dump({'runs': runs[-self.max_runs:]}, f, indent=2)
+            except Exception as e:
+                log.warning("⚠️ Çalışma geçmişi kaydedilemedi: %s", e)
+
+    # ---------------- Maliyet modeli ----------------
+
+    @staticmethod
+    def _method_order(client, group_type: str, methods: Iterable[str]) -> List[str]:
+        """Öğrenilen sıraya göre denenecek yöntemler (öğrenici yoksa varsayılan sıra)
+
+        Çalışma başında atlama sayaçları sıfırlandığından önceki çalışmada atlanan yöntemler de dahildir.
+        """
+        methods = list(methods)
+        learner = getattr(client, 'method_learner', None)
+        if learner is None:
+            return methods
+        return learner.order(client.organization_url, group_type, methods, skip_failing=False)
+
+    def predict_calls(self, users: Union[CallTally, Iterable[UserRow]], client=None) -> Tuple[Counter, float]:
+        """
+        BatchRunner akışını simüle ederek endpoint başına çağrı sayısını tahmin eder
+
+        Args:
+            users: Bölüme ait satırlar veya satırlar okunurken doldurulmuş CallTally
+            client: Bölümü işleyecek client (cache durumu ve öğrenilen yöntem sırası için, opsiyonel)
+
+        Returns:
+            Tuple[Counter, float]: (endpoint -> çağrı sayısı, API dışı bekleme süresi sn)
+        """
+        tally = users if isinstance(users, CallTally) else CallTally.from_rows(users)
+        calls = Counter()
+
+        def cached(cache, cache_time):
+            return client is not None and cache is not None and client._is_cache_valid(cache_time)
+
+        teams = client._teams_cache if client is not None and cached(client._teams_cache, client._teams_cache_time) else None
+        org_cached = client is not None and cached(client._org_users_cache, client._org_users_cache_time)
+        org_index = getattr(client, '_org_user_index', {}) if org_cached else None
+        team_members_cache = getattr(client, '_team_members_cache', {}) if client is not None else {}
+        descriptor_cache = getattr(client, '_team_descriptor_cache', {}) if client is not None else {}
+        project_cached = client is not None and bool(getattr(client, '_project_id_cache', None))
+        learner = getattr(client, 'method_learner', None)
+        failure_threshold = getattr(learner, 'failure_threshold', DEFAULT_FAILURE_THRESHOLD)
+
+        # Bağlantı testi + takım ve org üyesi listeleri
+        calls['projects'] += 1
+        if teams is None:
+            calls['teams'] += 1
+        if org_index is None:
+            calls['userentitlements'] += 1
+
+        team_by_name = {(team.get('name') or '').lower(): team for team in teams} if teams is not None else None
+        group_table = getattr(client, '_group_table', {}) if client is not None else {}
+
+        def group_type(key: str) -> str:
+            # Önceki çalışmanın sınıflandırması (tablo çalışma başında yeniden kurulur), yoksa takım listesi
+            entry = group_table.get(key)
+            if entry:
+                return entry['type']
+            if team_by_name is None:
+                return 'team'  # Takım listesi henüz yok: en yaygın durum varsayılır
+            return 'team' if key in team_by_name else 'custom'
+
+        def need_project():
+            nonlocal project_cached
+            if not project_cached:
+                calls['project'] += 1
+                project_cached = True
+
+        # Grup sınıflandırması: takım olmayan ad varsa proje kimliği + Graph grupları (çalışmada bir kez)
+        graph_groups_loaded = False
+        if any(group_type(key) != 'team' for key in tally.adds):
+            need_project()
+            calls['graph_groups'] += 1
+            graph_groups_loaded = True
+
+        # Toplu davet: org'da olmayan her farklı kullanıcı bir kez davet edilir. Org üyeleri henüz
+        # bilinmiyorsa (soğuk cache) eklenen her farklı kullanıcının davet gerektirebileceği varsayılır
+        add_emails = set()
+        for emails in tally.adds.values():
+            add_emails.update(emails)
+        new_emails = add_emails if org_index is None else {e for e in add_emails if e not in org_index}
+        if new_emails:
+            need_project()
+            calls['userentitlements_add'] += len(new_emails)
+        idle = INVITE_PROPAGATION_WAIT * len(new_emails)
+
+        # Satırlar: davet edilen kullanıcılar da davetten sonra gruba eklenir
+        team_method = self._method_order(client, 'team', TEAM_METHOD_CALLS)[0] if client is not None else 'email_direct'
+        for key, emails in tally.adds.items():
+            kind = group_type(key)
+            if kind == 'team':
+                team = team_by_name.get(key) if team_by_name is not None else None
+                team_id = team.get('id') if team else None
+                # Üye listesi çalışma başında atılır ve takım başına bir kez indirilir; önceki
+                # çalışmanın listesindeki üyeler ve tekrarlanan satırlar yöntem zincirine girmez
+                calls['team_members'] += 1
+                members = team_members_cache.get(team_id) if team_id is not None else None
+                adds = sum(1 for email in emails if members is None or email not in members)
+                for endpoint in TEAM_METHOD_CALLS[team_method]:
+                    calls[endpoint] += adds
+                continue
+
+            rows = tally.add_rows[key]
+            if kind == 'security':
+                # Proje güvenlik grubu: sınıflandırmadaki descriptor ile satır başına bir Graph üyeliği
+                calls['graph_membership_add'] += rows
+                continue
+
+            # Özel/bilinmeyen grup: desteklenmeyen yöntemler öğrenici atlayana kadar denenir,
+            # bulunamayan grup için Graph ve Teams API çağrı yapmadan başarısız olur
+            for method in self._method_order(client, f"custom:{kind}", CUSTOM_METHODS):
+                if method in UNSUPPORTED_METHOD_CALLS:
+                    tried = min(rows, failure_threshold)
+                    calls[UNSUPPORTED_METHOD_CALLS[method]] += tried
+                elif method == 'graph' and kind == 'custom':
+                    calls['graph_membership_add'] += rows
+                    break
+
+        # Toplu çıkarma: takım başına descriptor, organizasyondaki her kullanıcı için bir DELETE
+        for key, emails in tally.removals.items():
+            if org_index is not None:
+                emails = {email for email in emails if email in org_index}
+            team = team_by_name.get(key) if team_by_name is not None else {'id': None}
+            if group_type(key) == 'team' and team is not None:
+                team_id = team.get('id')
+                if team_id is None or team_id not in descriptor_cache:
+                    calls['graph_descriptors'] += 1
+            elif not graph_groups_loaded:
+                calls['graph_groups'] += 1
+                graph_groups_loaded = True
+            calls['graph_membership_remove'] += len(emails)
+
+        return calls, idle
+
+    def _duration(self, calls: Counter, idle: float, requests_per_second: float,
+                  latencies: Dict[str, float]) -> float:
+        """Çağrı sayıları ve gecikmelerden süre: sıralı toplam ile hız sınırı tabanının büyüğü"""
+        seconds = 0.0
+        for endpoint, count in calls.items():
+            latency = latencies.get(endpoint, self.default_latency)
+            seconds += count * latency / PARALLEL_ENDPOINTS.get(endpoint, 1)
+        if requests_per_second and requests_per_second > 0:
+            seconds = max(seconds, sum(calls.values()) / requests_per_second)
+        return seconds + idle
+
+    def estimate(self, partitions: List[Tuple[Union[CallTally, List[UserRow]], object]], requests_per_second: float = 10.0,
+                 max_parallel: int = 1) -> RunEstimate:
+        """
+        Bir iş için tahmin (bölümler paralel işlendiğinden süre en uzun bölümden kısa olamaz)
+
+        Args:
+            partitions: (bölüm satırları veya CallTally, bölüm client'ı veya None) listesi
+            requests_per_second: Client başına hız sınırı
+            max_parallel: Aynı anda işlenen en fazla bölüm sayısı
+        """
+        latencies = self.latencies()
+        total_calls = Counter()
+        durations = []
+        rows = 0
+        idle = 0.0
+        for users, client in partitions:
+            tally = users if isinstance(users, CallTally) else CallTally.from_rows(users)
+            calls, partition_idle = self.predict_calls(tally, client)
+            total_calls.update(calls)
+            durations.append(self._duration(calls, partition_idle, requests_per_second, latencies))
+            rows += tally.rows
+            idle = max(idle, partition_idle)
+
+        if not durations:
+            return RunEstimate({}, 0.0, 0)
+        workers = max(1, min(max_parallel, len(durations)))
+        seconds = max(max(durations), sum(durations) / workers)
+        return RunEstimate(total_calls, seconds, rows, idle)
+
+    @staticmethod
+    def compare(estimate: RunEstimate, actual_calls: Dict[str, int], elapsed: Optional[float] = None) -> List[str]:
+        """Tahmin ile gerçekleşen çağrı sayılarını karşılaştırır (sapma büyükten küçüğe)"""
+        endpoints = set(estimate.calls) | set(actual_calls)
+        rows = sorted(endpoints, key=lambda e: -abs(actual_calls.get(e, 0) - estimate.calls.get(e, 0)))
+        actual_total = sum(actual_calls.values())
+        lines = [f"📐 Tahmin / gerçekleşen: {estimate.total_calls} / {actual_total} API çağrısı"]
+        if elapsed is not None:
+            lines[0] += f", {format_duration(estimate.seconds)} / {format_duration(elapsed)}"
+        for endpoint in rows:
+            predicted, actual = estimate.calls.get(endpoint, 0), actual_calls.get(endpoint, 0)
+            if predicted != actual:
+                lines.append(f"   • {endpoint}: tahmin {predicted}, gerçekleşen {actual} ({actual - predicted:+d})")
+        return lines
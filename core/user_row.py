@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kullanıcı Satırı
+Girdi dosyasındaki bir satırın ayrıştırma sırasında bir kez normalize edilmiş, değişmez
+kaydı. Satır başına sözlük yerine tuple tabanlı olduğu için bellekte daha küçüktür ve
+sonraki aşamalar alanları tekrar strip/lower etmeden doğrudan kullanır.
+"""
+
+from typing import NamedTuple
+
+
+class UserRow(NamedTuple):
+    """Normalize edilmiş kullanıcı satırı"""
+    email: str              # Küçük harfe çevrilmiş e-posta
+    action: str             # 'add' / 'remove' (geçersizse küçük harfli ham değer)
+    team: str               # Takım / grup adı
+    role: str               # 'Member', 'Admin', ... (boşsa 'Member')
+    license_type: str       # Geçerli lisans türlerinden biri (boşsa 'stakeholder')
+    organization: str       # Satırın organizasyonu (boşsa varsayılan kullanılır)
+    project: str            # Satırın projesi (boşsa varsayılan kullanılır)
+    row: int                # Girdi dosyasındaki satır numarası
+    error: str = ''         # Doğrulama hatası (geçerli satırda boş)
@@ -0,0 +1,112 @@
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.connection_probe import ConnectionProber, PROBE_LABELS
+
+
+class ConnectionTestThread(QThread):
+    """Bağlantı yoklamalarını arka planda paralel çalıştırır; sonuçlar geldikçe sinyalle iletilir"""
+    result_signal = pyqtSignal(object)    # ProbeResult
+    finished_signal = pyqtSignal(list)    # Tüm ProbeResult'lar (PROBE_LABELS sırasıyla)
+    error_signal = pyqtSignal(str)        # Client oluşturulamadı
+
+    def __init__(self, organization_url, project_name, pat_token, timeout=10):
+        super().__init__()
+        self.organization_url = organization_url
+        self.project_name = project_name
+        self.pat_token = pat_token
+        self.timeout = timeout
+        self.teams = []
+
+    def run(self):
+        try:
+            # HTTP katmanı ilk bağlantı testinde, bu thread'de yüklenir
+            from core.azure_rest_client import AzureDevOpsRESTClient
+            client = AzureDevOpsRESTClient(self.organization_url, self.project_name, self.pat_token)
+            prober = ConnectionProber(client, timeout=self.timeout)
+            results = prober.run(self.result_signal.emit)
+            self.teams = prober.teams
+            self.finished_signal.emit(results)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+
+class ConnectionTestDialog(QDialog):
+    """Endpoint yoklama sonuçlarını geldikçe gecikmeleriyle gösteren bağlantı testi penceresi"""
+
+    def __init__(self, parent, organization_url, project_name, pat_token, on_log=None, on_finished=None):
+        """
+        Args:
+            on_log: Sonuçların yazılacağı log callback'i (opsiyonel)
+            on_finished: Test bitince (başarılı mı, takım listesi) ile çağrılır (opsiyonel)
+        """
+        super().__init__(parent)
+        self.on_log = on_log
+        self.on_finished = on_finished
+        self._rows = {name: row for row, name in enumerate(PROBE_LABELS)}
+
+        self.setWindowTitle("🔗 Bağlantı Testi")
+        self.resize(640, 280)
+
+        layout = QVBoxLayout(self)
+        self._header = f"📍 {organization_url}\n📂 {project_name}"
+        self.header_label = QLabel(f"{self._header}\n🔄 Endpoint'ler paralel test ediliyor...")
+        layout.addWidget(self.header_label)
+
+        self.table = QTableWidget(len(PROBE_LABELS), 3)
+        self.table.setHorizontalHeaderLabels(['Endpoint', 'Süre', 'Sonuç'])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        for name, row in self._rows.items():
+            self.table.setItem(row, 0, QTableWidgetItem(f"⏳ {PROBE_LABELS[name]}"))
+            self.table.setItem(row, 1, QTableWidgetItem("-"))
+            self.table.setItem(row, 2, QTableWidgetItem("Bekleniyor..."))
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.close_btn = QPushButton("Kapat")
+        self.close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_btn)
+        layout.addLayout(button_layout)
+
+        self.test_thread = ConnectionTestThread(organization_url, project_name, pat_token)
+        self.test_thread.result_signal.connect(self.show_result)
+        self.test_thread.finished_signal.connect(self.show_summary)
+        self.test_thread.error_signal.connect(self.show_error)
+        self.test_thread.start()
+
+    def log(self, message):
+        if self.on_log:
+            self.on_log(message)
+
+    def show_result(self, result):
+        """Tek bir endpoint sonucunu tabloya yaz"""
+        row = self._rows[result.name]
+        icon = "✅" if result.ok else "❌"
+        self.table.item(row, 0).setText(f"{icon} {result.label}")
+        self.table.item(row, 1).setText(f"{result.latency * 1000:.0f} ms")
+        self.table.item(row, 2).setText(result.detail)
+        self.log(f"{icon} {result.label}: {result.detail} ({result.latency * 1000:.0f} ms)")
+
+    def show_summary(self, results):
+        """Tüm yoklamalar bitince özet satırını güncelle"""
+        failed = [result for result in results if not result.ok]
+        slowest = max(results, key=lambda result: result.latency)
+        if failed:
+            text = f"❌ {len(failed)}/{len(results)} endpoint başarısız"
+        else:
+            text = "✅ Bağlantı başarılı - sistem hazır"
+        self.header_label.setText(f"{self._header}\n{text} (en yavaş: {slowest.label}, {slowest.latency * 1000:.0f} ms)")
+        self.log(text)
+        if self.on_finished:
+            self.on_finished(not failed, self.test_thread.teams)
+
+    def show_error(self, message):
+        self.header_label.setText(f"{self._header}\n❌ Bağlantı hatası: {message}")
+        self.log(f"❌ Bağlantı test hatası: {message}")
+        if self.on_finished:
+            self.on_finished(False, [])
+
@@ -0,0 +1,111 @@
+from PyQt5.QtWidgets import (QGroupBox, QVBoxLayout, QGridLayout, QLabel, QTableWidget,
+                             QTableWidgetItem, QHeaderView)
+from PyQt5.QtCore import Qt, QTimer
+
+from core.metrics import snapshot
+from core.run_estimator import format_duration
+
+
+class DashboardPanel(QGroupBox):
+    """Çalışma sırasında hız, gecikme, kısıtlama ve cache ölçümlerini gösteren panel
+
+    Ölçümler client'ların ClientMetrics nesnelerinden zamanlayıcıyla okunur; işçi thread'lerine
+    sinyal gönderilmez ve yüzdelikler arayüz thread'inde hesaplanır.
+    """
+
+    STATS = [
+        ('rate', 'Satır/sn'), ('eta', 'Kalan süre'), ('in_flight', 'Eşzamanlı istek'),
+        ('requests', 'İstek'), ('retries', 'Yeniden deneme'), ('throttled', '429'),
+        ('wait', 'Hız sınırı beklemesi'), ('failures', 'Bağlantı hatası'),
+    ]
+    ENDPOINT_COLUMNS = ['Endpoint', 'Çağrı', 'p50 (ms)', 'p95 (ms)', '429', 'Hata']
+
+    def __init__(self, client_pool, refresh_interval_ms: int = 1000, parent=None):
+        super().__init__("📈 Canlı Ölçümler", parent)
+        self.client_pool = client_pool
+        self.last_progress = None  # Son ProgressUpdate
+
+        layout = QVBoxLayout(self)
+
+        stats_layout = QGridLayout()
+        self.stat_labels = {}
+        for position, (key, title) in enumerate(self.STATS):
+            row, column = divmod(position, 4)
+            title_label = QLabel(f"{title}:")
+            value_label = QLabel("-")
+            value_label.setStyleSheet("font-weight: bold;")
+            stats_layout.addWidget(title_label, row, column * 2)
+            stats_layout.addWidget(value_label, row, column * 2 + 1)
+            self.stat_labels[key] = value_label
+        layout.addLayout(stats_layout)
+
+        self.endpoint_table = QTableWidget(0, len(self.ENDPOINT_COLUMNS))
+        self.endpoint_table.setHorizontalHeaderLabels(self.ENDPOINT_COLUMNS)
+        self.endpoint_table.verticalHeader().setVisible(False)
+        self.endpoint_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.endpoint_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.endpoint_table.setMaximumHeight(140)
+        layout.addWidget(self.endpoint_table)
+
+        self.cache_label = QLabel("Cache isabeti: -")
+        self.cache_label.setWordWrap(True)
+        layout.addWidget(self.cache_label)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(refresh_interval_ms)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def start(self):
+        self.last_progress = None
+        self.refresh_timer.start()
+
+    def stop(self):
+        """Zamanlayıcıyı durdur (son değerler ekranda kalır)"""
+        self.refresh_timer.stop()
+        self.refresh()
+
+    def set_progress(self, update):
+        """Son ilerleme güncellemesini sakla (satır/sn ve kalan süre için)"""
+        self.last_progress = update
+
+    def refresh(self):
+        """Client ölçümlerini oku ve paneli güncelle"""
+        metrics = [client.metrics for client in self.client_pool.clients() if hasattr(client, 'metrics')]
+        stats = snapshot(metrics)
+
+        progress = self.last_progress
+        if progress is not None:
+            self.stat_labels['rate'].setText(f"{progress.rows_per_second:.1f}")
+            if progress.final:
+                self.stat_labels['eta'].setText("Bitti")
+            elif progress.eta_seconds is not None:
+                self.stat_labels['eta'].setText(format_duration(progress.eta_seconds))
+        self.stat_labels['in_flight'].setText(str(stats['in_flight']))
+        self.stat_labels['requests'].setText(str(stats['requests']))
+        self.stat_labels['retries'].setText(str(stats['retries']))
+        self.stat_labels['throttled'].setText(str(stats['throttled']))
+        self.stat_labels['wait'].setText(format_duration(stats['wait_seconds']))
+        self.stat_labels['failures'].setText(str(stats['failures']))
+        # Sunucu kısıtlaması varsa dikkat çek
+        self.stat_labels['throttled'].setStyleSheet(
+            "font-weight: bold; color: #dc3545;" if stats['throttled'] else "font-weight: bold;")
+
+        # En yavaş (p95) endpoint'ler üstte
+        endpoints = sorted(stats['endpoints'].items(), key=lambda item: item[1]['p95'], reverse=True)
+        self.endpoint_table.setRowCount(len(endpoints))
+        for row, (endpoint, values) in enumerate(endpoints):
+            cells = [endpoint, values['count'], f"{values['p50'] * 1000:.0f}", f"{values['p95'] * 1000:.0f}",
+                     values['throttled'], values['failures']]
+            for column, value in enumerate(cells):
+                item = self.endpoint_table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.endpoint_table.setItem(row, column, item)
+                item.setText(str(value))
+
+        if stats['caches']:
+            parts = [f"{cache} %{values['hit_rate'] * 100:.0f} ({values['hits']}/{values['hits'] + values['misses']})"
+                     for cache, values in stats['caches'].items()]
+            self.cache_label.setText("Cache isabeti: " + ", ".join(parts))
@@ -0,0 +1,166 @@
+import os
+
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableView, QComboBox, QLineEdit, QHeaderView, QMessageBox)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt5.QtGui import QColor
+
+from core.row_preview import RowPreview, FILTER_ALL, FILTER_ERRORS, FILTER_VALID
+
+
+class RowPreviewModel(QAbstractTableModel):
+    """RowPreview'u tabloya bağlayan tembel model
+
+    Satırlar görünüm kaydırıldıkça canFetchMore/fetchMore ile sayfa sayfa eklenir; hücre
+    değerleri yalnızca görünen satırlar için RowPreview'dan istenir.
+    """
+
+    COLUMNS = [
+        ('Satır', 'row'), ('Email', 'email'), ('İşlem', 'action'), ('Takım', 'team'),
+        ('Rol', 'role'), ('Lisans', 'license_type'), ('Organizasyon', 'organization'),
+        ('Proje', 'project'), ('Durum', 'error'),
+    ]
+
+    def __init__(self, preview: RowPreview, parent=None):
+        super().__init__(parent)
+        self.preview = preview
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.preview.loaded_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        user = self.preview.row(index.row())
+        if user is None:
+            return None
+        field = self.COLUMNS[index.column()][1]
+        if role == Qt.DisplayRole:
+            if field == 'error':
+                return f"❌ {user.error}" if user.error else "✅ Geçerli"
+            return getattr(user, field)
+        if role == Qt.ToolTipRole and user.error:
+            return user.error
+        if role == Qt.BackgroundRole and user.error:
+            return QColor('#f8d7da')
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.preview.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        first = self.preview.loaded_rows
+        added = self.preview.fetch_more()
+        if added:
+            # Satırlar okunduktan sonra eklenir; görünüm yalnızca görünen hücreleri ister
+            self.beginInsertRows(QModelIndex(), first, first + added - 1)
+            self.endInsertRows()
+
+    def set_filter(self, mode, text):
+        self.beginResetModel()
+        self.preview.set_filter(mode, text)
+        self.endResetModel()
+
+
+class InputPreviewDialog(QDialog):
+    """Girdi dosyasını doğrulama durumuyla, süzülebilir ve sayfalı gösteren önizleme penceresi"""
+
+    FILTERS = [('Tüm satırlar', FILTER_ALL), ('Yalnızca hatalı', FILTER_ERRORS), ('Yalnızca geçerli', FILTER_VALID)]
+
+    def __init__(self, parent, excel_processor, file_path):
+        super().__init__(parent)
+        self.setWindowTitle(f"👁️ Önizleme - {os.path.basename(file_path)}")
+        self.resize(1000, 600)
+
+        self.preview = RowPreview(excel_processor, file_path)
+        self.total_hint = None
+        self.model = RowPreviewModel(self.preview, self)
+
+        layout = QVBoxLayout(self)
+
+        filter_layout = QHBoxLayout()
+        self.filter_combo = QComboBox()
+        for label, mode in self.FILTERS:
+            self.filter_combo.addItem(label, mode)
+        self.filter_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_combo)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Email, takım veya hata mesajında ara...")
+        # Her tuşta dosya baştan okunmasın diye arama kısa bir beklemeden sonra uygulanır
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(self.apply_filter)
+        self.search_edit.textChanged.connect(lambda text: self.search_timer.start())
+        filter_layout.addWidget(self.search_edit)
+        layout.addLayout(filter_layout)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        # Sabit satır yüksekliği: görünüm satır boyutlarını hesaplamak için tüm satırları sorgulamaz
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setColumnWidth(1, 240)
+        layout.addWidget(self.table)
+
+        bottom_layout = QHBoxLayout()
+        self.info_label = QLabel()
+        bottom_layout.addWidget(self.info_label)
+        bottom_layout.addStretch()
+        close_btn = QPushButton("Kapat")
+        close_btn.clicked.connect(self.accept)
+        bottom_layout.addWidget(close_btn)
+        layout.addLayout(bottom_layout)
+
+        self.model.rowsInserted.connect(lambda *args: self.update_info())
+        self.model.modelReset.connect(lambda: self.update_info())
+        self.load_first_page()
+        # Yaklaşık toplam satır sayısı pencere göründükten sonra hesaplanır
+        QTimer.singleShot(0, self.load_total_hint)
+
+    def load_first_page(self):
+        try:
+            self.model.fetchMore()
+        except Exception as e:
+            QMessageBox.critical(self, "Önizleme Hatası", f"Dosya okunamadı:\n\n{str(e)}")
+        self.update_info()
+
+    def apply_filter(self):
+        self.search_timer.stop()
+        self.model.set_filter(self.filter_combo.currentData(), self.search_edit.text())
+        self.load_first_page()
+
+    def load_total_hint(self):
+        self.total_hint = self.preview.total_hint
+        self.update_info()
+
+    def update_info(self):
+        preview = self.preview
+        text = f"Yüklenen: {preview.loaded_rows} satır"
+        if preview.exhausted:
+            text += " (dosyanın sonu)"
+        elif self.total_hint:
+            text += f" / yaklaşık {self.total_hint}"
+        if preview.filter_mode == FILTER_ALL and not preview.filter_text:
+            text += f" - {preview.error_rows} hatalı"
+        self.info_label.setText(text)
+
+    def done(self, result):
+        self.preview.close()
+        super().done(result)
@@ -0,0 +1,34 @@
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtCore import QTimer
+
+
+class LogView(QPlainTextEdit):
+    """LogSink'teki mesajları zamanlayıcıyla toplu ekleyen, satır sayısı sınırlı log alanı
+
+    Mesaj başına widget güncellemesi yerine her flush'ta tek appendPlainText yapılır; en eski
+    satırlar max_lines aşılınca Qt tarafından atılır (tam log LogSink'in dosyasındadır).
+    """
+
+    def __init__(self, log_sink, max_lines: int = 5000, flush_interval_ms: int = 100, parent=None):
+        super().__init__(parent)
+        self.log_sink = log_sink
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+        self.setUndoRedoEnabled(False)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(flush_interval_ms)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start()
+
+    def flush(self):
+        """Biriken mesajları tek seferde ekle; kullanıcı en alttaysa otomatik kaydır"""
+        lines = self.log_sink.drain()
+        if not lines:
+            return
+        scroll_bar = self.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 2
+        # Ekranda zaten tutulamayacak satırlar eklenmez
+        self.appendPlainText("\n".join(lines[-self.maximumBlockCount():]))
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
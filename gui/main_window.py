@@ -1,6 +1,5 @@
 import os
 import sys
-import datetime
 import threading
 
 # PyQt5 kütüphaneleri
@@ -8,8 +7,8 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QFileDialog, QMessageBox,
                              QProgressBar, QTextEdit, QFrame, QSplitter,
                              QApplication, QGroupBox, QScrollArea, QLineEdit,
-                             QDialog, QFormLayout, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, pyqtSlot
+                             QDialog, QFormLayout, QDialogButtonBox, QListWidget)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont, QIcon
 
 # Uyarıları bastır
@@ -21,8 +20,17 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
     from core.config_manager import ConfigManager
+    # pandas/openpyxl ve HTTP katmanı (requests) bu modüllerde ilk kullanımda yüklenir;
+    # pencere bunlar import edilmeden açılır
     from core.excel_processor import ExcelProcessor
-    from core.azure_rest_client import AzureDevOpsRESTClient
+    from core.job_queue import JobQueue, ClientPool
+    from core.log import configure_from_config, get_logger
+    from core.log_sink import LogSink
+    from core.progress_throttle import ProgressThrottle
+    from gui.log_view import LogView
+    from gui.connection_test_dialog import ConnectionTestDialog
+    from gui.input_preview import InputPreviewDialog
+    from gui.dashboard import DashboardPanel
     from gui.settings_window import SettingsWindow
     print("✅ Tüm core modüller başarıyla yüklendi")
 except ImportError as e:
@@ -30,280 +38,117 @@ except ImportError as e:
     QMessageBox.critical(None, "Import Hatası", f"Core modüller yüklenemedi: {e}")
     sys.exit(1)
 
+log = get_logger('runner')
+
 # İşlem thread'i
-class ProcessThread(QThread):
-    log_signal = pyqtSignal(str)
-    status_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int, int)  # current, total
+class QueueThread(QThread):
+    """İş kuyruğunu arka planda sırayla işler; her iş paylaşılan client ile BatchRunner'da çalışır
+
+    Log mesajları sinyal yerine doğrudan LogSink'e yazılır; arayüz bunları zamanlayıcıyla toplu çeker.
+    İlerleme ve durum olayları ProgressThrottle ile birleştirilip saniyede en fazla birkaç kez iletilir.
+    """
+    progress_signal = pyqtSignal(object)  # ProgressUpdate (ilerleme, hız, kalan süre, son durum)
+    job_started_signal = pyqtSignal(object)
+    job_finished_signal = pyqtSignal(object)
     finished_signal = pyqtSignal(bool, str)
     
-    def __init__(self, file_path, azure_rest_client, excel_processor):
+    def __init__(self, job_queue, excel_processor, log_sink, progress_updates_per_second=10.0):
         super().__init__()
-        self.file_path = file_path
-        self.azure_rest_client = azure_rest_client
+        self.job_queue = job_queue
         self.excel_processor = excel_processor
-        self.is_running = False
-        
-        # Rapor verilerini toplama sistemi
-        self.report_data = []
+        self.log = log_sink.write
+        self.progress_updates_per_second = progress_updates_per_second
+        self.current_job = None
+        self.finished_jobs = []
+        self._stopping = False
         
     def run(self):
-        try:
-            self.is_running = True
-            self.log_signal.emit("🚀 Azure DevOps işlemi başlatılıyor...")
-            
-            # Bağlantıyı test et
-            self.log_signal.emit("🔍 Azure DevOps bağlantısı test ediliyor...")
-            try:
-                success = self.azure_rest_client.test_connection()
-                if not success:
-                    self.log_signal.emit("❌ Azure CLI bağlantı hatası")
-                    self.status_signal.emit("❌ Bağlantı hatası")
-                    self.finished_signal.emit(False, "Azure CLI bağlantı hatası")
-                    return
-            except Exception as e:
-                self.log_signal.emit(f"❌ Bağlantı test hatası: {str(e)}")
-                self.finished_signal.emit(False, f"Bağlantı test hatası: {str(e)}")
-                return
-            
-            self.log_signal.emit("✅ Azure DevOps bağlantısı başarılı")
-            self.status_signal.emit("📂 Excel dosyası okunuyor...")
-            
-            # Excel dosyasını oku
-            try:
-                excel_data = self.excel_processor.read_excel(self.file_path)
-                if not excel_data or 'users' not in excel_data:
-                    self.log_signal.emit("❌ Excel dosyası okunamadı veya boş")
-                    self.finished_signal.emit(False, "Excel dosyası okunamadı")
-                    return
-                    
-                users = excel_data['users']
-                if not users:
-                    self.log_signal.emit("❌ Excel dosyasında kullanıcı bulunamadı")
-                    self.finished_signal.emit(False, "Excel dosyasında kullanıcı bulunamadı")
-                    return
-                    
-            except Exception as e:
-                self.log_signal.emit(f"❌ Excel okuma hatası: {str(e)}")
-                self.finished_signal.emit(False, f"Excel okuma hatası: {str(e)}")
-                return
-            
-            self.log_signal.emit(f"📊 {len(users)} kullanıcı bulundu, işlem başlatılıyor...")
-            
-            # 🚀 PERFORMANS OPTİMİZASYONU: Toplu işlem stratejisi
-            self.log_signal.emit("⚡ Performans optimizasyonu aktif: Cache ve batch işlem kullanılıyor")
-            
-            # Kullanıcıları işlem türüne göre grupla
-            add_users = []
-            remove_users = []
-            
-            for user in users:
-                user_email = user.get('User Email', '').strip()
-                team_name = user.get('Team Name', '').strip()
-                action = user.get('Action', 'add').strip().lower()
-                
-                if not user_email or not team_name:
-                    continue
-                    
-                if action == 'add':
-                    add_users.append(user)
-                elif action == 'remove':
-                    remove_users.append(user)
-            
-            self.log_signal.emit(f"📊 İşlem planı: {len(add_users)} ekleme, {len(remove_users)} çıkarma")
-            
-            # Önce tüm takımları ve organizasyon üyelerini cache'le (tek seferde)
-            self.status_signal.emit("🔄 Takımlar ve organizasyon üyeleri yükleniyor...")
-            teams = self.azure_rest_client.get_teams()  # Cache'lenir
-            org_users = self.azure_rest_client._load_all_org_users()  # Cache'lenir
-            self.log_signal.emit(f"💾 {len(teams)} takım ve {len(org_users)} organizasyon üyesi cache'lendi")
-            
-            # Toplu davet işlemi (sadece ekleme için)
-            if add_users:
-                self.status_signal.emit("📧 Toplu davet işlemi başlatılıyor...")
-                add_emails = [user.get('User Email', '').strip() for user in add_users]
-                batch_invite_results = self.azure_rest_client.invite_multiple_users_batch(add_emails)
-                self.log_signal.emit(f"📧 Toplu davet tamamlandı: {sum(batch_invite_results.values())}/{len(add_emails)} başarılı")
-            
-            # Kullanıcıları işle (optimize edilmiş)
-            success_count = 0
-            error_count = 0
-            errors = []
-            total_users = len(users)
-            
-            for i, user in enumerate(users):
-                if not self.is_running:
-                    self.log_signal.emit("⏹️ İşlem kullanıcı tarafından durduruldu")
-                    break
-                    
-                try:
-                    user_email = user.get('User Email', '').strip()
-                    team_name = user.get('Team Name', '').strip()
-                    role = user.get('Role', 'Member').strip()
-                    action = user.get('Action', 'add').strip().lower()
-                    
-                    self.progress_signal.emit(i + 1, total_users)
-                    self.status_signal.emit(f"⚡ İşleniyor: {user_email} ({i+1}/{total_users})")
-                    
-                    if not user_email or not team_name:
-                        self.log_signal.emit(f"❌ Eksik bilgi: {user}")
-                        error_count += 1
-                        errors.append(f"Eksik bilgi: {user_email or 'Email yok'} - {team_name or 'Takım yok'}")
-                        continue
-                        
-                    try:
-                        # İşlem türüne göre kullanıcı ekle/çıkar (cache'den hızlı)
-                        if action == 'add':
-                            result = self.azure_rest_client.add_user_to_team(user_email, team_name, role)
-                        elif action == 'remove':
-                            result = self.azure_rest_client.remove_user_from_team(user_email, team_name)
-                        else:
-                            self.log_signal.emit(f"❌ Geçersiz işlem: {action} - {user_email}")
-                            error_count += 1
-                            errors.append(f"Geçersiz işlem: {action} - {user_email}")
-                            continue
-                        
-                        # Rapor verilerini topla
-                        import datetime
-                        report_entry = {
-                            'Kullanıcı Email': user_email,
-                            'Takım Adı': team_name,
-                            'Rol': role,
-                            'İşlem': action.upper(),
-                            'Durum': 'BAŞARILI' if result else 'BAŞARISIZ',
-                            'Hata Mesajı': '' if result else 'API işlemi başarısız',
-                            'Zaman': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        self.report_data.append(report_entry)
-                        
-                        if result:
-                            self.log_signal.emit(f"✅ Başarılı: {user_email} -> {team_name} ({action})")
-                            success_count += 1
-                        else:
-                            self.log_signal.emit(f"❌ Başarısız: {user_email} -> {team_name} ({action})")
-                            error_count += 1
-                            errors.append(f"İşlem başarısız: {user_email} -> {team_name}")
-                            
-                    except Exception as e:
-                        # Hata durumu için rapor verisi
-                        import datetime
-                        report_entry = {
-                            'Kullanıcı Email': user_email,
-                            'Takım Adı': team_name,
-                            'Rol': role,
-                            'İşlem': action.upper(),
-                            'Durum': 'HATA',
-                            'Hata Mesajı': str(e),
-                            'Zaman': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        self.report_data.append(report_entry)
-                        
-                        self.log_signal.emit(f"❌ Hata: {user_email} -> {str(e)}")
-                        error_count += 1
-                        errors.append(f"Hata: {user_email} -> {str(e)}")
-                        
-                except Exception as e:
-                    error_msg = f"Satır {i+2} işlem hatası: {str(e)}"
-                    self.log_signal.emit(f"❌ {error_msg}")
-                    errors.append(error_msg)
-                    error_count += 1
-            
-            # Bekleyen davetleri işle (non-blocking)
-            if hasattr(self.azure_rest_client, '_pending_invitations') and self.azure_rest_client._pending_invitations:
-                self.status_signal.emit("⏳ Bekleyen davetler işleniyor...")
-                processed = self.azure_rest_client.wait_for_pending_invitations(max_wait_time=30)
-                if processed > 0:
-                    self.log_signal.emit(f"✅ {processed} bekleyen davet başarıyla işlendi")
-                    
-            # Sonuçları raporla
-            self.progress_signal.emit(len(users), len(users))
+        while not self._stopping:
+            job = self.job_queue.next_job()
+            if job is None:
+                break
+            
+            self.current_job = job
+            self.job_started_signal.emit(job)
+            self.log(f"📦 İş #{job.id} başlatılıyor: {job.name}")
+            
+            throttle = ProgressThrottle(self.progress_signal.emit, self.progress_updates_per_second)
+            self.job_queue.run_job(
+                job,
+                self.excel_processor,
+                on_log=self.log,
+                on_status=throttle.status,
+                on_progress=throttle.progress
+            )
+            throttle.flush()
             
-            if success_count > 0:
-                self.log_signal.emit(f"\n🎉 İşlem tamamlandı!")
-                self.log_signal.emit(f"✅ Başarılı işlem sayısı: {success_count}")
-                if error_count > 0:
-                    self.log_signal.emit(f"❌ Hatalı işlem sayısı: {error_count}")
-                    
-            if error_count == 0:
-                self.status_signal.emit("🎉 Tüm işlemler başarılı!")
-                self.finished_signal.emit(True, None)
-            else:
-                error_summary = f"{error_count} hata oluştu"
-                if errors:
-                    error_summary += f": {'; '.join(errors[:3])}"
-                    if len(errors) > 3:
-                        error_summary += f" ve {len(errors)-3} hata daha..."
-                        
-                self.status_signal.emit(f"⚠️ {success_count} başarılı, {error_count} hatalı")
-                self.finished_signal.emit(success_count > 0, error_summary)
-                
-        except Exception as e:
-            self.log_signal.emit(f"❌ Genel işlem hatası: {str(e)}")
-            self.status_signal.emit("❌ İşlem hatası")
-            self.finished_signal.emit(False, str(e))
-        finally:
-            self.is_running = False
+            self.log(f"📦 İş #{job.id} bitti: {job.name} "
+                     f"({job.rows_done} satır, {job.throughput:.1f} satır/sn)")
+            self.finished_jobs.append(job)
+            self.job_finished_signal.emit(job)
+        
+        self.current_job = None
+        
+        failed = [job for job in self.finished_jobs if not job.success]
+        partial = [job for job in self.finished_jobs if job.success and job.error_message]
+        if not failed and not partial:
+            self.finished_signal.emit(bool(self.finished_jobs), None)
+            return
+        
+        summary = [f"{job.name}: {job.error_message}" for job in failed + partial]
+        self.finished_signal.emit(len(failed) < len(self.finished_jobs), "\n".join(summary))
             
     def stop(self):
-        """Thread'i durdur"""
-        self.is_running = False
+        """Bekleyen işleri iptal et ve çalışan işi durdur"""
+        self._stopping = True
+        cancelled = self.job_queue.cancel_pending()
+        if cancelled:
+            self.log(f"⏹️ {cancelled} bekleyen iş iptal edildi")
+        if self.current_job:
+            self.job_queue.stop_job(self.current_job)
     
-    def generate_excel_report(self):
-        """İşlem sonuçlarının Excel raporunu oluşturur"""
-        try:
-            import pandas as pd
-            import os
-            import datetime
-            
-            if not self.report_data:
-                return None
-            
-            # Masaüstü yolunu al
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-            timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-            report_filename = f"azure_devops_islem_raporu_{timestamp}.xlsx"
-            report_path = os.path.join(desktop_path, report_filename)
-            
-            # DataFrame oluştur
-            df = pd.DataFrame(self.report_data)
-            
-            # Excel dosyasını oluştur
-            with pd.ExcelWriter(report_path, engine='openpyxl') as writer:
-                # Ana rapor sayfası
-                df.to_excel(writer, sheet_name='İşlem Detayları', index=False)
-                
-                # Özet istatistikler sayfası
-                summary_data = {
-                    'Metrik': [
-                        'Toplam İşlem Sayısı',
-                        'Başarılı İşlemler',
-                        'Başarısız İşlemler', 
-                        'Hatalı İşlemler',
-                        'Başarı Oranı (%)'
-                    ],
-                    'Değer': [
-                        len(self.report_data),
-                        len([r for r in self.report_data if r['Durum'] == 'BAŞARILI']),
-                        len([r for r in self.report_data if r['Durum'] == 'BAŞARISIZ']),
-                        len([r for r in self.report_data if r['Durum'] == 'HATA']),
-                        round((len([r for r in self.report_data if r['Durum'] == 'BAŞARILI']) / len(self.report_data)) * 100, 2) if self.report_data else 0
-                    ]
-                }
-                
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Özet İstatistikler', index=False)
-                
-                # Takım bazında özet
-                team_summary = df.groupby(['Takım Adı', 'Durum']).size().unstack(fill_value=0)
-                if not team_summary.empty:
-                    team_summary.to_excel(writer, sheet_name='Takım Bazında Özet')
-            
-            return report_path
-            
-        except Exception as e:
-            print(f"Excel raporu oluşturma hatası: {str(e)}")
-            return None
+    def generate_excel_reports(self):
+        """Tamamlanan her iş için Excel raporu oluşturur"""
+        report_paths = []
+        for job in self.finished_jobs:
+            if job.runner:
+                report_path = job.runner.generate_excel_report()
+                if report_path:
+                    report_paths.append(report_path)
+                if job.runner.profile_path:
+                    job.profile_path = job.runner.profile_path
+                    self.log(f"🔬 Profil: {job.profile_path}")
+        return report_paths
+
+
+
+class EstimateThread(QThread):
+    """Seçili dosyaların çalışma tahminini arka planda hesaplar (dosya okunurken arayüz donmaz)"""
+    finished_signal = pyqtSignal(dict, str)  # dosya -> RunEstimate, hata mesajı ('' = hata yok)
+
+    def __init__(self, job_queue, excel_processor, file_paths, organization_url, project_name, pat_token):
+        super().__init__()
+        self.job_queue = job_queue
+        self.excel_processor = excel_processor
+        self.file_paths = file_paths
+        self.organization_url = organization_url
+        self.project_name = project_name
+        self.pat_token = pat_token
 
+    def run(self):
+        estimates = {}
+        for file_path in self.file_paths:
+            try:
+                estimate, error_message = self.job_queue.estimate(file_path, self.organization_url,
+                                                                  self.project_name, self.pat_token,
+                                                                  self.excel_processor)
+            except Exception as e:
+                estimate, error_message = None, str(e)
+            if error_message:
+                self.finished_signal.emit(estimates, f"{os.path.basename(file_path)}: {error_message}")
+                return
+            estimates[file_path] = estimate
+        self.finished_signal.emit(estimates, '')
 
 
 # Ana pencere sınıfı
@@ -315,9 +160,23 @@ class MainWindow(QMainWindow):
         self.config_manager = ConfigManager()
         self.excel_processor = ExcelProcessor()
         self.azure_client = None
-        self.selected_file = None
+        self.selected_files = []
         self.processing = False
         self.process_thread = None
+        self.estimate_thread = None
+        self.closing = False  # Pencere kapatılıyor: thread'lerin bitmesi bekleniyor
+        self.log_sink = LogSink()
+        config = self.config_manager.get_config()
+        configure_from_config(config)
+        self.job_queue = JobQueue(
+            ClientPool(requests_per_second=config.get('requests_per_second', 10.0),
+                       metrics_enabled=config.get('metrics_enabled', True)),
+            max_parallel_partitions=config.get('max_parallel_partitions', 4),
+            metrics_dir=config.get('metrics_dir') or None,
+            prometheus_textfile=config.get('prometheus_textfile') or None,
+            profiling=config.get('profiling_enabled', False),
+            profile_sample_interval=config.get('profile_sample_interval_ms', 10) / 1000
+        )
         
         # UI kurulumu
         self.setup_ui()
@@ -375,21 +234,47 @@ class MainWindow(QMainWindow):
         self.browse_btn = QPushButton("📁 Dosya Seç")
         self.browse_btn.clicked.connect(self.browse_file)
         
+        self.preview_btn = QPushButton("👁️ Önizle")
+        self.preview_btn.clicked.connect(self.preview_file)
+        self.preview_btn.setEnabled(False)
+        
         self.template_btn = QPushButton("📋 Şablon Oluştur")
         self.template_btn.clicked.connect(self.create_template)
         
         file_buttons.addWidget(self.browse_btn)
+        file_buttons.addWidget(self.preview_btn)
         file_buttons.addWidget(self.template_btn)
         file_buttons.addStretch()
         
         file_layout.addLayout(file_buttons)
         main_layout.addWidget(file_group)
         
-        # İşlem butonu
+        # İşlem butonları
+        process_buttons = QHBoxLayout()
         self.process_btn = QPushButton("🚀 Kullanıcıları Ekle")
         self.process_btn.clicked.connect(self.start_processing)
         self.process_btn.setEnabled(False)
-        main_layout.addWidget(self.process_btn)
+        
+        self.stop_btn = QPushButton("🛑 İşlemi Durdur")
+        self.stop_btn.clicked.connect(self.stop_processing)
+        self.stop_btn.setEnabled(False)
+        
+        process_buttons.addWidget(self.process_btn)
+        process_buttons.addWidget(self.stop_btn)
+        main_layout.addLayout(process_buttons)
+        
+        # İş kuyruğu
+        queue_group = QGroupBox("İş Kuyruğu")
+        queue_layout = QVBoxLayout(queue_group)
+        self.queue_list = QListWidget()
+        self.queue_list.setMaximumHeight(100)
+        queue_layout.addWidget(self.queue_list)
+        main_layout.addWidget(queue_group)
+        
+        # Kuyruk görünümünü (sıra ve satır/sn) periyodik güncelle
+        self.queue_timer = QTimer(self)
+        self.queue_timer.setInterval(1000)
+        self.queue_timer.timeout.connect(self.refresh_queue_view)
         
         # Durum bilgisi
         status_layout = QHBoxLayout()
@@ -406,13 +291,16 @@ class MainWindow(QMainWindow):
         self.progress_bar.setTextVisible(False)
         main_layout.addWidget(self.progress_bar)
         
+        # Canlı ölçüm paneli (çalışma sırasında saniyede bir client ölçümlerinden güncellenir)
+        self.dashboard = DashboardPanel(self.job_queue.client_pool)
+        main_layout.addWidget(self.dashboard)
+        
         # Log alanı
         log_group = QGroupBox("İşlem Logları")
         log_layout = QVBoxLayout(log_group)
         
-        # Log text widget
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        # Log alanı: mesajlar LogSink'te birikir, 100 ms'de bir toplu eklenir (en fazla 5000 satır)
+        self.log_text = LogView(self.log_sink, max_lines=5000, flush_interval_ms=100)
         log_layout.addWidget(self.log_text)
         
         # Log temizleme butonu
@@ -433,24 +321,42 @@ class MainWindow(QMainWindow):
         
     def on_settings_saved(self):
         """Ayarlar kaydedildiğinde çağrılır"""
+        config = self.config_manager.get_config()
+        configure_from_config(config)
+        self.job_queue.profiling = config.get('profiling_enabled', False)  # Sonraki işlerden itibaren
         self.log_message("Ayarlar güncellendi")
         self.check_ready_state()
         
     def browse_file(self):
-        """Excel dosyası seç"""
-        file_path, _ = QFileDialog.getOpenFileName(
+        """Excel dosyası seç (birden fazla dosya seçilebilir)"""
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Excel Dosyası Seç",
             "",
+            "Girdi Dosyaları (*.xlsx *.xls *.csv *.tsv *.jsonl *.ndjson *.parquet);;"
             "Excel Dosyaları (*.xlsx *.xls);;Tüm Dosyalar (*)"
         )
         
-        if file_path:
-            self.selected_file = file_path
-            self.file_label.setText(os.path.basename(file_path))
-            self.log_message(f"Dosya seçildi: {os.path.basename(file_path)}")
+        if file_paths:
+            self.selected_files = file_paths
+            names = [os.path.basename(path) for path in file_paths]
+            self.file_label.setText(", ".join(names))
+            self.log_message(f"Dosya seçildi: {', '.join(names)}")
             self.check_ready_state()
     
+    def preview_file(self):
+        """Seçili (ilk) dosyanın satırlarını doğrulama durumuyla önizle"""
+        if not self.selected_files:
+            return
+        file_path = self.selected_files[0]
+        try:
+            self.preview_dialog = InputPreviewDialog(self, self.excel_processor, file_path)
+            self.preview_dialog.show()
+        except Exception as e:
+            error_msg = f"Önizleme hatası: {str(e)}"
+            self.log_message(f"❌ {error_msg}")
+            QMessageBox.critical(self, "Hata", error_msg)
+    
     def create_template(self):
         """Excel şablonu oluştur"""
         try:
@@ -513,75 +419,16 @@ class MainWindow(QMainWindow):
             self.log_message(f"📂 Project: {config['project_name']}")
             self.log_message("🔑 PAT Token: [GIZLI]")
             
-            # Azure DevOps REST API Client oluştur
-            from core.azure_rest_client import AzureDevOpsRESTClient
-            
-            azure_rest_client = AzureDevOpsRESTClient(
+            # Endpoint'ler arka planda paralel yoklanır; sonuçlar geldikçe pencerede ve logda görünür
+            self.log_message("🔄 Azure DevOps endpoint'leri paralel test ediliyor...")
+            self.connection_dialog = ConnectionTestDialog(
+                self,
                 config['organization_url'],
                 config['project_name'],
-                config['pat_token']
+                config['pat_token'],
+                on_log=self.log_message
             )
-            
-            self.log_message("🔄 Azure DevOps REST API bağlantısı test ediliyor...")
-            
-            # Bağlantıyı test et
-            success = azure_rest_client.test_connection()
-            
-            if success:
-                self.log_message("✅ Azure DevOps REST API bağlantısı BAŞARILI!")
-                
-                # Takım listesini al
-                try:
-                    self.log_message("📋 Takımlar listeleniyor...")
-                    teams = azure_rest_client.get_teams()
-                    
-                    if teams and len(teams) > 0:
-                        self.log_message(f"✅ {len(teams)} takım bulundu:")
-                        for i, team in enumerate(teams[:5], 1):
-                            self.log_message(f"  {i}. {team['name']}")
-                        if len(teams) > 5:
-                            self.log_message(f"  ... ve {len(teams)-5} takım daha")
-                        
-                        # Başarı mesajı
-                        QMessageBox.information(
-                            self, 
-                            "✅ Bağlantı Başarılı", 
-                            f"✅ Azure DevOps bağlantısı başarılı!\n\n"
-                            f"📍 Organization: {config['organization_url']}\n"
-                            f"📂 Project: {config['project_name']}\n"
-                            f"👥 Takım Sayısı: {len(teams)}\n\n"
-                            f"Sistem hazır! Excel dosyasını seçip kullanıcı ekleme işlemini başlatabilirsiniz."
-                        )
-                    else:
-                        self.log_message("⚠️ Projede takım bulunamadı")
-                        QMessageBox.warning(
-                            self, 
-                            "⚠️ Uyarı", 
-                            f"Bağlantı başarılı ancak '{config['project_name']}' projesinde takım bulunamadı.\n\n"
-                            f"Lütfen proje adını kontrol edin veya projede takım oluşturun."
-                        )
-                        
-                except Exception as team_error:
-                    self.log_message(f"⚠️ Takım listesi alınamadı: {str(team_error)}")
-                    QMessageBox.information(
-                        self, 
-                        "✅ Bağlantı Başarılı", 
-                        f"✅ Azure DevOps bağlantısı başarılı!\n\n"
-                        f"Ancak takım listesi alınamadı:\n{str(team_error)}"
-                    )
-            else:
-                error_msg = "Azure DevOps bağlantısı başarısız!"
-                self.log_message(f"❌ {error_msg}")
-                QMessageBox.critical(
-                    self, 
-                    "❌ Bağlantı Hatası", 
-                    f"{error_msg}\n\n"
-                    f"Lütfen şunları kontrol edin:\n"
-                    f"• PAT Token geçerli mi?\n"
-                    f"• Organization URL doğru mu?\n"
-                    f"• Project adı doğru mu?\n"
-                    f"• İnternet bağlantınız var mı?"
-                )
+            self.connection_dialog.show()
                 
         except Exception as e:
             error_msg = f"Bağlantı test hatası: {str(e)}"
@@ -625,7 +472,8 @@ class MainWindow(QMainWindow):
                 config.get('project_name')
             )
             
-            has_file = self.selected_file is not None and os.path.exists(self.selected_file)
+            has_file = bool(self.selected_files) and all(os.path.exists(path) for path in self.selected_files)
+            self.preview_btn.setEnabled(has_file)
             
             if has_config and has_file:
                 self.process_btn.setEnabled(True)
@@ -644,8 +492,8 @@ class MainWindow(QMainWindow):
             self.log_message(f"Durum kontrolü hatası: {str(e)}")
     
     def start_processing(self):
-        """İşlemi başlat"""
-        if not self.selected_file or not os.path.exists(self.selected_file):
+        """Seçili dosyaları kuyruğa ekle ve kuyruk çalışmıyorsa başlat"""
+        if not self.selected_files or not all(os.path.exists(path) for path in self.selected_files):
             QMessageBox.critical(self, "Hata", "Lütfen geçerli bir Excel dosyası seçin")
             return
         
@@ -656,63 +504,136 @@ class MainWindow(QMainWindow):
             self.open_settings()
             return
         
-        # İşlem zaten çalışıyorsa durdur
+        pat_token = config.get('pat_token', '')
+        if not pat_token:
+            QMessageBox.critical(self, "Hata", "PAT token bulunamadı! Lütfen ayarlardan PAT token'ınızı girin.")
+            self.open_settings()
+            return
+        
+        if self.estimate_thread and self.estimate_thread.isRunning():
+            return
+        
+        # Başlamadan önce çağrı sayısı ve süre tahmini (API'ye istek atılmaz); dosyalar arka planda okunur
+        self.process_btn.setEnabled(False)
+        self.status_label.setText("⏱️ Çalışma tahmini hesaplanıyor...")
+        self.estimate_thread = EstimateThread(self.job_queue, self.excel_processor, list(self.selected_files),
+                                              config['organization_url'], config['project_name'], pat_token)
+        self.estimate_thread.finished_signal.connect(self.on_estimate_finished)
+        self.estimate_thread.start()
+    
+    def on_estimate_finished(self, estimates, error_message):
+        """Tahmini göster; onaylanırsa dosyaları kuyruğa ekle ve kuyruk çalışmıyorsa başlat"""
+        thread = self.estimate_thread
+        self.process_btn.setEnabled(True)
+        if error_message:
+            QMessageBox.critical(self, "Hata", error_message)
+            if not self.processing:
+                self.check_ready_state()
+            return
+        
+        estimate_lines = []
+        for file_path in thread.file_paths:
+            summary = estimates[file_path].summary()
+            estimate_lines.append(f"• {os.path.basename(file_path)}: {summary}")
+            self.log_message(f"⏱️ Tahmin - {os.path.basename(file_path)}: {summary}")
+
+        answer = QMessageBox.question(
+            self, "Çalışma Tahmini",
+            "Tahmini API çağrısı ve süre:\n\n" + "\n".join(estimate_lines) + "\n\nİşlem başlatılsın mı?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+        )
+        if answer != QMessageBox.Yes:
+            if not self.processing:
+                self.check_ready_state()
+            return
+
+        # Dosyaları kuyruğa ekle (aynı org/proje için client ve cache'leri paylaşılır)
+        for file_path in thread.file_paths:
+            job = self.job_queue.submit(file_path, thread.organization_url, thread.project_name, thread.pat_token,
+                                        run_estimate=estimates.get(file_path))
+            self.log_message(f"📥 Kuyruğa eklendi: #{job.id} {job.name} (sıra: {self.job_queue.position(job)})")
+        
+        self.selected_files = []
+        self.file_label.setText("Henüz dosya seçilmedi")
+        self.preview_btn.setEnabled(False)
+        self.refresh_queue_view()
+        
         if self.processing and self.process_thread and self.process_thread.isRunning():
-            reply = QMessageBox.question(
-                self, 
-                "Devam Eden İşlem", 
-                "Devam eden bir işlem var. İptal edip yeni işlem başlatmak istiyor musunuz?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                self.process_thread.stop()
-                self.process_thread.wait()
-            else:
-                return
+            return
         
+        self._start_queue_thread()
+    
+    def _start_queue_thread(self):
+        """Kuyruk işleyici thread'ini başlat"""
         # UI'yi işlem moduna al
         self.processing = True
-        self.process_btn.setText("🛑 İşlemi Durdur")
-        self.browse_btn.setEnabled(False)
+        self.process_btn.setText("📥 Kuyruğa Ekle")
+        self.stop_btn.setEnabled(True)
         self.template_btn.setEnabled(False)
         
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.status_label.setText("🔄 İşlem başlatılıyor...")
         
-        # Thread'de işlemi başlat
         config = self.config_manager.get_config()
-        pat_token = config.get('pat_token', '')
-        if not pat_token:
-            QMessageBox.critical(self, "Hata", "PAT token bulunamadı! Lütfen ayarlardan PAT token'ınızı girin.")
-            self.open_settings()
-            return
-        
-        self.azure_rest_client = AzureDevOpsRESTClient(
-            config['organization_url'],
-            config['project_name'],
-            pat_token
-        )
-        
-        self.process_thread = ProcessThread(self.selected_file, self.azure_rest_client, self.excel_processor)
-        self.process_thread.log_signal.connect(self.log_message)
-        self.process_thread.status_signal.connect(self.update_status)
+        self.process_thread = QueueThread(self.job_queue, self.excel_processor, self.log_sink,
+                                          config.get('progress_updates_per_second', 10.0))
         self.process_thread.progress_signal.connect(self.update_progress)
+        self.process_thread.job_started_signal.connect(lambda job: self.refresh_queue_view())
+        self.process_thread.job_finished_signal.connect(lambda job: self.refresh_queue_view())
         self.process_thread.finished_signal.connect(self.on_process_finished)
         self.process_thread.start()
+        self.queue_timer.start()
+        self.dashboard.start()
+    
+    def stop_processing(self):
+        """Çalışan işi ve bekleyen kuyruğu durdur"""
+        if self.process_thread and self.process_thread.isRunning():
+            self.log_message("⏹️ Durdurma isteği gönderildi")
+            self.process_thread.stop()
+            self.stop_btn.setEnabled(False)
+    
+    def refresh_queue_view(self):
+        """Kuyruk listesini sıra, durum ve satır/sn bilgisiyle güncelle"""
+        state_labels = {
+            'queued': '⏳ Bekliyor',
+            'running': '🔄 Çalışıyor',
+            'done': '✅ Tamamlandı',
+            'failed': '❌ Başarısız',
+            'cancelled': '⏹️ İptal'
+        }
+        pending = self.job_queue.pending()
+        self.queue_list.clear()
+        for job in self.job_queue.jobs():
+            label = state_labels.get(job.state, job.state)
+            if job.state == 'queued' and job in pending:
+                label += f" (sıra {pending.index(job) + 1})"
+            line = f"#{job.id} {job.name} - {label}"
+            if job.started_at:
+                line += f" - {job.rows_done}/{job.rows_total} satır, {job.throughput:.1f} satır/sn"
+            self.queue_list.addItem(line)
     
     def on_process_finished(self, success, error_message):
-        """İşlem tamamlandığında çağrılır"""
+        """Kuyruk boşaldığında çağrılır"""
+        self.queue_timer.stop()
+        self.dashboard.stop()
+        self.refresh_queue_view()
+        if self.closing:
+            return  # Pencere kapanıyor: kuyruk yeniden başlatılmaz, popup gösterilmez
+        
+        # Thread bitmek üzereyken eklenen işler varsa kuyruğu yeniden başlat
+        if self.job_queue.pending() and not self.process_thread._stopping:
+            self._start_queue_thread()
+            return
+        
         # UI'yi normal duruma getir
         self.processing = False
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(100 if success else 0)
         self.process_btn.setText("🚀 İşlemi Başlat")
-        self.process_btn.setEnabled(True)
-        self.browse_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
         self.template_btn.setEnabled(True)
+        self.check_ready_state()
         
         # Excel raporu indirme seçeneği ile gelişmiş popup
         self.show_completion_popup_with_report(success, error_message)
@@ -792,13 +713,15 @@ class MainWindow(QMainWindow):
             try:
                 # ProcessThread'den Excel raporu oluştur
                 if hasattr(self, 'process_thread') and self.process_thread:
-                    report_path = self.process_thread.generate_excel_report()
-                    if report_path and os.path.exists(report_path):
-                        self.log_message(f"✅ Excel raporu oluşturuldu: {os.path.basename(report_path)}")
+                    report_paths = [path for path in self.process_thread.generate_excel_reports() if os.path.exists(path)]
+                    if report_paths:
+                        names = [os.path.basename(path) for path in report_paths]
+                        for name in names:
+                            self.log_message(f"✅ Excel raporu oluşturuldu: {name}")
                         QMessageBox.information(
                             dialog,
                             "Rapor İndirildi",
-                            f"Excel raporu masaüstüne kaydedildi:\n\n{os.path.basename(report_path)}"
+                            "Excel raporu masaüstüne kaydedildi:\n\n" + "\n".join(names)
                         )
                     else:
                         QMessageBox.warning(
@@ -849,35 +772,63 @@ class MainWindow(QMainWindow):
         # Dialog'u göster
         dialog.exec_()
             
-    def update_progress(self, current, total):
-        """İlerleme çubuğunu güncelle"""
-        if total > 0:
-            percent = int((current / total) * 100)
-            self.progress_bar.setValue(percent)
+    def update_progress(self, update):
+        """İlerleme çubuğunu ve durum satırını (hız ve kalan süre ile) güncelle"""
+        if update.total > 0:
+            self.progress_bar.setValue(update.percent)
+        self.dashboard.set_progress(update)
+        summary = update.summary()
+        self.update_status(f"{update.status} - {summary}" if update.status else summary)
     
     def update_status(self, message):
         """Durum mesajını güncelle"""
         self.status_label.setText(message)
     
     def log_message(self, message):
-        """Log mesajı ekle"""
+        """Log mesajı ekle (LogSink'e yazılır, log alanına bir sonraki flush'ta eklenir)"""
         try:
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-            formatted_message = f"[{timestamp}] {message}"
-            
-            self.log_text.append(formatted_message)
-            # Otomatik kaydırma
-            self.log_text.verticalScrollBar().setValue(
-                self.log_text.verticalScrollBar().maximum()
-            )
+            self.log_sink.write(message)
         except Exception as e:
             print(f"Log mesajı eklenirken hata: {e}")
     
     def clear_logs(self):
         """Log alanını temizle"""
+        self.log_sink.drain()
         self.log_text.clear()
         self.log_message("Loglar temizlendi")
     
 
     
 
+    
+    def _running_threads(self):
+        return [thread for thread in (self.process_thread, self.estimate_thread) if thread and thread.isRunning()]
+
+    def closeEvent(self, event):
+        """Pencere kapanırken çalışan işi iptal eder; pencere thread'ler bittikten sonra kapanır
+
+        İptal sürmekte olan HTTP isteklerini de keser, bu yüzden bekleme kısadır. Beklerken arayüz
+        donmaz: kapanış ertelenir ve her thread bittiğinde yeniden denenir.
+        """
+        threads = self._running_threads()
+        if threads:
+            if not self.closing:
+                self.closing = True
+                log.info("⏹️ Pencere kapatılıyor: çalışan işin durması bekleniyor")
+                self.setEnabled(False)
+                if self.process_thread in threads:
+                    self.process_thread.stop()
+                for thread in threads:
+                    thread.finished.connect(self._close_when_idle)
+            event.ignore()
+            return
+        self.queue_timer.stop()
+        self.dashboard.refresh_timer.stop()
+        self.log_sink.close()
+        event.accept()
+
+    def _close_when_idle(self):
+        """Kapanışı bekleyen thread'lerden biri bitti: hepsi bittiyse pencereyi kapat"""
+        # finished sinyali thread'in son adımında gelir; kısa wait thread'in tamamen çıkmasını bekler
+        if all(thread.wait(100) for thread in self._running_threads()):
+            self.close()
@@ -1,10 +1,11 @@
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QGroupBox, QMessageBox, QFormLayout
+    QPushButton, QGroupBox, QMessageBox, QFormLayout, QCheckBox
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
-import threading
+
+from gui.connection_test_dialog import ConnectionTestDialog
 
 class SettingsWindow(QDialog):
     def __init__(self, parent, config_manager, callback=None):
@@ -14,7 +15,7 @@ class SettingsWindow(QDialog):
         
         # Pencere ayarları
         self.setWindowTitle("⚙️ Azure DevOps Ayarları")
-        self.setFixedSize(600, 500)
+        self.setFixedSize(600, 560)
         self.setModal(True)
         
         # Mevcut ayarları yükle
@@ -93,6 +94,15 @@ class SettingsWindow(QDialog):
         
         layout.addWidget(settings_group)
         
+        # Gelişmiş ayarlar
+        advanced_group = QGroupBox("Gelişmiş")
+        advanced_layout = QVBoxLayout(advanced_group)
+        self.profiling_check = QCheckBox("🔬 Profil modu (aşama süreleri ve örnekleme profili raporun yanına yazılır)")
+        self.profiling_check.setToolTip("Yavaş çalışmaların teşhisi için; .folded dosyası flamegraph.pl veya "
+                                        "speedscope ile açılabilir")
+        advanced_layout.addWidget(self.profiling_check)
+        layout.addWidget(advanced_group)
+        
         # Yardım metni
         help_label = QLabel("""
         💡 Yardım:
@@ -184,6 +194,7 @@ class SettingsWindow(QDialog):
         self.org_url_edit.setText(self.config.get('organization_url', ''))
         self.pat_edit.setText(self.config.get('pat_token', ''))
         self.project_edit.setText(self.config.get('project_name', ''))
+        self.profiling_check.setChecked(bool(self.config.get('profiling_enabled', False)))
     
     def test_connection(self):
         """Bağlantıyı test et"""
@@ -195,52 +206,22 @@ class SettingsWindow(QDialog):
             QMessageBox.critical(self, "Hata", "Lütfen tüm alanları doldurun")
             return
         
-        # Test butonunu devre dışı bırak
+        # URL formatını düzelt
+        if not org_url.startswith('https://'):
+            org_url = f"https://dev.azure.com/{org_url}"
+        
+        # Test butonunu devre dışı bırak; endpoint'ler arka planda paralel yoklanır
         self.test_btn.setEnabled(False)
         self.test_btn.setText("🔄 Test ediliyor...")
         
-        # Direkt test et (thread kullanmadan)
-        try:
-            from core.azure_rest_client import AzureDevOpsRESTClient
-            
-            # URL formatını düzelt
-            if not org_url.startswith('https://'):
-                org_url = f"https://dev.azure.com/{org_url}"
-            
-            print(f"🔄 Bağlantı test ediliyor...")
-            print(f"📍 Organization: {org_url}")
-            print(f"📂 Project: {project_name}")
-            
-            client = AzureDevOpsRESTClient(org_url, project_name, pat_token)
-            result = client.test_connection()
-            
-            if result:
-                print("✅ Bağlantı testi başarılı!")
-                QMessageBox.information(self, "Başarılı", "✅ Bağlantı başarıyla test edildi!\n\n" +
-                                      f"Organization: {org_url}\n" +
-                                      f"Project: {project_name}")
-            else:
-                print("❌ Bağlantı testi başarısız!")
-                QMessageBox.critical(self, "Hata", "❌ Bağlantı test edilemedi.\n\n" +
-                                    "Lütfen şunları kontrol edin:\n" +
-                                    "• PAT token geçerli mi?\n" +
-                                    "• Organization URL doğru mu?\n" +
-                                    "• Project adı doğru mu?\n" +
-                                    "• İnternet bağlantınız var mı?")
-        except Exception as e:
-            print(f"❌ Bağlantı test hatası: {e}")
-            QMessageBox.critical(self, "Hata", f"❌ Bağlantı hatası:\n\n{str(e)}\n\n" +
-                               "Lütfen şunları kontrol edin:\n" +
-                               "• PAT token doğru girildi mi?\n" +
-                               "• Organization URL formatı: https://dev.azure.com/organizasyon\n" +
-                               "• Project adı doğru yazıldı mı?")
-        finally:
-            # Test butonunu her durumda yeniden etkinleştir
-            self.test_btn.setEnabled(True)
-            self.test_btn.setText("🔗 Bağlantıyı Test Et")
-            print("🔄 Test butonu yeniden etkinleştirildi")
+        self.connection_dialog = ConnectionTestDialog(self, org_url, project_name, pat_token,
+                                                      on_log=print, on_finished=self.on_test_finished)
+        self.connection_dialog.show()
     
-
+    def on_test_finished(self, success, teams):
+        """Bağlantı testi bitince test butonunu yeniden etkinleştir"""
+        self.test_btn.setEnabled(True)
+        self.test_btn.setText("🔗 Bağlantıyı Test Et")
     
     def save_settings(self):
         """Ayarları kaydet"""
@@ -258,12 +239,15 @@ class SettingsWindow(QDialog):
             return
         
         try:
-            # Ayarları kaydet
-            self.config_manager.save_config({
+            # Ayarları kaydet (formda olmayan gelişmiş ayarlar korunur)
+            config = dict(self.config_manager.get_config())
+            config.update({
                 'organization_url': org_url,
                 'pat_token': pat_token,
-                'project_name': project_name
+                'project_name': project_name,
+                'profiling_enabled': self.profiling_check.isChecked()
             })
+            self.config_manager.save_config(config)
             
             QMessageBox.information(self, "Başarılı", "Ayarlar başarıyla kaydedildi!")
             
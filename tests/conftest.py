@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+Testler core modüllerini ve benchmarks/ altındaki sahte Azure DevOps sunucusunu, ölçüm
+betiklerini kullanır; depo paket olarak kurulmadığından ikisi de import yoluna eklenir.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Runner iptali: bölümün toplu çıkarması bittikten sonra gelen iptal, silinen satırları İPTAL göstermemeli"""
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.batch_runner import BatchRunner
+from core.excel_processor import ExcelProcessor
+from core.method_learner import MethodLearner
+from core.user_row import UserRow
+
+
+def row(number, email, action):
+    return UserRow(email, action, "Team 0", 'Member', 'stakeholder', '', '', number)
+
+
+def test_cancel_mid_segment_reports_completed_removals(tmp_path):
+    removed = [f"old{i}@company.com" for i in range(3)]
+    added = [f"new{i}@company.com" for i in range(3)]
+    organization = FakeOrganization(teams=2, users=removed + added)
+    for email in removed:
+        organization.add_member('team-0', email)
+    client = RecordingTransport(FakeAzureDevOps(organization)).attach(AzureDevOpsRESTClient(
+        f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat', requests_per_second=0,
+        method_learner=MethodLearner(str(tmp_path / 'method_order.json'))))
+    # Ekleme satırları önce gelir: iptal anında çıkarma satırları satır döngüsünde henüz raporlanmamıştır
+    users = [row(i + 2, email, 'add') for i, email in enumerate(added)] + \
+            [row(i + 5, email, 'remove') for i, email in enumerate(removed)]
+    runner = BatchRunner('', client, ExcelProcessor(), users=users)
+
+    # Çıkarmalar toplu olarak bölüm başında biter; iptal ilk ekleme satırı sürerken gelir
+    add_user_to_team = client.add_user_to_team
+
+    def cancel_then_add(*args):
+        runner.stop()
+        return add_user_to_team(*args)
+
+    client.add_user_to_team = cancel_then_add
+
+    success, error_message = runner.run()
+
+    assert not success
+    statuses = {report_row[0]: report_row[4] for report_row in runner.report.rows()}
+    assert statuses == {**{email: 'BAŞARILI' for email in removed}, **{email: 'İPTAL' for email in added}}
+    assert not any(email in organization.members['team-0'] for email in removed)
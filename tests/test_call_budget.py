@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""API çağrı bütçesi regresyonu: her senaryonun HTTP çağrısı sabit + takım başına + satır başına bütçeyi aşmamalı"""
+
+import pytest
+
+import check_call_budget
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+
+ROWS = 50
+
+
+@pytest.mark.parametrize('name', sorted(check_call_budget.BUDGETS))
+def test_scenario_within_call_budget(name, tmp_path):
+    counts, rows_done, _ = check_call_budget.run_scenario(name, ROWS, str(tmp_path))
+    assert check_call_budget.check(name, counts, rows_done, ROWS) == []
+
+
+def test_throttled_resends_are_counted():
+    server = FakeAzureDevOps(FakeOrganization(teams=3), throttle_every=2, retry_after=0.001)
+    transport = RecordingTransport(server)
+    client = transport.attach(AzureDevOpsRESTClient(f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat',
+                                                    requests_per_second=0))
+    for _ in range(3):
+        assert client.test_connection()
+    statuses = [status for _, _, status in transport.calls]
+    assert 429 in statuses
+    assert len(transport.calls) == server.total_requests
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""İptal: yanıtı gecikmeli sürmekte olan HTTP isteği zaman aşımını beklemeden kesilmeli"""
+
+import threading
+import time
+
+import pytest
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, redirect, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.cancellation import CancellationToken, CancelledError
+
+LATENCY = 10.0
+
+
+def test_cancel_interrupts_request_in_flight():
+    with FakeAzureDevOps(FakeOrganization(teams=1), latency=LATENCY) as server:
+        client = redirect(AzureDevOpsRESTClient(f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat',
+                                                requests_per_second=0), server.url)
+        token = CancellationToken()
+        client.set_cancel_token(token)
+        threading.Timer(0.3, token.cancel).start()
+
+        started = time.monotonic()
+        with pytest.raises(CancelledError) as error:
+            client._request('GET', f"{client.base_url}/projects?api-version={client.api_version}", 'projects')
+
+        assert time.monotonic() - started < LATENCY / 2
+        assert error.value.in_flight
+
+        # Sonraki çalışma taze bağlantı havuzuyla normal ilerler
+        server.latency = 0
+        client.set_cancel_token(CancellationToken())
+        assert client.test_connection()
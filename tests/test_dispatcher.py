@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Dağıtıcı: iptalde okuma durmalı, çalışamayan bölümün satırları rapordan düşmemeli"""
+
+import csv
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.dispatcher import PartitionDispatcher
+from core.excel_processor import ExcelProcessor
+from core.job_queue import ClientPool
+from core.method_learner import MethodLearner
+
+ORGANIZATION_URL = f"https://dev.azure.com/{ORGANIZATION}"
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['User Email', 'Action', 'Team Name', 'Project'])
+        writer.writerows(rows)
+    return str(path)
+
+
+def make_dispatcher(tmp_path, path, **kwargs):
+    transport = RecordingTransport(FakeAzureDevOps(FakeOrganization(teams=2)))
+
+    def make_client(organization_url, project_name, pat_token):
+        return transport.attach(AzureDevOpsRESTClient(
+            organization_url, project_name, pat_token, requests_per_second=0,
+            method_learner=MethodLearner(str(tmp_path / 'method_order.json'))))
+
+    return PartitionDispatcher(path, ClientPool(make_client), ExcelProcessor(), ORGANIZATION_URL, PROJECT, 'pat',
+                               prepare_report=False, **kwargs)
+
+
+def test_cancel_stops_reading_and_reports_unread_rows_in_bulk(tmp_path):
+    rows = 20000
+    path = write_csv(tmp_path / 'users.csv', ((f"user{i}@company.com", 'remove', "Team 0", '')
+                                              for i in range(rows)))
+    dispatcher = make_dispatcher(tmp_path, path, on_progress=lambda current, total: dispatcher.stop())
+
+    success, error_message = dispatcher.run()
+
+    assert not success
+    assert dispatcher._rows_read < rows
+    report = dispatcher.partitions[0].runner.report
+    unread = [row for row in report.rows() if not row[0]]
+    assert len(unread) == 1 and unread[0][4] == 'İPTAL' and 'okunmadı' in unread[0][5]
+    assert report.row_count == dispatcher._rows_read + 1
+    assert dispatcher.generate_excel_report(str(tmp_path))
+
+
+def test_rows_of_failed_partition_are_reported_as_errors(tmp_path):
+    rows = 1200
+    path = write_csv(tmp_path / 'users.csv', ((f"user{i}@company.com", 'remove', "Team 0",
+                                               'Missing' if i % 2 else '') for i in range(rows)))
+    dispatcher = make_dispatcher(tmp_path, path)
+
+    _, error_message = dispatcher.run()
+
+    assert '[bench/Missing]' in error_message
+    failed = next(p for p in dispatcher.partitions if p.project_name == 'Missing')
+    assert not failed.success
+    statuses = [row[4] for row in failed.runner.report.rows()]
+    assert statuses == ['HATA'] * (rows // 2)
+    assert sum(len(p.runner.report) for p in dispatcher.partitions) == rows
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""İş kuyruğu: runner kurulmadan durdurulan iş çalışmaya başladığında API'ye istek atmadan iptal edilmeli"""
+
+import csv
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.excel_processor import ExcelProcessor
+from core.job_queue import Job, JobQueue, ClientPool
+from core.method_learner import MethodLearner
+from core.run_estimator import RunEstimator
+
+ROWS = 20
+
+
+def test_stop_before_runner_is_assigned_cancels_the_job(tmp_path):
+    path = tmp_path / 'users.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['User Email', 'Action', 'Team Name'])
+        writer.writerows((f"user{i}@company.com", 'add', "Team 0") for i in range(ROWS))
+    transport = RecordingTransport(FakeAzureDevOps(FakeOrganization(teams=2)))
+
+    def make_client(organization_url, project_name, pat_token):
+        return transport.attach(AzureDevOpsRESTClient(
+            organization_url, project_name, pat_token, requests_per_second=0,
+            method_learner=MethodLearner(str(tmp_path / 'method_order.json'))))
+
+    queue = JobQueue(ClientPool(make_client), estimator=RunEstimator(str(tmp_path / 'run_history.json')),
+                     metrics_dir='', prepare_reports=False)
+    job = queue.submit(str(path), f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat')
+    assert queue.next_job() is job
+    queue.stop_job(job)  # İş thread'i işi aldı, run_job henüz runner kurmadı
+
+    queue.run_job(job, ExcelProcessor())
+
+    assert job.state == Job.CANCELLED
+    assert transport.calls == []
+    # Okuma ilk satırda durur; satırlar tek toplu İPTAL kaydıyla rapora yazılır
+    assert job.runner.partitions == []
+    assert [row[4] for row in job.runner.unread_report.rows()] == ['İPTAL']
+    assert job.runner.generate_excel_report(str(tmp_path))
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""Büyük girdi bellek regresyonu: 100.000 satır pipeline'dan geçerken en yüksek RSS artışı sınırlı kalmalı"""
+
+import sys
+
+import pytest
+
+import bench_memory_rss
+
+ROWS = 100000
+MAX_RSS_MB = 60.0
+
+
+@pytest.mark.skipif(sys.platform.startswith('win'), reason="RSS ölçümü Windows'ta desteklenmiyor")
+def test_peak_rss_growth_is_bounded():
+    measured = bench_memory_rss.measure(ROWS)
+    assert bench_memory_rss.check(measured, ROWS, MAX_RSS_MB) == []
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Toplu çıkarma: birden fazla sayfalık takım ve organizasyon listelerinde üyelikler gerçekten silinmeli"""
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient, PAGE_SIZE
+
+MEMBERS = 150
+
+
+def make_client(page_size: int = 0):
+    """İlk takımında MEMBERS üye olan organizasyona bağlı client ve sunucu"""
+    emails = [f"u{i}@company.com" for i in range(MEMBERS)]
+    organization = FakeOrganization(teams=2, users=emails)
+    for email in emails:
+        organization.add_member('team-0', email)
+    server = FakeAzureDevOps(organization, page_size=page_size)
+    client = RecordingTransport(server).attach(
+        AzureDevOpsRESTClient(f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat', requests_per_second=0))
+    return client, organization
+
+
+def test_team_members_are_read_from_every_page():
+    client, _ = make_client()
+    assert MEMBERS > PAGE_SIZE
+    assert len(client.get_team_members('team-0')) == MEMBERS
+
+
+def test_removes_member_past_first_page():
+    client, organization = make_client(page_size=50)
+    assert len(client._load_all_org_users()) == MEMBERS
+
+    results = client.remove_users_batch([("u120@company.com", "Team 0")])
+
+    assert results[("u120@company.com", "team 0")] == (True, "Üyelik silindi")
+    assert "u120@company.com" not in organization.members['team-0']
+
+
+def test_cached_member_map_does_not_skip_delete():
+    client, organization = make_client()
+    # Önceki işten kalan, kullanıcıyı içermeyen üye listesi silmeyi engellememeli
+    client._team_members_cache['team-0'] = {}
+
+    results = client.remove_users_batch([("u5@company.com", "Team 0"), ("u6@company.com", "Team 1")])
+
+    assert results[("u5@company.com", "team 0")] == (True, "Üyelik silindi")
+    assert results[("u6@company.com", "team 1")] == (True, "Zaten üye değil")
+    assert "u5@company.com" not in organization.members['team-0']
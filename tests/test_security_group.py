@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Proje güvenlik grubuna ekleme: sınıflandırmadaki descriptor ile tek bir Graph üyeliği oluşturulmalı"""
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.method_learner import MethodLearner
+
+
+def test_adds_user_to_project_security_group(tmp_path):
+    organization = FakeOrganization(teams=3, users=["alice@company.com"])
+    transport = RecordingTransport(FakeAzureDevOps(organization))
+    client = transport.attach(AzureDevOpsRESTClient(
+        f"https://dev.azure.com/{ORGANIZATION}", PROJECT, 'pat', requests_per_second=0,
+        method_learner=MethodLearner(str(tmp_path / 'method_order.json'))))
+    group_name = f"[{PROJECT}]\\Team 1"
+
+    assert client.classify_groups([group_name])[group_name.lower()]['type'] == 'security'
+    assert client.add_user_to_any_group("alice@company.com", group_name)
+
+    user = organization.users["alice@company.com"]
+    assert (user['descriptor'], 'vssgp.team1') in organization.memberships
+    assert transport.counts()['graph_membership_add'] == 1
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Takıma ekleme zinciri: zaten üye olan satırlar ve satıra özgü 404'ler yöntem öğrenicisini etkilememeli"""
+
+from fake_azure_devops import FakeAzureDevOps, FakeOrganization, RecordingTransport, ORGANIZATION, PROJECT
+from core.azure_rest_client import AzureDevOpsRESTClient
+from core.method_learner import MethodLearner
+
+METHODS = ['email_direct', 'id_direct', 'simple_invite']
+ORGANIZATION_URL = f"https://dev.azure.com/{ORGANIZATION}"
+
+
+def make_client(tmp_path, team_member_add_status=None, failure_threshold=3):
+    """Team 0'da member@ üyesi olan, tüm kullanıcıları organizasyonda bulunan client"""
+    emails = ["member@company.com"] + [f"user{i}@company.com" for i in range(5)]
+    organization = FakeOrganization(teams=2, users=emails)
+    organization.add_member('team-0', "member@company.com")
+    server = FakeAzureDevOps(organization)
+    if team_member_add_status is not None:
+        server._team_member_add = lambda params, query, payload: (team_member_add_status, {'message': 'x'}, {})
+    transport = RecordingTransport(server)
+    learner = MethodLearner(str(tmp_path / 'method_order.json'), failure_threshold=failure_threshold)
+    client = transport.attach(AzureDevOpsRESTClient(ORGANIZATION_URL, PROJECT, 'pat', requests_per_second=0,
+                                                    method_learner=learner))
+    return client, transport, learner
+
+
+def test_existing_member_is_not_recorded_as_method_success(tmp_path):
+    client, transport, learner = make_client(tmp_path)
+
+    assert client.add_user_to_any_group("member@company.com", "Team 0")
+
+    assert transport.counts()['team_member_add'] == 0
+    assert not (tmp_path / 'method_order.json').exists()
+
+
+def test_unsupported_method_is_skipped_after_existing_member_row(tmp_path):
+    client, transport, learner = make_client(tmp_path, team_member_add_status=405, failure_threshold=1)
+
+    assert client.add_user_to_any_group("member@company.com", "Team 0")
+    assert client.add_user_to_any_group("user0@company.com", "Team 0")
+
+    assert learner.order(ORGANIZATION_URL, 'team', METHODS) == ['id_direct', 'simple_invite']
+
+
+def test_row_specific_404_does_not_mark_method_unsupported(tmp_path):
+    client, transport, learner = make_client(tmp_path, team_member_add_status=404, failure_threshold=1)
+
+    assert client.add_user_to_any_group("user0@company.com", "Team 0")
+
+    assert 'email_direct' in learner.order(ORGANIZATION_URL, 'team', METHODS)